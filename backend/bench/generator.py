@@ -0,0 +1,303 @@
+import random
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from typing import Any, Iterator
+
+import asyncpg
+
+from backend.core.security import get_password_hash
+
+BENCH_PREFIX = "bench"
+BENCH_PASSWORD = "password"
+
+PROJECT_STATUSES = ("active", "active", "active", "maintenance", "archived")
+USAGE_TYPES = ("production", "production", "development", "testing")
+MEMBER_ROLES = ("developer", "developer", "developer", "Team Lead", "QA Engineer", "DevOps Engineer")
+
+# Tables in load order; cleared in reverse order by --reset
+DATASET_TABLES = (
+    "users",
+    "teams",
+    "team_members",
+    "technologies",
+    "technology_versions",
+    "projects",
+    "project_technologies",
+)
+
+EPOCH = datetime(2020, 1, 1)
+
+
+@dataclass(frozen=True)
+class Scale:
+    """
+    Size of generated dataset
+    """
+    users: int
+    teams: int
+    members_per_team: int
+    technologies: int
+    versions_per_technology: int
+    projects: int
+    technologies_per_project: int
+    seed: int = 42
+
+
+SCALES = {
+    "small": Scale(
+        users=200, teams=20, members_per_team=8, technologies=100,
+        versions_per_technology=3, projects=1000, technologies_per_project=10,
+    ),
+    "medium": Scale(
+        users=1000, teams=100, members_per_team=10, technologies=300,
+        versions_per_technology=4, projects=5000, technologies_per_project=25,
+    ),
+    "large": Scale(
+        users=5000, teams=500, members_per_team=12, technologies=1000,
+        versions_per_technology=5, projects=10000, technologies_per_project=50,
+    ),
+}
+
+
+def resolve_scale(name: str, **overrides: int | None) -> Scale:
+    """
+    Get preset scale with individual sizes overridden
+
+    Args:
+        name: Preset name
+        **overrides: Scale fields to override (None values are ignored)
+
+    Returns:
+        Dataset scale
+    """
+    scale = replace(SCALES[name], **{key: value for key, value in overrides.items() if value is not None})
+    if scale.technologies_per_project > scale.technologies:
+        raise ValueError("technologies_per_project не может превышать technologies")
+    return scale
+
+
+def _timestamp(rng: random.Random, days: int = 1500) -> datetime:
+    return EPOCH + timedelta(days=rng.randrange(days), seconds=rng.randrange(86400))
+
+
+def _skewed_index(rng: random.Random, size: int) -> int:
+    """
+    Pick index with popularity skew towards the start of the range
+    """
+    return int(size * rng.random() ** 2)
+
+
+class DatasetGenerator:
+    """
+    Deterministic synthetic registry of a large organization
+
+    The same scale and seed always produce the same rows. Identifiers start
+    after the existing maximum of each table, so generated rows never
+    collide with data already in the database.
+    """
+    def __init__(
+        self,
+        scale: Scale,
+        id_offsets: dict[str, int],
+        category_ids: list[int],
+        status_ids: list[int],
+        password_hash: str,
+    ):
+        self.scale = scale
+        self.offsets = id_offsets
+        self.category_ids = category_ids
+        self.status_ids = status_ids
+        self.password_hash = password_hash
+
+    def _rng(self, table: str) -> random.Random:
+        # Separate stream per table: changing one size keeps other tables stable
+        return random.Random(f"{self.scale.seed}:{table}")
+
+    def _id(self, table: str, index: int) -> int:
+        return self.offsets[table] + index + 1
+
+    def users(self) -> Iterator[tuple[Any, ...]]:
+        rng = self._rng("users")
+        for i in range(self.scale.users):
+            created_at = _timestamp(rng)
+            yield (
+                self._id("users", i),
+                f"{BENCH_PREFIX}-user-{i + 1}@{BENCH_PREFIX}.local",
+                self.password_hash,
+                f"Bench User {i + 1}",
+                i == 0,
+                rng.random() > 0.02,
+                created_at,
+                created_at,
+            )
+
+    def teams(self) -> Iterator[tuple[Any, ...]]:
+        rng = self._rng("teams")
+        for i in range(self.scale.teams):
+            created_at = _timestamp(rng)
+            yield (
+                self._id("teams", i),
+                f"{BENCH_PREFIX.title()} Team {i + 1}",
+                f"Synthetic team {i + 1} for load testing",
+                self._id("users", rng.randrange(self.scale.users)),
+                created_at,
+                created_at,
+            )
+
+    def team_members(self) -> Iterator[tuple[Any, ...]]:
+        rng = self._rng("team_members")
+        member_id = 0
+        per_team = min(self.scale.members_per_team, self.scale.users)
+        for team in range(self.scale.teams):
+            for user in rng.sample(range(self.scale.users), per_team):
+                yield (
+                    self._id("team_members", member_id),
+                    self._id("teams", team),
+                    self._id("users", user),
+                    rng.choice(MEMBER_ROLES),
+                    _timestamp(rng),
+                )
+                member_id += 1
+
+    def technologies(self) -> Iterator[tuple[Any, ...]]:
+        rng = self._rng("technologies")
+        for i in range(self.scale.technologies):
+            created_at = _timestamp(rng)
+            name = f"{BENCH_PREFIX.title()}Tech {i + 1}"
+            yield (
+                self._id("technologies", i),
+                name,
+                rng.choice(self.category_ids),
+                f"Synthetic technology {i + 1} used by generated projects",
+                f"https://{BENCH_PREFIX}.local/tech/{i + 1}",
+                self.status_ids[_skewed_index(rng, len(self.status_ids))],
+                created_at,
+                created_at,
+            )
+
+    def technology_versions(self) -> Iterator[tuple[Any, ...]]:
+        rng = self._rng("technology_versions")
+        per_tech = self.scale.versions_per_technology
+        for tech in range(self.scale.technologies):
+            release = date(2018, 1, 1) + timedelta(days=rng.randrange(365))
+            for v in range(per_tech):
+                release += timedelta(days=rng.randrange(60, 400))
+                yield (
+                    self._id("technology_versions", tech * per_tech + v),
+                    self._id("technologies", tech),
+                    f"{v + 1}.{rng.randrange(10)}",
+                    release,
+                    rng.random() < 0.2,
+                    release + timedelta(days=1095) if v < per_tech - 1 else None,
+                    None,
+                    datetime.combine(release, datetime.min.time()),
+                )
+
+    def projects(self) -> Iterator[tuple[Any, ...]]:
+        rng = self._rng("projects")
+        for i in range(self.scale.projects):
+            created_at = _timestamp(rng)
+            updated_at = created_at + timedelta(days=rng.randrange(600))
+            yield (
+                self._id("projects", i),
+                f"{BENCH_PREFIX.title()} Project {i + 1}",
+                f"Synthetic project {i + 1} of team {i % self.scale.teams + 1}",
+                self._id("teams", _skewed_index(rng, self.scale.teams)) if rng.random() > 0.05 else None,
+                rng.choice(PROJECT_STATUSES),
+                f"https://git.{BENCH_PREFIX}.local/project-{i + 1}",
+                created_at.date(),
+                created_at,
+                updated_at,
+            )
+
+    def project_technologies(self) -> Iterator[tuple[Any, ...]]:
+        rng = self._rng("project_technologies")
+        per_tech = self.scale.versions_per_technology
+        link_id = 0
+        for project in range(self.scale.projects):
+            chosen: set[int] = set()
+            while len(chosen) < self.scale.technologies_per_project:
+                chosen.add(_skewed_index(rng, self.scale.technologies))
+            for tech in sorted(chosen):
+                version = rng.randrange(per_tech) if per_tech and rng.random() > 0.1 else None
+                yield (
+                    self._id("project_technologies", link_id),
+                    self._id("projects", project),
+                    self._id("technologies", tech),
+                    self._id("technology_versions", tech * per_tech + version) if version is not None else None,
+                    rng.choice(USAGE_TYPES),
+                    _timestamp(rng),
+                    None,
+                )
+                link_id += 1
+
+
+COLUMNS = {
+    "users": ["id", "email", "password_hash", "full_name", "is_admin", "is_active", "created_at", "updated_at"],
+    "teams": ["id", "name", "description", "lead_id", "created_at", "updated_at"],
+    "team_members": ["id", "team_id", "user_id", "role", "joined_at"],
+    "technologies": [
+        "id", "name", "category_id", "description", "official_website",
+        "status_id", "created_at", "updated_at",
+    ],
+    "technology_versions": [
+        "id", "technology_id", "version", "release_date", "is_lts",
+        "end_of_life", "notes", "created_at",
+    ],
+    "projects": [
+        "id", "name", "description", "team_id", "status", "repository_url",
+        "start_date", "created_at", "updated_at",
+    ],
+    "project_technologies": ["id", "project_id", "technology_id", "version_id", "usage_type", "added_at", "notes"],
+}
+
+
+async def load_dataset(conn: asyncpg.Connection, scale: Scale, reset: bool = False) -> dict[str, int]:
+    """
+    Generate dataset and load it with binary COPY in one transaction
+
+    Categories and statuses are taken from the database. Identity sequences
+    are moved past the loaded rows and tables are analyzed afterwards.
+
+    Args:
+        conn: Database connection
+        scale: Dataset scale
+        reset: Truncate registry tables before loading
+
+    Returns:
+        Mapping of table name to loaded row count
+    """
+    category_ids = [row["id"] for row in await conn.fetch("SELECT id FROM technology_categories ORDER BY id")]
+    status_ids = [row["id"] for row in await conn.fetch("SELECT id FROM technology_statuses ORDER BY id")]
+    if not category_ids or not status_ids:
+        raise ValueError("Нет категорий или статусов технологий, примените миграции")
+
+    loaded = {}
+    async with conn.transaction():
+        if reset:
+            await conn.execute(f"TRUNCATE {', '.join(reversed(DATASET_TABLES))} RESTART IDENTITY CASCADE")
+
+        offsets = {}
+        for table in DATASET_TABLES:
+            offsets[table] = await conn.fetchval(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+
+        generator = DatasetGenerator(scale, offsets, category_ids, status_ids, get_password_hash(BENCH_PASSWORD))
+
+        for table in DATASET_TABLES:
+            result = await conn.copy_records_to_table(
+                table,
+                records=getattr(generator, table)(),
+                columns=COLUMNS[table],
+            )
+            loaded[table] = int(result.split()[-1])
+            await conn.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), GREATEST((SELECT MAX(id) FROM {table}), 1))"
+            )
+
+        await conn.fetchval("SELECT rebuild_technology_stats()")
+
+    for table in DATASET_TABLES:
+        await conn.execute(f"ANALYZE {table}")
+
+    return loaded
+
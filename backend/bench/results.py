@@ -0,0 +1,108 @@
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+COMPARED_METRICS = ("p50_ms", "p95_ms", "p99_ms", "rps")
+
+
+def git_revision() -> str:
+    """
+    Get short commit hash of the working tree, with "-dirty" suffix for
+    uncommitted changes
+
+    Returns:
+        Revision label or "unknown" outside of a git checkout
+    """
+    cwd = Path(__file__).parent
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=cwd, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=cwd, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{sha}-dirty" if dirty else sha
+
+
+def save_results(
+    results: dict[str, dict[str, Any]],
+    settings: dict[str, Any],
+    output_dir: Path = RESULTS_DIR,
+) -> Path:
+    """
+    Save benchmark results as JSON named after the git revision
+
+    Args:
+        results: Mapping of scenario name to summary
+        settings: Run parameters (concurrency, requests, dataset counts)
+        output_dir: Target directory
+
+    Returns:
+        Path of written file
+    """
+    revision = git_revision()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{revision}.json"
+    document = {
+        "revision": revision,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "settings": settings,
+        "scenarios": results,
+    }
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n")
+    return path
+
+
+def load_results(path_or_revision: str, results_dir: Path = RESULTS_DIR) -> dict[str, Any]:
+    """
+    Load saved results by file path or revision
+
+    Args:
+        path_or_revision: JSON file path or revision label
+        results_dir: Directory searched for revision labels
+
+    Returns:
+        Results document
+    """
+    path = Path(path_or_revision)
+    if not path.exists():
+        path = results_dir / f"{path_or_revision}.json"
+    if not path.exists():
+        raise FileNotFoundError(f"Результаты не найдены: {path_or_revision}")
+    return json.loads(path.read_text())
+
+
+def compare_results(base: dict[str, Any], head: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Compare two result documents scenario by scenario
+
+    Args:
+        base: Baseline results document
+        head: New results document
+
+    Returns:
+        Rows with base/head values and relative change per metric;
+        scenarios present in only one document are skipped
+    """
+    rows = []
+    for name, head_summary in head["scenarios"].items():
+        base_summary = base["scenarios"].get(name)
+        if base_summary is None:
+            continue
+        row = {"scenario": name}
+        for metric in COMPARED_METRICS:
+            before, after = base_summary[metric], head_summary[metric]
+            change = (after - before) / before * 100 if before else 0.0
+            row[metric] = (before, after, round(change, 1))
+        rows.append(row)
+    return rows
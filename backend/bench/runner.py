@@ -0,0 +1,251 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fastapi import FastAPI
+
+from backend.config import get_settings
+from backend.core.database import fetch_one, fetch_val
+from backend.core.security import create_access_token
+
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    One benchmarked endpoint
+
+    The path factory gets a seeded random generator and the id ranges of
+    the loaded dataset, so runs with the same seed request the same URLs
+    """
+    name: str
+    path: Callable[[random.Random, dict[str, tuple[int, int]]], str]
+    auth: bool = False
+
+
+def _pick(rng: random.Random, ids: dict[str, tuple[int, int]], table: str) -> int:
+    low, high = ids[table]
+    return rng.randint(low, high)
+
+
+SCENARIOS = [
+    Scenario("projects.list", lambda rng, ids: f"/projects?page={rng.randint(1, 20)}&include_total=false"),
+    Scenario("projects.list_large", lambda rng, ids: f"/projects?page={rng.randint(1, 10)}&page_size=100&include_total=false"),
+    Scenario("projects.list_total", lambda rng, ids: f"/projects?page={rng.randint(1, 20)}&page_size=50"),
+    Scenario("projects.search", lambda rng, ids: f"/projects?q=project+{rng.randint(1, 999)}"),
+    Scenario("projects.by_team", lambda rng, ids: f"/projects?team_id={_pick(rng, ids, 'teams')}"),
+    Scenario("projects.get", lambda rng, ids: f"/projects/{_pick(rng, ids, 'projects')}"),
+    Scenario("projects.technologies", lambda rng, ids: f"/projects/{_pick(rng, ids, 'projects')}/technologies"),
+    Scenario("technologies.list", lambda rng, ids: f"/technologies?page={rng.randint(1, 10)}&page_size=50"),
+    Scenario("technologies.get", lambda rng, ids: f"/technologies/{_pick(rng, ids, 'technologies')}"),
+    Scenario("technologies.stats", lambda rng, ids: "/technologies/stats"),
+    Scenario("teams.list", lambda rng, ids: f"/teams?page={rng.randint(1, 10)}&page_size=20"),
+    Scenario("dashboard.stats", lambda rng, ids: "/dashboard/stats", auth=True),
+]
+
+
+class ASGIClient:
+    """
+    Minimal in-process HTTP client calling the ASGI app directly
+
+    No sockets or HTTP parsing are involved, so measured latency is the
+    application's own (routing, queries, serialization)
+    """
+    def __init__(self, app: FastAPI):
+        self.app = app
+
+    async def get(self, path: str, headers: dict[str, str] | None = None) -> tuple[int, int]:
+        """
+        Send GET request
+
+        Args:
+            path: Path with query string
+            headers: Request headers
+
+        Returns:
+            Tuple of (status code, response body size)
+        """
+        raw_path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": raw_path,
+            "raw_path": raw_path.encode(),
+            "root_path": "",
+            "query_string": query.encode(),
+            "headers": [(b"host", b"bench")] + [
+                (key.lower().encode(), value.encode()) for key, value in (headers or {}).items()
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("bench", 80),
+        }
+        status = 0
+        size = 0
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return status, size
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """
+    Nearest-rank percentile
+
+    Args:
+        sorted_values: Values sorted ascending
+        pct: Percentile (0-100)
+
+    Returns:
+        Percentile value
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    """
+    Build latency summary of one scenario
+
+    Args:
+        latencies: Request latencies in seconds
+        errors: Number of non-2xx responses
+        elapsed: Wall time of the scenario in seconds
+
+    Returns:
+        Request count, throughput and latency percentiles in milliseconds
+    """
+    values = sorted(latencies)
+    summary = {
+        "requests": len(values),
+        "errors": errors,
+        "rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}_ms"] = round(percentile(values, pct) * 1000, 3)
+    summary["max_ms"] = round(values[-1] * 1000, 3) if values else 0.0
+    return summary
+
+
+async def _dataset_ids() -> dict[str, tuple[int, int]]:
+    ids = {}
+    for table in ("projects", "technologies", "teams"):
+        row = await fetch_one(f"SELECT COALESCE(MIN(id), 0) as low, COALESCE(MAX(id), 0) as high FROM {table}")
+        ids[table] = (row["low"], row["high"])
+    return ids
+
+
+async def run_scenario(
+    client: ASGIClient,
+    scenario: Scenario,
+    ids: dict[str, tuple[int, int]],
+    headers: dict[str, str],
+    concurrency: int,
+    requests: int,
+    warmup: int,
+    seed: int,
+) -> dict[str, Any]:
+    """
+    Drive one scenario with concurrent clients
+
+    Args:
+        client: In-process client
+        scenario: Scenario to run
+        ids: Id ranges of the dataset
+        headers: Headers for authenticated scenarios
+        concurrency: Number of concurrent clients
+        requests: Measured requests in total
+        warmup: Unmeasured requests sent first
+        seed: Seed of generated URLs
+
+    Returns:
+        Scenario summary
+    """
+    prefix = get_settings().app.api_v1_prefix
+    rng = random.Random(f"{seed}:{scenario.name}")
+    paths = [prefix + scenario.path(rng, ids) for _ in range(warmup + requests)]
+    request_headers = headers if scenario.auth else {}
+
+    for path in paths[:warmup]:
+        await client.get(path, request_headers)
+
+    queue = iter(paths[warmup:])
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for path in queue:
+            started = time.perf_counter()
+            status, _ = await client.get(path, request_headers)
+            latencies.append(time.perf_counter() - started)
+            if status >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def run_benchmark(
+    app: FastAPI,
+    scenarios: list[Scenario],
+    concurrency: int = 16,
+    requests: int = 500,
+    warmup: int = 20,
+    seed: int = 42,
+    on_result: Callable[[str, dict[str, Any]], None] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Run scenarios one after another against the app in this process
+
+    The app lifespan (pool, caches, change feed) is started for the run
+
+    Args:
+        app: FastAPI application
+        scenarios: Scenarios to run
+        concurrency: Concurrent clients per scenario
+        requests: Measured requests per scenario
+        warmup: Unmeasured requests per scenario
+        seed: Seed of generated URLs
+        on_result: Callback receiving each scenario summary as it finishes
+
+    Returns:
+        Mapping of scenario name to summary
+    """
+    client = ASGIClient(app)
+    results = {}
+
+    async with app.router.lifespan_context(app):
+        ids = await _dataset_ids()
+        admin_id = await fetch_val(
+            "SELECT id FROM users WHERE is_admin AND is_active ORDER BY id LIMIT 1"
+        )
+        if admin_id is None and any(scenario.auth for scenario in scenarios):
+            raise ValueError("Нет активного администратора для сценариев с авторизацией")
+        headers = {"Authorization": f"Bearer {create_access_token({'user_id': admin_id})}"}
+
+        for scenario in scenarios:
+            result = await run_scenario(client, scenario, ids, headers, concurrency, requests, warmup, seed)
+            results[scenario.name] = result
+            if on_result is not None:
+                on_result(scenario.name, result)
+
+    return results
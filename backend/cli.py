@@ -1,13 +1,23 @@
 import argparse
 import asyncio
+import importlib
+import importlib.util
+import os
 import sys
 from pathlib import Path
 
 import asyncpg
 import uvicorn
 
+from backend.bench.generator import SCALES, load_dataset, resolve_scale
+from backend.bench.results import RESULTS_DIR, compare_results, load_results, save_results
+from backend.bench.runner import SCENARIOS, run_benchmark
+from backend.bench.serialization import BASELINE, encoder_name, run_serialization_benchmark
 from backend.config import get_settings
 from backend.core.security import get_password_hash
+from backend.services.bulk import IMPORT_FORMATS, BulkService
+
+FILE_CHUNK_SIZE = 64 * 1024
 
 
 class MigrationManager:
@@ -338,6 +348,311 @@ class UserManager:
         print(f"    Role: {'Admin' if user['is_admin'] else 'User'}")
 
 
+class StatsManager:
+    """
+    Technology stats counters management
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.conn: asyncpg.Connection | None = None
+
+    async def connect(self) -> None:
+        """
+        Connect to database
+        """
+        self.conn = await asyncpg.connect(
+            host=self.settings.database.host,
+            port=self.settings.database.port,
+            user=self.settings.database.username,
+            password=self.settings.database.password,
+            database=self.settings.database.database,
+        )
+
+    async def disconnect(self) -> None:
+        """
+        Disconnect from database
+        """
+        if self.conn:
+            await self.conn.close()
+            self.conn = None
+
+    async def rebuild(self) -> None:
+        """
+        Rebuild stats counters from scratch and report drift
+        """
+        print("[*] Rebuilding technology stats counters...")
+
+        async with self.conn.transaction():
+            drifted = await self.conn.fetchval("SELECT rebuild_technology_stats()")
+
+        if drifted:
+            print(f"[WARN] Fixed {drifted} drifted counter row(s)")
+        else:
+            print("[OK] Counters are consistent")
+
+
+class BulkManager:
+    """
+    Bulk import/export of projects and technologies
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.conn: asyncpg.Connection | None = None
+
+    async def connect(self) -> None:
+        """
+        Connect to database
+        """
+        self.conn = await asyncpg.connect(
+            host=self.settings.database.host,
+            port=self.settings.database.port,
+            user=self.settings.database.username,
+            password=self.settings.database.password,
+            database=self.settings.database.database,
+        )
+
+    async def disconnect(self) -> None:
+        """
+        Disconnect from database
+        """
+        if self.conn:
+            await self.conn.close()
+            self.conn = None
+
+    @staticmethod
+    def resolve_format(path: Path, fmt: str | None) -> str:
+        """
+        Resolve file format from argument or extension
+
+        Args:
+            path: File path
+            fmt: Explicit format
+
+        Returns:
+            Format name
+        """
+        if fmt:
+            return fmt
+        return "csv" if path.suffix.lower() == ".csv" else "ndjson"
+
+    @staticmethod
+    async def read_chunks(path: Path):
+        """
+        Read file in chunks
+
+        Args:
+            path: File path
+
+        Yields:
+            Byte chunks
+        """
+        with path.open("rb") as f:
+            while chunk := f.read(FILE_CHUNK_SIZE):
+                yield chunk
+
+    async def import_file(self, path: Path, fmt: str | None) -> None:
+        """
+        Import file into registry
+
+        Args:
+            path: Source file
+            fmt: File format
+        """
+        if not path.exists():
+            print(f"[ERROR] File not found: {path}")
+            sys.exit(1)
+
+        fmt = self.resolve_format(path, fmt)
+        print(f"[*] Importing {path} ({fmt})...")
+
+        report = await BulkService.import_records(self.conn, self.read_chunks(path), fmt)
+
+        print(f"[OK] Imported {report['imported_rows']} of {report['rows']} row(s)")
+        print(f"    Projects created: {report['projects_created']}")
+        print(f"    Projects updated: {report['projects_updated']}")
+        print(f"    Technologies created: {report['technologies_created']}")
+        print(f"    Links upserted: {report['links_upserted']}")
+
+        if report["error_count"]:
+            print(f"[WARN] {report['error_count']} row(s) rejected")
+            for error in report["errors"]:
+                print(f"    line {error['line']}: {error['message']}")
+
+    async def export_file(self, path: Path, fmt: str | None) -> None:
+        """
+        Export registry into file
+
+        Args:
+            path: Target file
+            fmt: File format
+        """
+        fmt = self.resolve_format(path, fmt)
+        print(f"[*] Exporting to {path} ({fmt})...")
+
+        size = 0
+        with path.open("wb") as f:
+            async for chunk in BulkService.export_records(self.conn, fmt):
+                f.write(chunk)
+                size += len(chunk)
+
+        print(f"[OK] Written {size} bytes")
+
+
+class BenchManager:
+    """
+    Benchmark dataset generation, runs and comparison
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.conn: asyncpg.Connection | None = None
+
+    async def connect(self) -> None:
+        """
+        Connect to database
+        """
+        self.conn = await asyncpg.connect(
+            host=self.settings.database.host,
+            port=self.settings.database.port,
+            user=self.settings.database.username,
+            password=self.settings.database.password,
+            database=self.settings.database.database,
+        )
+
+    async def disconnect(self) -> None:
+        """
+        Disconnect from database
+        """
+        if self.conn:
+            await self.conn.close()
+            self.conn = None
+
+    async def seed(self, args: argparse.Namespace) -> None:
+        """
+        Load synthetic dataset
+
+        Args:
+            args: Parsed arguments with scale preset and overrides
+        """
+        scale = resolve_scale(
+            args.scale,
+            users=args.users,
+            teams=args.teams,
+            technologies=args.technologies,
+            projects=args.projects,
+            technologies_per_project=args.technologies_per_project,
+            seed=args.seed,
+        )
+
+        if args.reset:
+            print("[WARN] Registry tables will be truncated before loading")
+        print(f"[*] Generating '{args.scale}' dataset: {scale.projects} projects x "
+              f"{scale.technologies_per_project} technologies (seed {scale.seed})...")
+
+        await self.connect()
+        loaded = await load_dataset(self.conn, scale, reset=args.reset)
+
+        print("[OK] Dataset loaded")
+        for table, count in loaded.items():
+            print(f"    {table}: {count}")
+
+    async def run(self, args: argparse.Namespace) -> None:
+        """
+        Run scenarios against the app in this process and save results
+
+        Args:
+            args: Parsed arguments with run parameters
+        """
+        from backend.main import app
+
+        scenarios = SCENARIOS
+        if args.scenarios:
+            selected = set(args.scenarios.split(","))
+            unknown = selected - {scenario.name for scenario in SCENARIOS}
+            if unknown:
+                print(f"[ERROR] Unknown scenarios: {', '.join(sorted(unknown))}")
+                sys.exit(1)
+            scenarios = [scenario for scenario in SCENARIOS if scenario.name in selected]
+
+        print(f"[*] Running {len(scenarios)} scenario(s): "
+              f"{args.requests} requests, {args.concurrency} concurrent clients")
+        print(f"    {'scenario':<24} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+
+        def report(name: str, result: dict) -> None:
+            print(f"    {name:<24} {result['rps']:>8} {result['p50_ms']:>9} "
+                  f"{result['p95_ms']:>9} {result['p99_ms']:>9} {result['errors']:>7}")
+
+        results = await run_benchmark(
+            app,
+            scenarios,
+            concurrency=args.concurrency,
+            requests=args.requests,
+            warmup=args.warmup,
+            seed=args.seed,
+            on_result=report,
+        )
+
+        await self.connect()
+        counts = {
+            table: await self.conn.fetchval(f"SELECT COUNT(*) FROM {table}")
+            for table in ("projects", "technologies", "project_technologies", "teams", "users")
+        }
+        path = save_results(
+            results,
+            {
+                "concurrency": args.concurrency,
+                "requests": args.requests,
+                "warmup": args.warmup,
+                "seed": args.seed,
+                "pool_size": self.settings.database.max_pool_size,
+                "dataset": counts,
+            },
+            Path(args.output) if args.output else RESULTS_DIR,
+        )
+        print(f"[OK] Results saved to {path}")
+
+    @staticmethod
+    def serialization(args: argparse.Namespace) -> None:
+        """
+        Print CPU time of row-to-JSON pipelines for one list page
+
+        Args:
+            args: Parsed arguments with page shape and iterations
+        """
+        print(f"[*] Encoding {args.rows} project rows with {args.technologies} technologies each, "
+              f"{args.iterations} pages per round (plain data encoder: {encoder_name()})")
+        print(f"    {'pipeline':<16} {'page us':>10} {'row us':>8} {'saved us':>9} {'speedup':>8}")
+        results = run_serialization_benchmark(args.rows, args.technologies, args.iterations, args.seed)
+        for name, result in results.items():
+            print(f"    {name:<16} {result['page_us']:>10} {result['row_us']:>8} "
+                  f"{result['saved_row_us']:>9} {result['speedup']:>7}x")
+        print(f"[OK] Savings are per row against {BASELINE}")
+
+    @staticmethod
+    def compare(base: str, head: str) -> None:
+        """
+        Print latency and throughput changes between two saved runs
+
+        Args:
+            base: Baseline revision or file
+            head: New revision or file
+        """
+        base_doc = load_results(base)
+        head_doc = load_results(head)
+        print(f"[*] Comparing {base_doc['revision']} -> {head_doc['revision']}")
+
+        if base_doc["settings"].get("dataset") != head_doc["settings"].get("dataset"):
+            print("[WARN] Runs used different datasets")
+
+        print(f"    {'scenario':<24} {'metric':<7} {'base':>10} {'head':>10} {'change':>9}")
+        for row in compare_results(base_doc, head_doc):
+            for metric in ("p50_ms", "p95_ms", "p99_ms", "rps"):
+                before, after, change = row[metric]
+                print(f"    {row['scenario']:<24} {metric:<7} {before:>10} {after:>10} {change:>+8.1f}%")
+
+
 def create_parser() -> argparse.ArgumentParser:
     """
     Create CLI argument parser
@@ -354,10 +669,23 @@ def create_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     serve_parser = subparsers.add_parser("serve", help="Start FastAPI server")
-    serve_parser.add_argument("--host", default="0.0.0.0", help="Host to bind (default: 0.0.0.0)")
-    serve_parser.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
-    serve_parser.add_argument("--reload", action="store_true", help="Enable auto-reload")
-    serve_parser.add_argument("--workers", type=int, default=1, help="Number of workers (default: 1)")
+    server_settings = get_settings().server
+    serve_parser.add_argument(
+        "--host", default=server_settings.host, help=f"Host to bind (default: {server_settings.host})"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=server_settings.port, help=f"Port to bind (default: {server_settings.port})"
+    )
+    serve_parser.add_argument("--reload", action="store_true", help="Enable auto-reload (single worker)")
+    serve_parser.add_argument(
+        "--workers", type=int, default=server_settings.workers,
+        help=f"Number of worker processes (default: WEB_CONCURRENCY or {server_settings.workers})",
+    )
+    serve_parser.add_argument(
+        "--graceful-timeout", type=int, default=server_settings.graceful_shutdown_seconds,
+        help="Seconds to wait for in-flight requests on shutdown "
+             f"(default: {server_settings.graceful_shutdown_seconds})",
+    )
 
     migrate_parser = subparsers.add_parser("migrate", help="Database migrations")
     migrate_subparsers = migrate_parser.add_subparsers(dest="migrate_command", help="Migration commands")
@@ -385,6 +713,52 @@ def create_parser() -> argparse.ArgumentParser:
     user_create.add_argument("--name", help="User full name")
     user_create.add_argument("--admin", action="store_true", help="Create admin user")
 
+    stats_parser = subparsers.add_parser("stats", help="Technology stats counters")
+    stats_subparsers = stats_parser.add_subparsers(dest="stats_command", help="Stats commands")
+
+    stats_subparsers.add_parser("rebuild", help="Check and rebuild counters from scratch")
+
+    import_parser = subparsers.add_parser("import", help="Bulk import projects and technologies from NDJSON/CSV file")
+    import_parser.add_argument("file", help="Source file")
+    import_parser.add_argument("--format", choices=IMPORT_FORMATS, help="File format (default: by extension)")
+
+    export_parser = subparsers.add_parser("export", help="Export projects and technologies to NDJSON/CSV file")
+    export_parser.add_argument("file", help="Target file")
+    export_parser.add_argument("--format", choices=IMPORT_FORMATS, help="File format (default: by extension)")
+
+    bench_parser = subparsers.add_parser("bench", help="Benchmark dataset and load tests")
+    bench_subparsers = bench_parser.add_subparsers(dest="bench_command", help="Bench commands")
+
+    bench_seed = bench_subparsers.add_parser("seed", help="Load deterministic synthetic dataset with COPY")
+    bench_seed.add_argument("--scale", choices=sorted(SCALES), default="small", help="Dataset size preset")
+    bench_seed.add_argument("--users", type=int, help="Override number of users")
+    bench_seed.add_argument("--teams", type=int, help="Override number of teams")
+    bench_seed.add_argument("--technologies", type=int, help="Override number of technologies")
+    bench_seed.add_argument("--projects", type=int, help="Override number of projects")
+    bench_seed.add_argument("--technologies-per-project", type=int, help="Override technologies per project")
+    bench_seed.add_argument("--seed", type=int, help="Random seed (default: 42)")
+    bench_seed.add_argument("--reset", action="store_true", help="Truncate registry tables first")
+
+    bench_run = bench_subparsers.add_parser("run", help="Run scenarios in-process and save results")
+    bench_run.add_argument("--scenarios", help="Comma-separated scenario names (default: all)")
+    bench_run.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    bench_run.add_argument("--requests", type=int, default=500, help="Measured requests per scenario")
+    bench_run.add_argument("--warmup", type=int, default=20, help="Warmup requests per scenario")
+    bench_run.add_argument("--seed", type=int, default=42, help="Seed of requested URLs")
+    bench_run.add_argument("--output", help=f"Results directory (default: {RESULTS_DIR})")
+
+    bench_serialization = bench_subparsers.add_parser(
+        "serialization", help="Time row-to-JSON pipelines of a list page (no database)"
+    )
+    bench_serialization.add_argument("--rows", type=int, default=100, help="Rows per page")
+    bench_serialization.add_argument("--technologies", type=int, default=10, help="Technologies per row")
+    bench_serialization.add_argument("--iterations", type=int, default=200, help="Pages encoded per round")
+    bench_serialization.add_argument("--seed", type=int, default=42, help="Seed of generated rows")
+
+    bench_compare = bench_subparsers.add_parser("compare", help="Compare two saved runs")
+    bench_compare.add_argument("base", help="Baseline revision or results file")
+    bench_compare.add_argument("head", help="New revision or results file")
+
     return parser
 
 
@@ -459,26 +833,151 @@ async def handle_user(args: argparse.Namespace) -> None:
         await manager.disconnect()
 
 
+async def handle_stats(args: argparse.Namespace) -> None:
+    """
+    Handle stats commands
+
+    Args:
+        args: Parsed arguments
+    """
+    manager = StatsManager()
+
+    try:
+        await manager.connect()
+
+        if args.stats_command == "rebuild":
+            await manager.rebuild()
+
+        else:
+            print("[ERROR] Unknown stats command")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\n[ERROR] {e}")
+        sys.exit(1)
+
+    finally:
+        await manager.disconnect()
+
+
+async def handle_bulk(args: argparse.Namespace) -> None:
+    """
+    Handle import/export commands
+
+    Args:
+        args: Parsed arguments
+    """
+    manager = BulkManager()
+
+    try:
+        await manager.connect()
+
+        if args.command == "import":
+            await manager.import_file(Path(args.file), args.format)
+
+        else:
+            await manager.export_file(Path(args.file), args.format)
+
+    except Exception as e:
+        print(f"\n[ERROR] {e}")
+        sys.exit(1)
+
+    finally:
+        await manager.disconnect()
+
+
+async def handle_bench(args: argparse.Namespace) -> None:
+    """
+    Handle bench commands
+
+    Args:
+        args: Parsed arguments
+    """
+    manager = BenchManager()
+
+    try:
+        if args.bench_command == "seed":
+            await manager.seed(args)
+
+        elif args.bench_command == "run":
+            await manager.run(args)
+
+        elif args.bench_command == "serialization":
+            manager.serialization(args)
+
+        elif args.bench_command == "compare":
+            manager.compare(args.base, args.head)
+
+        else:
+            print("[ERROR] Unknown bench command")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\n[ERROR] {e}")
+        sys.exit(1)
+
+    finally:
+        await manager.disconnect()
+
+
 def handle_serve(args: argparse.Namespace) -> None:
     """
     Handle serve command
 
+    Without --reload runs the production server: worker processes share
+    the pool budget, uvloop and httptools are used when installed, and
+    SIGTERM drains in-flight requests before the database pool is closed
+
     Args:
         args: Parsed arguments
     """
+    workers = 1 if args.reload else max(1, args.workers)
+
+    # Worker processes read settings from the environment; the pool of each
+    # worker is sized from the number of workers
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    get_settings.cache_clear()
+    settings = get_settings()
+    min_pool, max_pool = settings.database.worker_pool_sizes(workers)
+
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
     print("[*] Starting Stack Radar FastAPI server...")
     print(f"    Host: {args.host}")
     print(f"    Port: {args.port}")
     print(f"    Reload: {'Enabled' if args.reload else 'Disabled'}")
-    print(f"    Workers: {args.workers}")
+    print(f"    Workers: {workers}")
+    print(f"    DB pool per worker: {min_pool}-{max_pool}")
+    replicas = settings.database.replica_addresses()
+    if replicas:
+        print(f"    Read replicas: {', '.join(f'{host}:{port}' for host, port in replicas)} ({settings.database.replica_routing})")
+    print(f"    Event loop: {loop}, HTTP parser: {http}")
+    print(f"    Graceful shutdown: {args.graceful_timeout}s")
     print()
 
+    if not args.reload and (loop == "asyncio" or http == "h11"):
+        print("[WARN] uvloop/httptools not installed, install uvicorn[standard] for production")
+
+    if workers > 1:
+        # Fail in the supervisor on import errors instead of in every worker
+        try:
+            importlib.import_module("backend.main")
+        except Exception as e:
+            print(f"[ERROR] Failed to load application: {e}")
+            sys.exit(1)
+
     uvicorn.run(
         "backend.main:app",
         host=args.host,
         port=args.port,
         reload=args.reload,
-        workers=args.workers if not args.reload else 1,
+        workers=workers,
+        loop=loop,
+        http=http,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        timeout_keep_alive=settings.server.keepalive_seconds,
+        proxy_headers=True,
         log_level="info",
     )
 
@@ -509,6 +1008,21 @@ def main() -> None:
             sys.exit(1)
         asyncio.run(handle_user(args))
 
+    elif args.command == "stats":
+        if not args.stats_command:
+            print("[ERROR] Stats command required (rebuild)")
+            sys.exit(1)
+        asyncio.run(handle_stats(args))
+
+    elif args.command in ("import", "export"):
+        asyncio.run(handle_bulk(args))
+
+    elif args.command == "bench":
+        if not args.bench_command:
+            print("[ERROR] Bench command required (seed, run, compare)")
+            sys.exit(1)
+        asyncio.run(handle_bench(args))
+
     else:
         print(f"[ERROR] Unknown command: {args.command}")
         parser.print_help()
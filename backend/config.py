@@ -1,5 +1,5 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 
 
@@ -15,11 +15,51 @@ class DatabaseConfig:
     database: str
     min_pool_size: int = 5
     max_pool_size: int = 20
+    slow_query_threshold_ms: float = 500.0
+    slow_query_explain: bool = False
+    slow_query_log_size: int = 100
+    statement_cache_size: int = 256
+    statement_cache_lifetime_seconds: float = 3600.0
+    replica_hosts: list[str] = field(default_factory=list)
+    replica_routing: str = "round_robin"
+    replica_check_interval_seconds: float = 5.0
+    replica_timeout_seconds: float = 2.0
+    read_your_writes_seconds: float = 5.0
 
     @property
     def dsn(self) -> str:
         return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
 
+    def worker_pool_sizes(self, workers: int) -> tuple[int, int]:
+        """
+        Split pool limits between server worker processes
+
+        DB_MAX_POOL_SIZE is the connection budget of the whole server, so
+        adding workers does not multiply connections to PostgreSQL
+
+        Args:
+            workers: Number of worker processes
+
+        Returns:
+            Tuple of (min size, max size) of one worker's pool
+        """
+        max_size = max(1, self.max_pool_size // max(1, workers))
+        return min(self.min_pool_size, max_size), max_size
+
+    def replica_addresses(self) -> list[tuple[str, int]]:
+        """
+        Parse replica hosts ("host" or "host:port", primary port by default)
+
+        Returns:
+            List of (host, port) tuples
+        """
+        addresses = []
+        for entry in self.replica_hosts:
+            host, _, port = entry.strip().partition(":")
+            if host:
+                addresses.append((host, int(port) if port else self.port))
+        return addresses
+
 
 @dataclass
 class AuthConfig:
@@ -29,6 +69,52 @@ class AuthConfig:
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24
+    hash_workers: int = 4
+    hash_queue_size: int = 32
+    hash_pool: str = "thread"
+    principal_cache_size: int = 10000
+    principal_cache_ttl_seconds: float = 60.0
+
+
+@dataclass
+class CacheConfig:
+    """
+    In-process cache configuration
+    """
+    dashboard_ttl_seconds: float = 30.0
+    reference_ttl_seconds: float = 300.0
+    table_versions_ttl_seconds: float = 60.0
+    proxy_ttl_seconds: int = 1
+    radar_refresh_debounce_seconds: float = 2.0
+    radar_refresh_max_delay_seconds: float = 30.0
+
+
+@dataclass
+class JobsConfig:
+    """
+    Background jobs configuration
+
+    Daily times are "HH:MM" in UTC; an empty value disables the schedule
+    """
+    scheduler_enabled: bool = True
+    max_concurrency: int = 2
+    archive_at: str = "03:00"
+    archive_inactive_days: int = 180
+    archive_batch_size: int = 500
+    stats_reconcile_at: str = "04:00"
+    radar_refresh_interval_seconds: float = 900.0
+
+
+@dataclass
+class ServerConfig:
+    """
+    HTTP server configuration
+    """
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1
+    graceful_shutdown_seconds: int = 30
+    keepalive_seconds: int = 5
 
 
 @dataclass
@@ -49,6 +135,9 @@ class Settings:
     database: DatabaseConfig
     auth: AuthConfig
     app: AppConfig
+    cache: CacheConfig
+    jobs: JobsConfig
+    server: ServerConfig
 
 
 @lru_cache
@@ -65,14 +154,53 @@ def get_settings() -> Settings:
             database=os.getenv("POSTGRES_DB", "stack_radar"),
             min_pool_size=int(os.getenv("DB_MIN_POOL_SIZE", "5")),
             max_pool_size=int(os.getenv("DB_MAX_POOL_SIZE", "20")),
+            slow_query_threshold_ms=float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "500")),
+            slow_query_explain=os.getenv("SLOW_QUERY_EXPLAIN", "false").lower() == "true",
+            slow_query_log_size=int(os.getenv("SLOW_QUERY_LOG_SIZE", "100")),
+            statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256")),
+            statement_cache_lifetime_seconds=float(os.getenv("DB_STATEMENT_CACHE_LIFETIME_SECONDS", "3600")),
+            replica_hosts=[host for host in os.getenv("DB_REPLICA_HOSTS", "").split(",") if host.strip()],
+            replica_routing=os.getenv("DB_REPLICA_ROUTING", "round_robin"),
+            replica_check_interval_seconds=float(os.getenv("DB_REPLICA_CHECK_INTERVAL_SECONDS", "5")),
+            replica_timeout_seconds=float(os.getenv("DB_REPLICA_TIMEOUT_SECONDS", "2")),
+            read_your_writes_seconds=float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5")),
         ),
         auth=AuthConfig(
             secret_key=os.getenv("SECRET_KEY", "your-secret-key-change-in-production"),
             algorithm=os.getenv("JWT_ALGORITHM", "HS256"),
             access_token_expire_minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440")),
+            hash_workers=int(os.getenv("PASSWORD_HASH_WORKERS", "4")),
+            hash_queue_size=int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32")),
+            hash_pool=os.getenv("PASSWORD_HASH_POOL", "thread"),
+            principal_cache_size=int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000")),
+            principal_cache_ttl_seconds=float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60")),
         ),
         app=AppConfig(
             debug=os.getenv("DEBUG", "false").lower() == "true",
             allowed_origins=os.getenv("ALLOWED_ORIGINS", "http://localhost:5173,http://localhost:3000").split(","),
         ),
+        cache=CacheConfig(
+            dashboard_ttl_seconds=float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "30")),
+            reference_ttl_seconds=float(os.getenv("REFERENCE_CACHE_TTL_SECONDS", "300")),
+            table_versions_ttl_seconds=float(os.getenv("TABLE_VERSIONS_CACHE_TTL_SECONDS", "60")),
+            proxy_ttl_seconds=int(os.getenv("HTTP_PROXY_CACHE_TTL_SECONDS", "1")),
+            radar_refresh_debounce_seconds=float(os.getenv("RADAR_REFRESH_DEBOUNCE_SECONDS", "2")),
+            radar_refresh_max_delay_seconds=float(os.getenv("RADAR_REFRESH_MAX_DELAY_SECONDS", "30")),
+        ),
+        jobs=JobsConfig(
+            scheduler_enabled=os.getenv("JOBS_SCHEDULER_ENABLED", "true").lower() == "true",
+            max_concurrency=int(os.getenv("JOBS_MAX_CONCURRENCY", "2")),
+            archive_at=os.getenv("ARCHIVE_SCHEDULE_AT", "03:00"),
+            archive_inactive_days=int(os.getenv("ARCHIVE_INACTIVE_DAYS", "180")),
+            archive_batch_size=int(os.getenv("ARCHIVE_BATCH_SIZE", "500")),
+            stats_reconcile_at=os.getenv("STATS_RECONCILE_SCHEDULE_AT", "04:00"),
+            radar_refresh_interval_seconds=float(os.getenv("RADAR_REFRESH_INTERVAL_SECONDS", "900")),
+        ),
+        server=ServerConfig(
+            host=os.getenv("SERVER_HOST", "0.0.0.0"),
+            port=int(os.getenv("SERVER_PORT", "8000")),
+            workers=max(1, int(os.getenv("WEB_CONCURRENCY", "1"))),
+            graceful_shutdown_seconds=int(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "30")),
+            keepalive_seconds=int(os.getenv("KEEPALIVE_SECONDS", "5")),
+        ),
     )
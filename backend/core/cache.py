@@ -0,0 +1,187 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from backend.core.metrics import Counter, Gauge, collector
+
+_MISSING = object()
+
+
+class _LoadCancelled(Exception):
+    """
+    The caller running a shared load was cancelled; waiters load again
+    """
+
+
+CACHE_LOOKUPS = Counter("cache_lookups_total", "In-process cache lookups by result", ("cache", "result"))
+CACHE_HIT_RATIO = Gauge("cache_hit_ratio", "In-process cache hit ratio since start", ("cache",))
+CACHE_ENTRIES = Gauge("cache_entries", "In-process cache entries", ("cache",))
+
+_registry: dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with per-entry TTL
+
+    Concurrent misses for the same key are collapsed into a single load
+    """
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._generation = 0
+        _registry[name] = self
+
+    @property
+    def generation(self) -> int:
+        """
+        Invalidation counter, changes whenever anything is invalidated
+        """
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get cached value
+
+        Args:
+            key: Cache key
+            default: Value returned on miss
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Store value in cache
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Entry TTL in seconds (defaults to cache TTL)
+        """
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable = _MISSING) -> None:
+        """
+        Drop one key or the whole cache
+
+        Loads that are in flight while invalidating are not stored
+
+        Args:
+            key: Cache key (omit to clear everything)
+        """
+        self._generation += 1
+        if key is _MISSING:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get cached value or load it once for all concurrent callers
+
+        If the caller running the load is cancelled, the callers waiting
+        for it are not: the next one of them runs the load again
+
+        Args:
+            key: Cache key
+            loader: Coroutine factory producing the value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except _LoadCancelled:
+                return await self.get_or_load(key, loader)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            # Only this caller is cancelled, the waiters retry the load
+            future.set_exception(_LoadCancelled())
+            future.exception()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited failure is not reported as lost
+            future.exception()
+            raise
+        else:
+            if generation == self._generation:
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Size, hit/miss counters and hit ratio
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    """
+    Get statistics of all registered caches
+
+    Returns:
+        Mapping of cache name to its statistics
+    """
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+
+@collector
+def _collect_cache_metrics() -> None:
+    for name, cache in _registry.items():
+        lookups = cache.hits + cache.misses
+        CACHE_LOOKUPS.set(cache.hits, name, "hit")
+        CACHE_LOOKUPS.set(cache.misses, name, "miss")
+        CACHE_HIT_RATIO.set(cache.hits / lookups if lookups else 0.0, name)
+        CACHE_ENTRIES.set(len(cache._entries), name)
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Callable
+
+import asyncpg
+
+from backend.config import get_settings
+from backend.core.database import after_commit
+from backend.core.replicas import ReplicaSet
+
+logger = logging.getLogger(__name__)
+
+ChangeListener = Callable[[frozenset[str]], None]
+
+CHANGES_CHANNEL = "stack_radar_changes"
+
+NOTIFYING_TABLES = frozenset({
+    "users",
+    "teams",
+    "team_members",
+    "technology_categories",
+    "technology_statuses",
+    "technologies",
+    "technology_versions",
+    "projects",
+    "project_technologies",
+})
+
+RECONNECT_DELAY_SECONDS = 5.0
+
+_listeners: list[ChangeListener] = []
+
+
+def on_change(listener: ChangeListener) -> ChangeListener:
+    """
+    Register listener for data changes
+
+    Args:
+        listener: Callable receiving the set of changed table names
+
+    Returns:
+        The listener (usable as decorator)
+    """
+    _listeners.append(listener)
+    return listener
+
+
+# Written tables are read from the primary during the read-your-writes window
+on_change(ReplicaSet.note_changed)
+
+
+def mark_changed(*tables: str) -> None:
+    """
+    Notify listeners that service writes touched the given tables
+
+    Inside a transactional request listeners are called after commit
+
+    Args:
+        *tables: Changed table names
+    """
+    changed = frozenset(tables)
+    after_commit(lambda: _notify(changed))
+
+
+def _notify(changed: frozenset[str]) -> None:
+    for listener in list(_listeners):
+        try:
+            listener(changed)
+        except Exception:
+            logger.exception("Change listener %r failed", listener)
+
+
+class ChangeFeed:
+    """
+    Bridge of PostgreSQL change notifications into the change hub
+
+    Writes made by other workers (and by anything else talking to the
+    database) are announced by triggers on the changes channel
+    """
+    _connection: asyncpg.Connection | None = None
+    _lost: asyncio.Event | None = None
+    _task: asyncio.Task | None = None
+
+    @classmethod
+    async def start(cls) -> None:
+        """
+        Start listening for change notifications
+        """
+        if cls._task is None:
+            await cls._listen()
+            cls._task = asyncio.create_task(cls._supervise())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        Stop listening and close the connection
+        """
+        task, cls._task = cls._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await cls._close()
+
+    @classmethod
+    async def _listen(cls) -> None:
+        settings = get_settings()
+        connection = await asyncpg.connect(
+            host=settings.database.host,
+            port=settings.database.port,
+            user=settings.database.username,
+            password=settings.database.password,
+            database=settings.database.database,
+        )
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        await connection.add_listener(CHANGES_CHANNEL, cls._on_notification)
+        cls._connection, cls._lost = connection, lost
+
+    @classmethod
+    async def _close(cls) -> None:
+        connection, cls._connection = cls._connection, None
+        if connection is not None and not connection.is_closed():
+            with suppress(Exception):
+                await connection.close()
+
+    @classmethod
+    async def _supervise(cls) -> None:
+        while True:
+            await cls._lost.wait()
+            logger.warning("Change feed connection lost, reconnecting")
+            await cls._close()
+
+            while True:
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                try:
+                    await cls._listen()
+                    break
+                except (OSError, asyncpg.PostgresError) as exc:
+                    logger.warning("Change feed reconnect failed: %s", exc)
+
+            # Notifications sent while disconnected are lost
+            _notify(NOTIFYING_TABLES)
+
+    @staticmethod
+    def _on_notification(connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        _notify(frozenset({payload}))
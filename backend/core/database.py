@@ -1,43 +1,110 @@
+import asyncio
+import logging
+import sys
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+from contextvars import ContextVar
+from functools import wraps
+from types import CodeType
+from typing import Any, AsyncGenerator, Awaitable, Callable, TypeVar
 
 import asyncpg
 from asyncpg import Pool
 
 from backend.config import get_settings
+from backend.core.metrics import Counter, Gauge, Histogram, collector
+from backend.core.queries import Query, StatementCache
+from backend.core.replicas import REPLICA_ERRORS, Replica, ReplicaSet
+from backend.core.slow_queries import SlowQueryLog
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+POOL_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Query execution time of fetch helpers by calling function",
+    ("caller",),
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_acquire_wait_seconds",
+    "Time spent waiting for a pool connection",
+    buckets=tuple(bound / 1000 for bound in POOL_WAIT_BUCKETS_MS),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Pool connections by state",
+    ("state",),
+)
+DB_POOL_MAX_SIZE = Gauge("db_pool_max_size", "Configured pool size limit")
+DB_POOL_REUSED = Counter(
+    "db_pool_reused_total",
+    "Queries served by the already acquired request connection",
+)
+
+_caller_labels: dict[CodeType, str] = {}
 
 
 class Database:
     """
     Database connection pool manager
+
+    Holds the primary pool and, when DB_REPLICA_HOSTS is set, the pools of
+    read replicas (see ReplicaSet) that serve methods marked replica_read
     """
     _pool: Pool | None = None
 
     @classmethod
     async def connect(cls) -> None:
         """
-        Initialize database connection pool
+        Initialize primary and replica connection pools
         """
         if cls._pool is None:
             settings = get_settings()
+            min_size, max_size = settings.database.worker_pool_sizes(settings.server.workers)
+            StatementCache.configure(
+                settings.database.statement_cache_size,
+                settings.database.statement_cache_lifetime_seconds,
+            )
+            pool_options = {
+                "user": settings.database.username,
+                "password": settings.database.password,
+                "database": settings.database.database,
+                "min_size": min_size,
+                "max_size": max_size,
+                "statement_cache_size": settings.database.statement_cache_size,
+                "max_cached_statement_lifetime": settings.database.statement_cache_lifetime_seconds,
+                "init": StatementCache.init_connection,
+            }
             cls._pool = await asyncpg.create_pool(
                 host=settings.database.host,
                 port=settings.database.port,
-                user=settings.database.username,
-                password=settings.database.password,
-                database=settings.database.database,
-                min_size=settings.database.min_pool_size,
-                max_size=settings.database.max_pool_size,
+                **pool_options,
             )
+            await ReplicaSet.connect(**pool_options)
 
     @classmethod
-    async def disconnect(cls) -> None:
+    async def disconnect(cls, timeout: float | None = None) -> None:
         """
         Close database connection pool
+
+        Waits for checked out connections to be released; connections
+        still busy after the timeout are terminated
+
+        Args:
+            timeout: Seconds to wait for busy connections (no limit if None)
         """
         if cls._pool is not None:
-            await cls._pool.close()
-            cls._pool = None
+            await SlowQueryLog.shutdown()
+            await ReplicaSet.disconnect(timeout)
+            pool, cls._pool = cls._pool, None
+            try:
+                await asyncio.wait_for(pool.close(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Database pool did not close in %s s, terminating connections", timeout)
+                pool.terminate()
 
     @classmethod
     def get_pool(cls) -> Pool:
@@ -52,76 +119,502 @@ class Database:
         return cls._pool
 
 
+class PoolStats:
+    """
+    Pool checkout counters and wait time histogram of this worker
+    """
+    acquires = 0
+    reused = 0
+    wait_total_ms = 0.0
+    wait_max_ms = 0.0
+    wait_buckets = [0] * (len(POOL_WAIT_BUCKETS_MS) + 1)
+
+    @classmethod
+    def record(cls, wait_ms: float) -> None:
+        """
+        Record one pool checkout
+
+        Args:
+            wait_ms: Time spent waiting for a connection
+        """
+        cls.acquires += 1
+        cls.wait_total_ms += wait_ms
+        cls.wait_max_ms = max(cls.wait_max_ms, wait_ms)
+        for index, bound in enumerate(POOL_WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                cls.wait_buckets[index] += 1
+                break
+        else:
+            cls.wait_buckets[-1] += 1
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        Get pool statistics
+
+        Returns:
+            Pool size, checkout counters and wait time distribution
+        """
+        pool = Database._pool
+        buckets = {f"le_{bound}ms": count for bound, count in zip(POOL_WAIT_BUCKETS_MS, cls.wait_buckets)}
+        buckets["gt_1000ms"] = cls.wait_buckets[-1]
+        return {
+            "size": pool.get_size() if pool else 0,
+            "idle": pool.get_idle_size() if pool else 0,
+            "min_size": pool.get_min_size() if pool else 0,
+            "max_size": pool.get_max_size() if pool else 0,
+            "acquires": cls.acquires,
+            "reused_in_request": cls.reused,
+            "wait_avg_ms": round(cls.wait_total_ms / cls.acquires, 3) if cls.acquires else 0.0,
+            "wait_max_ms": round(cls.wait_max_ms, 3),
+            "wait_buckets": buckets,
+        }
+
+
+async def _acquire_connection() -> asyncpg.Connection:
+    """
+    Check out connection from pool, recording wait time
+    """
+    pool = Database.get_pool()
+    started = time.perf_counter()
+    connection = await pool.acquire()
+    waited = time.perf_counter() - started
+    PoolStats.record(waited * 1000)
+    DB_POOL_WAIT.observe(waited)
+    return connection
+
+
+@collector
+def _collect_pool_metrics() -> None:
+    pool = Database._pool
+    size = pool.get_size() if pool else 0
+    idle = pool.get_idle_size() if pool else 0
+    DB_POOL_CONNECTIONS.set(size - idle, "busy")
+    DB_POOL_CONNECTIONS.set(idle, "idle")
+    DB_POOL_MAX_SIZE.set(pool.get_max_size() if pool else 0)
+    DB_POOL_REUSED.set(PoolStats.reused)
+
+
+def _caller_label() -> str:
+    """
+    Name of the function that called a fetch helper
+
+    Labels are cached per code object, so this costs one frame lookup
+    """
+    code = sys._getframe(2).f_code
+    label = _caller_labels.get(code)
+    if label is None:
+        label = _caller_labels[code] = code.co_qualname
+    return label
+
+
+def _statement(query: str | Query, caller: str) -> tuple[str, str]:
+    """
+    Resolve SQL text and statement cache label of a fetch helper argument
+    """
+    if isinstance(query, Query):
+        return query.sql, query.name
+    return query, caller
+
+
+def _record_query(query: str, args: tuple[Any, ...], caller: str, started: float, pool: Pool | None) -> None:
+    """
+    Record statement timing and report it if slow
+    """
+    elapsed = time.perf_counter() - started
+    DB_QUERY_DURATION.observe(elapsed, caller)
+    SlowQueryLog.observe(query, args, elapsed, caller, pool)
+
+
+class RequestScope:
+    """
+    Per-request unit of work
+
+    Holds one lazily acquired connection shared by all queries of a request
+    and the request's batch loaders. When marked transactional, the
+    connection runs inside a transaction that is committed or rolled back
+    once the response status is known.
+    """
+    def __init__(self):
+        self.connection: asyncpg.Connection | None = None
+        self.loaders: dict[str, Any] = {}
+        self.transactional = False
+        self._transaction = None
+        self._owner: asyncio.Task | None = None
+        self._depth = 0
+        self._after_commit: list[Callable[[], None]] = []
+
+    def in_transaction(self) -> bool:
+        """
+        Check whether the request writes or has a transaction open
+        """
+        if self.transactional:
+            return True
+        return self.connection is not None and self.connection.is_in_transaction()
+
+    def is_busy(self) -> bool:
+        """
+        Check whether the connection is in use by another task
+        """
+        return self._owner is not None and self._owner is not asyncio.current_task()
+
+    @asynccontextmanager
+    async def use(self) -> AsyncGenerator[asyncpg.Connection, None]:
+        """
+        Borrow the request connection, acquiring it on first use
+
+        Yields:
+            Database connection
+        """
+        # Claimed before the first await: other tasks of the request that
+        # arrive while the connection is being acquired see the scope busy
+        # and take their own connection instead of acquiring a second one
+        self._owner = asyncio.current_task()
+        self._depth += 1
+        try:
+            if self.connection is None:
+                self.connection = await _acquire_connection()
+            else:
+                PoolStats.reused += 1
+
+            if self.transactional and self._transaction is None:
+                transaction = self.connection.transaction()
+                await transaction.start()
+                self._transaction = transaction
+
+            yield self.connection
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Defer callback until the request transaction commits
+
+        Args:
+            callback: Callable to run after commit
+        """
+        self._after_commit.append(callback)
+
+    async def finish(self, commit: bool) -> None:
+        """
+        Commit or roll back the request transaction
+
+        Args:
+            commit: Commit if True, roll back otherwise
+        """
+        transaction, self._transaction = self._transaction, None
+        callbacks, self._after_commit = self._after_commit, []
+        self.transactional = False
+
+        if transaction is not None:
+            if commit:
+                await transaction.commit()
+            else:
+                await transaction.rollback()
+
+        if commit:
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("After-commit callback %r failed", callback)
+
+    async def release_idle(self) -> None:
+        """
+        Return the connection to pool if it holds no transaction and is not in use
+        """
+        if self.connection is None or self._owner is not None:
+            return
+        if self.transactional or self._transaction is not None:
+            return
+        connection, self.connection = self.connection, None
+        await Database.get_pool().release(connection)
+
+    async def close(self) -> None:
+        """
+        Roll back unfinished work and return connection to pool
+        """
+        connection, self.connection = self.connection, None
+        try:
+            if self._transaction is not None or self._after_commit:
+                await self.finish(commit=False)
+        finally:
+            if connection is not None:
+                await Database.get_pool().release(connection)
+
+
+_request_scope: ContextVar[RequestScope | None] = ContextVar("request_scope", default=None)
+_replica_tables: ContextVar[frozenset[str] | None] = ContextVar("replica_tables", default=None)
+
+
+class RequestScopeMiddleware:
+    """
+    ASGI middleware opening a request scope for every HTTP request
+
+    A transactional scope is committed right before the response starts if
+    the status is below 400 and rolled back otherwise
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_scope = RequestScope()
+        token = _request_scope.set(request_scope)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and request_scope.transactional:
+                await request_scope.finish(commit=message["status"] < 400)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_scope.reset(token)
+            await request_scope.close()
+
+
+async def request_transaction() -> None:
+    """
+    Dependency running the whole request in one transaction
+
+    Has no effect outside of a request scope
+    """
+    request_scope = _request_scope.get()
+    if request_scope is not None:
+        request_scope.transactional = True
+
+
+def replica_read(*tables: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Mark read-only service method whose fetch helper calls may use a replica
+
+    Reads are routed to a replica only inside a request that has no open
+    transaction and only when none of the tables was written within the
+    read-your-writes window; otherwise, and when no replica is healthy, they
+    go to the primary. Jobs and CLI commands always read from the primary.
+
+    Args:
+        *tables: Tables the method reads
+
+    Returns:
+        Decorator
+    """
+    read_tables = frozenset(tables)
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            token = _replica_tables.set(read_tables)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _replica_tables.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+def _read_replica() -> Replica | None:
+    """
+    Pick replica for a fetch helper call, None to use the primary
+    """
+    tables = _replica_tables.get()
+    if tables is None or not ReplicaSet.replicas:
+        return None
+    request_scope = _request_scope.get()
+    replica = None
+    if request_scope is not None and not request_scope.in_transaction():
+        replica = ReplicaSet.choose(tables)
+    if replica is None:
+        ReplicaSet.record_primary_read()
+    return replica
+
+
+def request_loaders() -> dict[str, Any] | None:
+    """
+    Get batch loaders of the current request
+
+    Returns:
+        Loaders by name, or None outside of a request scope
+    """
+    request_scope = _request_scope.get()
+    return request_scope.loaders if request_scope is not None else None
+
+
+async def release_request_connection() -> None:
+    """
+    Return idle request connection to pool before a long non-database wait
+
+    The connection is acquired again lazily on the next query
+    """
+    request_scope = _request_scope.get()
+    if request_scope is not None:
+        await request_scope.release_idle()
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """
+    Run callback after the request transaction commits
+
+    Runs immediately when there is no request transaction
+
+    Args:
+        callback: Callable to run
+    """
+    request_scope = _request_scope.get()
+    if request_scope is not None and request_scope.transactional:
+        request_scope.after_commit(callback)
+    else:
+        callback()
+
+
 @asynccontextmanager
-async def get_db_connection() -> AsyncGenerator[asyncpg.Connection, None]:
+async def get_db_connection(scoped: bool = True) -> AsyncGenerator[asyncpg.Connection, None]:
     """
-    Get database connection from pool
+    Get database connection
+
+    Inside a request the request-scoped connection is reused. Concurrent
+    tasks of the same request that find it busy get their own pool connection.
+
+    Args:
+        scoped: Reuse the request-scoped connection; pass False for reads
+            that must not see the request's uncommitted writes (shared caches)
 
     Yields:
         Database connection
     """
-    pool = Database.get_pool()
-    async with pool.acquire() as connection:
+    request_scope = _request_scope.get() if scoped else None
+    if request_scope is not None and not request_scope.is_busy():
+        async with request_scope.use() as connection:
+            yield connection
+        return
+
+    connection = await _acquire_connection()
+    try:
         yield connection
+    finally:
+        await Database.get_pool().release(connection)
+
+
+@asynccontextmanager
+async def transaction() -> AsyncGenerator[asyncpg.Connection, None]:
+    """
+    Get database connection with an open transaction
+
+    Commits on normal exit and rolls back on exception. Inside a
+    transactional request this becomes a savepoint.
+
+    Yields:
+        Database connection
+    """
+    async with get_db_connection() as connection:
+        async with connection.transaction():
+            yield connection
 
 
-async def fetch_one(query: str, *args: Any) -> dict[str, Any] | None:
+async def _fetch(method: str, query: str | Query, args: tuple[Any, ...], caller: str) -> Any:
+    """
+    Run read of a fetch helper on a replica or on the primary
+
+    A replica that fails is ejected and the read is repeated on the primary
+    """
+    sql, name = _statement(query, caller)
+    replica = _read_replica()
+    if replica is not None:
+        try:
+            async with ReplicaSet.connection(replica) as conn:
+                return await _run(conn, method, sql, name, args, caller, replica.pool)
+        except asyncpg.SerializationError:
+            # Canceled by a conflict with WAL replay, the replica is fine
+            ReplicaSet.record_primary_read()
+        except REPLICA_ERRORS as exc:
+            ReplicaSet.eject(replica, exc)
+            ReplicaSet.record_primary_read()
+
+    async with get_db_connection() as conn:
+        return await _run(conn, method, sql, name, args, caller, Database._pool)
+
+
+async def _run(
+    conn: asyncpg.Connection,
+    method: str,
+    sql: str,
+    name: str,
+    args: tuple[Any, ...],
+    caller: str,
+    pool: Pool | None,
+) -> Any:
+    StatementCache.lookup(conn, sql, name)
+    started = time.perf_counter()
+    try:
+        return await getattr(conn, method)(sql, *args)
+    finally:
+        _record_query(sql, args, caller, started, pool)
+
+
+async def fetch_one(query: str | Query, *args: Any) -> dict[str, Any] | None:
     """
     Execute query and fetch one row as dictionary
 
     Args:
-        query: SQL query
+        query: SQL query or registered query
         *args: Query parameters
 
     Returns:
         Row as dictionary or None if not found
     """
-    async with get_db_connection() as conn:
-        row = await conn.fetchrow(query, *args)
-        return dict(row) if row else None
+    row = await _fetch("fetchrow", query, args, _caller_label())
+    return dict(row) if row else None
 
 
-async def fetch_all(query: str, *args: Any) -> list[dict[str, Any]]:
+async def fetch_all(query: str | Query, *args: Any) -> list[dict[str, Any]]:
     """
     Execute query and fetch all rows as list of dictionaries
 
     Args:
-        query: SQL query
+        query: SQL query or registered query
         *args: Query parameters
 
     Returns:
         List of rows as dictionaries
     """
-    async with get_db_connection() as conn:
-        rows = await conn.fetch(query, *args)
-        return [dict(row) for row in rows]
+    rows = await _fetch("fetch", query, args, _caller_label())
+    return [dict(row) for row in rows]
 
 
-async def fetch_val(query: str, *args: Any) -> Any:
+async def fetch_val(query: str | Query, *args: Any) -> Any:
     """
     Execute query and fetch single value
 
     Args:
-        query: SQL query
+        query: SQL query or registered query
         *args: Query parameters
 
     Returns:
         Single value
     """
-    async with get_db_connection() as conn:
-        return await conn.fetchval(query, *args)
+    return await _fetch("fetchval", query, args, _caller_label())
 
 
-async def execute(query: str, *args: Any) -> str:
+async def execute(query: str | Query, *args: Any) -> str:
     """
     Execute query without returning results
 
     Args:
-        query: SQL query
+        query: SQL query or registered query
         *args: Query parameters
 
     Returns:
         Status message
     """
+    caller = _caller_label()
+    sql, name = _statement(query, caller)
     async with get_db_connection() as conn:
-        return await conn.execute(query, *args)
+        return await _run(conn, "execute", sql, name, args, caller, Database._pool)
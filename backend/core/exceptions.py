@@ -1,5 +1,5 @@
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 
 class APIException(Exception):
@@ -37,6 +37,23 @@ class ConflictException(APIException):
         super().__init__(message, status_code=status.HTTP_409_CONFLICT)
 
 
+class NotModifiedException(APIException):
+    """
+    Client copy is still valid, answered with an empty 304 response
+    """
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
+        super().__init__("Not modified", status_code=status.HTTP_304_NOT_MODIFIED)
+
+
+class TooManyRequestsException(APIException):
+    """
+    Server is saturated, client should retry later
+    """
+    def __init__(self, message: str = "Too many requests"):
+        super().__init__(message, status_code=status.HTTP_429_TOO_MANY_REQUESTS)
+
+
 async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
     """
     Handle API exceptions
@@ -46,8 +63,11 @@ async def api_exception_handler(request: Request, exc: APIException) -> JSONResp
         exc: Exception instance
 
     Returns:
-        JSON error response
+        JSON error response (empty response for 304)
     """
+    if isinstance(exc, NotModifiedException):
+        return Response(status_code=exc.status_code, headers=exc.headers)
+
     content = {"message": exc.message}
     if isinstance(exc, ValidationException) and exc.errors:
         content["errors"] = exc.errors
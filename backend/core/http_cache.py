@@ -0,0 +1,145 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable
+
+from fastapi import Request, Response
+
+from backend.config import get_settings
+from backend.core.cache import TTLCache
+from backend.core.changes import on_change
+from backend.core.database import fetch_all
+from backend.core.exceptions import NotModifiedException
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_version_cache = TTLCache(
+    "table_versions",
+    maxsize=256,
+    ttl=get_settings().cache.table_versions_ttl_seconds,
+)
+
+
+@on_change
+def _invalidate_versions(tables: frozenset[str]) -> None:
+    for table in tables:
+        _version_cache.invalidate(table)
+
+
+async def get_table_versions(tables: tuple[str, ...]) -> dict[str, tuple[int, datetime]]:
+    """
+    Get version counters of tables
+
+    Versions are kept in memory and dropped on local writes and on change
+    notifications from other workers
+
+    Args:
+        tables: Table names
+
+    Returns:
+        Mapping of table name to (version, last modification time)
+    """
+    versions = {}
+    missing = []
+    for table in tables:
+        cached = _version_cache.get(table)
+        if cached is None:
+            missing.append(table)
+        else:
+            versions[table] = cached
+
+    if missing:
+        generation = _version_cache.generation
+        rows = await fetch_all(
+            "SELECT table_name, version, updated_at FROM table_versions WHERE table_name = ANY($1)",
+            missing,
+        )
+        loaded = {row["table_name"]: (row["version"], row["updated_at"]) for row in rows}
+        for table in missing:
+            versions[table] = loaded.get(table, (0, _EPOCH))
+            # Do not store versions read before a concurrent invalidation
+            if generation == _version_cache.generation:
+                _version_cache.set(table, versions[table])
+
+    return versions
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def conditional(
+    *tables: str,
+    public: bool = True,
+    expansions: dict[str, tuple[str, ...]] | None = None,
+) -> Callable[..., Any]:
+    """
+    Create dependency adding validators to a read endpoint
+
+    The ETag is derived from the request URL and the version counters of
+    the tables the response is built from. A matching If-None-Match (or
+    If-Modified-Since) is answered with 304 before the endpoint runs.
+
+    Args:
+        *tables: Tables the response depends on
+        public: Response is the same for every client and may be stored by
+            shared caches (nginx); otherwise it is marked private
+        expansions: Tables read by each value of the endpoint's include
+            parameter, added to the ETag only when requested
+
+    Returns:
+        FastAPI dependency
+    """
+    base_tables = tuple(sorted(set(tables)))
+
+    async def dependency(request: Request, response: Response) -> None:
+        settings = get_settings()
+        tables = base_tables
+        include = request.query_params.get("include") if expansions else None
+        if include:
+            extra = {table for name in include.split(",") for table in expansions.get(name.strip(), ())}
+            tables = tuple(sorted(extra.union(base_tables)))
+        versions = await get_table_versions(tables)
+
+        fingerprint = "|".join([
+            request.url.path,
+            str(sorted(request.query_params.multi_items())),
+            *(f"{table}:{versions[table][0]}" for table in tables),
+        ])
+        etag = f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()[:20]}"'
+        last_modified = max(updated_at for _, updated_at in versions.values())
+
+        headers = {
+            "ETag": etag,
+            "Last-Modified": format_datetime(last_modified.astimezone(timezone.utc), usegmt=True),
+        }
+        if public:
+            headers["Cache-Control"] = "public, no-cache"
+            headers["X-Accel-Expires"] = str(settings.cache.proxy_ttl_seconds)
+        else:
+            headers["Cache-Control"] = "private, no-cache"
+
+        if_none_match = request.headers.get("if-none-match")
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_none_match is not None:
+            if _etag_matches(if_none_match, etag):
+                raise NotModifiedException(headers)
+        elif if_modified_since is not None and _not_modified_since(if_modified_since, last_modified):
+            raise NotModifiedException(headers)
+
+        response.headers.update(headers)
+
+    return dependency
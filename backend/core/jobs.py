@@ -0,0 +1,435 @@
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import socket
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Awaitable, Callable
+
+from backend.config import get_settings
+from backend.core.database import execute, fetch_all, fetch_one, fetch_val, get_db_connection
+from backend.core.exceptions import NotFoundException
+
+logger = logging.getLogger(__name__)
+
+RUN_COLUMNS = """
+    id, job_name, status, params, scheduled_for, triggered_by, worker,
+    progress_done, progress_total, message, result, error,
+    created_at, started_at, finished_at
+"""
+
+WORKER_NAME = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def parse_daily_time(value: str) -> time | None:
+    """
+    Parse "HH:MM" (UTC) schedule setting
+
+    Args:
+        value: Time string, empty to disable
+
+    Returns:
+        Time of day or None
+    """
+    if not value:
+        return None
+    hour, minute = value.split(":")
+    return time(int(hour), int(minute), tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """
+    Recurring schedule: fixed interval aligned to the epoch or daily at a
+    UTC time of day. Slots are computed the same way on every worker.
+    """
+    every_seconds: float | None = None
+    daily_at: time | None = None
+
+    def next_after(self, moment: datetime) -> datetime | None:
+        """
+        Get first slot strictly after moment
+
+        Args:
+            moment: Aware datetime
+
+        Returns:
+            Slot start or None if the schedule is disabled
+        """
+        if self.every_seconds:
+            slots = int(moment.timestamp() // self.every_seconds) + 1
+            return datetime.fromtimestamp(slots * self.every_seconds, timezone.utc)
+        if self.daily_at is not None:
+            slot = datetime.combine(moment.astimezone(timezone.utc).date(), self.daily_at)
+            return slot if slot > moment else slot + timedelta(days=1)
+        return None
+
+
+class JobContext:
+    """
+    Handle passed to a running job
+    """
+    def __init__(self, run_id: int, params: dict[str, Any], triggered_by: int | None):
+        self.run_id = run_id
+        self.params = params
+        self.triggered_by = triggered_by
+
+    async def progress(self, done: int, total: int | None = None, message: str | None = None) -> None:
+        """
+        Report job progress
+
+        Args:
+            done: Processed units
+            total: Total units, if known
+            message: Human-readable state
+        """
+        await execute(
+            """
+            UPDATE job_runs
+            SET progress_done = $2,
+                progress_total = COALESCE($3, progress_total),
+                message = COALESCE($4, message)
+            WHERE id = $1
+            """,
+            self.run_id,
+            done,
+            total,
+            message,
+        )
+
+
+JobFunc = Callable[[JobContext], Awaitable[dict[str, Any] | None]]
+
+
+@dataclass
+class Job:
+    """
+    Registered background job
+    """
+    name: str
+    func: JobFunc
+    description: str
+    schedule: Schedule = field(default_factory=Schedule)
+    default_params: dict[str, Any] = field(default_factory=dict)
+
+
+def _decode_run(row: dict[str, Any] | None) -> dict[str, Any] | None:
+    if row is None:
+        return None
+    for column in ("params", "result"):
+        if isinstance(row.get(column), str):
+            row[column] = json.loads(row[column])
+    return row
+
+
+class JobRunner:
+    """
+    In-process runner of background jobs
+
+    Runs are executed as tasks detached from any request, at most
+    max_concurrency at a time per worker. A job runs on one worker at a
+    time across the deployment (session advisory lock held for the run);
+    a run that finds the lock taken is recorded as skipped. Scheduled slots
+    are claimed through a unique index, so each slot runs once.
+    """
+    _jobs: dict[str, Job] = {}
+    _semaphore: asyncio.Semaphore | None = None
+    _scheduler: asyncio.Task | None = None
+    _tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def register(cls, job: Job) -> Job:
+        """
+        Register job
+
+        Args:
+            job: Job definition
+
+        Returns:
+            The job
+        """
+        cls._jobs[job.name] = job
+        return job
+
+    @classmethod
+    def jobs(cls) -> list[Job]:
+        """
+        Get registered jobs
+        """
+        return list(cls._jobs.values())
+
+    @classmethod
+    def get_job(cls, name: str) -> Job:
+        """
+        Get registered job by name
+
+        Raises:
+            NotFoundException: If job is not registered
+        """
+        job = cls._jobs.get(name)
+        if job is None:
+            raise NotFoundException(f'Задача "{name}" не найдена')
+        return job
+
+    @classmethod
+    async def start(cls) -> None:
+        """
+        Start scheduler of recurring jobs
+        """
+        settings = get_settings().jobs
+        cls._semaphore = asyncio.Semaphore(settings.max_concurrency)
+        if settings.scheduler_enabled and cls._scheduler is None:
+            cls._scheduler = cls._spawn(cls._schedule_loop())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        Stop scheduler and cancel running jobs
+
+        Cancelled runs are recorded as failed
+        """
+        scheduler, cls._scheduler = cls._scheduler, None
+        tasks = [task for task in (scheduler, *cls._tasks) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @classmethod
+    def _spawn(cls, coro: Awaitable[Any]) -> asyncio.Task:
+        # Fresh context: a run started from a request must not inherit the
+        # request-scoped connection, which is released when the request ends
+        task = asyncio.get_running_loop().create_task(coro, context=contextvars.Context())
+        cls._tasks.add(task)
+        task.add_done_callback(cls._tasks.discard)
+        return task
+
+    @classmethod
+    async def enqueue(
+        cls,
+        name: str,
+        params: dict[str, Any] | None = None,
+        triggered_by: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Record a manual run and start it in background
+
+        Args:
+            name: Job name
+            params: Job parameters (merged over defaults)
+            triggered_by: User who started the run
+
+        Returns:
+            Queued run
+
+        Raises:
+            NotFoundException: If job is not registered
+        """
+        job = cls.get_job(name)
+        run = await fetch_one(
+            f"""
+            INSERT INTO job_runs (job_name, params, triggered_by)
+            VALUES ($1, $2::jsonb, $3)
+            RETURNING {RUN_COLUMNS}
+            """,
+            job.name,
+            json.dumps({**job.default_params, **(params or {})}),
+            triggered_by,
+        )
+        run = _decode_run(run)
+        cls._spawn(cls._execute(job, run["id"], run["params"], triggered_by))
+        return run
+
+    @classmethod
+    async def _claim_slot(cls, job: Job, slot: datetime) -> None:
+        run_id = await fetch_val(
+            """
+            INSERT INTO job_runs (job_name, params, scheduled_for)
+            VALUES ($1, $2::jsonb, $3)
+            ON CONFLICT (job_name, scheduled_for) DO NOTHING
+            RETURNING id
+            """,
+            job.name,
+            json.dumps(job.default_params),
+            slot,
+        )
+        if run_id is not None:
+            cls._spawn(cls._execute(job, run_id, dict(job.default_params), None))
+
+    @classmethod
+    async def _schedule_loop(cls) -> None:
+        now = datetime.now(timezone.utc)
+        due = {job.name: job.schedule.next_after(now) for job in cls._jobs.values()}
+        due = {name: slot for name, slot in due.items() if slot is not None}
+        while due:
+            name, slot = min(due.items(), key=lambda item: item[1])
+            delay = (slot - datetime.now(timezone.utc)).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            job = cls._jobs[name]
+            try:
+                await cls._claim_slot(job, slot)
+            except Exception:
+                logger.exception("Failed to schedule job %s", name)
+            due[name] = job.schedule.next_after(slot)
+
+    @staticmethod
+    async def _finish(run_id: int, status: str, result: Any = None, error: str | None = None) -> None:
+        await execute(
+            """
+            UPDATE job_runs
+            SET status = $2, result = $3::jsonb, error = $4, finished_at = NOW()
+            WHERE id = $1
+            """,
+            run_id,
+            status,
+            json.dumps(result, default=str) if result is not None else None,
+            error,
+        )
+
+    @classmethod
+    async def _execute(cls, job: Job, run_id: int, params: dict[str, Any], triggered_by: int | None) -> None:
+        async with cls._semaphore:
+            async with get_db_connection(scoped=False) as lock_conn:
+                if not await lock_conn.fetchval("SELECT pg_try_advisory_lock(hashtext($1))", f"job:{job.name}"):
+                    await cls._finish(run_id, "skipped", error="Задача уже выполняется")
+                    return
+                try:
+                    await cls._run_locked(job, run_id, params, triggered_by)
+                finally:
+                    with suppress(Exception):
+                        await lock_conn.execute("SELECT pg_advisory_unlock(hashtext($1))", f"job:{job.name}")
+
+    @classmethod
+    async def _run_locked(cls, job: Job, run_id: int, params: dict[str, Any], triggered_by: int | None) -> None:
+        # Holding the lock proves that older "running" rows were left by a
+        # worker that died mid-run
+        await execute(
+            """
+            UPDATE job_runs
+            SET status = 'failed', error = 'Прервано: процесс завершился до окончания задачи', finished_at = NOW()
+            WHERE job_name = $1 AND status = 'running' AND id <> $2
+            """,
+            job.name,
+            run_id,
+        )
+        await execute(
+            "UPDATE job_runs SET status = 'running', started_at = NOW(), worker = $2 WHERE id = $1",
+            run_id,
+            WORKER_NAME,
+        )
+
+        try:
+            result = await job.func(JobContext(run_id, params, triggered_by))
+        except asyncio.CancelledError:
+            await cls._finish(run_id, "failed", error="Прервано остановкой приложения")
+            raise
+        except Exception as exc:
+            logger.exception("Job %s (run %s) failed", job.name, run_id)
+            await cls._finish(run_id, "failed", error=f"{type(exc).__name__}: {exc}")
+        else:
+            await cls._finish(run_id, "succeeded", result=result)
+
+    @staticmethod
+    async def get_run(run_id: int) -> dict[str, Any] | None:
+        """
+        Get job run by ID
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Run or None if not found
+        """
+        row = await fetch_one(f"SELECT {RUN_COLUMNS} FROM job_runs WHERE id = $1", run_id)
+        return _decode_run(row)
+
+    @staticmethod
+    async def list_runs(job_name: str | None = None, limit: int = 20) -> list[dict[str, Any]]:
+        """
+        Get recent job runs, newest first
+
+        Args:
+            job_name: Only runs of this job
+            limit: Maximum number of runs
+
+        Returns:
+            List of runs
+        """
+        rows = await fetch_all(
+            f"""
+            SELECT {RUN_COLUMNS}
+            FROM job_runs
+            WHERE $1::text IS NULL OR job_name = $1
+            ORDER BY created_at DESC, id DESC
+            LIMIT $2
+            """,
+            job_name,
+            limit,
+        )
+        return [_decode_run(row) for row in rows]
+
+    @classmethod
+    async def describe_jobs(cls) -> list[dict[str, Any]]:
+        """
+        Get registered jobs with schedule and latest run
+
+        Returns:
+            List of job descriptions
+        """
+        latest = await fetch_all(
+            f"""
+            SELECT DISTINCT ON (job_name) {RUN_COLUMNS}
+            FROM job_runs
+            WHERE job_name = ANY($1)
+            ORDER BY job_name, created_at DESC, id DESC
+            """,
+            list(cls._jobs),
+        )
+        latest_by_job = {row["job_name"]: _decode_run(row) for row in latest}
+        now = datetime.now(timezone.utc)
+        return [
+            {
+                "name": job.name,
+                "description": job.description,
+                "every_seconds": job.schedule.every_seconds,
+                "daily_at": job.schedule.daily_at.strftime("%H:%M") if job.schedule.daily_at else None,
+                "next_run_at": job.schedule.next_after(now),
+                "default_params": job.default_params,
+                "last_run": latest_by_job.get(job.name),
+            }
+            for job in cls._jobs.values()
+        ]
+
+
+def job(
+    name: str,
+    description: str,
+    schedule: Schedule | None = None,
+    default_params: dict[str, Any] | None = None,
+) -> Callable[[JobFunc], JobFunc]:
+    """
+    Register coroutine function as background job
+
+    Args:
+        name: Unique job name
+        description: Job description
+        schedule: Recurring schedule (manual runs only if omitted)
+        default_params: Parameters used by scheduled runs and as defaults
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: JobFunc) -> JobFunc:
+        JobRunner.register(Job(
+            name=name,
+            func=func,
+            description=description,
+            schedule=schedule or Schedule(),
+            default_params=default_params or {},
+        ))
+        return func
+
+    return decorator
@@ -0,0 +1,132 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, Iterable, TypeVar
+
+from backend.core.database import request_loaders
+from backend.core.metrics import Histogram
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFunc = Callable[[list[K]], Awaitable[dict[K, V]]]
+
+MAX_BATCH_SIZE = 1000
+
+LOADER_BATCH_SIZE = Histogram(
+    "loader_batch_keys",
+    "Keys resolved per batch loader call",
+    ("loader",),
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Batching loader of rows by key
+
+    Keys requested during the same event loop iteration (e.g. by tasks of
+    one gather, or by a loop over rows) are resolved together by one call
+    of the batch function, usually a single "= ANY($1)" query. Results,
+    including misses, are kept for the lifetime of the loader.
+    """
+    def __init__(self, name: str, batch: BatchFunc, max_batch_size: int = MAX_BATCH_SIZE):
+        self.name = name
+        self.batch = batch
+        self.max_batch_size = max_batch_size
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def _future(self, key: K) -> asyncio.Future:
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        return future
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        for start in range(0, len(keys), self.max_batch_size):
+            # Created from the callback, so the task runs in the context of
+            # the first caller and shares its request scope
+            task = asyncio.ensure_future(self._resolve(keys[start:start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, keys: list[K]) -> None:
+        LOADER_BATCH_SIZE.observe(len(keys), self.name)
+        try:
+            values = await self.batch(keys)
+        except asyncio.CancelledError:
+            for key in keys:
+                self._futures.pop(key).cancel()
+            raise
+        except Exception as exc:
+            # Failed keys are not cached, a later load retries them
+            for key in keys:
+                self._futures.pop(key).set_exception(exc)
+            return
+        for key in keys:
+            self._futures[key].set_result(values.get(key))
+
+    async def load(self, key: K) -> V | None:
+        """
+        Load value by key
+
+        Args:
+            key: Key
+
+        Returns:
+            Value or None if the batch function returned nothing for the key
+        """
+        return await self._future(key)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        """
+        Load values of several keys in one batch
+
+        Args:
+            keys: Keys
+
+        Returns:
+            Values in the order of keys (None for misses)
+        """
+        futures = [self._future(key) for key in keys]
+        return [await future for future in futures]
+
+    def prime(self, key: K, value: V) -> None:
+        """
+        Store known value, e.g. a row the caller has already read
+
+        Args:
+            key: Key
+            value: Value
+        """
+        if key not in self._futures:
+            future = self._futures[key] = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+
+
+def get_loader(name: str, batch: BatchFunc, max_batch_size: int = MAX_BATCH_SIZE) -> DataLoader:
+    """
+    Get loader of the current request, created on first use
+
+    Outside of a request (jobs, CLI) every call returns a new loader
+
+    Args:
+        name: Loader name, unique per batch function
+        batch: Coroutine function mapping a list of keys to values by key
+        max_batch_size: Maximum keys per batch function call
+
+    Returns:
+        Loader
+    """
+    loaders: dict[str, Any] | None = request_loaders()
+    if loaders is None:
+        return DataLoader(name, batch, max_batch_size)
+    loader = loaders.get(name)
+    if loader is None:
+        loader = loaders[name] = DataLoader(name, batch, max_batch_size)
+    return loader
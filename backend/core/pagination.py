@@ -1,24 +1,39 @@
+import base64
+import binascii
+import json
+from contextlib import contextmanager
+from datetime import date, datetime
 from math import ceil
-from typing import Generic, TypeVar
+from typing import Any, Generator, Generic, Mapping, TypeVar
 
-from fastapi import Query
+import asyncpg
+from fastapi import Query, Response
 from pydantic import BaseModel
 
+from backend.core.exceptions import ValidationException
+from backend.core.serialization import FastJSONResponse, dumps, shape_rows
+
 T = TypeVar("T")
 
 
 class PaginationParams:
     """
     Pagination query parameters
+
+    Offset pagination by default; passing a cursor switches to keyset mode
     """
     def __init__(
         self,
         page: int = Query(1, ge=1, description="Page number"),
         page_size: int = Query(20, ge=1, le=100, description="Page size"),
+        cursor: str | None = Query(None, description="Cursor from previous page (next_cursor), overrides page"),
+        include_total: bool = Query(True, description="Compute total count"),
     ):
         self.page = page
         self.page_size = page_size
-        self.offset = (page - 1) * page_size
+        self.cursor = cursor
+        self.include_total = include_total
+        self.offset = 0 if cursor else (page - 1) * page_size
 
 
 class SortParams:
@@ -28,7 +43,7 @@ class SortParams:
     def __init__(
         self,
         sort_by: str = Query("created_at", description="Sort field"),
-        sort_order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
+        sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
     ):
         self.sort_by = sort_by
         self.sort_order = sort_order.lower()
@@ -41,33 +56,207 @@ class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
     page: int
     page_size: int
-    total: int
-    total_pages: int
+    total: int | None = None
+    total_pages: int | None = None
     sort_by: str
     sort_order: str
+    next_cursor: str | None = None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise ValueError("Unknown cursor value type")
+    if value is not None and not isinstance(value, (str, int, float)):
+        raise ValueError("Unknown cursor value type")
+    return value
+
+
+def encode_cursor(sort_params: SortParams, value: Any, last_id: int) -> str:
+    """
+    Encode keyset position into opaque cursor
+
+    Args:
+        sort_params: Sort parameters
+        value: Sort key value of the last row
+        last_id: ID of the last row
+
+    Returns:
+        URL-safe cursor token
+    """
+    raw = json.dumps(
+        [sort_params.sort_by, sort_params.sort_order, _encode_value(value), last_id],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_params: SortParams) -> tuple[Any, int]:
+    """
+    Decode cursor token
+
+    Args:
+        cursor: Cursor token
+        sort_params: Sort parameters of the current request
+
+    Returns:
+        Tuple of (sort key value, last row ID)
+
+    Raises:
+        ValidationException: If cursor is malformed or sort does not match
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_by, sort_order, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+        value = _decode_value(value)
+        last_id = int(last_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise ValidationException("Некорректный курсор")
+
+    if sort_by != sort_params.sort_by or sort_order != sort_params.sort_order:
+        raise ValidationException("Курсор не соответствует параметрам сортировки")
+
+    return value, last_id
+
+
+@contextmanager
+def cursor_errors(pagination: PaginationParams) -> Generator[None, None, None]:
+    """
+    Report page query errors caused by the cursor as invalid input
+
+    A cursor can only be checked against the sort field, not against the
+    type of its SQL column, so a tampered value is rejected by asyncpg
+    when the page query runs
+
+    Args:
+        pagination: Pagination parameters
+
+    Raises:
+        ValidationException: If a cursor was given and its value does not
+            fit the sort column
+    """
+    try:
+        yield
+    except asyncpg.DataError:
+        if not pagination.cursor:
+            raise
+        raise ValidationException("Некорректный курсор")
+
+
+def apply_cursor(
+    where_clause: str,
+    params: list[Any],
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    sort_column: str,
+    id_column: str,
+) -> tuple[str, list[Any]]:
+    """
+    Extend WHERE clause with keyset condition for cursor pagination
+
+    Rows are ordered by (sort_column, id_column) in the requested direction
+    with PostgreSQL default NULL placement (last for ASC, first for DESC)
+
+    Args:
+        where_clause: Current SQL condition
+        params: Current query parameters
+        pagination: Pagination parameters
+        sort_params: Sort parameters
+        sort_column: SQL sort column
+        id_column: SQL ID column used as tie-breaker
+
+    Returns:
+        Tuple of (SQL condition, parameters list)
+    """
+    if not pagination.cursor:
+        return where_clause, params
+
+    value, last_id = decode_cursor(pagination.cursor, sort_params)
+    params = [*params]
+
+    if value is None:
+        params.append(last_id)
+        id_param = f"${len(params)}"
+        if sort_params.sort_order == "asc":
+            condition = f"({sort_column} IS NULL AND {id_column} > {id_param})"
+        else:
+            condition = f"(({sort_column} IS NULL AND {id_column} < {id_param}) OR {sort_column} IS NOT NULL)"
+    else:
+        params.extend([value, last_id])
+        value_param = f"${len(params) - 1}"
+        id_param = f"${len(params)}"
+        if sort_params.sort_order == "asc":
+            condition = (
+                f"({sort_column} > {value_param}"
+                f" OR ({sort_column} = {value_param} AND {id_column} > {id_param})"
+                f" OR {sort_column} IS NULL)"
+            )
+        else:
+            condition = (
+                f"({sort_column} < {value_param}"
+                f" OR ({sort_column} = {value_param} AND {id_column} < {id_param}))"
+            )
+
+    return f"{where_clause} AND {condition}", params
+
+
+def next_cursor(items: list[dict[str, Any]], pagination: PaginationParams, sort_params: SortParams) -> str | None:
+    """
+    Build cursor pointing after the last row of a full page
+
+    Args:
+        items: Page rows (must contain "id" and the sort field)
+        pagination: Pagination parameters
+        sort_params: Sort parameters
+
+    Returns:
+        Cursor token or None if this is the last page
+    """
+    if len(items) < pagination.page_size:
+        return None
+    last = items[-1]
+    return encode_cursor(sort_params, last[sort_params.sort_by], last["id"])
 
 
 def paginate(
     items: list[T],
-    total: int,
+    total: int | None,
     pagination: PaginationParams,
     sort_params: SortParams,
+    next_cursor: str | None = None,
 ) -> PaginatedResponse[T]:
     """
     Create paginated response
 
+    Items are taken as is (rows or models): the endpoint's response model
+    validates and serializes the page once, in pydantic-core
+
     Args:
         items: List of items
-        total: Total number of items
+        total: Total number of items (None if not computed)
         pagination: Pagination parameters
         sort_params: Sort parameters
+        next_cursor: Cursor for the next page
 
     Returns:
         Paginated response
     """
-    total_pages = ceil(total / pagination.page_size) if pagination.page_size > 0 else 0
+    total_pages = None
+    if total is not None:
+        total_pages = ceil(total / pagination.page_size) if pagination.page_size > 0 else 0
 
-    return PaginatedResponse(
+    return PaginatedResponse.model_construct(
         items=items,
         page=pagination.page,
         page_size=pagination.page_size,
@@ -75,4 +264,79 @@ def paginate(
         total_pages=total_pages,
         sort_by=sort_params.sort_by,
         sort_order=sort_params.sort_order,
+        next_cursor=next_cursor,
+    )
+
+
+def paginate_rows(
+    model: type[BaseModel],
+    rows: list[dict[str, Any]],
+    total: int | None,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    next_cursor: str | None,
+    headers: Mapping[str, str],
+    extra: tuple[str, ...] = (),
+) -> FastJSONResponse:
+    """
+    Create paginated JSON response from trusted database rows
+
+    The page is encoded directly instead of going through the response
+    model (kept on the route for the schema); use it only for rows whose
+    columns are selected explicitly in the model's shape
+
+    Args:
+        model: Item model
+        rows: Rows of the page
+        total: Total number of items (None if not computed)
+        pagination: Pagination parameters
+        sort_params: Sort parameters
+        next_cursor: Cursor for the next page
+        headers: Headers set by dependencies on the injected response
+        extra: Keys of expansions attached to the rows
+
+    Returns:
+        JSON response
+    """
+    page = paginate(shape_rows(model, rows, extra), total, pagination, sort_params, next_cursor)
+    return FastJSONResponse(dict(page), headers=headers)
+
+
+def paginate_json(
+    items_json: str | bytes,
+    count: int,
+    last: tuple[Any, int] | None,
+    total: int | None,
+    pagination: PaginationParams,
+    sort_params: SortParams,
+    headers: Mapping[str, str],
+) -> Response:
+    """
+    Create paginated JSON response around an items array rendered by the database
+
+    The array text is inserted into the body as is, without being parsed
+
+    Args:
+        items_json: JSON array of page items
+        count: Number of items on the page
+        last: Sort value and id of the last item, None on an empty page
+        total: Total number of items (None if not computed)
+        pagination: Pagination parameters
+        sort_params: Sort parameters
+        headers: Headers set by dependencies on the injected response
+
+    Returns:
+        JSON response
+    """
+    cursor = None
+    if last is not None and count >= pagination.page_size:
+        cursor = encode_cursor(sort_params, *last)
+    page = paginate([], total, pagination, sort_params, cursor)
+    envelope = dumps({key: value for key, value in page if key != "items"})
+    if isinstance(items_json, str):
+        items_json = items_json.encode()
+    return Response(
+        b'{"items":' + items_json + b"," + envelope[1:],
+        media_type="application/json",
+        headers=headers,
     )
@@ -0,0 +1,296 @@
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import asyncpg
+
+from backend.core.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+# Distinct rendered texts kept per dynamic query; more shapes than this
+# means the shape parts are not bounded and is reported once
+MAX_SHAPES_PER_QUERY = 256
+
+DB_STATEMENT_CACHE = Counter(
+    "db_statement_cache_total",
+    "Statement cache lookups of fetch helpers by query and result (hit, miss)",
+    ("query", "result"),
+)
+
+
+@dataclass(frozen=True)
+class Query:
+    """
+    Registered SQL statement
+
+    Accepted by the fetch helpers in place of SQL text. Queries with warmup
+    arguments are executed with them on every new pool connection, so their
+    statements are already prepared when requests arrive; the arguments
+    must make the statement cheap (unknown id, zero limit).
+    """
+    name: str
+    sql: str
+    warmup_args: tuple[Any, ...] | None = None
+
+
+class QueryRegistry:
+    """
+    Named service queries and the rendered shapes of dynamic ones
+
+    asyncpg caches prepared statements by exact SQL text. Dynamic queries
+    (filters, sort, cursor) are rendered from a template once per distinct
+    combination of parts and reused, so each combination maps to one
+    canonical text and one cached statement per connection.
+    """
+    _queries: dict[str, Query] = {}
+    _shapes: dict[str, dict[tuple[tuple[str, str], ...], Query]] = {}
+    _overflowed: set[str] = set()
+
+    @classmethod
+    def register(cls, name: str, sql: str, warmup_args: tuple[Any, ...] | None = None) -> Query:
+        """
+        Register static query
+
+        Args:
+            name: Unique query name ("<service>.<operation>")
+            sql: SQL text
+            warmup_args: Arguments to prepare the statement on new connections
+
+        Returns:
+            Registered query
+
+        Raises:
+            ValueError: If name is already registered
+        """
+        if name in cls._queries or name in cls._shapes:
+            raise ValueError(f"Query {name} is already registered")
+        query = cls._queries[name] = Query(name, sql, warmup_args)
+        return query
+
+    @classmethod
+    def shape(
+        cls,
+        name: str,
+        template: str,
+        warmup_args: tuple[Any, ...] | None = None,
+        **parts: str,
+    ) -> Query:
+        """
+        Get dynamic query rendered for the given parts
+
+        Args:
+            name: Query name shared by all shapes
+            template: SQL template with {part} placeholders
+            warmup_args: Arguments to prepare this shape on new connections
+            **parts: SQL fragments (conditions with $n placeholders, sort
+                columns from a whitelist), never values
+
+        Returns:
+            Query of this shape
+        """
+        key = tuple(sorted(parts.items()))
+        shapes = cls._shapes.setdefault(name, {})
+        query = shapes.get(key)
+        if query is not None:
+            return query
+
+        query = Query(name, template.format(**parts), warmup_args)
+        if len(shapes) < MAX_SHAPES_PER_QUERY:
+            shapes[key] = query
+        elif name not in cls._overflowed:
+            cls._overflowed.add(name)
+            logger.warning("Query %s has more than %d shapes, new shapes are not cached", name, MAX_SHAPES_PER_QUERY)
+        return query
+
+    @classmethod
+    def warmup_queries(cls) -> list[Query]:
+        """
+        Get queries prepared on new connections
+        """
+        shapes = [query for queries in cls._shapes.values() for query in queries.values()]
+        return [query for query in (*cls._queries.values(), *shapes) if query.warmup_args is not None]
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        Get registry size
+
+        Returns:
+            Number of static queries and rendered shapes per dynamic query
+        """
+        return {
+            "static": len(cls._queries),
+            "shapes": {name: len(shapes) for name, shapes in sorted(cls._shapes.items())},
+            "overflowed": sorted(cls._overflowed),
+        }
+
+
+def page_query(
+    name: str,
+    template: str,
+    where_clause: str,
+    sort_field: str,
+    sort_order: str,
+    param_count: int,
+    warmup: bool = False,
+    **parts: str,
+) -> Query:
+    """
+    Get shape of a paginated list query
+
+    The template takes {where}, {sort_field}, {sort_order}, {limit} and
+    {offset}; limit and offset are the two parameters after the filters
+
+    Args:
+        name: Query name
+        template: SQL template
+        where_clause: SQL condition
+        sort_field: Whitelisted SQL sort column
+        sort_order: ASC or DESC
+        param_count: Number of filter parameters
+        warmup: Prepare this shape on new connections (empty page)
+        **parts: Other template parts
+
+    Returns:
+        Query of this shape
+    """
+    return QueryRegistry.shape(
+        name,
+        template,
+        warmup_args=(0, 0) if warmup else None,
+        where=where_clause,
+        sort_field=sort_field,
+        sort_order=sort_order,
+        limit=f"${param_count + 1}",
+        offset=f"${param_count + 2}",
+        **parts,
+    )
+
+
+class StatementCache:
+    """
+    Hit accounting and warmup of asyncpg's per-connection statement cache
+
+    asyncpg does not report cache hits, so the LRU (size and idle lifetime)
+    is mirrored per server connection for statements run through the fetch
+    helpers. Statements run on connections directly are not seen and may
+    evict entries, so the ratio is an upper bound.
+    """
+    _connections: dict[int, OrderedDict[str, float]] = {}
+    _size = 0
+    _lifetime = 0.0
+    hits: dict[str, int] = {}
+    misses: dict[str, int] = {}
+    warmed = 0
+    warmup_failures = 0
+
+    @classmethod
+    def configure(cls, size: int, lifetime: float) -> None:
+        """
+        Set mirrored cache limits
+
+        Args:
+            size: asyncpg statement_cache_size (0 disables the cache)
+            lifetime: asyncpg max_cached_statement_lifetime (0 = unlimited)
+        """
+        cls._size = size
+        cls._lifetime = lifetime
+
+    @classmethod
+    def _statements(cls, conn: asyncpg.Connection) -> OrderedDict[str, float]:
+        pid = conn.get_server_pid()
+        statements = cls._connections.get(pid)
+        if statements is None:
+            statements = cls._connections[pid] = OrderedDict()
+            conn.add_termination_listener(lambda _: cls._connections.pop(pid, None))
+        return statements
+
+    @classmethod
+    def _touch(cls, statements: OrderedDict[str, float], sql: str) -> bool:
+        now = time.monotonic()
+        last_used = statements.get(sql)
+        hit = last_used is not None and (not cls._lifetime or now - last_used < cls._lifetime)
+        statements[sql] = now
+        statements.move_to_end(sql)
+        while len(statements) > cls._size:
+            statements.popitem(last=False)
+        return hit
+
+    @classmethod
+    def lookup(cls, conn: asyncpg.Connection, sql: str, name: str) -> None:
+        """
+        Record statement about to run on connection
+
+        Args:
+            conn: Connection
+            sql: SQL text
+            name: Query name (or caller of unregistered SQL)
+        """
+        if not cls._size:
+            return
+        if cls._touch(cls._statements(conn), sql):
+            cls.hits[name] = cls.hits.get(name, 0) + 1
+            DB_STATEMENT_CACHE.inc(name, "hit")
+        else:
+            cls.misses[name] = cls.misses.get(name, 0) + 1
+            DB_STATEMENT_CACHE.inc(name, "miss")
+
+    @classmethod
+    async def init_connection(cls, conn: asyncpg.Connection) -> None:
+        """
+        Prepare warmup queries on new pool connection
+
+        Used as asyncpg pool init callback; failures are logged and do not
+        prevent the connection from being used
+
+        Args:
+            conn: New connection
+        """
+        if not cls._size:
+            return
+        statements = cls._statements(conn)
+        for query in QueryRegistry.warmup_queries():
+            try:
+                await conn.fetch(query.sql, *query.warmup_args)
+            except Exception:
+                cls.warmup_failures += 1
+                logger.warning("Warmup of query %s failed", query.name, exc_info=True)
+                continue
+            cls._touch(statements, query.sql)
+            cls.warmed += 1
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        Get statement cache statistics of this worker
+
+        Returns:
+            Cache limits, totals and per-query hit ratios
+        """
+        def ratio(hits: int, misses: int) -> float:
+            return round(hits / (hits + misses), 4) if hits + misses else 0.0
+
+        hits = sum(cls.hits.values())
+        misses = sum(cls.misses.values())
+        return {
+            "size": cls._size,
+            "lifetime_seconds": cls._lifetime,
+            "connections": len(cls._connections),
+            "warmed": cls.warmed,
+            "warmup_failures": cls.warmup_failures,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": ratio(hits, misses),
+            "queries": {
+                name: {
+                    "hits": cls.hits.get(name, 0),
+                    "misses": cls.misses.get(name, 0),
+                    "hit_ratio": ratio(cls.hits.get(name, 0), cls.misses.get(name, 0)),
+                }
+                for name in sorted(cls.hits.keys() | cls.misses.keys())
+            },
+            "registry": QueryRegistry.stats(),
+        }
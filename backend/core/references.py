@@ -0,0 +1,92 @@
+import re
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import asyncpg
+
+from backend.core.exceptions import APIException, ConflictException, NotFoundException
+
+CONSTRAINT_ERRORS: dict[str, tuple[type[APIException], str]] = {
+    "technologies_category_id_fkey": (NotFoundException, "Категория с id={category_id} не найдена"),
+    "technologies_status_id_fkey": (NotFoundException, 'Статус "{status}" не найден'),
+    "technology_categories_name_key": (ConflictException, 'Категория с именем "{name}" уже существует'),
+    "technology_statuses_name_key": (ConflictException, 'Статус "{name}" уже существует'),
+    "projects_team_id_fkey": (NotFoundException, "Команда с id={team_id} не найдена"),
+    "teams_lead_id_fkey": (NotFoundException, "Пользователь с id={lead_id} не найден"),
+    "project_technologies_project_id_fkey": (NotFoundException, "Проект с id={project_id} не найден"),
+    "project_technologies_technology_id_fkey": (NotFoundException, "Технология с id={technology_id} не найдена"),
+    "project_technologies_version_id_fkey": (
+        NotFoundException,
+        "Версия с id={version_id} не найдена для этой технологии",
+    ),
+    "project_technologies_project_id_technology_id_key": (
+        ConflictException,
+        "Эта технология уже добавлена в проект",
+    ),
+}
+
+_KEY_DETAIL = re.compile(r"Key \((?P<columns>[^)]+)\)=\((?P<values>[^)]*)\)")
+
+
+def _detail_values(detail: str | None) -> dict[str, str]:
+    """
+    Extract offending key values from constraint violation detail
+    """
+    match = _KEY_DETAIL.search(detail or "")
+    if not match:
+        return {}
+    columns = [c.strip() for c in match.group("columns").split(",")]
+    values = [v.strip() for v in match.group("values").split(",")]
+    if len(columns) != len(values):
+        return {}
+    return dict(zip(columns, values))
+
+
+@contextmanager
+def integrity_errors(**context: Any) -> Iterator[None]:
+    """
+    Map foreign key and unique violations to API exceptions
+
+    Messages are formatted with the given context, overridden by the key
+    values reported by PostgreSQL. Unknown constraints are re-raised.
+
+    Args:
+        **context: Values referenced by the write
+    """
+    try:
+        yield
+    except (asyncpg.ForeignKeyViolationError, asyncpg.UniqueViolationError) as exc:
+        mapped = CONSTRAINT_ERRORS.get(exc.constraint_name)
+        if mapped is None:
+            raise
+        exc_type, template = mapped
+        values = {**context, **_detail_values(exc.detail)}
+        try:
+            message = template.format(**values)
+        except KeyError:
+            raise exc
+        raise exc_type(message) from exc
+
+
+def check_references(row: dict[str, Any] | None, checks: dict[str, APIException]) -> dict[str, Any]:
+    """
+    Validate reference flags returned by a single-statement write
+
+    Flags (columns ending with "_found") are removed from the result
+
+    Args:
+        row: Statement result
+        checks: Mapping of column name to exception raised when it is falsy,
+            checked in order
+
+    Returns:
+        Row without reference flags
+
+    Raises:
+        APIException: First exception whose column is falsy
+    """
+    row = row or {}
+    for column, exc in checks.items():
+        if not row.get(column):
+            raise exc
+    return {key: value for key, value in row.items() if not key.endswith("_found")}
@@ -0,0 +1,292 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncGenerator
+
+import asyncpg
+from asyncpg import Pool
+
+from backend.config import get_settings
+from backend.core.metrics import Counter, Gauge, collector
+
+logger = logging.getLogger(__name__)
+
+ROUTING_STRATEGIES = ("round_robin", "least_busy")
+
+# Errors meaning the replica itself is unreachable or refusing work
+REPLICA_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.OperatorInterventionError,
+    asyncpg.TooManyConnectionsError,
+)
+
+# Replay lag; zero when all received WAL is applied, as replay time does
+# not advance while the primary is idle
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+DB_READS = Counter(
+    "db_routed_reads_total",
+    "Reads of replica-routed service methods by target (primary or replica address)",
+    ("target",),
+)
+DB_REPLICA_EJECTIONS = Counter(
+    "db_replica_ejections_total",
+    "Replicas taken out of read routing",
+    ("replica",),
+)
+DB_REPLICA_HEALTHY = Gauge(
+    "db_replica_healthy",
+    "Replica serves reads (1) or is ejected (0)",
+    ("replica",),
+)
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replay lag of replica at the last health check",
+    ("replica",),
+)
+
+
+class Replica:
+    """
+    Read replica and its connection pool
+    """
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.name = f"{host}:{port}"
+        self.pool: Pool | None = None
+        self.healthy = False
+        self.in_flight = 0
+        self.reads = 0
+        self.ejections = 0
+        self.lag_seconds: float | None = None
+        self.last_error: str | None = None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get replica state
+
+        Returns:
+            Address, health, load and pool size
+        """
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "in_flight": self.in_flight,
+            "reads": self.reads,
+            "ejections": self.ejections,
+            "lag_seconds": self.lag_seconds,
+            "last_error": self.last_error,
+            "pool_size": self.pool.get_size() if self.pool else 0,
+        }
+
+
+class ReplicaSet:
+    """
+    Read replicas of the database and routing of reads between them
+
+    A read goes to a replica only if none of the tables it reads was
+    written within the read-your-writes window, as seen by this worker
+    through the change hub (local writes and notifications of other
+    workers). Replicas lagging more than the window, failing health checks
+    or failing a query are ejected; ejected replicas are checked again on
+    every health check interval and rejoin once they pass.
+    """
+    replicas: list[Replica] = []
+    primary_reads = 0
+    _pool_options: dict[str, Any] = {}
+    _changed_at: dict[str, float] = {}
+    _cursor = 0
+    _task: asyncio.Task | None = None
+
+    @classmethod
+    async def connect(cls, **pool_options: Any) -> None:
+        """
+        Create replica pools and start health checks
+
+        Unreachable replicas do not prevent startup, they start ejected
+
+        Args:
+            **pool_options: asyncpg pool options except host and port
+        """
+        settings = get_settings().database
+        if settings.replica_routing not in ROUTING_STRATEGIES:
+            raise ValueError(
+                f"DB_REPLICA_ROUTING must be one of {', '.join(ROUTING_STRATEGIES)}, got {settings.replica_routing!r}"
+            )
+        cls.replicas = [Replica(host, port) for host, port in settings.replica_addresses()]
+        if not cls.replicas:
+            return
+        cls._pool_options = {**pool_options, "timeout": settings.replica_timeout_seconds}
+        await asyncio.gather(*(cls._check(replica) for replica in cls.replicas))
+        cls._task = asyncio.create_task(cls._monitor())
+
+    @classmethod
+    async def disconnect(cls, timeout: float | None = None) -> None:
+        """
+        Stop health checks and close replica pools
+
+        Args:
+            timeout: Seconds to wait for busy connections (no limit if None)
+        """
+        task, cls._task = cls._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        replicas, cls.replicas = cls.replicas, []
+        for replica in replicas:
+            pool, replica.pool = replica.pool, None
+            if pool is None:
+                continue
+            try:
+                await asyncio.wait_for(pool.close(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Replica %s pool did not close in %s s, terminating connections", replica.name, timeout)
+                pool.terminate()
+
+    @classmethod
+    def note_changed(cls, tables: frozenset[str]) -> None:
+        """
+        Start read-your-writes window of written tables (change listener)
+
+        Args:
+            tables: Changed table names
+        """
+        now = time.monotonic()
+        for table in tables:
+            cls._changed_at[table] = now
+
+    @classmethod
+    def choose(cls, tables: frozenset[str]) -> Replica | None:
+        """
+        Pick replica for a read
+
+        Args:
+            tables: Tables the read depends on
+
+        Returns:
+            Healthy replica, or None if the read must go to the primary
+        """
+        healthy = [replica for replica in cls.replicas if replica.healthy]
+        if not healthy:
+            return None
+
+        settings = get_settings().database
+        horizon = time.monotonic() - settings.read_your_writes_seconds
+        if any(cls._changed_at.get(table, horizon) > horizon for table in tables):
+            return None
+
+        cls._cursor += 1
+        start = cls._cursor % len(healthy)
+        if settings.replica_routing == "least_busy":
+            # Rotated so that idle replicas share the load evenly
+            return min(healthy[start:] + healthy[:start], key=lambda replica: replica.in_flight)
+        return healthy[start]
+
+    @classmethod
+    def eject(cls, replica: Replica, reason: BaseException | str) -> None:
+        """
+        Take replica out of read routing until its next successful health check
+
+        Args:
+            replica: Replica
+            reason: Error or description of the failure
+        """
+        replica.last_error = str(reason) or type(reason).__name__
+        if not replica.healthy:
+            return
+        replica.healthy = False
+        replica.ejections += 1
+        DB_REPLICA_EJECTIONS.inc(replica.name)
+        logger.warning("Replica %s ejected from read routing: %s", replica.name, replica.last_error)
+
+    @classmethod
+    @asynccontextmanager
+    async def connection(cls, replica: Replica) -> AsyncGenerator[asyncpg.Connection, None]:
+        """
+        Check out connection of a replica for one read
+
+        Args:
+            replica: Replica returned by choose()
+
+        Yields:
+            Database connection
+        """
+        replica.in_flight += 1
+        replica.reads += 1
+        DB_READS.inc(replica.name)
+        try:
+            async with replica.pool.acquire() as connection:
+                yield connection
+        finally:
+            replica.in_flight -= 1
+
+    @classmethod
+    def record_primary_read(cls) -> None:
+        """
+        Count replica-routed read served by the primary
+        """
+        cls.primary_reads += 1
+        DB_READS.inc("primary")
+
+    @classmethod
+    async def _check(cls, replica: Replica) -> None:
+        settings = get_settings().database
+        try:
+            if replica.pool is None:
+                replica.pool = await asyncpg.create_pool(host=replica.host, port=replica.port, **cls._pool_options)
+            lag = await asyncio.wait_for(replica.pool.fetchval(REPLICA_LAG_QUERY), settings.replica_timeout_seconds)
+        except (*REPLICA_ERRORS, asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+            replica.lag_seconds = None
+            cls.eject(replica, exc)
+            return
+
+        replica.lag_seconds = round(float(lag), 3)
+        if replica.lag_seconds > settings.read_your_writes_seconds:
+            cls.eject(replica, f"replication lag {replica.lag_seconds} s")
+            return
+        if not replica.healthy:
+            replica.healthy = True
+            replica.last_error = None
+            logger.info("Replica %s is serving reads", replica.name)
+
+    @classmethod
+    async def _monitor(cls) -> None:
+        interval = get_settings().database.replica_check_interval_seconds
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.gather(*(cls._check(replica) for replica in cls.replicas))
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        Get read routing statistics of this worker
+
+        Returns:
+            Routing strategy, reads served by the primary and replica states
+        """
+        settings = get_settings().database
+        return {
+            "routing": settings.replica_routing,
+            "read_your_writes_seconds": settings.read_your_writes_seconds,
+            "primary_reads": cls.primary_reads,
+            "replicas": [replica.stats() for replica in cls.replicas],
+        }
+
+
+@collector
+def _collect_replica_metrics() -> None:
+    for replica in ReplicaSet.replicas:
+        DB_REPLICA_HEALTHY.set(1 if replica.healthy else 0, replica.name)
+        DB_REPLICA_LAG.set(replica.lag_seconds or 0, replica.name)
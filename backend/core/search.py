@@ -0,0 +1,60 @@
+SEARCH_CONFIG = "simple"
+
+
+def escape_like(value: str) -> str:
+    """
+    Escape LIKE wildcards in user input
+
+    Args:
+        value: Raw search string
+
+    Returns:
+        String safe to embed into a LIKE pattern
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_params(query: str) -> list[str]:
+    """
+    Get SQL parameters of a search condition
+
+    Args:
+        query: Search query string
+
+    Returns:
+        Query string and escaped substring pattern
+    """
+    return [query, f"%{escape_like(query)}%"]
+
+
+def build_search_condition(
+    query: str,
+    vector_column: str,
+    text_columns: list[str],
+    param_index: int,
+) -> tuple[str, str, list[str]]:
+    """
+    Build indexed search condition and relevance expression
+
+    Matches rows by full-text vector (GIN) or by substring on the text
+    columns (pg_trgm GIN). Relevance combines ts_rank with trigram
+    similarity of the first text column.
+
+    Args:
+        query: Search query string
+        vector_column: Generated tsvector column
+        text_columns: Columns for substring matching
+        param_index: Index of the first SQL parameter to use
+
+    Returns:
+        Tuple of (SQL condition, SQL rank expression, parameters list)
+    """
+    query_param = f"${param_index}"
+    pattern_param = f"${param_index + 1}"
+    tsquery = f"websearch_to_tsquery('{SEARCH_CONFIG}', {query_param})"
+
+    substring_match = " OR ".join(f"{column} ILIKE {pattern_param}" for column in text_columns)
+    condition = f"({vector_column} @@ {tsquery} OR {substring_match})"
+    rank = f"(ts_rank({vector_column}, {tsquery}) + similarity({text_columns[0]}, {query_param}))"
+
+    return condition, rank, search_params(query)
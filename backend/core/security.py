@@ -1,5 +1,10 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -7,10 +12,53 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from backend.config import get_settings
-from backend.core.database import fetch_one
+from backend.core.cache import TTLCache
+from backend.core.changes import on_change
+from backend.core.database import fetch_one, release_request_connection
+from backend.core.exceptions import TooManyRequestsException
+from backend.core.metrics import Counter, Gauge, Histogram, collector
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+R = TypeVar("R")
+
+HASH_POOLS = ("thread", "process")
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hashing and verification time in worker threads",
+)
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time password hashing calls wait for a free worker",
+)
+PASSWORD_HASH_PENDING = Gauge("password_hash_pending", "Password hashing calls running or queued")
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hashing calls rejected because the queue was full",
+)
+
+_principal_cache = TTLCache(
+    "auth_principals",
+    maxsize=get_settings().auth.principal_cache_size,
+    ttl=get_settings().auth.principal_cache_ttl_seconds,
+)
+_token_cache = TTLCache(
+    "auth_tokens",
+    maxsize=get_settings().auth.principal_cache_size,
+    ttl=get_settings().auth.principal_cache_ttl_seconds,
+)
+
+
+@on_change
+def _invalidate_principals(tables: frozenset[str]) -> None:
+    # Writes made by other workers arrive here through the change feed;
+    # invalidate_principal() only reaches this worker's cache
+    if "users" in tables:
+        _principal_cache.invalidate()
+        _token_cache.invalidate()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -40,6 +88,174 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHasher:
+    """
+    Bounded worker pool for bcrypt hashing and verification
+
+    Keeps KDF work off the event loop and rejects requests with 429
+    once all workers are busy and the wait queue is full. Workers are
+    threads (bcrypt releases the GIL) or, with PASSWORD_HASH_POOL=process,
+    processes
+    """
+    _executor: Executor | None = None
+    _pending: int = 0
+    _calls: int = 0
+    _rejected: int = 0
+    _hash_seconds_total: float = 0.0
+    _hash_seconds_max: float = 0.0
+    _wait_seconds_total: float = 0.0
+    _wait_seconds_max: float = 0.0
+
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        if cls._executor is None:
+            settings = get_settings().auth
+            if settings.hash_pool not in HASH_POOLS:
+                raise ValueError(
+                    f"PASSWORD_HASH_POOL must be one of {', '.join(HASH_POOLS)}, got {settings.hash_pool!r}"
+                )
+            if settings.hash_pool == "process":
+                cls._executor = ProcessPoolExecutor(max_workers=settings.hash_workers)
+            else:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=settings.hash_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return cls._executor
+
+    @classmethod
+    def _capacity(cls) -> int:
+        settings = get_settings()
+        return settings.auth.hash_workers + settings.auth.hash_queue_size
+
+    @classmethod
+    def _release(cls) -> None:
+        cls._pending -= 1
+
+    @classmethod
+    async def run(cls, func: Callable[..., R], *args: Any) -> R:
+        """
+        Run KDF function in worker pool
+
+        A slot is held until the worker finishes, even if the awaiting
+        request is cancelled meanwhile: a started hash cannot be stopped
+
+        Args:
+            func: Blocking hashing function (module-level, so that it can
+                be sent to a process pool)
+            *args: Function arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            TooManyRequestsException: If the pool queue is full
+        """
+        if cls._pending >= cls._capacity():
+            cls._rejected += 1
+            raise TooManyRequestsException("Сервер перегружен, повторите попытку позже")
+
+        cls._pending += 1
+        try:
+            await release_request_connection()
+            future = cls._get_executor().submit(_timed_call, func, args, time.perf_counter())
+        except BaseException:
+            cls._pending -= 1
+            raise
+
+        loop = asyncio.get_running_loop()
+
+        def release(_: Future) -> None:
+            # Called from the worker side once the call has finished or was
+            # cancelled before it started
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(cls._release)
+
+        future.add_done_callback(release)
+        result, waited, elapsed = await asyncio.wrap_future(future)
+
+        cls._calls += 1
+        cls._wait_seconds_total += waited
+        cls._wait_seconds_max = max(cls._wait_seconds_max, waited)
+        cls._hash_seconds_total += elapsed
+        cls._hash_seconds_max = max(cls._hash_seconds_max, elapsed)
+        PASSWORD_HASH_QUEUE_WAIT.observe(waited)
+        PASSWORD_HASH_DURATION.observe(elapsed)
+        return result
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        Get hashing pool statistics
+
+        Returns:
+            Queue depth, call counters and latency aggregates
+        """
+        settings = get_settings()
+        calls = cls._calls
+        return {
+            "workers": settings.auth.hash_workers,
+            "queue_size": settings.auth.hash_queue_size,
+            "pending": cls._pending,
+            "calls": calls,
+            "rejected": cls._rejected,
+            "hash_seconds_avg": round(cls._hash_seconds_total / calls, 6) if calls else 0.0,
+            "hash_seconds_max": round(cls._hash_seconds_max, 6),
+            "queue_wait_seconds_avg": round(cls._wait_seconds_total / calls, 6) if calls else 0.0,
+            "queue_wait_seconds_max": round(cls._wait_seconds_max, 6),
+        }
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Stop worker pool
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+
+
+def _timed_call(func: Callable[..., R], args: tuple[Any, ...], submitted_at: float) -> tuple[R, float, float]:
+    # Runs in the worker; perf_counter() is system-wide, so the queue wait
+    # is also measured correctly in a worker process
+    started_at = time.perf_counter()
+    result = func(*args)
+    return result, started_at - submitted_at, time.perf_counter() - started_at
+
+
+@collector
+def _collect_hasher_metrics() -> None:
+    PASSWORD_HASH_PENDING.set(PasswordHasher._pending)
+    PASSWORD_HASH_REJECTED.set(PasswordHasher._rejected)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify password against hash without blocking the event loop
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password
+
+    Returns:
+        True if password matches
+    """
+    return await PasswordHasher.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash password without blocking the event loop
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password
+    """
+    return await PasswordHasher.run(get_password_hash, password)
+
+
 def create_access_token(data: dict[str, Any]) -> str:
     """
     Create JWT access token
@@ -82,6 +298,37 @@ def decode_access_token(token: str) -> dict[str, Any]:
         )
 
 
+def _decode_cached(token: str) -> dict[str, Any]:
+    """
+    Decode JWT token, reusing payloads of recently seen tokens
+
+    Args:
+        token: JWT token
+
+    Returns:
+        Decoded token payload
+    """
+    token_key = hashlib.sha256(token.encode()).digest()
+    payload = _token_cache.get(token_key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    payload = decode_access_token(token)
+    expires_in = payload.get("exp", 0) - time.time()
+    _token_cache.set(token_key, payload, ttl=min(_token_cache.ttl, expires_in))
+    return payload
+
+
+def invalidate_principal(user_id: int) -> None:
+    """
+    Drop cached principal so the next request reloads it
+
+    Args:
+        user_id: User ID
+    """
+    _principal_cache.invalidate(user_id)
+
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict[str, Any]:
     """
     Get current authenticated user from JWT token
@@ -96,7 +343,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         HTTPException: If user not found or token invalid
     """
     token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = _decode_cached(token)
 
     user_id = payload.get("user_id")
     if user_id is None:
@@ -106,23 +353,47 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    query = """
-        SELECT
-            id, email, password_hash, full_name,
-            is_admin, is_active, created_at, updated_at
-        FROM users
-        WHERE id = $1 AND is_active = TRUE
+    async def load_user() -> dict[str, Any]:
+        query = """
+            SELECT
+                id, email, full_name,
+                is_admin, is_active, created_at, updated_at
+            FROM users
+            WHERE id = $1 AND is_active = TRUE
+        """
+        user = await fetch_one(query, user_id)
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        return user
+
+    # Copied so that a request changing its principal does not alter the cached one
+    return dict(await _principal_cache.get_or_load(user_id, load_user))
+
+
+async def get_optional_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+) -> dict[str, Any] | None:
     """
-    user = await fetch_one(query, user_id)
+    Get current user if request carries a bearer token
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    Args:
+        credentials: HTTP authorization credentials (optional)
 
-    return user
+    Returns:
+        User data or None for anonymous requests
+
+    Raises:
+        HTTPException: If token is present but invalid
+    """
+    if credentials is None:
+        return None
+    return await get_current_user(credentials)
 
 
 async def get_current_active_user(current_user: dict[str, Any] = Depends(get_current_user)) -> dict[str, Any]:
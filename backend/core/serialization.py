@@ -0,0 +1,117 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from functools import cache
+from typing import Any, get_args, get_origin, get_type_hints
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional "speedups" extra
+    orjson = None
+
+
+def json_default(value: Any) -> Any:
+    """
+    Encode values of database rows that JSON has no type for
+
+    Args:
+        value: Value rejected by the encoder
+
+    Returns:
+        JSON-compatible value
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode value as compact UTF-8 JSON
+
+    Uses orjson when installed, the standard library encoder otherwise
+
+    Args:
+        value: Dicts, lists and scalars as returned by the fetch helpers
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=json_default)
+    return json.dumps(value, default=json_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(value: str | bytes) -> Any:
+    """
+    Decode JSON text, e.g. a document rendered by the database
+
+    Args:
+        value: JSON text
+
+    Returns:
+        Decoded value
+    """
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response for plain data returned without a response model
+
+    Return it from the endpoint instead of the data: FastAPI then skips
+    jsonable_encoder, which walks the whole payload in Python first. Headers
+    set by dependencies on the injected Response must be passed along.
+    Endpoints with a response model need nothing: FastAPI validates and
+    serializes them to JSON in pydantic-core, and setting a response class
+    there would disable that path.
+    """
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@cache
+def _row_fields(model: type[BaseModel]) -> tuple[tuple[str, type[BaseModel] | None], ...]:
+    hints = get_type_hints(model)
+    fields = []
+    for name in model.model_fields:
+        args = get_args(hints[name])
+        nested = None
+        if get_origin(hints[name]) is list and args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+            nested = args[0]
+        fields.append((name, nested))
+    return tuple(fields)
+
+
+def shape_rows(
+    model: type[BaseModel],
+    rows: list[dict[str, Any]],
+    extra: tuple[str, ...] = (),
+) -> list[dict[str, Any]]:
+    """
+    Cut trusted database rows to the fields of a response model
+
+    Replaces model validation for rows whose columns come straight from the
+    database with the model's types: only the key set is enforced, nested
+    lists of models are cut the same way.
+
+    Args:
+        model: Response model of one row
+        rows: Rows with every field of the model
+        extra: Keys of already shaped values kept as they are (expansions)
+
+    Returns:
+        Rows in the response shape
+    """
+    fields = _row_fields(model) + tuple((name, None) for name in extra)
+    return [
+        {name: shape_rows(nested, row[name]) if nested else row[name] for name, nested in fields}
+        for row in rows
+    ]
@@ -0,0 +1,191 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import deque
+from datetime import datetime, timezone
+from itertools import count
+from typing import Any
+
+from asyncpg import Pool
+
+from backend.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+EXPLAIN_TIMEOUT_MS = 10000
+EXPLAIN_COOLDOWN_SECONDS = 300.0
+MAX_QUERY_LENGTH = 4000
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_READ_STATEMENT = re.compile(r"^\s*(select|with)\b", re.IGNORECASE)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize SQL text for grouping
+
+    Collapses whitespace and replaces inline literals with "?";
+    bind parameters ($1, $2, ...) are kept
+
+    Args:
+        query: SQL query
+
+    Returns:
+        Normalized query
+    """
+    query = _STRING_LITERAL.sub("?", query)
+    query = _NUMBER_LITERAL.sub("?", query)
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+def param_shape(value: Any) -> str:
+    """
+    Describe query parameter without exposing its value
+
+    Args:
+        value: Parameter value
+
+    Returns:
+        Type name, with length for strings and sequences
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, (str, bytes)):
+        return f"{type(value).__name__}({len(value)})"
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+class SlowQueryLog:
+    """
+    Ring buffer of statements slower than the configured threshold
+
+    Entries are also written to the log as JSON. Optionally a plan is
+    captured with EXPLAIN (ANALYZE, BUFFERS) on a separate connection in a
+    read-only transaction, at most once per query shape per cooldown.
+    """
+    _entries: deque[dict[str, Any]] | None = None
+    _ids = count(1)
+    _explained_at: dict[str, float] = {}
+    _tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def _buffer(cls) -> deque[dict[str, Any]]:
+        if cls._entries is None:
+            cls._entries = deque(maxlen=get_settings().database.slow_query_log_size)
+        return cls._entries
+
+    @classmethod
+    def observe(cls, query: str, args: tuple[Any, ...], elapsed: float, caller: str, pool: Pool | None) -> None:
+        """
+        Record statement if it exceeded the slow query threshold
+
+        Args:
+            query: SQL query
+            args: Query parameters
+            elapsed: Execution time in seconds
+            caller: Calling function
+            pool: Pool used for plan capture
+        """
+        settings = get_settings().database
+        duration_ms = elapsed * 1000
+        if settings.slow_query_threshold_ms <= 0 or duration_ms < settings.slow_query_threshold_ms:
+            return
+
+        normalized = normalize_query(query)
+        fingerprint = hashlib.sha1(normalized.encode()).hexdigest()[:16]
+        entry = {
+            "id": next(cls._ids),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration_ms, 3),
+            "caller": caller,
+            "fingerprint": fingerprint,
+            "query": normalized[:MAX_QUERY_LENGTH],
+            "params": [param_shape(arg) for arg in args],
+            "plan": None,
+            "plan_error": None,
+        }
+        cls._buffer().append(entry)
+        logger.warning("Slow query %s", json.dumps({key: value for key, value in entry.items() if key != "plan"}))
+
+        if settings.slow_query_explain and pool is not None and cls._should_explain(normalized, fingerprint):
+            task = asyncio.get_running_loop().create_task(cls._explain(entry, query, args, pool))
+            cls._tasks.add(task)
+            task.add_done_callback(cls._tasks.discard)
+
+    @classmethod
+    def _should_explain(cls, normalized: str, fingerprint: str) -> bool:
+        if not _READ_STATEMENT.match(normalized):
+            return False
+        now = time.monotonic()
+        explained_at = cls._explained_at.get(fingerprint)
+        if explained_at is not None and now - explained_at < EXPLAIN_COOLDOWN_SECONDS:
+            return False
+        if len(cls._explained_at) >= 1000:
+            cls._explained_at.clear()
+        cls._explained_at[fingerprint] = now
+        return True
+
+    @classmethod
+    async def _explain(cls, entry: dict[str, Any], query: str, args: tuple[Any, ...], pool: Pool) -> None:
+        """
+        Capture execution plan of a slow statement
+
+        Skipped when the pool has no idle connection, so plan capture never
+        competes with requests for connections
+        """
+        if pool.get_idle_size() == 0:
+            entry["plan_error"] = "пул соединений занят"
+            return
+        try:
+            async with pool.acquire() as conn:
+                async with conn.transaction(readonly=True):
+                    await conn.execute(f"SET LOCAL statement_timeout = {EXPLAIN_TIMEOUT_MS}")
+                    plan = await conn.fetchval(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}", *args)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            entry["plan_error"] = f"{type(exc).__name__}: {exc}"
+            logger.warning("EXPLAIN of slow query %s failed: %s", entry["fingerprint"], exc)
+            return
+
+        entry["plan"] = json.loads(plan)[0] if isinstance(plan, str) else plan
+        logger.warning("Slow query plan %s", json.dumps({"id": entry["id"], "fingerprint": entry["fingerprint"], "plan": entry["plan"]}))
+
+    @classmethod
+    def entries(cls, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Get recorded slow queries, newest first
+
+        Args:
+            limit: Maximum number of entries
+
+        Returns:
+            List of slow query entries
+        """
+        entries = list(reversed(cls._buffer()))
+        return entries[:limit] if limit is not None else entries
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop recorded slow queries
+        """
+        cls._buffer().clear()
+        cls._explained_at.clear()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        Cancel plan captures in progress
+        """
+        tasks = list(cls._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
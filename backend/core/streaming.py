@@ -0,0 +1,216 @@
+import csv
+import io
+from datetime import date, datetime
+from typing import Any, AsyncGenerator, AsyncIterable, Iterable
+
+import asyncpg
+from fastapi.responses import StreamingResponse
+
+from backend.core.database import get_db_connection
+from backend.core.serialization import dumps
+
+STREAM_CHUNK_SIZE = 500
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_FORMAT_PATTERN = "^(ndjson|csv)$"
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def encode_ndjson(rows: Iterable[dict[str, Any]]) -> bytes:
+    """
+    Encode rows as newline-delimited JSON
+
+    Args:
+        rows: Rows to encode
+
+    Returns:
+        NDJSON bytes (one object per line)
+    """
+    return b"".join(dumps(row) + b"\n" for row in rows)
+
+
+def encode_csv(rows: Iterable[dict[str, Any]], columns: list[str], header: bool = False) -> bytes:
+    """
+    Encode rows as CSV
+
+    Args:
+        rows: Rows to encode
+        columns: Column order
+        header: Emit header line first
+
+    Returns:
+        CSV bytes
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(columns)
+    for row in rows:
+        writer.writerow([_csv_value(row.get(column)) for column in columns])
+    return buffer.getvalue().encode()
+
+
+def encode_rows(rows: Iterable[dict[str, Any]], fmt: str, columns: list[str]) -> bytes:
+    """
+    Encode rows in export format
+
+    Args:
+        rows: Rows to encode
+        fmt: Export format (ndjson or csv)
+        columns: Column order for CSV
+
+    Returns:
+        Encoded bytes
+    """
+    if fmt == "csv":
+        return encode_csv(rows, columns)
+    return encode_ndjson(rows)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ";".join(str(item) for item in value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+async def iter_cursor(
+    conn: asyncpg.Connection,
+    query: str,
+    *args: Any,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncGenerator[list[dict[str, Any]], None]:
+    """
+    Iterate query results in fixed-size chunks through a server-side cursor
+
+    Must be called inside a transaction
+
+    Args:
+        conn: Database connection
+        query: SQL query
+        *args: Query parameters
+        chunk_size: Rows per chunk
+
+    Yields:
+        Lists of rows as dictionaries
+    """
+    cursor = await conn.cursor(query, *args)
+    while True:
+        rows = await cursor.fetch(chunk_size)
+        if not rows:
+            break
+        yield [dict(row) for row in rows]
+        if len(rows) < chunk_size:
+            break
+
+
+async def stream_query(
+    query: str,
+    *args: Any,
+    fmt: str = "ndjson",
+    columns: list[str] | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Stream query results as encoded chunks
+
+    Holds the request connection (a private one if it is busy) and a
+    read-only transaction for the lifetime of the stream. The request scope
+    stays open until the response body is sent, so the stream can be
+    consumed after the endpoint has returned.
+
+    Args:
+        query: SQL query
+        *args: Query parameters
+        fmt: Export format (ndjson or csv)
+        columns: Column order for CSV
+        chunk_size: Rows per chunk
+
+    Yields:
+        Encoded chunks
+    """
+    columns = columns or []
+    if fmt == "csv":
+        yield encode_csv([], columns, header=True)
+
+    async with get_db_connection() as conn:
+        async with conn.transaction(readonly=True):
+            async for rows in iter_cursor(conn, query, *args, chunk_size=chunk_size):
+                yield encode_rows(rows, fmt, columns)
+
+
+def streaming_response(chunks: AsyncIterable[bytes], fmt: str, filename: str) -> StreamingResponse:
+    """
+    Wrap encoded chunks into downloadable streaming response
+
+    Args:
+        chunks: Stream of encoded chunks
+        fmt: Export format (ndjson or csv)
+        filename: File name without extension
+
+    Returns:
+        Streaming response
+    """
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncGenerator[str, None]:
+    """
+    Split byte stream into text lines
+
+    Args:
+        chunks: Stream of byte chunks
+
+    Yields:
+        Decoded lines without line terminators
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r").decode("utf-8-sig")
+    if buffer:
+        yield buffer.rstrip(b"\r").decode("utf-8-sig")
+
+
+async def iter_csv_rows(lines: AsyncIterable[str]) -> AsyncGenerator[tuple[int, list[str]], None]:
+    """
+    Parse CSV records from a line stream
+
+    Quoted fields spanning several lines are joined before parsing
+
+    Args:
+        lines: Stream of text lines
+
+    Yields:
+        Tuples of (starting line number, parsed fields)
+    """
+    pending: list[str] = []
+    start_line = 0
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not pending:
+            start_line = line_no
+        pending.append(line)
+        record = "\n".join(pending)
+        if record.count('"') % 2:
+            continue
+        pending = []
+        if not record.strip():
+            continue
+        yield start_line, next(csv.reader([record]))
+    if pending:
+        yield start_line, next(csv.reader(["\n".join(pending)]))
@@ -1,12 +1,37 @@
+import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.config import get_settings
-from backend.core.database import Database
+from backend.core.changes import ChangeFeed
+from backend.core.database import Database, RequestScopeMiddleware
 from backend.core.exceptions import APIException, api_exception_handler, general_exception_handler
-from backend.routers import auth, projects, teams, technologies, dashboard, admin
+from backend.core.jobs import JobRunner
+from backend.core.metrics import CONTENT_TYPE, MetricsMiddleware, render_metrics
+from backend.core.security import PasswordHasher
+from backend.routers import auth, projects, teams, technologies, dashboard, admin, search
+from backend.services.dashboard import DashboardService
+from backend.services.radar_views import RadarViewRefresher
+from backend.services.reference_data import ReferenceDataService
+
+logger = logging.getLogger(__name__)
+
+
+async def warmup() -> None:
+    """
+    Fill in-process caches before the worker accepts traffic
+
+    The server starts accepting connections only after lifespan startup,
+    so the first requests of a fresh worker do not pay for cold caches.
+    Reference data is required; the dashboard snapshot is best effort.
+    """
+    await ReferenceDataService.get_snapshot()
+    try:
+        await DashboardService.get_snapshot()
+    except Exception:
+        logger.warning("Dashboard warmup failed", exc_info=True)
 
 
 @asynccontextmanager
@@ -14,11 +39,20 @@ async def lifespan(_: FastAPI):
     """
     Application lifespan manager
 
-    Handles startup and shutdown events
+    Handles startup and shutdown events. Shutdown runs after the server
+    has drained in-flight requests (or given up after the graceful timeout)
     """
     await Database.connect()
+    await ChangeFeed.start()
+    await warmup()
+    await RadarViewRefresher.start()
+    await JobRunner.start()
     yield
-    await Database.disconnect()
+    await JobRunner.stop()
+    await RadarViewRefresher.stop()
+    await ChangeFeed.stop()
+    await Database.disconnect(timeout=get_settings().server.graceful_shutdown_seconds)
+    PasswordHasher.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -48,6 +82,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    app.add_middleware(RequestScopeMiddleware)
+    app.add_middleware(MetricsMiddleware)
+
     app.add_exception_handler(APIException, api_exception_handler)
     app.add_exception_handler(Exception, general_exception_handler)
 
@@ -59,6 +96,7 @@ def create_app() -> FastAPI:
     app.include_router(teams.router, prefix=f"{api_prefix}")
     app.include_router(dashboard.router, prefix=f"{api_prefix}")
     app.include_router(admin.router, prefix=f"{api_prefix}")
+    app.include_router(search.router, prefix=f"{api_prefix}")
 
     @app.get("/")
     async def root():
@@ -74,6 +112,13 @@ def create_app() -> FastAPI:
         """
         return {"status": "healthy"}
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """
+        Prometheus metrics of this worker
+        """
+        return Response(render_metrics(), media_type=CONTENT_TYPE)
+
     return app
 
 
@@ -0,0 +1,25 @@
+-- Rollback for technology stats counters
+
+DROP FUNCTION IF EXISTS rebuild_technology_stats();
+
+DROP TRIGGER IF EXISTS project_technologies_usage_stats_delete ON project_technologies;
+DROP TRIGGER IF EXISTS project_technologies_usage_stats_update ON project_technologies;
+DROP TRIGGER IF EXISTS project_technologies_usage_stats_insert ON project_technologies;
+DROP TRIGGER IF EXISTS technologies_usage_stats_insert ON technologies;
+
+DROP TRIGGER IF EXISTS technology_categories_counter_delete ON technology_categories;
+DROP TRIGGER IF EXISTS technology_categories_counter_insert ON technology_categories;
+DROP TRIGGER IF EXISTS project_technologies_counter_delete ON project_technologies;
+DROP TRIGGER IF EXISTS project_technologies_counter_insert ON project_technologies;
+DROP TRIGGER IF EXISTS projects_counter_delete ON projects;
+DROP TRIGGER IF EXISTS projects_counter_insert ON projects;
+DROP TRIGGER IF EXISTS technologies_counter_delete ON technologies;
+DROP TRIGGER IF EXISTS technologies_counter_insert ON technologies;
+
+DROP FUNCTION IF EXISTS technology_usage_stats_apply_delta();
+DROP FUNCTION IF EXISTS technology_usage_stats_on_technology_insert();
+DROP FUNCTION IF EXISTS registry_counters_on_delete();
+DROP FUNCTION IF EXISTS registry_counters_on_insert();
+
+DROP TABLE IF EXISTS technology_usage_stats;
+DROP TABLE IF EXISTS registry_counters;
@@ -0,0 +1,227 @@
+-- =====================================================
+-- TECHNOLOGY STATS COUNTERS
+-- =====================================================
+
+-- Глобальные счётчики реестра (сводка для /technologies/stats)
+CREATE TABLE registry_counters (
+    name VARCHAR(50) PRIMARY KEY,
+    value BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Агрегаты использования технологий в проектах
+CREATE TABLE technology_usage_stats (
+    technology_id INTEGER PRIMARY KEY REFERENCES technologies(id) ON DELETE CASCADE,
+    project_count INTEGER NOT NULL DEFAULT 0,
+    production_count INTEGER NOT NULL DEFAULT 0,
+    development_count INTEGER NOT NULL DEFAULT 0,
+    testing_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_technology_usage_stats_project_count
+    ON technology_usage_stats(project_count DESC, technology_id);
+
+-- Счётчики строк таблиц (имя счётчика передаётся аргументом триггера)
+CREATE OR REPLACE FUNCTION registry_counters_on_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE registry_counters
+    SET value = value + (SELECT COUNT(*) FROM new_rows),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION registry_counters_on_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE registry_counters
+    SET value = value - (SELECT COUNT(*) FROM old_rows),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER technologies_counter_insert AFTER INSERT ON technologies
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION registry_counters_on_insert('total_technologies');
+
+CREATE TRIGGER technologies_counter_delete AFTER DELETE ON technologies
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION registry_counters_on_delete('total_technologies');
+
+CREATE TRIGGER projects_counter_insert AFTER INSERT ON projects
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION registry_counters_on_insert('total_projects');
+
+CREATE TRIGGER projects_counter_delete AFTER DELETE ON projects
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION registry_counters_on_delete('total_projects');
+
+CREATE TRIGGER project_technologies_counter_insert AFTER INSERT ON project_technologies
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION registry_counters_on_insert('total_usages');
+
+CREATE TRIGGER project_technologies_counter_delete AFTER DELETE ON project_technologies
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION registry_counters_on_delete('total_usages');
+
+CREATE TRIGGER technology_categories_counter_insert AFTER INSERT ON technology_categories
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION registry_counters_on_insert('total_categories');
+
+CREATE TRIGGER technology_categories_counter_delete AFTER DELETE ON technology_categories
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION registry_counters_on_delete('total_categories');
+
+-- Строка агрегатов создаётся вместе с технологией
+CREATE OR REPLACE FUNCTION technology_usage_stats_on_technology_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO technology_usage_stats (technology_id)
+    SELECT id FROM new_rows
+    ON CONFLICT (technology_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER technologies_usage_stats_insert AFTER INSERT ON technologies
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION technology_usage_stats_on_technology_insert();
+
+-- Применение дельт по связям проект-технология
+CREATE OR REPLACE FUNCTION technology_usage_stats_apply_delta()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE technology_usage_stats s
+        SET project_count = s.project_count - d.project_count,
+            production_count = s.production_count - d.production_count,
+            development_count = s.development_count - d.development_count,
+            testing_count = s.testing_count - d.testing_count,
+            updated_at = CURRENT_TIMESTAMP
+        FROM (
+            SELECT
+                technology_id,
+                COUNT(*) AS project_count,
+                COUNT(*) FILTER (WHERE usage_type = 'production') AS production_count,
+                COUNT(*) FILTER (WHERE usage_type = 'development') AS development_count,
+                COUNT(*) FILTER (WHERE usage_type = 'testing') AS testing_count
+            FROM old_rows
+            GROUP BY technology_id
+        ) d
+        WHERE s.technology_id = d.technology_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO technology_usage_stats AS s (
+            technology_id, project_count, production_count,
+            development_count, testing_count, updated_at
+        )
+        SELECT
+            technology_id,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE usage_type = 'production'),
+            COUNT(*) FILTER (WHERE usage_type = 'development'),
+            COUNT(*) FILTER (WHERE usage_type = 'testing'),
+            CURRENT_TIMESTAMP
+        FROM new_rows
+        WHERE technology_id IS NOT NULL
+        GROUP BY technology_id
+        ON CONFLICT (technology_id) DO UPDATE
+        SET project_count = s.project_count + EXCLUDED.project_count,
+            production_count = s.production_count + EXCLUDED.production_count,
+            development_count = s.development_count + EXCLUDED.development_count,
+            testing_count = s.testing_count + EXCLUDED.testing_count,
+            updated_at = CURRENT_TIMESTAMP;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER project_technologies_usage_stats_insert AFTER INSERT ON project_technologies
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION technology_usage_stats_apply_delta();
+
+CREATE TRIGGER project_technologies_usage_stats_update AFTER UPDATE ON project_technologies
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION technology_usage_stats_apply_delta();
+
+CREATE TRIGGER project_technologies_usage_stats_delete AFTER DELETE ON project_technologies
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION technology_usage_stats_apply_delta();
+
+-- Полный пересчёт счётчиков; возвращает количество исправленных строк
+CREATE OR REPLACE FUNCTION rebuild_technology_stats()
+RETURNS INTEGER AS $$
+DECLARE
+    drifted INTEGER := 0;
+    affected INTEGER;
+BEGIN
+    LOCK TABLE technologies, projects, project_technologies, technology_categories IN SHARE MODE;
+
+    WITH actual(name, value) AS (
+        VALUES
+            ('total_technologies', (SELECT COUNT(*) FROM technologies)),
+            ('total_projects', (SELECT COUNT(*) FROM projects)),
+            ('total_usages', (SELECT COUNT(*) FROM project_technologies)),
+            ('total_categories', (SELECT COUNT(*) FROM technology_categories))
+    )
+    INSERT INTO registry_counters AS rc (name, value, updated_at)
+    SELECT name, value, CURRENT_TIMESTAMP FROM actual
+    ON CONFLICT (name) DO UPDATE
+    SET value = EXCLUDED.value, updated_at = CURRENT_TIMESTAMP
+    WHERE rc.value IS DISTINCT FROM EXCLUDED.value;
+    GET DIAGNOSTICS affected = ROW_COUNT;
+    drifted := drifted + affected;
+
+    WITH actual AS (
+        SELECT
+            t.id AS technology_id,
+            COUNT(pt.id) AS project_count,
+            COUNT(pt.id) FILTER (WHERE pt.usage_type = 'production') AS production_count,
+            COUNT(pt.id) FILTER (WHERE pt.usage_type = 'development') AS development_count,
+            COUNT(pt.id) FILTER (WHERE pt.usage_type = 'testing') AS testing_count
+        FROM technologies t
+        LEFT JOIN project_technologies pt ON pt.technology_id = t.id
+        GROUP BY t.id
+    )
+    INSERT INTO technology_usage_stats AS s (
+        technology_id, project_count, production_count,
+        development_count, testing_count, updated_at
+    )
+    SELECT technology_id, project_count, production_count,
+           development_count, testing_count, CURRENT_TIMESTAMP
+    FROM actual
+    ON CONFLICT (technology_id) DO UPDATE
+    SET project_count = EXCLUDED.project_count,
+        production_count = EXCLUDED.production_count,
+        development_count = EXCLUDED.development_count,
+        testing_count = EXCLUDED.testing_count,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (s.project_count, s.production_count, s.development_count, s.testing_count)
+        IS DISTINCT FROM
+        (EXCLUDED.project_count, EXCLUDED.production_count, EXCLUDED.development_count, EXCLUDED.testing_count);
+    GET DIAGNOSTICS affected = ROW_COUNT;
+    drifted := drifted + affected;
+
+    RETURN drifted;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Начальное заполнение
+INSERT INTO registry_counters (name) VALUES
+    ('total_technologies'),
+    ('total_projects'),
+    ('total_usages'),
+    ('total_categories');
+
+SELECT rebuild_technology_stats();
+
+COMMENT ON TABLE registry_counters IS 'Incrementally maintained registry totals used by /technologies/stats';
+COMMENT ON TABLE technology_usage_stats IS 'Per-technology usage rollup maintained by project_technologies triggers';
+COMMENT ON FUNCTION rebuild_technology_stats IS 'Recomputes stats counters from scratch. Returns number of drifted rows fixed.';
@@ -0,0 +1,20 @@
+-- Rollback for search indexes
+
+DROP INDEX IF EXISTS idx_users_full_name_trgm;
+DROP INDEX IF EXISTS idx_users_email_trgm;
+DROP INDEX IF EXISTS idx_teams_description_trgm;
+DROP INDEX IF EXISTS idx_teams_name_trgm;
+DROP INDEX IF EXISTS idx_technologies_description_trgm;
+DROP INDEX IF EXISTS idx_technologies_name_trgm;
+DROP INDEX IF EXISTS idx_projects_description_trgm;
+DROP INDEX IF EXISTS idx_projects_name_trgm;
+
+DROP INDEX IF EXISTS idx_users_search_vector;
+DROP INDEX IF EXISTS idx_teams_search_vector;
+DROP INDEX IF EXISTS idx_technologies_search_vector;
+DROP INDEX IF EXISTS idx_projects_search_vector;
+
+ALTER TABLE users DROP COLUMN IF EXISTS search_vector;
+ALTER TABLE teams DROP COLUMN IF EXISTS search_vector;
+ALTER TABLE technologies DROP COLUMN IF EXISTS search_vector;
+ALTER TABLE projects DROP COLUMN IF EXISTS search_vector;
@@ -0,0 +1,41 @@
+-- =====================================================
+-- SEARCH INDEXES
+-- =====================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Полнотекстовые векторы (конфигурация 'simple' — данные на русском и английском)
+ALTER TABLE projects ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', COALESCE(name, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(description, '')), 'B')
+) STORED;
+
+ALTER TABLE technologies ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', COALESCE(name, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(description, '')), 'B')
+) STORED;
+
+ALTER TABLE teams ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', COALESCE(name, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(description, '')), 'B')
+) STORED;
+
+ALTER TABLE users ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', COALESCE(full_name, '')), 'A') ||
+    setweight(to_tsvector('simple', COALESCE(email, '')), 'B')
+) STORED;
+
+CREATE INDEX idx_projects_search_vector ON projects USING GIN (search_vector);
+CREATE INDEX idx_technologies_search_vector ON technologies USING GIN (search_vector);
+CREATE INDEX idx_teams_search_vector ON teams USING GIN (search_vector);
+CREATE INDEX idx_users_search_vector ON users USING GIN (search_vector);
+
+-- Триграммные индексы для подстрочного поиска (ILIKE '%...%')
+CREATE INDEX idx_projects_name_trgm ON projects USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_projects_description_trgm ON projects USING GIN (description gin_trgm_ops);
+CREATE INDEX idx_technologies_name_trgm ON technologies USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_technologies_description_trgm ON technologies USING GIN (description gin_trgm_ops);
+CREATE INDEX idx_teams_name_trgm ON teams USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_teams_description_trgm ON teams USING GIN (description gin_trgm_ops);
+CREATE INDEX idx_users_email_trgm ON users USING GIN (email gin_trgm_ops);
+CREATE INDEX idx_users_full_name_trgm ON users USING GIN (full_name gin_trgm_ops);
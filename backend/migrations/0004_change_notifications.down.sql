@@ -0,0 +1,13 @@
+-- Rollback for cross-worker change notifications
+
+DROP TRIGGER IF EXISTS project_technologies_notify_change ON project_technologies;
+DROP TRIGGER IF EXISTS projects_notify_change ON projects;
+DROP TRIGGER IF EXISTS technology_versions_notify_change ON technology_versions;
+DROP TRIGGER IF EXISTS technologies_notify_change ON technologies;
+DROP TRIGGER IF EXISTS technology_statuses_notify_change ON technology_statuses;
+DROP TRIGGER IF EXISTS technology_categories_notify_change ON technology_categories;
+DROP TRIGGER IF EXISTS team_members_notify_change ON team_members;
+DROP TRIGGER IF EXISTS teams_notify_change ON teams;
+DROP TRIGGER IF EXISTS users_notify_change ON users;
+
+DROP FUNCTION IF EXISTS notify_table_change();
@@ -0,0 +1,48 @@
+-- Cross-worker change notifications
+--
+-- Every statement that modifies a registry table sends its table name on the
+-- stack_radar_changes channel. Notifications are delivered on commit and
+-- identical payloads within one transaction are collapsed by PostgreSQL.
+
+CREATE OR REPLACE FUNCTION notify_table_change() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('stack_radar_changes', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER users_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON users
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER teams_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON teams
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER team_members_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON team_members
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_categories_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON technology_categories
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_statuses_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON technology_statuses
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technologies_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON technologies
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_versions_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON technology_versions
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER projects_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON projects
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER project_technologies_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON project_technologies
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
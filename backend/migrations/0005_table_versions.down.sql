@@ -0,0 +1,10 @@
+-- Rollback for table-level version counters
+
+CREATE OR REPLACE FUNCTION notify_table_change() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('stack_radar_changes', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TABLE IF EXISTS table_versions;
@@ -0,0 +1,36 @@
+-- Table-level version counters for HTTP conditional caching
+--
+-- The change notification trigger now also bumps the version of the
+-- modified table. The row lock serializes bumps of the same table, so
+-- clock_timestamp() keeps updated_at monotonic across transactions.
+
+CREATE TABLE table_versions (
+    table_name VARCHAR(100) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO table_versions (table_name)
+VALUES
+    ('users'),
+    ('teams'),
+    ('team_members'),
+    ('technology_categories'),
+    ('technology_statuses'),
+    ('technologies'),
+    ('technology_versions'),
+    ('projects'),
+    ('project_technologies');
+
+CREATE OR REPLACE FUNCTION notify_table_change() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO table_versions (table_name, version, updated_at)
+    VALUES (TG_TABLE_NAME, 1, clock_timestamp())
+    ON CONFLICT (table_name) DO UPDATE
+    SET version = table_versions.version + 1,
+        updated_at = GREATEST(table_versions.updated_at, clock_timestamp());
+
+    PERFORM pg_notify('stack_radar_changes', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,12 @@
+-- Rollback for materialized technology radar rollups
+
+DROP TRIGGER IF EXISTS materialized_view_refreshes_notify ON materialized_view_refreshes;
+DROP FUNCTION IF EXISTS notify_view_refresh();
+DROP TABLE IF EXISTS materialized_view_refreshes;
+
+DELETE FROM table_versions
+WHERE table_name IN ('mv_technology_usage', 'mv_category_usage', 'mv_team_summary');
+
+DROP MATERIALIZED VIEW IF EXISTS mv_team_summary;
+DROP MATERIALIZED VIEW IF EXISTS mv_category_usage;
+DROP MATERIALIZED VIEW IF EXISTS mv_technology_usage;
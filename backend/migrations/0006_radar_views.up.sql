@@ -0,0 +1,83 @@
+-- Materialized technology radar rollups
+--
+-- Refreshed concurrently by the application after writes to their source
+-- tables (see services/radar_views.py). Every refresh is recorded in
+-- materialized_view_refreshes together with the summed table_versions of
+-- the sources it was built from; recording it bumps the view's own
+-- version and announces it on the changes channel like a table write.
+
+CREATE MATERIALIZED VIEW mv_technology_usage AS
+SELECT
+    t.id AS technology_id,
+    t.name,
+    t.category_id,
+    tc.name AS category_name,
+    COUNT(pt.id) AS project_count,
+    COUNT(pt.id) FILTER (WHERE pt.usage_type = 'production') AS production_count,
+    COUNT(pt.id) FILTER (WHERE pt.usage_type = 'development') AS development_count,
+    COUNT(pt.id) FILTER (WHERE pt.usage_type = 'testing') AS testing_count
+FROM technologies t
+LEFT JOIN technology_categories tc ON tc.id = t.category_id
+LEFT JOIN project_technologies pt ON pt.technology_id = t.id
+GROUP BY t.id, tc.name;
+
+CREATE UNIQUE INDEX idx_mv_technology_usage_technology ON mv_technology_usage(technology_id);
+CREATE INDEX idx_mv_technology_usage_project_count ON mv_technology_usage(project_count DESC, name);
+
+CREATE MATERIALIZED VIEW mv_category_usage AS
+SELECT
+    tc.id AS category_id,
+    tc.name AS category,
+    COUNT(DISTINCT t.id) AS technology_count,
+    COUNT(DISTINCT pt.project_id) AS project_count
+FROM technology_categories tc
+LEFT JOIN technologies t ON t.category_id = tc.id
+LEFT JOIN project_technologies pt ON pt.technology_id = t.id
+GROUP BY tc.id, tc.name;
+
+CREATE UNIQUE INDEX idx_mv_category_usage_category ON mv_category_usage(category_id);
+
+CREATE MATERIALIZED VIEW mv_team_summary AS
+SELECT
+    t.id AS team_id,
+    t.name,
+    u.full_name AS lead_name,
+    COUNT(p.id) AS project_count,
+    COUNT(p.id) FILTER (WHERE p.status = 'active') AS active_project_count
+FROM teams t
+LEFT JOIN users u ON u.id = t.lead_id
+LEFT JOIN projects p ON p.team_id = t.id
+GROUP BY t.id, u.full_name;
+
+CREATE UNIQUE INDEX idx_mv_team_summary_team ON mv_team_summary(team_id);
+CREATE INDEX idx_mv_team_summary_project_count ON mv_team_summary(project_count DESC);
+
+CREATE TABLE materialized_view_refreshes (
+    view_name VARCHAR(100) PRIMARY KEY,
+    source_version BIGINT NOT NULL DEFAULT 0,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    duration_ms NUMERIC(12, 3)
+);
+
+INSERT INTO materialized_view_refreshes (view_name)
+VALUES
+    ('mv_technology_usage'),
+    ('mv_category_usage'),
+    ('mv_team_summary');
+
+CREATE OR REPLACE FUNCTION notify_view_refresh() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO table_versions (table_name, version, updated_at)
+    VALUES (NEW.view_name, 1, clock_timestamp())
+    ON CONFLICT (table_name) DO UPDATE
+    SET version = table_versions.version + 1,
+        updated_at = GREATEST(table_versions.updated_at, clock_timestamp());
+
+    PERFORM pg_notify('stack_radar_changes', NEW.view_name);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER materialized_view_refreshes_notify
+    AFTER INSERT OR UPDATE ON materialized_view_refreshes
+    FOR EACH ROW EXECUTE FUNCTION notify_view_refresh();
@@ -0,0 +1,89 @@
+-- Rollback for background job runs
+
+DROP FUNCTION archive_inactive_projects(INTEGER, BOOLEAN, INTEGER);
+
+CREATE OR REPLACE FUNCTION archive_inactive_projects(
+    inactive_days INTEGER DEFAULT 180,
+    dry_run BOOLEAN DEFAULT TRUE
+)
+RETURNS TABLE(
+    project_id INTEGER,
+    project_name VARCHAR,
+    last_updated TIMESTAMP,
+    days_inactive INTEGER,
+    action_taken TEXT
+) AS $$
+DECLARE
+    archived_count INTEGER := 0;
+    project_ids_array INTEGER[];
+BEGIN
+    IF dry_run THEN
+        -- Preview mode: just show what would be archived without making changes
+        RETURN QUERY
+        SELECT 
+            p.id,
+            p.name,
+            p.updated_at,
+            EXTRACT(DAY FROM NOW() - p.updated_at)::INTEGER as days_inactive,
+            'Would archive (DRY RUN)'::TEXT as action
+        FROM projects p
+        WHERE p.status = 'active'
+          AND p.updated_at < NOW() - (inactive_days || ' days')::INTERVAL
+        ORDER BY p.updated_at ASC;
+    ELSE
+        -- Real archiving mode: actually update projects
+        
+        -- First, collect IDs of projects to be archived for logging
+        SELECT ARRAY_AGG(id) INTO project_ids_array
+        FROM projects
+        WHERE status = 'active'
+          AND updated_at < NOW() - (inactive_days || ' days')::INTERVAL;
+        
+        -- If no projects to archive, return early
+        IF project_ids_array IS NULL THEN
+            RETURN;
+        END IF;
+        
+        -- Update projects to archived status
+        UPDATE projects p
+        SET status = 'archived', 
+            updated_at = NOW()
+        WHERE p.status = 'active'
+          AND p.updated_at < NOW() - (inactive_days || ' days')::INTERVAL;
+        
+        -- Get count of affected rows
+        GET DIAGNOSTICS archived_count = ROW_COUNT;
+        
+        -- Log the archiving operation (archived_by will be set by backend)
+        INSERT INTO archive_log (
+            projects_archived, 
+            inactive_days_threshold, 
+            project_ids,
+            notes
+        )
+        VALUES (
+            archived_count,
+            inactive_days,
+            project_ids_array,
+            'Automated archiving of ' || archived_count || ' inactive project(s)'
+        );
+        
+        -- Return archived projects
+        RETURN QUERY
+        SELECT 
+            p.id,
+            p.name,
+            p.updated_at,
+            EXTRACT(DAY FROM NOW() - p.updated_at)::INTEGER as days_inactive,
+            'Archived successfully'::TEXT as action
+        FROM projects p
+        WHERE p.id = ANY(project_ids_array)
+        ORDER BY p.updated_at ASC;
+        
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION archive_inactive_projects IS 'Archives projects inactive for specified days. Supports dry-run preview mode.';
+
+DROP TABLE IF EXISTS job_runs;
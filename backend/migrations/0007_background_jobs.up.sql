@@ -0,0 +1,118 @@
+-- Background job runs and race-free archive attribution
+--
+-- job_runs records every run of an in-process background job. Scheduled
+-- runs carry the slot they were scheduled for; the unique index lets only
+-- one worker claim a slot. archive_inactive_projects now takes the user
+-- that started archiving and writes it into archive_log itself.
+
+CREATE TABLE job_runs (
+    id BIGSERIAL PRIMARY KEY,
+    job_name VARCHAR(100) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'succeeded', 'failed', 'skipped')),
+    params JSONB NOT NULL DEFAULT '{}',
+    scheduled_for TIMESTAMPTZ,
+    triggered_by INTEGER REFERENCES users(id) ON DELETE SET NULL,
+    worker VARCHAR(255),
+    progress_done BIGINT,
+    progress_total BIGINT,
+    message TEXT,
+    result JSONB,
+    error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+CREATE UNIQUE INDEX idx_job_runs_schedule_slot ON job_runs(job_name, scheduled_for);
+CREATE INDEX idx_job_runs_job_created ON job_runs(job_name, created_at DESC);
+CREATE INDEX idx_job_runs_created ON job_runs(created_at DESC);
+
+DROP FUNCTION archive_inactive_projects(INTEGER, BOOLEAN);
+
+CREATE OR REPLACE FUNCTION archive_inactive_projects(
+    inactive_days INTEGER DEFAULT 180,
+    dry_run BOOLEAN DEFAULT TRUE,
+    archived_by_user INTEGER DEFAULT NULL
+)
+RETURNS TABLE(
+    project_id INTEGER,
+    project_name VARCHAR,
+    last_updated TIMESTAMP,
+    days_inactive INTEGER,
+    action_taken TEXT
+) AS $$
+DECLARE
+    archived_count INTEGER := 0;
+    project_ids_array INTEGER[];
+BEGIN
+    IF dry_run THEN
+        -- Preview mode: just show what would be archived without making changes
+        RETURN QUERY
+        SELECT 
+            p.id,
+            p.name,
+            p.updated_at,
+            EXTRACT(DAY FROM NOW() - p.updated_at)::INTEGER as days_inactive,
+            'Would archive (DRY RUN)'::TEXT as action
+        FROM projects p
+        WHERE p.status = 'active'
+          AND p.updated_at < NOW() - (inactive_days || ' days')::INTERVAL
+        ORDER BY p.updated_at ASC;
+    ELSE
+        -- Real archiving mode: actually update projects
+        
+        -- First, collect IDs of projects to be archived for logging
+        SELECT ARRAY_AGG(id) INTO project_ids_array
+        FROM projects
+        WHERE status = 'active'
+          AND updated_at < NOW() - (inactive_days || ' days')::INTERVAL;
+        
+        -- If no projects to archive, return early
+        IF project_ids_array IS NULL THEN
+            RETURN;
+        END IF;
+        
+        -- Update projects to archived status
+        UPDATE projects p
+        SET status = 'archived', 
+            updated_at = NOW()
+        WHERE p.status = 'active'
+          AND p.updated_at < NOW() - (inactive_days || ' days')::INTERVAL;
+        
+        -- Get count of affected rows
+        GET DIAGNOSTICS archived_count = ROW_COUNT;
+        
+        -- Log the archiving operation together with the user who started it
+        INSERT INTO archive_log (
+            projects_archived,
+            inactive_days_threshold,
+            project_ids,
+            archived_by,
+            notes
+        )
+        VALUES (
+            archived_count,
+            inactive_days,
+            project_ids_array,
+            archived_by_user,
+            'Automated archiving of ' || archived_count || ' inactive project(s)'
+        );
+        
+        -- Return archived projects
+        RETURN QUERY
+        SELECT 
+            p.id,
+            p.name,
+            p.updated_at,
+            EXTRACT(DAY FROM NOW() - p.updated_at)::INTEGER as days_inactive,
+            'Archived successfully'::TEXT as action
+        FROM projects p
+        WHERE p.id = ANY(project_ids_array)
+        ORDER BY p.updated_at ASC;
+        
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION archive_inactive_projects IS 'Archives projects inactive for specified days. Supports dry-run preview mode. Records the initiating user in archive_log.';
@@ -0,0 +1,51 @@
+-- Rollback for chunked archiving
+
+DROP FUNCTION get_archive_history(INTEGER);
+
+CREATE OR REPLACE FUNCTION get_archive_history(limit_count INTEGER DEFAULT 10)
+RETURNS TABLE(
+    id INTEGER,
+    archived_at TIMESTAMP,
+    archived_by_name VARCHAR,
+    projects_count INTEGER,
+    inactive_threshold INTEGER,
+    notes TEXT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT 
+        al.id,
+        al.archived_at,
+        COALESCE(u.full_name, 'System')::VARCHAR as archived_by_name,
+        al.projects_archived,
+        al.inactive_days_threshold,
+        al.notes
+    FROM archive_log al
+    LEFT JOIN users u ON al.archived_by = u.id
+    ORDER BY al.archived_at DESC
+    LIMIT limit_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Move archived ids of chunked runs back into project_ids
+UPDATE archive_log al
+SET project_ids = items.project_ids
+FROM (
+    SELECT archive_log_id, ARRAY_AGG(project_id ORDER BY project_id) AS project_ids
+    FROM archive_items
+    GROUP BY archive_log_id
+) items
+WHERE al.id = items.archive_log_id;
+
+DROP TABLE IF EXISTS archive_items;
+DROP INDEX IF EXISTS idx_archive_log_in_progress;
+
+ALTER TABLE archive_log
+    DROP CONSTRAINT archive_log_status_check,
+    DROP COLUMN status,
+    DROP COLUMN cutoff,
+    DROP COLUMN batch_size,
+    DROP COLUMN batches,
+    DROP COLUMN cursor_updated_at,
+    DROP COLUMN cursor_id,
+    DROP COLUMN finished_at;
@@ -0,0 +1,67 @@
+-- Chunked archiving
+--
+-- Archiving runs in batches committed one by one. archive_log keeps the
+-- run state and keyset cursor (updated_at, id) over idx_projects_status_updated,
+-- so an interrupted run continues where it stopped. Archived projects are
+-- recorded in archive_items instead of the project_ids array.
+
+ALTER TABLE archive_log
+    ADD COLUMN status VARCHAR(20) NOT NULL DEFAULT 'completed',
+    ADD COLUMN cutoff TIMESTAMP,
+    ADD COLUMN batch_size INTEGER,
+    ADD COLUMN batches INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN cursor_updated_at TIMESTAMP,
+    ADD COLUMN cursor_id INTEGER,
+    ADD COLUMN finished_at TIMESTAMP,
+    ADD CONSTRAINT archive_log_status_check CHECK (status IN ('in_progress', 'completed'));
+
+-- At most one unfinished run
+CREATE UNIQUE INDEX idx_archive_log_in_progress ON archive_log ((TRUE)) WHERE status = 'in_progress';
+
+CREATE TABLE archive_items (
+    archive_log_id INTEGER NOT NULL REFERENCES archive_log(id) ON DELETE CASCADE,
+    project_id INTEGER NOT NULL,
+    project_name VARCHAR(255) NOT NULL,
+    last_updated TIMESTAMP NOT NULL,
+    days_inactive INTEGER NOT NULL,
+    batch INTEGER NOT NULL,
+    PRIMARY KEY (archive_log_id, project_id)
+);
+
+CREATE INDEX idx_archive_items_last_updated ON archive_items(archive_log_id, last_updated, project_id);
+
+COMMENT ON TABLE archive_items IS 'Projects archived by each chunked archiving run';
+
+-- History shows run state of chunked runs
+DROP FUNCTION get_archive_history(INTEGER);
+
+CREATE OR REPLACE FUNCTION get_archive_history(limit_count INTEGER DEFAULT 10)
+RETURNS TABLE(
+    id INTEGER,
+    archived_at TIMESTAMP,
+    archived_by_name VARCHAR,
+    projects_count INTEGER,
+    inactive_threshold INTEGER,
+    notes TEXT,
+    status VARCHAR,
+    batches INTEGER,
+    finished_at TIMESTAMP
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT 
+        al.id,
+        al.archived_at,
+        COALESCE(u.full_name, 'System')::VARCHAR as archived_by_name,
+        al.projects_archived,
+        al.inactive_days_threshold,
+        al.notes,
+        al.status,
+        al.batches,
+        al.finished_at
+    FROM archive_log al
+    LEFT JOIN users u ON al.archived_by = u.id
+    ORDER BY al.archived_at DESC
+    LIMIT limit_count;
+END;
+$$ LANGUAGE plpgsql;
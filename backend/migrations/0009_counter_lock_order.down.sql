@@ -0,0 +1,75 @@
+-- Rollback of deadlock-free stats counter triggers
+
+CREATE OR REPLACE FUNCTION registry_counters_on_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE registry_counters
+    SET value = value + (SELECT COUNT(*) FROM new_rows),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION registry_counters_on_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE registry_counters
+    SET value = value - (SELECT COUNT(*) FROM old_rows),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION technology_usage_stats_apply_delta()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE technology_usage_stats s
+        SET project_count = s.project_count - d.project_count,
+            production_count = s.production_count - d.production_count,
+            development_count = s.development_count - d.development_count,
+            testing_count = s.testing_count - d.testing_count,
+            updated_at = CURRENT_TIMESTAMP
+        FROM (
+            SELECT
+                technology_id,
+                COUNT(*) AS project_count,
+                COUNT(*) FILTER (WHERE usage_type = 'production') AS production_count,
+                COUNT(*) FILTER (WHERE usage_type = 'development') AS development_count,
+                COUNT(*) FILTER (WHERE usage_type = 'testing') AS testing_count
+            FROM old_rows
+            GROUP BY technology_id
+        ) d
+        WHERE s.technology_id = d.technology_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO technology_usage_stats AS s (
+            technology_id, project_count, production_count,
+            development_count, testing_count, updated_at
+        )
+        SELECT
+            technology_id,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE usage_type = 'production'),
+            COUNT(*) FILTER (WHERE usage_type = 'development'),
+            COUNT(*) FILTER (WHERE usage_type = 'testing'),
+            CURRENT_TIMESTAMP
+        FROM new_rows
+        WHERE technology_id IS NOT NULL
+        GROUP BY technology_id
+        ON CONFLICT (technology_id) DO UPDATE
+        SET project_count = s.project_count + EXCLUDED.project_count,
+            production_count = s.production_count + EXCLUDED.production_count,
+            development_count = s.development_count + EXCLUDED.development_count,
+            testing_count = s.testing_count + EXCLUDED.testing_count,
+            updated_at = CURRENT_TIMESTAMP;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP FUNCTION IF EXISTS lock_registry_counters();
@@ -0,0 +1,118 @@
+-- Deadlock-free stats counter triggers
+--
+-- Creating a project locked the total_projects counter before total_usages,
+-- deleting one took them in the opposite order (the ON DELETE CASCADE on
+-- project_technologies fires its statement triggers first), so concurrent
+-- create and delete could fail with 40P01. Every trigger that maintains
+-- counters or usage stats now first locks all registry_counters rows in
+-- name order and keeps them until commit, and per-technology rows are
+-- locked in technology_id order before the deltas are applied.
+
+CREATE OR REPLACE FUNCTION lock_registry_counters()
+RETURNS VOID AS $$
+BEGIN
+    PERFORM 1 FROM registry_counters ORDER BY name FOR UPDATE;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION registry_counters_on_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM lock_registry_counters();
+    UPDATE registry_counters
+    SET value = value + (SELECT COUNT(*) FROM new_rows),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION registry_counters_on_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM lock_registry_counters();
+    UPDATE registry_counters
+    SET value = value - (SELECT COUNT(*) FROM old_rows),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION technology_usage_stats_apply_delta()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Counter rows first: writers of usage stats are serialized by them,
+    -- so stats rows are never locked in conflicting orders across statements
+    PERFORM lock_registry_counters();
+
+    IF TG_OP = 'INSERT' THEN
+        PERFORM 1 FROM technology_usage_stats
+        WHERE technology_id IN (SELECT technology_id FROM new_rows)
+        ORDER BY technology_id
+        FOR UPDATE;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM 1 FROM technology_usage_stats
+        WHERE technology_id IN (SELECT technology_id FROM old_rows)
+        ORDER BY technology_id
+        FOR UPDATE;
+    ELSE
+        PERFORM 1 FROM technology_usage_stats
+        WHERE technology_id IN (
+            SELECT technology_id FROM old_rows
+            UNION
+            SELECT technology_id FROM new_rows
+        )
+        ORDER BY technology_id
+        FOR UPDATE;
+    END IF;
+
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE technology_usage_stats s
+        SET project_count = s.project_count - d.project_count,
+            production_count = s.production_count - d.production_count,
+            development_count = s.development_count - d.development_count,
+            testing_count = s.testing_count - d.testing_count,
+            updated_at = CURRENT_TIMESTAMP
+        FROM (
+            SELECT
+                technology_id,
+                COUNT(*) AS project_count,
+                COUNT(*) FILTER (WHERE usage_type = 'production') AS production_count,
+                COUNT(*) FILTER (WHERE usage_type = 'development') AS development_count,
+                COUNT(*) FILTER (WHERE usage_type = 'testing') AS testing_count
+            FROM old_rows
+            GROUP BY technology_id
+        ) d
+        WHERE s.technology_id = d.technology_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO technology_usage_stats AS s (
+            technology_id, project_count, production_count,
+            development_count, testing_count, updated_at
+        )
+        SELECT
+            technology_id,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE usage_type = 'production'),
+            COUNT(*) FILTER (WHERE usage_type = 'development'),
+            COUNT(*) FILTER (WHERE usage_type = 'testing'),
+            CURRENT_TIMESTAMP
+        FROM new_rows
+        WHERE technology_id IS NOT NULL
+        GROUP BY technology_id
+        ORDER BY technology_id
+        ON CONFLICT (technology_id) DO UPDATE
+        SET project_count = s.project_count + EXCLUDED.project_count,
+            production_count = s.production_count + EXCLUDED.production_count,
+            development_count = s.development_count + EXCLUDED.development_count,
+            testing_count = s.testing_count + EXCLUDED.testing_count,
+            updated_at = CURRENT_TIMESTAMP;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION lock_registry_counters IS 'Locks all registry counters in name order; taken first by every stats trigger';
@@ -0,0 +1,98 @@
+-- Rollback for deferred, ordered table version bumps
+
+DROP TRIGGER IF EXISTS users_notify_insert ON users;
+DROP TRIGGER IF EXISTS users_notify_update ON users;
+DROP TRIGGER IF EXISTS users_notify_delete ON users;
+DROP TRIGGER IF EXISTS users_notify_truncate ON users;
+
+CREATE TRIGGER users_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON users
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS teams_notify_insert ON teams;
+DROP TRIGGER IF EXISTS teams_notify_update ON teams;
+DROP TRIGGER IF EXISTS teams_notify_delete ON teams;
+DROP TRIGGER IF EXISTS teams_notify_truncate ON teams;
+
+CREATE TRIGGER teams_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON teams
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS team_members_notify_insert ON team_members;
+DROP TRIGGER IF EXISTS team_members_notify_update ON team_members;
+DROP TRIGGER IF EXISTS team_members_notify_delete ON team_members;
+DROP TRIGGER IF EXISTS team_members_notify_truncate ON team_members;
+
+CREATE TRIGGER team_members_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON team_members
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS technology_categories_notify_insert ON technology_categories;
+DROP TRIGGER IF EXISTS technology_categories_notify_update ON technology_categories;
+DROP TRIGGER IF EXISTS technology_categories_notify_delete ON technology_categories;
+DROP TRIGGER IF EXISTS technology_categories_notify_truncate ON technology_categories;
+
+CREATE TRIGGER technology_categories_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON technology_categories
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS technology_statuses_notify_insert ON technology_statuses;
+DROP TRIGGER IF EXISTS technology_statuses_notify_update ON technology_statuses;
+DROP TRIGGER IF EXISTS technology_statuses_notify_delete ON technology_statuses;
+DROP TRIGGER IF EXISTS technology_statuses_notify_truncate ON technology_statuses;
+
+CREATE TRIGGER technology_statuses_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON technology_statuses
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS technologies_notify_insert ON technologies;
+DROP TRIGGER IF EXISTS technologies_notify_update ON technologies;
+DROP TRIGGER IF EXISTS technologies_notify_delete ON technologies;
+DROP TRIGGER IF EXISTS technologies_notify_truncate ON technologies;
+
+CREATE TRIGGER technologies_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON technologies
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS technology_versions_notify_insert ON technology_versions;
+DROP TRIGGER IF EXISTS technology_versions_notify_update ON technology_versions;
+DROP TRIGGER IF EXISTS technology_versions_notify_delete ON technology_versions;
+DROP TRIGGER IF EXISTS technology_versions_notify_truncate ON technology_versions;
+
+CREATE TRIGGER technology_versions_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON technology_versions
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS projects_notify_insert ON projects;
+DROP TRIGGER IF EXISTS projects_notify_update ON projects;
+DROP TRIGGER IF EXISTS projects_notify_delete ON projects;
+DROP TRIGGER IF EXISTS projects_notify_truncate ON projects;
+
+CREATE TRIGGER projects_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON projects
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS project_technologies_notify_insert ON project_technologies;
+DROP TRIGGER IF EXISTS project_technologies_notify_update ON project_technologies;
+DROP TRIGGER IF EXISTS project_technologies_notify_delete ON project_technologies;
+DROP TRIGGER IF EXISTS project_technologies_notify_truncate ON project_technologies;
+
+CREATE TRIGGER project_technologies_notify_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON project_technologies
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE OR REPLACE FUNCTION notify_table_change() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO table_versions (table_name, version, updated_at)
+    VALUES (TG_TABLE_NAME, 1, clock_timestamp())
+    ON CONFLICT (table_name) DO UPDATE
+    SET version = table_versions.version + 1,
+        updated_at = GREATEST(table_versions.updated_at, clock_timestamp());
+
+    PERFORM pg_notify('stack_radar_changes', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TABLE IF EXISTS table_version_bumps;
+DROP FUNCTION IF EXISTS apply_table_version_bumps();
@@ -0,0 +1,254 @@
+-- Deferred, ordered table version bumps
+--
+-- notify_table_change() bumped table_versions from every modifying statement,
+-- so two transactions writing the same tables in different order could
+-- deadlock on the version rows, every writer of a table queued behind its
+-- version row until commit, and statements that changed no rows still
+-- invalidated cached responses. The statement triggers now only record the
+-- changed table for the transaction and skip statements with empty
+-- transition tables; a deferred constraint trigger bumps the versions of all
+-- recorded tables once, at commit, in table name order. TRUNCATE cannot have
+-- transition tables and always counts as a change.
+
+-- One row per writing transaction, removed by its own deferred trigger
+CREATE UNLOGGED TABLE table_version_bumps (
+    txid BIGINT PRIMARY KEY DEFAULT txid_current()
+);
+
+CREATE OR REPLACE FUNCTION apply_table_version_bumps() RETURNS TRIGGER AS $$
+DECLARE
+    changed TEXT := current_setting('stack_radar.changed_tables', true);
+BEGIN
+    IF changed IS NOT NULL AND changed <> '' THEN
+        INSERT INTO table_versions (table_name, version, updated_at)
+        SELECT table_name, 1, clock_timestamp()
+        FROM unnest(string_to_array(changed, ',')) AS table_name
+        ORDER BY table_name
+        ON CONFLICT (table_name) DO UPDATE
+        SET version = table_versions.version + 1,
+            updated_at = GREATEST(table_versions.updated_at, clock_timestamp());
+        PERFORM set_config('stack_radar.changed_tables', '', true);
+    END IF;
+
+    DELETE FROM table_version_bumps WHERE txid = NEW.txid;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE CONSTRAINT TRIGGER table_version_bumps_apply
+    AFTER INSERT ON table_version_bumps
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION apply_table_version_bumps();
+
+-- The recorded set is transaction-local, so it is reset on commit and
+-- rolled back together with the bump row when a savepoint is rolled back
+CREATE OR REPLACE FUNCTION notify_table_change() RETURNS TRIGGER AS $$
+DECLARE
+    changed TEXT := current_setting('stack_radar.changed_tables', true);
+BEGIN
+    IF TG_OP <> 'TRUNCATE' THEN
+        IF NOT EXISTS (SELECT 1 FROM changed_rows) THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+
+    IF changed IS NULL OR changed = '' THEN
+        INSERT INTO table_version_bumps DEFAULT VALUES;
+        PERFORM set_config('stack_radar.changed_tables', TG_TABLE_NAME, true);
+    ELSIF NOT TG_TABLE_NAME = ANY(string_to_array(changed, ',')) THEN
+        PERFORM set_config('stack_radar.changed_tables', changed || ',' || TG_TABLE_NAME, true);
+    END IF;
+
+    PERFORM pg_notify('stack_radar_changes', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS users_notify_change ON users;
+
+CREATE TRIGGER users_notify_insert
+    AFTER INSERT ON users
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER users_notify_update
+    AFTER UPDATE ON users
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER users_notify_delete
+    AFTER DELETE ON users
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER users_notify_truncate
+    AFTER TRUNCATE ON users
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS teams_notify_change ON teams;
+
+CREATE TRIGGER teams_notify_insert
+    AFTER INSERT ON teams
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER teams_notify_update
+    AFTER UPDATE ON teams
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER teams_notify_delete
+    AFTER DELETE ON teams
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER teams_notify_truncate
+    AFTER TRUNCATE ON teams
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS team_members_notify_change ON team_members;
+
+CREATE TRIGGER team_members_notify_insert
+    AFTER INSERT ON team_members
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER team_members_notify_update
+    AFTER UPDATE ON team_members
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER team_members_notify_delete
+    AFTER DELETE ON team_members
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER team_members_notify_truncate
+    AFTER TRUNCATE ON team_members
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS technology_categories_notify_change ON technology_categories;
+
+CREATE TRIGGER technology_categories_notify_insert
+    AFTER INSERT ON technology_categories
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_categories_notify_update
+    AFTER UPDATE ON technology_categories
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_categories_notify_delete
+    AFTER DELETE ON technology_categories
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_categories_notify_truncate
+    AFTER TRUNCATE ON technology_categories
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS technology_statuses_notify_change ON technology_statuses;
+
+CREATE TRIGGER technology_statuses_notify_insert
+    AFTER INSERT ON technology_statuses
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_statuses_notify_update
+    AFTER UPDATE ON technology_statuses
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_statuses_notify_delete
+    AFTER DELETE ON technology_statuses
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_statuses_notify_truncate
+    AFTER TRUNCATE ON technology_statuses
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS technologies_notify_change ON technologies;
+
+CREATE TRIGGER technologies_notify_insert
+    AFTER INSERT ON technologies
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technologies_notify_update
+    AFTER UPDATE ON technologies
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technologies_notify_delete
+    AFTER DELETE ON technologies
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technologies_notify_truncate
+    AFTER TRUNCATE ON technologies
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS technology_versions_notify_change ON technology_versions;
+
+CREATE TRIGGER technology_versions_notify_insert
+    AFTER INSERT ON technology_versions
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_versions_notify_update
+    AFTER UPDATE ON technology_versions
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_versions_notify_delete
+    AFTER DELETE ON technology_versions
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER technology_versions_notify_truncate
+    AFTER TRUNCATE ON technology_versions
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS projects_notify_change ON projects;
+
+CREATE TRIGGER projects_notify_insert
+    AFTER INSERT ON projects
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER projects_notify_update
+    AFTER UPDATE ON projects
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER projects_notify_delete
+    AFTER DELETE ON projects
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER projects_notify_truncate
+    AFTER TRUNCATE ON projects
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS project_technologies_notify_change ON project_technologies;
+
+CREATE TRIGGER project_technologies_notify_insert
+    AFTER INSERT ON project_technologies
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER project_technologies_notify_update
+    AFTER UPDATE ON project_technologies
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER project_technologies_notify_delete
+    AFTER DELETE ON project_technologies
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER project_technologies_notify_truncate
+    AFTER TRUNCATE ON project_technologies
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
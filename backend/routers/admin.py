@@ -1,9 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
+from backend.config import get_settings
+from backend.core.cache import cache_stats
+from backend.core.database import PoolStats, get_db_connection
+from backend.core.exceptions import NotFoundException
+from backend.core.jobs import JobRunner
+from backend.core.pagination import (
+    PaginatedResponse,
+    PaginationParams,
+    SortParams,
+    apply_cursor,
+    cursor_errors,
+    next_cursor,
+    paginate,
+)
+from backend.core.queries import StatementCache
+from backend.core.replicas import ReplicaSet
+from backend.core.slow_queries import SlowQueryLog
+from backend.core.streaming import EXPORT_FORMAT_PATTERN, streaming_response
+from backend.schemas.projects import ArchivedProject
+from backend.services.archiving import ArchiveService
+from backend.services.bulk import BulkService
+from backend.services.maintenance import ARCHIVE_JOB
 from backend.services.projects import ProjectService
-from backend.core.security import get_current_active_user
+from backend.core.security import PasswordHasher, get_current_active_user
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+ARCHIVE_ITEM_SORT_FIELDS = {
+    "last_updated": "ai.last_updated",
+    "days_inactive": "ai.days_inactive",
+    "name": "ai.project_name",
+    "batch": "ai.batch",
+}
+
 
 def require_admin(current_user: dict = Depends(get_current_active_user)):
     """Dependency to ensure user is admin"""
@@ -35,27 +66,30 @@ async def preview_archive(
     }
 
 
-@router.post("/archive/execute")
+@router.post("/archive/execute", status_code=status.HTTP_202_ACCEPTED)
 async def execute_archive(
     inactive_days: int = 180,
+    batch_size: int | None = Query(None, ge=1, le=10000, description="Projects archived per transaction"),
     admin_user: dict = Depends(require_admin)
 ):
     """
-    Execute archiving of inactive projects
+    Start chunked archiving of inactive projects in background
+
+    An interrupted archiving run is resumed instead, with its original
+    threshold
 
     Args:
         inactive_days: Number of days of inactivity threshold
+        batch_size: Projects archived per transaction (configured default if omitted)
         admin_user: Current admin user (from dependency)
 
     Returns:
-        Success status and list of archived projects
+        Queued job run; poll /admin/jobs/runs/{id} for its result
     """
-    archived = await ProjectService.execute_archiving(inactive_days, admin_user["id"])
-    return {
-        "success": True,
-        "count": len(archived),
-        "archived_projects": archived
-    }
+    params = {"inactive_days": inactive_days}
+    if batch_size is not None:
+        params["batch_size"] = batch_size
+    return await JobRunner.enqueue(ARCHIVE_JOB, params, triggered_by=admin_user["id"])
 
 
 @router.get("/archive/history")
@@ -75,3 +109,220 @@ async def archive_history(
     """
     history = await ProjectService.get_archive_history(limit)
     return {"history": history}
+
+
+@router.get("/archive/history/{log_id}/items", response_model=PaginatedResponse[ArchivedProject])
+async def archive_history_items(
+    log_id: int,
+    pagination: PaginationParams = Depends(),
+    sort: SortParams = Depends(),
+    admin_user: dict = Depends(require_admin)
+):
+    """
+    List projects archived by an archiving run
+
+    Args:
+        log_id: Archive log ID
+        pagination: Pagination parameters
+        sort: Sort parameters
+        admin_user: Current admin user (from dependency)
+
+    Returns:
+        Paginated list of archived projects
+    """
+    if await ArchiveService.get_run(log_id) is None:
+        raise NotFoundException(f"Запись архивации {log_id} не найдена")
+
+    if sort.sort_by not in ARCHIVE_ITEM_SORT_FIELDS:
+        sort.sort_by = "last_updated"
+    sql_sort_field = ARCHIVE_ITEM_SORT_FIELDS[sort.sort_by]
+    where_clause, params = "ai.archive_log_id = $1", [log_id]
+
+    total_count = None
+    if pagination.include_total:
+        total_count = await ArchiveService.count_items(where_clause, params)
+
+    page_where, page_params = apply_cursor(where_clause, params, pagination, sort, sql_sort_field, "ai.project_id")
+    with cursor_errors(pagination):
+        items = await ArchiveService.list_items(
+            page_where,
+            sql_sort_field,
+            sort.sort_order.upper(),
+            pagination.page_size,
+            pagination.offset,
+            page_params
+        )
+    return paginate(items, total_count, pagination, sort, next_cursor(items, pagination, sort))
+
+
+@router.post("/import")
+async def import_registry(
+    request: Request,
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="Body format"),
+    admin_user: dict = Depends(require_admin)
+):
+    """
+    Bulk import projects, technologies and their links
+
+    The request body is streamed: NDJSON (flat rows or project objects with
+    a "technologies" list) or CSV with a header line
+
+    Args:
+        request: Request with streamed body
+        format: Body format
+        admin_user: Current admin user (from dependency)
+
+    Returns:
+        Import report with counters and per-row errors
+    """
+    async with get_db_connection() as conn:
+        return await BulkService.import_records(conn, request.stream(), format)
+
+
+@router.get("/export")
+async def export_registry(
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="Output format"),
+    admin_user: dict = Depends(require_admin)
+):
+    """
+    Stream projects with their technology links in the import format
+
+    Args:
+        format: Output format
+        admin_user: Current admin user (from dependency)
+
+    Returns:
+        Streaming NDJSON or CSV response
+    """
+    async def stream():
+        async with get_db_connection() as conn:
+            async for chunk in BulkService.export_records(conn, format):
+                yield chunk
+
+    return streaming_response(stream(), format, "stack-radar-export")
+
+
+@router.get("/runtime")
+async def runtime_stats(admin_user: dict = Depends(require_admin)):
+    """
+    Get in-process runtime statistics of this worker
+
+    Args:
+        admin_user: Current admin user (from dependency)
+
+    Returns:
+        Password hashing pool, database pools, statement cache and cache statistics
+    """
+    return {
+        "password_hashing": PasswordHasher.stats(),
+        "database_pool": PoolStats.stats(),
+        "read_replicas": ReplicaSet.stats(),
+        "statement_cache": StatementCache.stats(),
+        "caches": cache_stats(),
+    }
+
+
+@router.get("/slow-queries")
+async def slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    admin_user: dict = Depends(require_admin)
+):
+    """
+    Get statements of this worker that exceeded the slow query threshold
+
+    Args:
+        limit: Maximum number of entries to return
+        admin_user: Current admin user (from dependency)
+
+    Returns:
+        Threshold settings and recent slow queries, newest first
+    """
+    settings = get_settings().database
+    return {
+        "threshold_ms": settings.slow_query_threshold_ms,
+        "explain": settings.slow_query_explain,
+        "queries": SlowQueryLog.entries(limit),
+    }
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries(admin_user: dict = Depends(require_admin)):
+    """
+    Clear slow query log of this worker
+
+    Args:
+        admin_user: Current admin user (from dependency)
+    """
+    SlowQueryLog.clear()
+
+
+@router.get("/jobs")
+async def list_jobs(admin_user: dict = Depends(require_admin)):
+    """
+    Get registered background jobs
+
+    Args:
+        admin_user: Current admin user (from dependency)
+
+    Returns:
+        Jobs with schedule, next run time and latest run
+    """
+    return {"jobs": await JobRunner.describe_jobs()}
+
+
+@router.get("/jobs/runs")
+async def list_job_runs(
+    job: str | None = None,
+    limit: int = Query(20, ge=1, le=200),
+    admin_user: dict = Depends(require_admin)
+):
+    """
+    Get recent background job runs
+
+    Args:
+        job: Only runs of this job
+        limit: Maximum number of runs to return
+        admin_user: Current admin user (from dependency)
+
+    Returns:
+        Runs, newest first
+    """
+    return {"runs": await JobRunner.list_runs(job, limit)}
+
+
+@router.get("/jobs/runs/{run_id}")
+async def get_job_run(run_id: int, admin_user: dict = Depends(require_admin)):
+    """
+    Get background job run with progress and result
+
+    Args:
+        run_id: Run ID
+        admin_user: Current admin user (from dependency)
+
+    Returns:
+        Job run
+    """
+    run = await JobRunner.get_run(run_id)
+    if run is None:
+        raise NotFoundException(f"Запуск задачи {run_id} не найден")
+    return run
+
+
+@router.post("/jobs/{name}/run", status_code=status.HTTP_202_ACCEPTED)
+async def run_job(
+    name: str,
+    params: dict[str, Any] | None = Body(None),
+    admin_user: dict = Depends(require_admin)
+):
+    """
+    Start background job now
+
+    Args:
+        name: Job name
+        params: Job parameters overriding the defaults
+        admin_user: Current admin user (from dependency)
+
+    Returns:
+        Queued job run
+    """
+    return await JobRunner.enqueue(name, params, triggered_by=admin_user["id"])
@@ -3,8 +3,22 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from backend.services.auth import AuthService
 from backend.core.exceptions import NotFoundException, ValidationException
-from backend.core.pagination import PaginatedResponse, PaginationParams, SortParams, paginate
-from backend.core.security import create_access_token, verify_password, get_password_hash, get_current_admin_user
+from backend.core.pagination import (
+    PaginatedResponse,
+    PaginationParams,
+    SortParams,
+    apply_cursor,
+    cursor_errors,
+    next_cursor,
+    paginate,
+)
+from backend.core.search import build_search_condition
+from backend.core.security import (
+    create_access_token,
+    get_current_admin_user,
+    get_password_hash_async,
+    verify_password_async,
+)
 from backend.schemas.auth import LoginRequest, LoginResponse, UserListItem, UserResponse, CreateUserRequest, UpdateUserRequest
 
 router = APIRouter(prefix="", tags=["auth"])
@@ -32,7 +46,7 @@ async def login(request: LoginRequest):
             detail="Неверные учетные данные"
         )
 
-    if not verify_password(request.password, user["password_hash"]):
+    if not await verify_password_async(request.password, user["password_hash"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неверные учетные данные"
@@ -87,10 +101,12 @@ async def list_users(
     param_count = 0
 
     if q:
-        param_count += 2
-        where_conditions.append(f"(u.email ILIKE ${param_count-1} OR u.full_name ILIKE ${param_count})")
-        search_pattern = f"%{q}%"
-        params.extend([search_pattern, search_pattern])
+        search_condition, _, search_params = build_search_condition(
+            q, "u.search_vector", ["u.email", "u.full_name"], param_count + 1
+        )
+        param_count += len(search_params)
+        where_conditions.append(search_condition)
+        params.extend(search_params)
 
     if is_admin is not None:
         param_count += 1
@@ -99,20 +115,23 @@ async def list_users(
 
     where_clause = " AND ".join(where_conditions) if where_conditions else "TRUE"
 
-    total_count = await AuthService.count_users(where_clause, params)
+    total_count = None
+    if pagination.include_total:
+        total_count = await AuthService.count_users(where_clause, params)
 
-    items = await AuthService.list_users(
-        where_clause,
-        sql_sort_field,
-        sort.sort_order.upper(),
-        pagination.page_size,
-        pagination.offset,
-        params
-    )
+    page_where, page_params = apply_cursor(where_clause, params, pagination, sort, sql_sort_field, "u.id")
 
-    users = [UserListItem(**item) for item in items]
+    with cursor_errors(pagination):
+        items = await AuthService.list_users(
+            page_where,
+            sql_sort_field,
+            sort.sort_order.upper(),
+            pagination.page_size,
+            pagination.offset,
+            page_params
+        )
 
-    return paginate(users, total_count, pagination, sort)
+    return paginate(items, total_count, pagination, sort, next_cursor(items, pagination, sort))
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
@@ -161,7 +180,7 @@ async def create_user(
     if existing:
         raise ValidationException("Пользователь с таким email уже существует")
 
-    password_hash = get_password_hash(request.password)
+    password_hash = await get_password_hash_async(request.password)
     result = await AuthService.create_user(
         request.email,
         password_hash,
@@ -1,17 +1,27 @@
-from fastapi import APIRouter, Depends
-from backend.services.dashboard import DashboardService
+from fastapi import APIRouter, Depends, Response
+from backend.core.http_cache import conditional
+from backend.core.serialization import FastJSONResponse
+from backend.services.dashboard import SNAPSHOT_TABLES, DashboardService
 from backend.core.security import get_current_active_user
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
 @router.get("/stats")
-async def get_dashboard_stats(current_user: dict = Depends(get_current_active_user)):
+async def get_dashboard_stats(
+    response: Response,
+    current_user: dict = Depends(get_current_active_user),
+    _validators: None = Depends(conditional(*SNAPSHOT_TABLES, public=False)),
+):
     """
     Get all dashboard statistics
 
+    Answered with 304 when the client copy is still current
+
     Args:
+        response: Response carrying the validator headers
         current_user: Current authenticated user
+        _validators: ETag/Last-Modified check (from dependency)
 
     Returns:
         Dashboard statistics including:
@@ -22,18 +32,4 @@ async def get_dashboard_stats(current_user: dict = Depends(get_current_active_us
         - Team summary
         - Technology by category
     """
-    overview = await DashboardService.get_overview_stats()
-    tech_usage = await DashboardService.get_technology_usage()
-    project_status = await DashboardService.get_project_status_distribution()
-    recent_projects = await DashboardService.get_recent_projects()
-    team_summary = await DashboardService.get_team_summary()
-    tech_by_category = await DashboardService.get_technology_by_category()
-
-    return {
-        "overview": overview,
-        "technology_usage": tech_usage,
-        "project_status_distribution": project_status,
-        "recent_projects": recent_projects,
-        "team_summary": team_summary,
-        "technology_by_category": tech_by_category
-    }
+    return FastJSONResponse(await DashboardService.get_snapshot(), headers=response.headers)
@@ -1,10 +1,24 @@
-from fastapi import APIRouter, Depends, Query, status
-
-from backend.core.exceptions import ConflictException, NotFoundException
-from backend.core.pagination import PaginatedResponse, PaginationParams, SortParams, paginate
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Response, status
+
+from backend.core.database import request_transaction
+from backend.core.exceptions import NotFoundException
+from backend.core.http_cache import conditional
+from backend.core.pagination import (
+    PaginatedResponse,
+    PaginationParams,
+    SortParams,
+    apply_cursor,
+    cursor_errors,
+    paginate_json,
+)
+from backend.core.search import build_search_condition
+from backend.core.serialization import dumps, loads
+from backend.core.streaming import EXPORT_FORMAT_PATTERN, streaming_response
+from backend.services.includes import PROJECT_INCLUDES, expand_projects, include_description, parse_includes
 from backend.services.projects import ProjectService
-from backend.services.teams import TeamService
-from backend.services.technologies import TechnologyService
+from backend.schemas.includes import ProjectDetails
 from backend.schemas.projects import (
     Project,
     ProjectCreate,
@@ -16,49 +30,62 @@ from backend.schemas.projects import (
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+PROJECT_TABLES = (
+    "projects",
+    "project_technologies",
+    "technologies",
+    "technology_versions",
+    "technology_categories",
+    "technology_statuses",
+)
 
-@router.get("", response_model=PaginatedResponse[Project])
-async def list_projects(
-    pagination: PaginationParams = Depends(),
-    sort: SortParams = Depends(),
-    q: str | None = Query(None, description="Search query"),
-    status: str | None = Query(None, description="Filter by status"),
-    team_id: int | None = Query(None, description="Filter by team"),
-):
+
+SORT_FIELDS = {
+    "name": "p.name",
+    "status": "p.status",
+    "created_at": "p.created_at",
+    "team_id": "p.team_id",
+}
+
+
+def _sort_field(sort: SortParams) -> str:
     """
-    List projects with filtering and pagination
+    Resolve SQL sort column, falling back to created_at
 
     Args:
-        pagination: Pagination parameters
         sort: Sort parameters
-        q: Search query
-        status: Status filter
-        team_id: Team filter
 
     Returns:
-        Paginated list of projects
+        SQL sort column
     """
-    allowed_sort_fields = {
-        "name": "p.name",
-        "status": "p.status",
-        "created_at": "p.created_at",
-        "team_id": "p.team_id",
-    }
-
-    if sort.sort_by not in allowed_sort_fields:
+    if sort.sort_by not in SORT_FIELDS:
         sort.sort_by = "created_at"
+    return SORT_FIELDS[sort.sort_by]
 
-    sql_sort_field = allowed_sort_fields[sort.sort_by]
 
+def _build_filters(q: str | None, status: str | None, team_id: int | None) -> tuple[str, list[Any]]:
+    """
+    Build WHERE clause for list filters
+
+    Args:
+        q: Search query
+        status: Status filter
+        team_id: Team filter
+
+    Returns:
+        Tuple of (SQL condition, parameters list)
+    """
     where_conditions = []
     params = []
     param_count = 0
 
     if q:
-        param_count += 2
-        where_conditions.append(f"(p.name ILIKE ${param_count-1} OR p.description ILIKE ${param_count})")
-        search_pattern = f"%{q}%"
-        params.extend([search_pattern, search_pattern])
+        search_condition, _, search_params = build_search_condition(
+            q, "p.search_vector", ["p.name", "p.description"], param_count + 1
+        )
+        param_count += len(search_params)
+        where_conditions.append(search_condition)
+        params.extend(search_params)
 
     if status:
         param_count += 1
@@ -72,22 +99,69 @@ async def list_projects(
 
     where_clause = " AND ".join(where_conditions) if where_conditions else "TRUE"
 
-    total_count = await ProjectService.count_projects(where_clause, params)
+    return where_clause, params
 
-    items = await ProjectService.list_projects(
-        where_clause,
-        sql_sort_field,
-        sort.sort_order.upper(),
-        pagination.page_size,
-        pagination.offset,
-        params
-    )
-    projects = [Project(**item) for item in items]
 
-    return paginate(projects, total_count, pagination, sort)
+@router.get(
+    "",
+    response_model=PaginatedResponse[ProjectDetails],
+    dependencies=[Depends(conditional(*PROJECT_TABLES, expansions=PROJECT_INCLUDES))],
+)
+async def list_projects(
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    sort: SortParams = Depends(),
+    q: str | None = Query(None, description="Search query"),
+    status: str | None = Query(None, description="Filter by status"),
+    team_id: int | None = Query(None, description="Filter by team"),
+    include: str | None = Query(None, description=include_description(PROJECT_INCLUDES)),
+):
+    """
+    List projects with filtering and pagination
+
+    Args:
+        response: Response carrying the validator headers
+        pagination: Pagination parameters
+        sort: Sort parameters
+        q: Search query
+        status: Status filter
+        team_id: Team filter
+        include: Expansions (team, lead, members)
 
+    Returns:
+        Paginated list of projects
 
-@router.post("", response_model=Project, status_code=status.HTTP_201_CREATED)
+    Raises:
+        ValidationException: If an unknown expansion is requested
+    """
+    includes = parse_includes(include, PROJECT_INCLUDES)
+    sql_sort_field = _sort_field(sort)
+    where_clause, params = _build_filters(q, status, team_id)
+
+    total_count = None
+    if pagination.include_total:
+        total_count = await ProjectService.count_projects(where_clause, params)
+
+    page_where, page_params = apply_cursor(where_clause, params, pagination, sort, sql_sort_field, "p.id")
+
+    with cursor_errors(pagination):
+        page = await ProjectService.list_projects_json(
+            page_where,
+            sql_sort_field,
+            sort.sort_order.upper(),
+            pagination.page_size,
+            pagination.offset,
+            page_params
+        )
+    last = (page["last_sort_value"], page["last_id"]) if page["count"] else None
+    items = page["items"]
+    if includes and page["count"]:
+        # Expanded pages are rare; the common page stays unparsed
+        items = dumps(await expand_projects(loads(items), includes))
+    return paginate_json(items, page["count"], last, total_count, pagination, sort, response.headers)
+
+
+@router.post("", response_model=Project, status_code=status.HTTP_201_CREATED, dependencies=[Depends(request_transaction)])
 async def create_project(project: ProjectCreate):
     """
     Create project
@@ -99,41 +173,84 @@ async def create_project(project: ProjectCreate):
         Created project
 
     Raises:
-        NotFoundException: If team not found
+        NotFoundException: If team or technology not found
     """
-    if project.team_id:
-        team_check = await TeamService.get_team_by_id(project.team_id)
-        if not team_check:
-            raise NotFoundException(f"Команда с id={project.team_id} не найдена")
-
     result = await ProjectService.create_project(project)
 
     return Project(**result)
 
 
-@router.get("/{project_id}", response_model=Project)
-async def get_project(project_id: int):
+@router.get("/export")
+async def export_projects(
+    sort: SortParams = Depends(),
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="Output format"),
+    q: str | None = Query(None, description="Search query"),
+    status: str | None = Query(None, description="Filter by status"),
+    team_id: int | None = Query(None, description="Filter by team"),
+):
+    """
+    Export projects with technology names
+
+    Rows are read through a server-side cursor and streamed in chunks
+
+    Args:
+        sort: Sort parameters
+        format: Output format (ndjson or csv)
+        q: Search query
+        status: Status filter
+        team_id: Team filter
+
+    Returns:
+        Streaming NDJSON or CSV response
+    """
+    sql_sort_field = _sort_field(sort)
+    where_clause, params = _build_filters(q, status, team_id)
+
+    chunks = ProjectService.stream_projects(
+        where_clause,
+        sql_sort_field,
+        sort.sort_order.upper(),
+        params,
+        format,
+    )
+    return streaming_response(chunks, format, "projects")
+
+
+@router.get(
+    "/{project_id}",
+    response_model=ProjectDetails,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(conditional(*PROJECT_TABLES, expansions=PROJECT_INCLUDES))],
+)
+async def get_project(
+    project_id: int,
+    include: str | None = Query(None, description=include_description(PROJECT_INCLUDES)),
+):
     """
     Get project by ID
 
     Args:
         project_id: Project ID
+        include: Expansions (team, lead, members)
 
     Returns:
-        Project data
+        Project data with requested expansions
 
     Raises:
         NotFoundException: If project not found
+        ValidationException: If an unknown expansion is requested
     """
+    includes = parse_includes(include, PROJECT_INCLUDES)
     result = await ProjectService.get_project_by_id(project_id)
 
     if not result:
         raise NotFoundException(f"Проект с id={project_id} не найден")
 
-    return Project(**result)
+    await expand_projects([result], includes)
+    return result
 
 
-@router.put("/{project_id}", response_model=Project)
+@router.put("/{project_id}", response_model=Project, dependencies=[Depends(request_transaction)])
 async def update_project(project_id: int, project: ProjectUpdate):
     """
     Update project
@@ -146,23 +263,16 @@ async def update_project(project_id: int, project: ProjectUpdate):
         Updated project
 
     Raises:
-        NotFoundException: If project not found
+        NotFoundException: If project, team or technology not found
     """
-    check = await ProjectService.get_project_by_id(project_id)
-    if not check:
-        raise NotFoundException(f"Проект с id={project_id} не найден")
-
-    if project.team_id:
-        team_check = await TeamService.get_team_by_id(project.team_id)
-        if not team_check:
-            raise NotFoundException(f"Команда с id={project.team_id} не найдена")
-
     result = await ProjectService.update_project(project_id, project)
+    if result is None:
+        raise NotFoundException(f"Проект с id={project_id} не найден")
 
     return Project(**result)
 
 
-@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(request_transaction)])
 async def delete_project(project_id: int):
     """
     Delete project
@@ -173,14 +283,12 @@ async def delete_project(project_id: int):
     Raises:
         NotFoundException: If project not found
     """
-    check = await ProjectService.get_project_by_id(project_id)
-    if not check:
+    deleted = await ProjectService.delete_project(project_id)
+    if not deleted:
         raise NotFoundException(f"Проект с id={project_id} не найден")
 
-    await ProjectService.delete_project(project_id)
-
 
-@router.get("/{project_id}/technologies", response_model=list[ProjectTechnologyWithDetails])
+@router.get("/{project_id}/technologies", response_model=list[ProjectTechnologyWithDetails], dependencies=[Depends(conditional(*PROJECT_TABLES))])
 async def get_project_technologies(project_id: int):
     """
     Get project technologies
@@ -198,12 +306,10 @@ async def get_project_technologies(project_id: int):
     if not check:
         raise NotFoundException(f"Проект с id={project_id} не найден")
 
-    items = await ProjectService.get_project_technologies(project_id)
-
-    return [ProjectTechnologyWithDetails(**item) for item in items]
+    return await ProjectService.get_project_technologies(project_id)
 
 
-@router.post("/{project_id}/technologies", response_model=ProjectTechnology, status_code=status.HTTP_201_CREATED)
+@router.post("/{project_id}/technologies", response_model=ProjectTechnology, status_code=status.HTTP_201_CREATED, dependencies=[Depends(request_transaction)])
 async def add_technology_to_project(project_id: int, tech: ProjectTechnologyCreate):
     """
     Add technology to project
@@ -219,29 +325,12 @@ async def add_technology_to_project(project_id: int, tech: ProjectTechnologyCrea
         NotFoundException: If project, technology or version not found
         ConflictException: If technology already added to project
     """
-    check = await ProjectService.get_project_by_id(project_id)
-    if not check:
-        raise NotFoundException(f"Проект с id={project_id} не найден")
-
-    tech_check = await TechnologyService.get_technology_simple_by_id(tech.technology_id)
-    if not tech_check:
-        raise NotFoundException(f"Технология с id={tech.technology_id} не найдена")
-
-    if tech.version_id:
-        version_check = await TechnologyService.get_version_by_id(tech.version_id, tech.technology_id)
-        if not version_check:
-            raise NotFoundException(f"Версия с id={tech.version_id} не найдена для этой технологии")
-
-    duplicate_check = await ProjectService.check_project_technology_duplicate(project_id, tech.technology_id)
-    if duplicate_check:
-        raise ConflictException("Эта технология уже добавлена в проект")
-
     result = await ProjectService.add_technology_to_project(project_id, tech)
 
     return ProjectTechnology(**result)
 
 
-@router.delete("/{project_id}/technologies/{technology_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{project_id}/technologies/{technology_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(request_transaction)])
 async def remove_technology_from_project(project_id: int, technology_id: int):
     """
     Remove technology from project
@@ -253,8 +342,6 @@ async def remove_technology_from_project(project_id: int, technology_id: int):
     Raises:
         NotFoundException: If project technology relation not found
     """
-    check = await ProjectService.check_project_technology_duplicate(project_id, technology_id)
-    if not check:
+    removed = await ProjectService.remove_technology_from_project(project_id, technology_id)
+    if not removed:
         raise NotFoundException("Связь между проектом и технологией не найдена")
-
-    await ProjectService.remove_technology_from_project(project_id, technology_id)
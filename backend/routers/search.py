@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, Query
+
+from backend.core.exceptions import ValidationException
+from backend.core.security import get_optional_user
+from backend.services.search import SEARCH_TARGETS, SearchService
+from backend.schemas.search import SearchResponse
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+PUBLIC_TYPES = ["project", "technology", "team"]
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, description="Search query"),
+    types: str | None = Query(None, description="Comma-separated entity types (project, technology, team, user)"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    current_user: dict | None = Depends(get_optional_user),
+):
+    """
+    Search across all entity types ordered by relevance
+
+    Args:
+        q: Search query
+        types: Entity types to search
+        limit: Maximum number of results
+        current_user: Current user if authenticated (users are searchable by admins only)
+
+    Returns:
+        Ranked search results
+
+    Raises:
+        ValidationException: If unknown entity type requested
+    """
+    allowed_types = PUBLIC_TYPES + (["user"] if current_user and current_user.get("is_admin") else [])
+
+    if types:
+        requested = [t.strip() for t in types.split(",") if t.strip()]
+        unknown = [t for t in requested if t not in SEARCH_TARGETS]
+        if unknown:
+            raise ValidationException(f"Неизвестные типы поиска: {', '.join(unknown)}")
+        requested = [t for t in requested if t in allowed_types]
+    else:
+        requested = allowed_types
+
+    items = await SearchService.search(q, requested, limit)
+
+    return {"query": q, "items": items}
@@ -1,66 +1,169 @@
-from fastapi import APIRouter, Depends, Query, status
+from typing import Any
 
+from fastapi import APIRouter, Depends, Query, Response, status
+
+from backend.core.database import request_transaction
 from backend.core.exceptions import NotFoundException
-from backend.core.pagination import PaginatedResponse, PaginationParams, SortParams, paginate
-from backend.services.auth import AuthService
+from backend.core.http_cache import conditional
+from backend.core.pagination import (
+    PaginatedResponse,
+    PaginationParams,
+    SortParams,
+    apply_cursor,
+    cursor_errors,
+    next_cursor,
+    paginate_rows,
+)
+from backend.core.search import build_search_condition
+from backend.core.streaming import EXPORT_FORMAT_PATTERN, streaming_response
+from backend.services.includes import TEAM_INCLUDES, expand_teams, include_description, parse_includes
 from backend.services.teams import TeamService
+from backend.schemas.includes import TeamDetails
 from backend.schemas.teams import Team, TeamCreate
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
+TEAM_TABLES = ("teams",)
+
+
+SORT_FIELDS = {"name": "t.name", "created_at": "t.created_at"}
+
+
+def _sort_field(sort: SortParams) -> str:
+    """
+    Resolve SQL sort column, falling back to created_at
+
+    Args:
+        sort: Sort parameters
+
+    Returns:
+        SQL sort column
+    """
+    if sort.sort_by not in SORT_FIELDS:
+        sort.sort_by = "created_at"
+    return SORT_FIELDS[sort.sort_by]
+
+
+def _build_filters(q: str | None) -> tuple[str, list[Any]]:
+    """
+    Build WHERE clause for list filters
+
+    Args:
+        q: Search query
+
+    Returns:
+        Tuple of (SQL condition, parameters list)
+    """
+    where_conditions = []
+    params = []
+    param_count = 0
+
+    if q:
+        search_condition, _, search_params = build_search_condition(
+            q, "t.search_vector", ["t.name", "t.description"], param_count + 1
+        )
+        param_count += len(search_params)
+        where_conditions.append(search_condition)
+        params.extend(search_params)
+
+    where_clause = " AND ".join(where_conditions) if where_conditions else "TRUE"
+
+    return where_clause, params
 
-@router.get("", response_model=PaginatedResponse[Team])
+
+@router.get(
+    "",
+    response_model=PaginatedResponse[TeamDetails],
+    dependencies=[Depends(conditional(*TEAM_TABLES, expansions=TEAM_INCLUDES))],
+)
 async def list_teams(
+    response: Response,
     pagination: PaginationParams = Depends(),
     sort: SortParams = Depends(),
     q: str | None = Query(None, description="Search query"),
+    include: str | None = Query(None, description=include_description(TEAM_INCLUDES)),
 ):
     """
     List teams with filtering and pagination
 
     Args:
+        response: Response carrying the validator headers
         pagination: Pagination parameters
         sort: Sort parameters
         q: Search query
+        include: Expansions (lead, members, projects)
 
     Returns:
         Paginated list of teams
-    """
-    allowed_sort_fields = {"name": "t.name", "created_at": "t.created_at"}
 
-    if sort.sort_by not in allowed_sort_fields:
-        sort.sort_by = "created_at"
+    Raises:
+        ValidationException: If an unknown expansion is requested
+    """
+    includes = parse_includes(include, TEAM_INCLUDES)
+    sql_sort_field = _sort_field(sort)
+    where_clause, params = _build_filters(q)
+
+    total_count = None
+    if pagination.include_total:
+        total_count = await TeamService.count_teams(where_clause, params)
+
+    page_where, page_params = apply_cursor(where_clause, params, pagination, sort, sql_sort_field, "t.id")
+
+    with cursor_errors(pagination):
+        items = await TeamService.list_teams(
+            page_where,
+            sql_sort_field,
+            sort.sort_order.upper(),
+            pagination.page_size,
+            pagination.offset,
+            page_params
+        )
+    await expand_teams(items, includes)
+    return paginate_rows(
+        Team,
+        items,
+        total_count,
+        pagination,
+        sort,
+        next_cursor(items, pagination, sort),
+        response.headers,
+        tuple(sorted(includes)),
+    )
 
-    sql_sort_field = allowed_sort_fields[sort.sort_by]
 
-    where_conditions = []
-    params = []
-    param_count = 0
+@router.get("/export")
+async def export_teams(
+    sort: SortParams = Depends(),
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="Output format"),
+    q: str | None = Query(None, description="Search query"),
+):
+    """
+    Export teams
 
-    if q:
-        param_count += 2
-        where_conditions.append(f"(t.name ILIKE ${param_count-1} OR t.description ILIKE ${param_count})")
-        search_pattern = f"%{q}%"
-        params.extend([search_pattern, search_pattern])
+    Rows are read through a server-side cursor and streamed in chunks
 
-    where_clause = " AND ".join(where_conditions) if where_conditions else "TRUE"
+    Args:
+        sort: Sort parameters
+        format: Output format (ndjson or csv)
+        q: Search query
 
-    total_count = await TeamService.count_teams(where_clause, params)
+    Returns:
+        Streaming NDJSON or CSV response
+    """
+    sql_sort_field = _sort_field(sort)
+    where_clause, params = _build_filters(q)
 
-    items = await TeamService.list_teams(
+    chunks = TeamService.stream_teams(
         where_clause,
         sql_sort_field,
         sort.sort_order.upper(),
-        pagination.page_size,
-        pagination.offset,
-        params
+        params,
+        format,
     )
-    teams = [Team(**item) for item in items]
-
-    return paginate(teams, total_count, pagination, sort)
+    return streaming_response(chunks, format, "teams")
 
 
-@router.post("", response_model=Team, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=Team, status_code=status.HTTP_201_CREATED, dependencies=[Depends(request_transaction)])
 async def create_team(team: TeamCreate):
     """
     Create team
@@ -74,39 +177,46 @@ async def create_team(team: TeamCreate):
     Raises:
         NotFoundException: If lead user not found
     """
-    if team.lead_id:
-        lead_check = await AuthService.get_user_by_id(team.lead_id)
-        if not lead_check:
-            raise NotFoundException(f"Пользователь с id={team.lead_id} не найден")
-
     result = await TeamService.create_team(team)
 
     return Team(**result)
 
 
-@router.get("/{team_id}", response_model=Team)
-async def get_team(team_id: int):
+@router.get(
+    "/{team_id}",
+    response_model=TeamDetails,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(conditional(*TEAM_TABLES, expansions=TEAM_INCLUDES))],
+)
+async def get_team(
+    team_id: int,
+    include: str | None = Query(None, description=include_description(TEAM_INCLUDES)),
+):
     """
     Get team by ID
 
     Args:
         team_id: Team ID
+        include: Expansions (lead, members, projects)
 
     Returns:
-        Team data
+        Team data with requested expansions
 
     Raises:
         NotFoundException: If team not found
+        ValidationException: If an unknown expansion is requested
     """
+    includes = parse_includes(include, TEAM_INCLUDES)
     result = await TeamService.get_team_by_id(team_id)
 
     if not result:
         raise NotFoundException(f"Команда с id={team_id} не найдена")
 
-    return Team(**result)
+    await expand_teams([result], includes)
+    return result
 
 
-@router.put("/{team_id}", response_model=Team)
+@router.put("/{team_id}", response_model=Team, dependencies=[Depends(request_transaction)])
 async def update_team(team_id: int, team: TeamCreate):
     """
     Update team
@@ -121,21 +231,14 @@ async def update_team(team_id: int, team: TeamCreate):
     Raises:
         NotFoundException: If team or lead user not found
     """
-    check = await TeamService.get_team_by_id(team_id)
-    if not check:
-        raise NotFoundException(f"Команда с id={team_id} не найдена")
-
-    if team.lead_id:
-        lead_check = await AuthService.get_user_by_id(team.lead_id)
-        if not lead_check:
-            raise NotFoundException(f"Пользователь с id={team.lead_id} не найден")
-
     result = await TeamService.update_team(team_id, team)
+    if result is None:
+        raise NotFoundException(f"Команда с id={team_id} не найдена")
 
     return Team(**result)
 
 
-@router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(request_transaction)])
 async def delete_team(team_id: int):
     """
     Delete team
@@ -146,8 +249,6 @@ async def delete_team(team_id: int):
     Raises:
         NotFoundException: If team not found
     """
-    check = await TeamService.get_team_by_id(team_id)
-    if not check:
+    deleted = await TeamService.delete_team(team_id)
+    if not deleted:
         raise NotFoundException(f"Команда с id={team_id} не найдена")
-
-    await TeamService.delete_team(team_id)
@@ -1,22 +1,46 @@
-from fastapi import APIRouter, Depends, Query, status
-
-from backend.core.exceptions import ConflictException, NotFoundException
-from backend.core.pagination import PaginatedResponse, PaginationParams, SortParams, paginate
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Response, status
+
+from backend.core.database import request_transaction
+from backend.core.exceptions import NotFoundException
+from backend.core.http_cache import conditional
+from backend.core.pagination import (
+    PaginatedResponse,
+    PaginationParams,
+    SortParams,
+    apply_cursor,
+    cursor_errors,
+    next_cursor,
+    paginate_rows,
+)
+from backend.core.search import build_search_condition
+from backend.core.streaming import EXPORT_FORMAT_PATTERN, streaming_response
 from backend.services.technologies import TechnologyService
 from backend.schemas.technologies import (
     Technology,
     TechnologyCategory,
     TechnologyCategoryCreate,
     TechnologyCreate,
-    TechnologyStats,
     TechnologyStatsResponse,
     TechnologyUpdate,
 )
 
 router = APIRouter(prefix="/technologies", tags=["technologies"])
 
+CATEGORY_TABLES = ("technology_categories",)
+STATUS_TABLES = ("technology_statuses",)
+TECHNOLOGY_TABLES = ("technologies", "technology_statuses")
+STATS_TABLES = (
+    "technologies",
+    "technology_categories",
+    "technology_statuses",
+    "projects",
+    "project_technologies",
+)
+
 
-@router.get("/categories", response_model=list[TechnologyCategory])
+@router.get("/categories", response_model=list[TechnologyCategory], dependencies=[Depends(conditional(*CATEGORY_TABLES))])
 async def list_technology_categories():
     """
     Get list of technology categories
@@ -24,11 +48,10 @@ async def list_technology_categories():
     Returns:
         List of technology categories
     """
-    items = await TechnologyService.list_categories()
-    return [TechnologyCategory(**item) for item in items]
+    return await TechnologyService.list_categories()
 
 
-@router.post("/categories", response_model=TechnologyCategory, status_code=status.HTTP_201_CREATED)
+@router.post("/categories", response_model=TechnologyCategory, status_code=status.HTTP_201_CREATED, dependencies=[Depends(request_transaction)])
 async def create_technology_category(category: TechnologyCategoryCreate):
     """
     Create technology category
@@ -42,15 +65,11 @@ async def create_technology_category(category: TechnologyCategoryCreate):
     Raises:
         ConflictException: If category with same name exists
     """
-    existing = await TechnologyService.get_category_by_name(category.name)
-    if existing:
-        raise ConflictException(f'Категория с именем "{category.name}" уже существует')
-
     result = await TechnologyService.create_category(category)
     return TechnologyCategory(**result)
 
 
-@router.get("/statuses", response_model=list[str])
+@router.get("/statuses", response_model=list[str], dependencies=[Depends(conditional(*STATUS_TABLES))])
 async def list_technology_statuses():
     """
     Get list of technology statuses
@@ -61,7 +80,7 @@ async def list_technology_statuses():
     return await TechnologyService.list_statuses()
 
 
-@router.post("/statuses", status_code=status.HTTP_201_CREATED)
+@router.post("/statuses", status_code=status.HTTP_201_CREATED, dependencies=[Depends(request_transaction)])
 async def create_technology_status(name: str):
     """
     Create technology status
@@ -75,15 +94,11 @@ async def create_technology_status(name: str):
     Raises:
         ConflictException: If status already exists
     """
-    existing = await TechnologyService.get_status_by_name(name)
-    if existing:
-        raise ConflictException(f'Статус "{name}" уже существует')
-
     await TechnologyService.create_status(name)
     return {"message": "Статус создан"}
 
 
-@router.get("/stats", response_model=TechnologyStatsResponse)
+@router.get("/stats", response_model=TechnologyStatsResponse, dependencies=[Depends(conditional(*STATS_TABLES))])
 async def get_technology_stats():
     """
     Get technology usage statistics
@@ -93,49 +108,50 @@ async def get_technology_stats():
     """
     items, total_stats = await TechnologyService.get_stats()
 
-    return TechnologyStatsResponse(
-        technologies=[TechnologyStats(**item) for item in items],
-        summary=total_stats
-    )
+    return {"technologies": items, "summary": total_stats}
 
 
-@router.get("", response_model=PaginatedResponse[Technology])
-async def list_technologies(
-    pagination: PaginationParams = Depends(),
-    sort: SortParams = Depends(),
-    q: str | None = Query(None, description="Search query"),
-    status: str | None = Query(None, description="Filter by status"),
-    category_id: int | None = Query(None, description="Filter by category"),
-):
+SORT_FIELDS = {"name": "t.name", "status": "ts.name", "created_at": "t.created_at"}
+
+
+def _sort_field(sort: SortParams) -> str:
     """
-    List technologies with filtering and pagination
+    Resolve SQL sort column, falling back to created_at
 
     Args:
-        pagination: Pagination parameters
         sort: Sort parameters
-        q: Search query
-        status: Status filter
-        category_id: Category filter
 
     Returns:
-        Paginated list of technologies
+        SQL sort column
     """
-    allowed_sort_fields = {"name": "t.name", "status": "ts.name", "created_at": "t.created_at"}
-
-    if sort.sort_by not in allowed_sort_fields:
+    if sort.sort_by not in SORT_FIELDS:
         sort.sort_by = "created_at"
+    return SORT_FIELDS[sort.sort_by]
+
 
-    sql_sort_field = allowed_sort_fields[sort.sort_by]
+def _build_filters(q: str | None, status: str | None, category_id: int | None) -> tuple[str, list[Any]]:
+    """
+    Build WHERE clause for list filters
 
+    Args:
+        q: Search query
+        status: Status filter
+        category_id: Category filter
+
+    Returns:
+        Tuple of (SQL condition, parameters list)
+    """
     where_conditions = []
     params = []
     param_count = 0
 
     if q:
-        param_count += 2
-        where_conditions.append(f"(t.name ILIKE ${param_count-1} OR t.description ILIKE ${param_count})")
-        search_pattern = f"%{q}%"
-        params.extend([search_pattern, search_pattern])
+        search_condition, _, search_params = build_search_condition(
+            q, "t.search_vector", ["t.name", "t.description"], param_count + 1
+        )
+        param_count += len(search_params)
+        where_conditions.append(search_condition)
+        params.extend(search_params)
 
     if status:
         param_count += 1
@@ -149,22 +165,92 @@ async def list_technologies(
 
     where_clause = " AND ".join(where_conditions) if where_conditions else "TRUE"
 
-    total_count = await TechnologyService.count_technologies(where_clause, params)
+    return where_clause, params
+
+
+@router.get("", response_model=PaginatedResponse[Technology], dependencies=[Depends(conditional(*TECHNOLOGY_TABLES))])
+async def list_technologies(
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    sort: SortParams = Depends(),
+    q: str | None = Query(None, description="Search query"),
+    status: str | None = Query(None, description="Filter by status"),
+    category_id: int | None = Query(None, description="Filter by category"),
+):
+    """
+    List technologies with filtering and pagination
 
-    items = await TechnologyService.list_technologies(
+    Args:
+        response: Response carrying the validator headers
+        pagination: Pagination parameters
+        sort: Sort parameters
+        q: Search query
+        status: Status filter
+        category_id: Category filter
+
+    Returns:
+        Paginated list of technologies
+    """
+    sql_sort_field = _sort_field(sort)
+    where_clause, params = _build_filters(q, status, category_id)
+
+    total_count = None
+    if pagination.include_total:
+        total_count = await TechnologyService.count_technologies(where_clause, params)
+
+    page_where, page_params = apply_cursor(where_clause, params, pagination, sort, sql_sort_field, "t.id")
+
+    with cursor_errors(pagination):
+        items = await TechnologyService.list_technologies(
+            page_where,
+            sql_sort_field,
+            sort.sort_order.upper(),
+            pagination.page_size,
+            pagination.offset,
+            page_params
+        )
+    return paginate_rows(
+        Technology, items, total_count, pagination, sort, next_cursor(items, pagination, sort), response.headers
+    )
+
+
+@router.get("/export")
+async def export_technologies(
+    sort: SortParams = Depends(),
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="Output format"),
+    q: str | None = Query(None, description="Search query"),
+    status: str | None = Query(None, description="Filter by status"),
+    category_id: int | None = Query(None, description="Filter by category"),
+):
+    """
+    Export technologies
+
+    Rows are read through a server-side cursor and streamed in chunks
+
+    Args:
+        sort: Sort parameters
+        format: Output format (ndjson or csv)
+        q: Search query
+        status: Status filter
+        category_id: Category filter
+
+    Returns:
+        Streaming NDJSON or CSV response
+    """
+    sql_sort_field = _sort_field(sort)
+    where_clause, params = _build_filters(q, status, category_id)
+
+    chunks = TechnologyService.stream_technologies(
         where_clause,
         sql_sort_field,
         sort.sort_order.upper(),
-        pagination.page_size,
-        pagination.offset,
-        params
+        params,
+        format,
     )
-    technologies = [Technology(**item) for item in items]
+    return streaming_response(chunks, format, "technologies")
 
-    return paginate(technologies, total_count, pagination, sort)
 
-
-@router.post("", response_model=Technology, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=Technology, status_code=status.HTTP_201_CREATED, dependencies=[Depends(request_transaction)])
 async def create_technology(tech: TechnologyCreate):
     """
     Create technology
@@ -178,25 +264,12 @@ async def create_technology(tech: TechnologyCreate):
     Raises:
         NotFoundException: If category or status not found
     """
-    cat_check = await TechnologyService.get_category_by_id(tech.category_id)
-    if not cat_check:
-        raise NotFoundException(f"Категория с id={tech.category_id} не найдена")
-
-    status_check = await TechnologyService.get_status_by_name(tech.status)
-    if not status_check:
-        raise NotFoundException(f'Статус "{tech.status}" не найден')
-
-    status_id = status_check["id"]
-
-    result = await TechnologyService.create_technology(tech, status_id)
-
-    result["status"] = tech.status
-    result.pop("status_id")
+    result = await TechnologyService.create_technology(tech)
 
     return Technology(**result)
 
 
-@router.get("/{tech_id}", response_model=Technology)
+@router.get("/{tech_id}", response_model=Technology, dependencies=[Depends(conditional(*TECHNOLOGY_TABLES))])
 async def get_technology(tech_id: int):
     """
     Get technology by ID
@@ -218,7 +291,7 @@ async def get_technology(tech_id: int):
     return Technology(**result)
 
 
-@router.put("/{tech_id}", response_model=Technology)
+@router.put("/{tech_id}", response_model=Technology, dependencies=[Depends(request_transaction)])
 async def update_technology(tech_id: int, tech: TechnologyUpdate):
     """
     Update technology
@@ -233,29 +306,12 @@ async def update_technology(tech_id: int, tech: TechnologyUpdate):
     Raises:
         NotFoundException: If technology, category or status not found
     """
-    check = await TechnologyService.get_technology_simple_by_id(tech_id)
-    if not check:
-        raise NotFoundException(f"Технология с id={tech_id} не найдена")
-
-    cat_check = await TechnologyService.get_category_by_id(tech.category_id)
-    if not cat_check:
-        raise NotFoundException(f"Категория с id={tech.category_id} не найдена")
-
-    status_check = await TechnologyService.get_status_by_name(tech.status)
-    if not status_check:
-        raise NotFoundException(f'Статус "{tech.status}" не найден')
-
-    status_id = status_check["id"]
-
-    result = await TechnologyService.update_technology(tech_id, tech, status_id)
-
-    result["status"] = tech.status
-    result.pop("status_id")
+    result = await TechnologyService.update_technology(tech_id, tech)
 
     return Technology(**result)
 
 
-@router.delete("/{tech_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{tech_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(request_transaction)])
 async def delete_technology(tech_id: int):
     """
     Delete technology
@@ -266,8 +322,6 @@ async def delete_technology(tech_id: int):
     Raises:
         NotFoundException: If technology not found
     """
-    check = await TechnologyService.get_technology_simple_by_id(tech_id)
-    if not check:
+    deleted = await TechnologyService.delete_technology(tech_id)
+    if not deleted:
         raise NotFoundException(f"Технология с id={tech_id} не найдена")
-
-    await TechnologyService.delete_technology(tech_id)
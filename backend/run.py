@@ -1,10 +1,13 @@
 import uvicorn
 
+from backend.config import get_settings
+
 if __name__ == "__main__":
+    settings = get_settings()
     uvicorn.run(
         "backend.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
+        host=settings.server.host,
+        port=settings.server.port,
+        reload=settings.app.debug,
         log_level="info",
     )
@@ -1,4 +1,5 @@
 from backend.schemas.auth import LoginRequest, LoginResponse, Token, UserResponse
+from backend.schemas.includes import ProjectDetails, TeamDetails, TeamMember, UserSummary
 from backend.schemas.projects import (
     Project,
     ProjectCreate,
@@ -6,6 +7,7 @@ from backend.schemas.projects import (
     ProjectTechnologyCreate,
     ProjectTechnologyWithDetails,
 )
+from backend.schemas.search import SearchResponse, SearchResult
 from backend.schemas.teams import Team, TeamCreate
 from backend.schemas.technologies import (
     Technology,
@@ -22,6 +24,8 @@ __all__ = [
     "LoginResponse",
     "Token",
     "UserResponse",
+    "SearchResponse",
+    "SearchResult",
     "Team",
     "TeamCreate",
     "Technology",
@@ -36,4 +40,8 @@ __all__ = [
     "ProjectTechnology",
     "ProjectTechnologyCreate",
     "ProjectTechnologyWithDetails",
+    "ProjectDetails",
+    "TeamDetails",
+    "TeamMember",
+    "UserSummary",
 ]
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from backend.schemas.projects import Project, ProjectTechnologyWithDetails
+from backend.schemas.teams import Team
+
+
+class UserSummary(BaseModel):
+    """
+    Public part of a user shown in expansions
+    """
+    id: int
+    full_name: str | None = None
+
+
+class TeamMember(BaseModel):
+    """
+    Team member model
+    """
+    user_id: int
+    full_name: str | None = None
+    role: str | None = None
+    joined_at: datetime | None = None
+
+
+class TeamDetails(Team):
+    """
+    Team with expansions requested by ?include=lead,members,projects
+    """
+    lead: UserSummary | None = None
+    members: list[TeamMember] | None = None
+    projects: list[Project] | None = None
+
+
+class ProjectDetails(Project):
+    """
+    Project with expansions requested by ?include=team,lead,members
+    """
+    # Redeclared: the forward reference of Project is not resolvable here
+    technologies: list[ProjectTechnologyWithDetails] = []
+    team: Team | None = None
+    lead: UserSummary | None = None
+    members: list[TeamMember] | None = None
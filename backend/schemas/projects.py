@@ -86,3 +86,14 @@ class ProjectTechnologyWithDetails(BaseModel):
     added_at: datetime
     category_name: str
     status: str
+
+
+class ArchivedProject(BaseModel):
+    """
+    Project archived by a chunked archiving run
+    """
+    id: int
+    name: str
+    last_updated: datetime
+    days_inactive: int
+    batch: int
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    """
+    Search result item model
+    """
+    type: str
+    id: int
+    title: str
+    subtitle: str | None = None
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    """
+    Unified search response model
+    """
+    query: str
+    items: list[SearchResult]
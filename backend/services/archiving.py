@@ -0,0 +1,255 @@
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from backend.core.changes import mark_changed
+from backend.core.database import fetch_all, fetch_one, fetch_val, transaction
+from backend.core.exceptions import ValidationException
+
+ARCHIVE_LOG_COLUMNS = """
+    id, archived_at, archived_by, projects_archived, inactive_days_threshold,
+    notes, status, cutoff, batch_size, batches, cursor_updated_at, cursor_id, finished_at
+"""
+
+# One batch in one statement: lock the next candidates after the cursor,
+# archive them and record them. The updated_at range condition lets the
+# scan use idx_projects_status_updated, the row comparison breaks ties by id
+ARCHIVE_BATCH_QUERY = """
+    WITH batch AS (
+        SELECT p.id, p.name, p.updated_at
+        FROM projects p
+        WHERE p.status = 'active'
+          AND p.updated_at < $2
+          AND p.updated_at >= $3
+          AND (p.updated_at, p.id) > ($3, $4)
+        ORDER BY p.updated_at, p.id
+        LIMIT $5
+        FOR UPDATE
+    ),
+    archived AS (
+        UPDATE projects p
+        SET status = 'archived', updated_at = NOW()
+        FROM batch b
+        WHERE p.id = b.id
+        RETURNING b.id, b.name, b.updated_at
+    ),
+    items AS (
+        INSERT INTO archive_items (archive_log_id, project_id, project_name, last_updated, days_inactive, batch)
+        SELECT $1, id, name, updated_at, EXTRACT(DAY FROM NOW() - updated_at)::INTEGER, $6
+        FROM archived
+        RETURNING project_id, last_updated
+    )
+    SELECT
+        COUNT(*) AS archived,
+        (ARRAY_AGG(last_updated ORDER BY last_updated DESC, project_id DESC))[1] AS cursor_updated_at,
+        (ARRAY_AGG(project_id ORDER BY last_updated DESC, project_id DESC))[1] AS cursor_id
+    FROM items
+"""
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+class ArchiveService:
+    @staticmethod
+    async def get_unfinished_run() -> dict[str, Any] | None:
+        """
+        Get chunked archiving run that was interrupted
+
+        Returns:
+            Archive log entry or None
+        """
+        return await fetch_one(
+            f"SELECT {ARCHIVE_LOG_COLUMNS} FROM archive_log WHERE status = 'in_progress' ORDER BY id LIMIT 1"
+        )
+
+    @staticmethod
+    async def start_run(inactive_days: int, user_id: int | None, batch_size: int) -> dict[str, Any]:
+        """
+        Record new chunked archiving run
+
+        The inactivity cutoff is fixed at start, so a resumed run archives
+        the same candidate set
+
+        Args:
+            inactive_days: Number of days of inactivity threshold
+            user_id: User who started archiving
+            batch_size: Projects archived per transaction
+
+        Returns:
+            Archive log entry
+        """
+        return await fetch_one(
+            f"""
+            INSERT INTO archive_log (
+                projects_archived, inactive_days_threshold, project_ids, archived_by,
+                notes, status, cutoff, batch_size
+            )
+            VALUES (0, $1, '{{}}', $2, 'Chunked archiving in progress', 'in_progress',
+                    (NOW() - make_interval(days => $1))::TIMESTAMP, $3)
+            RETURNING {ARCHIVE_LOG_COLUMNS}
+            """,
+            inactive_days,
+            user_id,
+            batch_size,
+        )
+
+    @staticmethod
+    async def count_remaining(run: dict[str, Any]) -> int:
+        """
+        Count candidates of run not archived yet
+
+        Args:
+            run: Archive log entry
+
+        Returns:
+            Number of remaining projects
+        """
+        return await fetch_val(
+            "SELECT COUNT(*) FROM projects WHERE status = 'active' AND updated_at < $1",
+            run["cutoff"],
+        )
+
+    @staticmethod
+    async def archive_batch(run: dict[str, Any]) -> int:
+        """
+        Archive next batch of run and advance its cursor in one transaction
+
+        Args:
+            run: Archive log entry, updated in place
+
+        Returns:
+            Number of archived projects, 0 when the run is complete
+        """
+        async with transaction() as conn:
+            batch = await conn.fetchrow(
+                ARCHIVE_BATCH_QUERY,
+                run["id"],
+                run["cutoff"],
+                run["cursor_updated_at"] or datetime.min,
+                run["cursor_id"] or 0,
+                run["batch_size"],
+                run["batches"] + 1,
+            )
+            if not batch["archived"]:
+                return 0
+            updated = await conn.fetchrow(
+                f"""
+                UPDATE archive_log
+                SET projects_archived = projects_archived + $2,
+                    batches = batches + 1,
+                    cursor_updated_at = $3,
+                    cursor_id = $4
+                WHERE id = $1
+                RETURNING {ARCHIVE_LOG_COLUMNS}
+                """,
+                run["id"],
+                batch["archived"],
+                batch["cursor_updated_at"],
+                batch["cursor_id"],
+            )
+        run.update(dict(updated))
+        mark_changed("projects")
+        return batch["archived"]
+
+    @staticmethod
+    async def finish_run(run: dict[str, Any]) -> None:
+        """
+        Mark run as completed
+
+        Args:
+            run: Archive log entry, updated in place
+        """
+        updated = await fetch_one(
+            f"""
+            UPDATE archive_log
+            SET status = 'completed',
+                finished_at = NOW(),
+                notes = 'Chunked archiving of ' || projects_archived || ' inactive project(s) in '
+                        || batches || ' batch(es)'
+            WHERE id = $1
+            RETURNING {ARCHIVE_LOG_COLUMNS}
+            """,
+            run["id"],
+        )
+        run.update(updated)
+
+    @staticmethod
+    async def run_chunked(
+        inactive_days: int,
+        user_id: int | None,
+        batch_size: int,
+        progress: ProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        """
+        Archive inactive projects batch by batch
+
+        Each batch is committed on its own, so locks are held briefly. An
+        interrupted run is resumed from its cursor with its original
+        threshold instead of starting a new one.
+
+        Args:
+            inactive_days: Number of days of inactivity threshold (new runs)
+            user_id: User who started archiving (new runs)
+            batch_size: Projects archived per transaction (new runs)
+            progress: Callback receiving (archived, total) after each batch
+
+        Returns:
+            Completed archive log entry and whether it was resumed
+
+        Raises:
+            ValidationException: If batch size is not positive
+        """
+        if batch_size < 1:
+            raise ValidationException("Размер пакета должен быть положительным")
+
+        run = await ArchiveService.get_unfinished_run()
+        resumed = run is not None
+        if run is None:
+            run = await ArchiveService.start_run(inactive_days, user_id, batch_size)
+
+        total = run["projects_archived"] + await ArchiveService.count_remaining(run)
+        if progress is not None:
+            await progress(run["projects_archived"], total)
+
+        while await ArchiveService.archive_batch(run):
+            if progress is not None:
+                await progress(run["projects_archived"], max(total, run["projects_archived"]))
+
+        await ArchiveService.finish_run(run)
+        return {**run, "resumed": resumed}
+
+    @staticmethod
+    async def get_run(log_id: int) -> dict[str, Any] | None:
+        """
+        Get archive log entry by ID
+
+        Args:
+            log_id: Archive log ID
+
+        Returns:
+            Archive log entry or None if not found
+        """
+        return await fetch_one(f"SELECT {ARCHIVE_LOG_COLUMNS} FROM archive_log WHERE id = $1", log_id)
+
+    @staticmethod
+    async def count_items(where_clause: str, params: list[Any]) -> int:
+        return await fetch_val(f"SELECT COUNT(*) FROM archive_items ai WHERE {where_clause}", *params)
+
+    @staticmethod
+    async def list_items(
+        where_clause: str,
+        sort_field: str,
+        sort_order: str,
+        limit: int,
+        offset: int,
+        params: list[Any],
+    ) -> list[dict[str, Any]]:
+        data_query = f"""
+            SELECT
+                ai.project_id AS id, ai.project_name AS name,
+                ai.last_updated, ai.days_inactive, ai.batch
+            FROM archive_items ai
+            WHERE {where_clause}
+            ORDER BY {sort_field} {sort_order}, ai.project_id {sort_order}
+            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+        """
+        return await fetch_all(data_query, *params, limit, offset)
@@ -1,6 +1,15 @@
 from typing import Any
 
-from backend.core.database import fetch_all, fetch_one
+from backend.core.changes import mark_changed
+from backend.core.database import fetch_all, fetch_one, replica_read
+from backend.core.queries import QueryRegistry
+from backend.core.security import invalidate_principal
+
+USER_SUMMARIES_QUERY = QueryRegistry.register(
+    "users.summaries",
+    "SELECT id, full_name FROM users WHERE id = ANY($1)",
+    warmup_args=([],),
+)
 
 
 class AuthService:
@@ -27,6 +36,22 @@ class AuthService:
         return await fetch_one(query, user_id)
 
     @staticmethod
+    @replica_read("users")
+    async def get_user_summaries(user_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Get public user fields by IDs (batch function of the users loader)
+
+        Args:
+            user_ids: User IDs
+
+        Returns:
+            Mapping of user ID to id and full name
+        """
+        rows = await fetch_all(USER_SUMMARIES_QUERY, user_ids)
+        return {row["id"]: row for row in rows}
+
+    @staticmethod
+    @replica_read("users")
     async def count_users(where_clause: str, params: list[Any]) -> int:
         count_query = f"""
             SELECT COUNT(*) as total
@@ -37,6 +62,7 @@ class AuthService:
         return total["total"] if total else 0
 
     @staticmethod
+    @replica_read("users")
     async def list_users(
         where_clause: str,
         sort_field: str,
@@ -56,7 +82,7 @@ class AuthService:
                 u.updated_at
             FROM users u
             WHERE {where_clause}
-            ORDER BY {sort_field} {sort_order}
+            ORDER BY {sort_field} {sort_order}, u.id {sort_order}
             LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
         """
         return await fetch_all(data_query, *params, limit, offset)
@@ -75,6 +101,7 @@ class AuthService:
             RETURNING id, email, full_name, is_admin, is_active, created_at, updated_at
         """
         result = await fetch_one(query, email, password_hash, full_name, is_admin, is_active)
+        mark_changed("users")
         return dict(result) if result else {}
 
     @staticmethod
@@ -92,13 +119,18 @@ class AuthService:
             RETURNING id, email, full_name, is_admin, is_active, created_at, updated_at
         """
         result = await fetch_one(query, email, full_name, is_admin, is_active, user_id)
+        invalidate_principal(user_id)
+        mark_changed("users")
         return dict(result) if result else None
 
     @staticmethod
     async def delete_user(user_id: int) -> None:
         await fetch_one("DELETE FROM users WHERE id = $1", user_id)
+        invalidate_principal(user_id)
+        mark_changed("users", "teams", "team_members")
 
     @staticmethod
     async def update_user_password(user_id: int, password_hash: str) -> None:
         query = "UPDATE users SET password_hash = $1, updated_at = NOW() WHERE id = $2"
         await fetch_one(query, password_hash, user_id)
+        invalidate_principal(user_id)
@@ -0,0 +1,427 @@
+import json
+from datetime import date
+from typing import Any, AsyncGenerator, AsyncIterable
+
+import asyncpg
+
+from backend.core.changes import mark_changed
+from backend.core.exceptions import ValidationException
+from backend.core.streaming import (
+    EXPORT_FORMATS,
+    encode_csv,
+    encode_rows,
+    iter_csv_rows,
+    iter_cursor,
+    iter_lines,
+)
+
+IMPORT_FIELDS = [
+    "project_name",
+    "project_description",
+    "project_status",
+    "team_name",
+    "repository_url",
+    "start_date",
+    "technology_name",
+    "technology_category",
+    "technology_status",
+    "technology_version",
+    "usage_type",
+    "notes",
+]
+
+IMPORT_FORMATS = EXPORT_FORMATS
+PROJECT_STATUSES = ("active", "maintenance", "archived")
+USAGE_TYPES = ("production", "development", "testing")
+MAX_REPORTED_ERRORS = 1000
+
+STAGING_TABLE = "import_rows"
+
+EXPORT_QUERY = """
+    SELECT
+        p.name as project_name,
+        p.description as project_description,
+        p.status as project_status,
+        tm.name as team_name,
+        p.repository_url,
+        p.start_date,
+        t.name as technology_name,
+        tc.name as technology_category,
+        ts.name as technology_status,
+        tv.version as technology_version,
+        pt.usage_type,
+        pt.notes
+    FROM projects p
+    LEFT JOIN teams tm ON p.team_id = tm.id
+    LEFT JOIN project_technologies pt ON pt.project_id = p.id
+    LEFT JOIN technologies t ON pt.technology_id = t.id
+    LEFT JOIN technology_categories tc ON t.category_id = tc.id
+    LEFT JOIN technology_statuses ts ON t.status_id = ts.id
+    LEFT JOIN technology_versions tv ON pt.version_id = tv.id
+    ORDER BY p.id ASC, t.name ASC
+"""
+
+
+def _text(value: Any, field: str, max_length: int | None = None) -> str | None:
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    if max_length and len(value) > max_length:
+        raise ValueError(f"{field}: длина превышает {max_length} символов")
+    return value
+
+
+def _normalize_row(raw: dict[str, Any], line_no: int) -> tuple:
+    """
+    Validate flat import row and convert it to a staging record
+
+    Raises:
+        ValueError: If row is invalid
+    """
+    project_name = _text(raw.get("project_name"), "project_name", 255)
+    if not project_name:
+        raise ValueError("project_name: обязательное поле")
+
+    project_status = _text(raw.get("project_status"), "project_status")
+    if project_status and project_status not in PROJECT_STATUSES:
+        raise ValueError(f"project_status: недопустимое значение \"{project_status}\"")
+
+    start_date = _text(raw.get("start_date"), "start_date")
+    if start_date:
+        try:
+            start_date = date.fromisoformat(start_date)
+        except ValueError:
+            raise ValueError(f"start_date: некорректная дата \"{start_date}\"")
+
+    technology_name = _text(raw.get("technology_name"), "technology_name", 255)
+    usage_type = _text(raw.get("usage_type"), "usage_type") or "production"
+    if usage_type not in USAGE_TYPES:
+        raise ValueError(f"usage_type: недопустимое значение \"{usage_type}\"")
+
+    return (
+        line_no,
+        project_name,
+        _text(raw.get("project_description"), "project_description"),
+        project_status,
+        _text(raw.get("team_name"), "team_name"),
+        _text(raw.get("repository_url"), "repository_url", 500),
+        start_date,
+        technology_name,
+        _text(raw.get("technology_category"), "technology_category") if technology_name else None,
+        _text(raw.get("technology_status"), "technology_status") if technology_name else None,
+        _text(raw.get("technology_version"), "technology_version", 50) if technology_name else None,
+        usage_type if technology_name else None,
+        _text(raw.get("notes"), "notes") if technology_name else None,
+    )
+
+
+def _expand_project(obj: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Expand nested project object into flat import rows
+    """
+    base = {
+        "project_name": obj.get("name"),
+        "project_description": obj.get("description"),
+        "project_status": obj.get("status"),
+        "team_name": obj.get("team"),
+        "repository_url": obj.get("repository_url"),
+        "start_date": obj.get("start_date"),
+    }
+    technologies = obj.get("technologies") or []
+    if not isinstance(technologies, list):
+        raise ValueError("technologies: ожидается список")
+    if not technologies:
+        return [base]
+
+    rows = []
+    for tech in technologies:
+        if isinstance(tech, str):
+            tech = {"name": tech}
+        if not isinstance(tech, dict):
+            raise ValueError("technologies: ожидается строка или объект")
+        rows.append({
+            **base,
+            "technology_name": tech.get("name"),
+            "technology_category": tech.get("category"),
+            "technology_status": tech.get("status"),
+            "technology_version": tech.get("version"),
+            "usage_type": tech.get("usage_type"),
+            "notes": tech.get("notes"),
+        })
+    return rows
+
+
+class ImportReport:
+    """
+    Accumulates bulk import counters and per-row errors
+    """
+    def __init__(self):
+        self.rows = 0
+        self.error_count = 0
+        self.errors: list[dict[str, Any]] = []
+
+    def add_error(self, line_no: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_no, "message": message})
+
+
+class BulkService:
+    @staticmethod
+    async def _iter_records(
+        chunks: AsyncIterable[bytes],
+        fmt: str,
+        report: ImportReport,
+    ) -> AsyncGenerator[tuple, None]:
+        lines = iter_lines(chunks)
+
+        if fmt == "csv":
+            header: list[str] | None = None
+            async for line_no, fields in iter_csv_rows(lines):
+                if header is None:
+                    header = [f.strip() for f in fields]
+                    unknown = set(header) - set(IMPORT_FIELDS)
+                    if unknown:
+                        raise ValidationException(f"Неизвестные колонки: {', '.join(sorted(unknown))}")
+                    continue
+                report.rows += 1
+                try:
+                    yield _normalize_row(dict(zip(header, fields)), line_no)
+                except ValueError as e:
+                    report.add_error(line_no, str(e))
+            return
+
+        line_no = 0
+        async for line in lines:
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+                if not isinstance(obj, dict):
+                    raise ValueError("ожидается JSON-объект")
+                raw_rows = _expand_project(obj) if "project_name" not in obj else [obj]
+            except ValueError as e:
+                report.rows += 1
+                report.add_error(line_no, str(e))
+                continue
+
+            for raw in raw_rows:
+                report.rows += 1
+                try:
+                    yield _normalize_row(raw, line_no)
+                except ValueError as e:
+                    report.add_error(line_no, str(e))
+
+    @staticmethod
+    async def import_records(
+        conn: asyncpg.Connection,
+        chunks: AsyncIterable[bytes],
+        fmt: str = "ndjson",
+    ) -> dict[str, Any]:
+        """
+        Import projects, technologies and their links from NDJSON/CSV stream
+
+        Rows are staged with binary COPY and applied with set-based
+        statements in one transaction. Invalid rows are skipped and reported.
+        """
+        report = ImportReport()
+
+        async with conn.transaction():
+            await conn.execute(f"""
+                CREATE TEMP TABLE {STAGING_TABLE} (
+                    line_no INTEGER,
+                    project_name TEXT,
+                    project_description TEXT,
+                    project_status TEXT,
+                    team_name TEXT,
+                    repository_url TEXT,
+                    start_date DATE,
+                    technology_name TEXT,
+                    technology_category TEXT,
+                    technology_status TEXT,
+                    technology_version TEXT,
+                    usage_type TEXT,
+                    notes TEXT,
+                    project_id INTEGER,
+                    team_id INTEGER,
+                    technology_id INTEGER,
+                    category_id INTEGER,
+                    status_id INTEGER,
+                    version_id INTEGER
+                ) ON COMMIT DROP
+            """)
+
+            await conn.copy_records_to_table(
+                STAGING_TABLE,
+                records=BulkService._iter_records(chunks, fmt, report),
+                columns=["line_no", *IMPORT_FIELDS],
+            )
+
+            await conn.execute(f"""
+                UPDATE {STAGING_TABLE} r SET team_id = t.id
+                FROM (SELECT LOWER(name) as key, MIN(id) as id FROM teams GROUP BY LOWER(name)) t
+                WHERE LOWER(r.team_name) = t.key;
+
+                UPDATE {STAGING_TABLE} r SET category_id = c.id
+                FROM technology_categories c
+                WHERE LOWER(r.technology_category) = LOWER(c.name);
+
+                UPDATE {STAGING_TABLE} r SET status_id = s.id
+                FROM technology_statuses s
+                WHERE LOWER(r.technology_status) = LOWER(s.name);
+
+                UPDATE {STAGING_TABLE} r SET technology_id = t.id
+                FROM (SELECT LOWER(name) as key, MIN(id) as id FROM technologies GROUP BY LOWER(name)) t
+                WHERE LOWER(r.technology_name) = t.key;
+
+                UPDATE {STAGING_TABLE} r SET project_id = p.id
+                FROM (SELECT LOWER(name) as key, MIN(id) as id FROM projects GROUP BY LOWER(name)) p
+                WHERE LOWER(r.project_name) = p.key;
+            """)
+
+            rejected = await conn.fetch(f"""
+                DELETE FROM {STAGING_TABLE}
+                WHERE (team_name IS NOT NULL AND team_id IS NULL)
+                   OR (technology_name IS NOT NULL AND technology_id IS NULL
+                       AND (category_id IS NULL OR status_id IS NULL))
+                RETURNING
+                    line_no,
+                    CASE
+                        WHEN team_name IS NOT NULL AND team_id IS NULL
+                            THEN 'Команда "' || team_name || '" не найдена'
+                        WHEN technology_category IS NULL OR technology_status IS NULL
+                            THEN 'Технология "' || technology_name || '" не найдена, для создания укажите категорию и статус'
+                        WHEN category_id IS NULL
+                            THEN 'Категория "' || technology_category || '" не найдена'
+                        ELSE 'Статус "' || technology_status || '" не найден'
+                    END as message
+            """)
+            for row in sorted(rejected, key=lambda r: r["line_no"]):
+                report.add_error(row["line_no"], row["message"])
+
+            created_technologies = await conn.fetch(f"""
+                WITH new_technologies AS (
+                    SELECT DISTINCT ON (LOWER(technology_name))
+                        technology_name, category_id, status_id
+                    FROM {STAGING_TABLE}
+                    WHERE technology_name IS NOT NULL AND technology_id IS NULL
+                    ORDER BY LOWER(technology_name), line_no
+                ),
+                inserted AS (
+                    INSERT INTO technologies (name, category_id, status_id, created_at, updated_at)
+                    SELECT technology_name, category_id, status_id, NOW(), NOW()
+                    FROM new_technologies
+                    RETURNING id, name
+                )
+                UPDATE {STAGING_TABLE} r SET technology_id = i.id
+                FROM inserted i
+                WHERE r.technology_id IS NULL AND LOWER(r.technology_name) = LOWER(i.name)
+                RETURNING r.technology_id
+            """)
+
+            await conn.execute(f"""
+                INSERT INTO technology_versions (technology_id, version, created_at)
+                SELECT DISTINCT technology_id, technology_version, NOW()
+                FROM {STAGING_TABLE}
+                WHERE technology_id IS NOT NULL AND technology_version IS NOT NULL
+                ON CONFLICT (technology_id, version) DO NOTHING;
+
+                UPDATE {STAGING_TABLE} r SET version_id = v.id
+                FROM technology_versions v
+                WHERE v.technology_id = r.technology_id AND v.version = r.technology_version;
+            """)
+
+            updated_projects = await conn.fetch(f"""
+                UPDATE projects p
+                SET description = COALESCE(s.project_description, p.description),
+                    status = COALESCE(s.project_status, p.status),
+                    team_id = COALESCE(s.team_id, p.team_id),
+                    repository_url = COALESCE(s.repository_url, p.repository_url),
+                    start_date = COALESCE(s.start_date, p.start_date),
+                    updated_at = NOW()
+                FROM (
+                    SELECT DISTINCT ON (project_id)
+                        project_id, project_description, project_status,
+                        team_id, repository_url, start_date
+                    FROM {STAGING_TABLE}
+                    WHERE project_id IS NOT NULL
+                    ORDER BY project_id, line_no
+                ) s
+                WHERE p.id = s.project_id
+                RETURNING p.id
+            """)
+
+            created_projects = await conn.fetch(f"""
+                WITH new_projects AS (
+                    SELECT DISTINCT ON (LOWER(project_name))
+                        project_name, project_description, project_status,
+                        team_id, repository_url, start_date
+                    FROM {STAGING_TABLE}
+                    WHERE project_id IS NULL
+                    ORDER BY LOWER(project_name), line_no
+                ),
+                inserted AS (
+                    INSERT INTO projects (
+                        name, description, team_id, status, repository_url,
+                        start_date, created_at, updated_at
+                    )
+                    SELECT
+                        project_name, project_description, team_id,
+                        COALESCE(project_status, 'active'), repository_url,
+                        start_date, NOW(), NOW()
+                    FROM new_projects
+                    RETURNING id, name
+                )
+                UPDATE {STAGING_TABLE} r SET project_id = i.id
+                FROM inserted i
+                WHERE r.project_id IS NULL AND LOWER(r.project_name) = LOWER(i.name)
+                RETURNING r.project_id
+            """)
+
+            links_status = await conn.execute(f"""
+                INSERT INTO project_technologies AS pt (
+                    project_id, technology_id, version_id, usage_type, notes, added_at
+                )
+                SELECT DISTINCT ON (project_id, technology_id)
+                    project_id, technology_id, version_id, usage_type, notes, NOW()
+                FROM {STAGING_TABLE}
+                WHERE technology_id IS NOT NULL
+                ORDER BY project_id, technology_id, line_no DESC
+                ON CONFLICT (project_id, technology_id) DO UPDATE
+                SET version_id = COALESCE(EXCLUDED.version_id, pt.version_id),
+                    usage_type = EXCLUDED.usage_type,
+                    notes = COALESCE(EXCLUDED.notes, pt.notes)
+            """)
+
+        mark_changed(
+            "projects",
+            "project_technologies",
+            "technologies",
+            "technology_versions",
+        )
+
+        return {
+            "rows": report.rows,
+            "imported_rows": report.rows - report.error_count,
+            "projects_created": len({r["project_id"] for r in created_projects}),
+            "projects_updated": len(updated_projects),
+            "technologies_created": len({r["technology_id"] for r in created_technologies}),
+            "links_upserted": int(links_status.split()[-1]),
+            "error_count": report.error_count,
+            "errors": report.errors,
+        }
+
+    @staticmethod
+    async def export_records(conn: asyncpg.Connection, fmt: str = "ndjson") -> AsyncGenerator[bytes, None]:
+        """
+        Stream projects with their technology links in the import format
+        """
+        if fmt == "csv":
+            yield encode_csv([], IMPORT_FIELDS, header=True)
+
+        async with conn.transaction(readonly=True):
+            async for rows in iter_cursor(conn, EXPORT_QUERY):
+                yield encode_rows(rows, fmt, IMPORT_FIELDS)
@@ -1,9 +1,82 @@
+import asyncio
 from typing import Any
-from backend.core.database import fetch_all, fetch_one
+
+from backend.config import get_settings
+from backend.core.cache import TTLCache
+from backend.core.changes import on_change
+from backend.core.database import fetch_all, fetch_one, replica_read
+from backend.services.radar_views import RadarViewService
+
+SNAPSHOT_VIEWS = ["mv_technology_usage", "mv_team_summary", "mv_category_usage"]
+
+# Raw tables read directly plus the materialized views, whose refreshes
+# are announced like table writes
+SNAPSHOT_TABLES = frozenset({
+    "projects",
+    "project_technologies",
+    "technologies",
+    "teams",
+    "users",
+    *SNAPSHOT_VIEWS,
+})
+
+_snapshot_cache = TTLCache(
+    "dashboard_snapshot",
+    maxsize=1,
+    ttl=get_settings().cache.dashboard_ttl_seconds,
+)
+
+
+@on_change
+def _invalidate_snapshot(tables: frozenset[str]) -> None:
+    if tables & SNAPSHOT_TABLES:
+        _snapshot_cache.invalidate()
 
 
 class DashboardService:
     @staticmethod
+    async def get_snapshot() -> dict[str, Any]:
+        """Get all dashboard statistics, cached and refreshed once for concurrent callers"""
+        return await _snapshot_cache.get_or_load("stats", DashboardService.build_snapshot)
+
+    @staticmethod
+    async def build_snapshot() -> dict[str, Any]:
+        """Run all dashboard queries concurrently and assemble the result"""
+        (
+            overview,
+            tech_usage,
+            project_status,
+            recent_projects,
+            team_summary,
+            tech_by_category,
+            freshness,
+        ) = await asyncio.gather(
+            DashboardService.get_overview_stats(),
+            DashboardService.get_technology_usage(),
+            DashboardService.get_project_status_distribution(),
+            DashboardService.get_recent_projects(),
+            DashboardService.get_team_summary(),
+            DashboardService.get_technology_by_category(),
+            RadarViewService.get_freshness(SNAPSHOT_VIEWS),
+        )
+
+        return {
+            "overview": overview,
+            "technology_usage": tech_usage,
+            "project_status_distribution": project_status,
+            "recent_projects": recent_projects,
+            "team_summary": team_summary,
+            "technology_by_category": tech_by_category,
+            "freshness": freshness,
+        }
+
+    @staticmethod
+    def invalidate_snapshot() -> None:
+        """Drop cached dashboard snapshot"""
+        _snapshot_cache.invalidate()
+
+    @staticmethod
+    @replica_read(*SNAPSHOT_TABLES)
     async def get_overview_stats() -> dict[str, int]:
         """Get overall counts for dashboard"""
         query = """
@@ -14,27 +87,22 @@ class DashboardService:
                 (SELECT COUNT(*) FROM users) as total_users
         """
         result = await fetch_one(query)
-        return dict(result) if result else {}
+        return result or {}
 
     @staticmethod
+    @replica_read(*SNAPSHOT_TABLES)
     async def get_technology_usage() -> list[dict[str, Any]]:
         """Get most used technologies across projects"""
         query = """
-            SELECT
-                t.name,
-                COUNT(DISTINCT pt.project_id) as project_count,
-                tc.name as category_name
-            FROM technologies t
-            LEFT JOIN project_technologies pt ON t.id = pt.technology_id
-            LEFT JOIN technology_categories tc ON t.category_id = tc.id
-            GROUP BY t.id, t.name, tc.name
-            ORDER BY project_count DESC
+            SELECT name, project_count, category_name
+            FROM mv_technology_usage
+            ORDER BY project_count DESC, name
             LIMIT 10
         """
-        results = await fetch_all(query)
-        return [dict(r) for r in results]
+        return await fetch_all(query)
 
     @staticmethod
+    @replica_read(*SNAPSHOT_TABLES)
     async def get_project_status_distribution() -> list[dict[str, Any]]:
         """Get project count by status"""
         query = """
@@ -45,10 +113,10 @@ class DashboardService:
             GROUP BY status
             ORDER BY count DESC
         """
-        results = await fetch_all(query)
-        return [dict(r) for r in results]
+        return await fetch_all(query)
 
     @staticmethod
+    @replica_read(*SNAPSHOT_TABLES)
     async def get_recent_projects() -> list[dict[str, Any]]:
         """Get 5 most recent projects with team info"""
         query = """
@@ -64,39 +132,27 @@ class DashboardService:
             ORDER BY p.created_at DESC
             LIMIT 5
         """
-        results = await fetch_all(query)
-        return [dict(r) for r in results]
+        return await fetch_all(query)
 
     @staticmethod
+    @replica_read(*SNAPSHOT_TABLES)
     async def get_team_summary() -> list[dict[str, Any]]:
         """Get team statistics"""
         query = """
-            SELECT
-                t.id,
-                t.name,
-                COUNT(DISTINCT p.id) as project_count,
-                u.full_name as lead_name
-            FROM teams t
-            LEFT JOIN projects p ON p.team_id = t.id
-            LEFT JOIN users u ON t.lead_id = u.id
-            GROUP BY t.id, t.name, u.full_name
+            SELECT team_id as id, name, project_count, lead_name
+            FROM mv_team_summary
             ORDER BY project_count DESC
             LIMIT 5
         """
-        results = await fetch_all(query)
-        return [dict(r) for r in results]
+        return await fetch_all(query)
 
     @staticmethod
+    @replica_read(*SNAPSHOT_TABLES)
     async def get_technology_by_category() -> list[dict[str, Any]]:
         """Get technology count by category"""
         query = """
-            SELECT
-                tc.name as category,
-                COUNT(t.id) as count
-            FROM technology_categories tc
-            LEFT JOIN technologies t ON tc.id = t.category_id
-            GROUP BY tc.id, tc.name
+            SELECT category, technology_count as count
+            FROM mv_category_usage
             ORDER BY count DESC
         """
-        results = await fetch_all(query)
-        return [dict(r) for r in results]
+        return await fetch_all(query)
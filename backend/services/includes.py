@@ -0,0 +1,173 @@
+import asyncio
+from typing import Any, Awaitable
+
+from backend.core.exceptions import ValidationException
+from backend.core.loaders import DataLoader, get_loader
+from backend.core.serialization import shape_rows
+from backend.schemas.includes import TeamMember, UserSummary
+from backend.schemas.projects import Project
+from backend.schemas.teams import Team
+from backend.services.auth import AuthService
+from backend.services.projects import PROJECT_TABLES, ProjectService
+from backend.services.teams import TeamService
+
+# Expansion name -> tables it reads (added to the endpoint's ETag)
+TEAM_INCLUDES = {
+    "lead": ("users",),
+    "members": ("team_members", "users"),
+    "projects": PROJECT_TABLES,
+}
+
+PROJECT_INCLUDES = {
+    "team": ("teams",),
+    "lead": ("teams", "users"),
+    "members": ("team_members", "users"),
+}
+
+
+def users_loader() -> DataLoader[int, dict[str, Any]]:
+    return get_loader("users", AuthService.get_user_summaries)
+
+
+def teams_loader() -> DataLoader[int, dict[str, Any]]:
+    return get_loader("teams", TeamService.get_teams_by_ids)
+
+
+def team_members_loader() -> DataLoader[int, list[dict[str, Any]]]:
+    return get_loader("team_members", TeamService.get_members_by_team_ids)
+
+
+def team_projects_loader() -> DataLoader[int, list[dict[str, Any]]]:
+    return get_loader("team_projects", ProjectService.get_projects_by_team_ids)
+
+
+def project_technologies_loader() -> DataLoader[int, list[dict[str, Any]]]:
+    return get_loader("project_technologies", ProjectService.get_technologies_by_project_ids)
+
+
+def include_description(allowed: dict[str, tuple[str, ...]]) -> str:
+    """
+    Get description of the include query parameter
+    """
+    return f"Comma-separated expansions: {', '.join(allowed)}"
+
+
+def parse_includes(value: str | None, allowed: dict[str, tuple[str, ...]]) -> frozenset[str]:
+    """
+    Parse include query parameter
+
+    Args:
+        value: Comma-separated expansion names
+        allowed: Expansions of the endpoint
+
+    Returns:
+        Requested expansions
+
+    Raises:
+        ValidationException: If an unknown expansion is requested
+    """
+    if not value:
+        return frozenset()
+    requested = frozenset(name.strip() for name in value.split(",") if name.strip())
+    unknown = requested - allowed.keys()
+    if unknown:
+        raise ValidationException(f"Неизвестные включения: {', '.join(sorted(unknown))}")
+    return requested
+
+
+async def _load_user(user_id: int | None) -> dict[str, Any] | None:
+    if user_id is None:
+        return None
+    user = await users_loader().load(user_id)
+    return shape_rows(UserSummary, [user])[0] if user else None
+
+
+async def _load_members(team_id: int | None) -> list[dict[str, Any]]:
+    if team_id is None:
+        return []
+    return shape_rows(TeamMember, await team_members_loader().load(team_id) or [])
+
+
+async def _load_team_projects(team_id: int) -> list[dict[str, Any]]:
+    projects = await team_projects_loader().load(team_id) or []
+    stacks = await project_technologies_loader().load_many(project["id"] for project in projects)
+    for project, technologies in zip(projects, stacks):
+        project["technologies"] = technologies or []
+    return shape_rows(Project, projects)
+
+
+async def _load_team(team_id: int | None) -> dict[str, Any] | None:
+    if team_id is None:
+        return None
+    team = await teams_loader().load(team_id)
+    return shape_rows(Team, [team])[0] if team else None
+
+
+async def _load_team_lead(team_id: int | None) -> dict[str, Any] | None:
+    team = await _load_team(team_id)
+    return await _load_user(team["lead_id"]) if team else None
+
+
+async def _expand(row: dict[str, Any], loads: dict[str, Awaitable[Any]]) -> None:
+    values = await asyncio.gather(*loads.values())
+    row.update(zip(loads, values))
+
+
+async def expand_teams(teams: list[dict[str, Any]], includes: frozenset[str]) -> list[dict[str, Any]]:
+    """
+    Attach requested related rows to teams
+
+    Every team resolves its expansions independently through the request's
+    loaders; lookups of all teams made in the same step are batched, so
+    the number of queries does not depend on the number of teams
+
+    Args:
+        teams: Team rows, updated in place
+        includes: Expansions from TEAM_INCLUDES
+
+    Returns:
+        The teams
+    """
+    if not includes or not teams:
+        return teams
+
+    def loads(team: dict[str, Any]) -> dict[str, Awaitable[Any]]:
+        result = {}
+        if "lead" in includes:
+            result["lead"] = _load_user(team["lead_id"])
+        if "members" in includes:
+            result["members"] = _load_members(team["id"])
+        if "projects" in includes:
+            result["projects"] = _load_team_projects(team["id"])
+        return result
+
+    await asyncio.gather(*(_expand(team, loads(team)) for team in teams))
+    return teams
+
+
+async def expand_projects(projects: list[dict[str, Any]], includes: frozenset[str]) -> list[dict[str, Any]]:
+    """
+    Attach requested rows of the owning team to projects
+
+    Args:
+        projects: Project rows, updated in place
+        includes: Expansions from PROJECT_INCLUDES
+
+    Returns:
+        The projects
+    """
+    if not includes or not projects:
+        return projects
+
+    def loads(project: dict[str, Any]) -> dict[str, Awaitable[Any]]:
+        result = {}
+        if "team" in includes:
+            result["team"] = _load_team(project["team_id"])
+        if "lead" in includes:
+            result["lead"] = _load_team_lead(project["team_id"])
+        if "members" in includes:
+            result["members"] = _load_members(project["team_id"])
+        return result
+
+    await asyncio.gather(*(_expand(project, loads(project)) for project in projects))
+    return projects
@@ -0,0 +1,93 @@
+from typing import Any
+
+from backend.config import get_settings
+from backend.core.jobs import JobContext, Schedule, job, parse_daily_time
+from backend.services.archiving import ArchiveService
+from backend.services.radar_views import RADAR_VIEWS, RadarViewRefresher
+from backend.services.technologies import TechnologyService
+
+settings = get_settings().jobs
+
+ARCHIVE_JOB = "archive_inactive_projects"
+
+
+@job(
+    ARCHIVE_JOB,
+    "Архивирование проектов без изменений дольше порога",
+    schedule=Schedule(daily_at=parse_daily_time(settings.archive_at)),
+    default_params={"inactive_days": settings.archive_inactive_days, "batch_size": settings.archive_batch_size},
+)
+async def archive_inactive_projects(ctx: JobContext) -> dict[str, Any]:
+    """
+    Archive inactive projects in batches
+
+    An archiving run interrupted earlier is resumed first
+
+    Args:
+        ctx: Job context with "inactive_days" and "batch_size" parameters
+
+    Returns:
+        Archive log ID and counters; archived projects are listed by
+        /admin/archive/history/{id}/items
+    """
+    async def progress(done: int, total: int) -> None:
+        await ctx.progress(done, total, f"Архивировано проектов: {done} из {total}")
+
+    run = await ArchiveService.run_chunked(
+        int(ctx.params["inactive_days"]),
+        ctx.triggered_by,
+        int(ctx.params["batch_size"]),
+        progress,
+    )
+    return {
+        "archive_log_id": run["id"],
+        "inactive_days": run["inactive_days_threshold"],
+        "count": run["projects_archived"],
+        "batches": run["batches"],
+        "resumed": run["resumed"],
+    }
+
+
+@job(
+    "refresh_radar_views",
+    "Проверка и обновление материализованных представлений радара",
+    schedule=Schedule(every_seconds=settings.radar_refresh_interval_seconds or None),
+)
+async def refresh_radar_views(ctx: JobContext) -> dict[str, Any]:
+    """
+    Refresh radar views whose sources changed
+
+    Backstop for the debounced refresher: catches writes whose
+    notifications were missed
+
+    Args:
+        ctx: Job context
+
+    Returns:
+        Views that were locked by another worker
+    """
+    views = sorted(RADAR_VIEWS)
+    busy = []
+    for done, view in enumerate(views, start=1):
+        if not await RadarViewRefresher.refresh(view):
+            busy.append(view)
+        await ctx.progress(done, len(views), view)
+    return {"views": views, "busy": busy}
+
+
+@job(
+    "reconcile_stats_counters",
+    "Пересчёт счётчиков использования технологий",
+    schedule=Schedule(daily_at=parse_daily_time(settings.stats_reconcile_at)),
+)
+async def reconcile_stats_counters(ctx: JobContext) -> dict[str, Any]:
+    """
+    Rebuild technology usage counters from project links
+
+    Args:
+        ctx: Job context
+
+    Returns:
+        Number of counter rows that had drifted
+    """
+    return {"drifted_rows": await TechnologyService.rebuild_stats_counters()}
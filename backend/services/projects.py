@@ -1,132 +1,304 @@
-from typing import Any
-
-from backend.core.database import execute, fetch_all, fetch_one
+from typing import Any, AsyncGenerator
+
+from backend.core.changes import mark_changed
+from backend.core.database import fetch_all, fetch_one, fetch_val, replica_read, transaction
+from backend.core.exceptions import ConflictException, NotFoundException
+from backend.core.queries import QueryRegistry, page_query
+from backend.core.references import check_references, integrity_errors
+from backend.core.streaming import stream_query
+from backend.services.reference_data import ReferenceDataService
 from backend.schemas.projects import ProjectCreate, ProjectTechnologyCreate, ProjectUpdate
 
+# Tables of project pages: projects, their stacks and the technology catalog
+PROJECT_TABLES = (
+    "projects",
+    "project_technologies",
+    "technologies",
+    "technology_versions",
+    "technology_categories",
+    "technology_statuses",
+)
+
+PROJECT_COLUMNS = """
+    id, name, description, team_id, status, repository_url,
+    start_date, created_at, updated_at
+"""
+
+# Technology, category and status names are filled from reference data
+PROJECT_TECHNOLOGIES_QUERY = QueryRegistry.register("projects.technologies", """
+    SELECT
+        pt.id, pt.project_id, pt.technology_id,
+        pt.version_id,
+        tv.version as version_number,
+        pt.usage_type, pt.notes, pt.added_at
+    FROM project_technologies pt
+    LEFT JOIN technology_versions tv ON pt.version_id = tv.id
+    WHERE pt.project_id = $1
+""", warmup_args=(0,))
+
+PROJECTS_TECHNOLOGIES_QUERY = QueryRegistry.register("projects.technologies_many", """
+    SELECT
+        pt.id, pt.project_id, pt.technology_id,
+        pt.version_id,
+        tv.version as version_number,
+        pt.usage_type, pt.notes, pt.added_at
+    FROM project_technologies pt
+    LEFT JOIN technology_versions tv ON pt.version_id = tv.id
+    WHERE pt.project_id = ANY($1)
+""", warmup_args=([],))
+
+TEAM_PROJECTS_QUERY = QueryRegistry.register("projects.by_team_ids", f"""
+    SELECT {PROJECT_COLUMNS}
+    FROM projects
+    WHERE team_id = ANY($1)
+    ORDER BY team_id, created_at DESC, id DESC
+""", warmup_args=([],))
+
+PROJECT_BY_ID_QUERY = QueryRegistry.register(
+    "projects.get",
+    f"SELECT {PROJECT_COLUMNS} FROM projects WHERE id = $1",
+    warmup_args=(0,),
+)
+
+# Whole page in one statement: each project's stack is aggregated by a
+# LATERAL json_agg and the page by an outer json_agg, keys in the order of
+# the Project response model. Technologies are sorted by name like
+# ReferenceDataService.enrich_technologies (COLLATE "C" = code point order)
+# and links to deleted technologies are skipped the same way. The last row
+# is returned separately for the next cursor.
+PROJECT_PAGE_JSON_TEMPLATE = """
+    WITH page AS (
+        SELECT
+            p.id, p.name, p.description, p.team_id, p.status,
+            p.repository_url, p.start_date, p.created_at, p.updated_at
+        FROM projects p
+        WHERE {where}
+        ORDER BY {sort_field} {sort_order}, p.id {sort_order}
+        LIMIT {limit} OFFSET {offset}
+    ),
+    last AS (
+        SELECT {sort_field} AS sort_value, p.id
+        FROM page p
+        ORDER BY {sort_field} {reverse_order}, p.id {reverse_order}
+        LIMIT 1
+    )
+    SELECT
+        (SELECT COUNT(*) FROM page) AS count,
+        (SELECT sort_value FROM last) AS last_sort_value,
+        (SELECT id FROM last) AS last_id,
+        (
+            SELECT COALESCE(json_agg(json_build_object(
+                'name', p.name,
+                'description', p.description,
+                'team_id', p.team_id,
+                'status', p.status,
+                'repository_url', p.repository_url,
+                'start_date', p.start_date,
+                'id', p.id,
+                'created_at', p.created_at,
+                'updated_at', p.updated_at,
+                'technologies', COALESCE(stack.technologies, '[]'::json)
+            ) ORDER BY {sort_field} {sort_order}, p.id {sort_order}), '[]'::json)
+            FROM page p
+            LEFT JOIN LATERAL (
+                SELECT json_agg(json_build_object(
+                    'id', pt.id,
+                    'project_id', pt.project_id,
+                    'technology_id', pt.technology_id,
+                    'technology_name', t.name,
+                    'version_id', pt.version_id,
+                    'version_number', tv.version,
+                    'usage_type', pt.usage_type,
+                    'notes', pt.notes,
+                    'added_at', pt.added_at,
+                    'category_name', tc.name,
+                    'status', ts.name
+                ) ORDER BY t.name COLLATE "C", pt.id) AS technologies
+                FROM project_technologies pt
+                JOIN technologies t ON pt.technology_id = t.id
+                JOIN technology_categories tc ON t.category_id = tc.id
+                JOIN technology_statuses ts ON t.status_id = ts.id
+                LEFT JOIN technology_versions tv ON pt.version_id = tv.id
+                WHERE pt.project_id = p.id
+            ) stack ON TRUE
+        ) AS items
+"""
+
+PROJECT_COUNT_TEMPLATE = "SELECT COUNT(*) as total FROM projects p WHERE {where}"
+
+# Default listing (no filters, newest first)
+page_query(
+    "projects.page_json", PROJECT_PAGE_JSON_TEMPLATE, "TRUE", "p.created_at", "DESC", 0,
+    warmup=True, reverse_order="ASC",
+)
+
+LINK_TECHNOLOGIES_QUERY = """
+    WITH linked AS (
+        INSERT INTO project_technologies (project_id, technology_id, usage_type, added_at)
+        SELECT $1, tech_id, 'production', NOW()
+        FROM unnest($2::int[]) AS tech_id
+        ON CONFLICT (project_id, technology_id) DO NOTHING
+        RETURNING id, project_id, technology_id, version_id, usage_type, notes, added_at
+    )
+    SELECT
+        l.id, l.project_id, l.technology_id,
+        l.version_id,
+        tv.version as version_number,
+        l.usage_type, l.notes, l.added_at
+    FROM linked l
+    LEFT JOIN technology_versions tv ON l.version_id = tv.id
+"""
+
+SYNC_TECHNOLOGIES_QUERY = """
+    WITH removed AS (
+        DELETE FROM project_technologies
+        WHERE project_id = $1 AND NOT (technology_id = ANY($2::int[]))
+    )
+    INSERT INTO project_technologies (project_id, technology_id, usage_type, added_at)
+    SELECT $1, tech_id, 'production', NOW()
+    FROM unnest($2::int[]) AS tech_id
+    ON CONFLICT (project_id, technology_id) DO NOTHING
+"""
+ADD_TECHNOLOGY_QUERY = """
+    WITH refs AS (
+        SELECT
+            EXISTS(SELECT 1 FROM projects WHERE id = $1) as project_found,
+            EXISTS(SELECT 1 FROM technologies WHERE id = $2) as technology_found,
+            (
+                $3::int IS NULL
+                OR EXISTS(SELECT 1 FROM technology_versions WHERE id = $3 AND technology_id = $2)
+            ) as version_found
+    ),
+    linked AS (
+        INSERT INTO project_technologies (
+            project_id, technology_id, version_id, usage_type, notes, added_at
+        )
+        SELECT $1, $2, $3, $4, $5, NOW()
+        FROM refs
+        WHERE refs.project_found AND refs.technology_found AND refs.version_found
+        ON CONFLICT (project_id, technology_id) DO NOTHING
+        RETURNING id, project_id, technology_id, version_id, usage_type, notes, added_at
+    )
+    SELECT refs.*, linked.*
+    FROM refs
+    LEFT JOIN linked ON TRUE
+"""
+
+EXPORT_COLUMNS = [
+    "id", "name", "description", "team_id", "status", "repository_url",
+    "start_date", "created_at", "updated_at", "technologies",
+]
+
 
 class ProjectService:
     @staticmethod
+    @replica_read(*PROJECT_TABLES)
     async def count_projects(where_clause: str, params: list[Any]) -> int:
-        count_query = f"SELECT COUNT(*) as total FROM projects p WHERE {where_clause}"
+        count_query = QueryRegistry.shape("projects.count", PROJECT_COUNT_TEMPLATE, where=where_clause)
         total = await fetch_one(count_query, *params)
         return total["total"] if total else 0
 
     @staticmethod
-    async def list_projects(
+    def stream_projects(
         where_clause: str,
         sort_field: str,
         sort_order: str,
-        limit: int,
-        offset: int,
         params: list[Any],
-    ) -> list[dict[str, Any]]:
-        data_query = f"""
+        fmt: str,
+    ) -> AsyncGenerator[bytes, None]:
+        query = f"""
             SELECT
                 p.id, p.name, p.description, p.team_id, p.status,
-                p.repository_url, p.start_date, p.created_at, p.updated_at
+                p.repository_url, p.start_date, p.created_at, p.updated_at,
+                ARRAY(
+                    SELECT t.name
+                    FROM project_technologies pt
+                    JOIN technologies t ON pt.technology_id = t.id
+                    WHERE pt.project_id = p.id
+                    ORDER BY t.name ASC
+                ) as technologies
             FROM projects p
             WHERE {where_clause}
-            ORDER BY {sort_field} {sort_order}
-            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+            ORDER BY {sort_field} {sort_order}, p.id {sort_order}
         """
-        projects = await fetch_all(data_query, *params, limit, offset)
-
-        if not projects:
-            return []
-
-        project_ids = [p["id"] for p in projects]
+        return stream_query(query, *params, fmt=fmt, columns=EXPORT_COLUMNS)
 
-        # Fetch technologies for these projects
-        tech_query = """
-            SELECT
-                pt.id, pt.project_id, pt.technology_id,
-                t.name as technology_name,
-                pt.version_id,
-                tv.version as version_number,
-                pt.usage_type, pt.notes, pt.added_at,
-                tc.name as category_name,
-                ts.name as status
-            FROM project_technologies pt
-            JOIN technologies t ON pt.technology_id = t.id
-            LEFT JOIN technology_versions tv ON pt.version_id = tv.id
-            JOIN technology_categories tc ON t.category_id = tc.id
-            JOIN technology_statuses ts ON t.status_id = ts.id
-            WHERE pt.project_id = ANY($1)
-            ORDER BY t.name ASC
+    @staticmethod
+    @replica_read(*PROJECT_TABLES)
+    async def list_projects_json(
+        where_clause: str,
+        sort_field: str,
+        sort_order: str,
+        limit: int,
+        offset: int,
+        params: list[Any],
+    ) -> dict[str, Any]:
         """
-        technologies = await fetch_all(tech_query, project_ids)
-
-        # Group technologies by project_id
-        tech_map = {}
-        for tech in technologies:
-            pid = tech["project_id"]
-            if pid not in tech_map:
-                tech_map[pid] = []
-            tech_map[pid].append(dict(tech))
-
-        # Attach to projects
-        results = []
-        for p in projects:
-            p_dict = dict(p)
-            p_dict["technologies"] = tech_map.get(p["id"], [])
-            results.append(p_dict)
-
-        return results
+        Get page of projects with their technologies as one JSON array
+
+        Args:
+            where_clause: SQL condition
+            sort_field: SQL sort column
+            sort_order: ASC or DESC
+            limit: Page size
+            offset: Rows to skip
+            params: Condition parameters
+
+        Returns:
+            "items" (JSON text), "count" of projects on the page, and
+            "last_sort_value" and "last_id" of the last one (None if empty)
+        """
+        query = page_query(
+            "projects.page_json",
+            PROJECT_PAGE_JSON_TEMPLATE,
+            where_clause,
+            sort_field,
+            sort_order,
+            len(params),
+            reverse_order="ASC" if sort_order == "DESC" else "DESC",
+        )
+        return await fetch_one(query, *params, limit, offset)
 
     @staticmethod
     async def get_project_by_id(project_id: int) -> dict[str, Any] | None:
-        query = """
-            SELECT
-                id, name, description, team_id, status, repository_url,
-                start_date, created_at, updated_at
-            FROM projects
-            WHERE id = $1
-        """
-        project = await fetch_one(query, project_id)
+        project = await fetch_one(PROJECT_BY_ID_QUERY, project_id)
         if project:
-            project = dict(project)
             project["technologies"] = await ProjectService.get_project_technologies(project_id)
         return project
 
     @staticmethod
     async def create_project(project: ProjectCreate) -> dict[str, Any]:
-        insert_query = """
+        insert_query = f"""
             INSERT INTO projects (
                 name, description, team_id, status, repository_url,
                 start_date, created_at, updated_at
             )
             VALUES ($1, $2, $3, $4, $5, $6, NOW(), NOW())
-            RETURNING id, name, description, team_id, status, repository_url,
-                start_date, created_at, updated_at
+            RETURNING {PROJECT_COLUMNS}
         """
-        result = await fetch_one(
-            insert_query,
-            project.name,
-            project.description,
-            project.team_id,
-            project.status,
-            project.repository_url,
-            project.start_date,
-        )
-
-        if result and project.technology_ids:
-            project_id = result["id"]
-            for tech_id in project.technology_ids:
-                await execute(
-                    """
-                    INSERT INTO project_technologies (project_id, technology_id, usage_type, added_at)
-                    VALUES ($1, $2, 'production', NOW())
-                    ON CONFLICT (project_id, technology_id) DO NOTHING
-                    """,
-                    project_id,
-                    tech_id
+        technology_ids = list(dict.fromkeys(project.technology_ids))
+
+        with integrity_errors(team_id=project.team_id):
+            async with transaction() as conn:
+                row = await conn.fetchrow(
+                    insert_query,
+                    project.name,
+                    project.description,
+                    project.team_id,
+                    project.status,
+                    project.repository_url,
+                    project.start_date,
                 )
+                result = dict(row)
+
+                technologies = []
+                if technology_ids:
+                    technologies = await conn.fetch(LINK_TECHNOLOGIES_QUERY, result["id"], technology_ids)
 
-            # Fetch technologies to return with project
-            result = dict(result)
-            result["technologies"] = await ProjectService.get_project_technologies(project_id)
+        result["technologies"] = await ReferenceDataService.enrich_technologies([dict(t) for t in technologies])
 
-        return dict(result) if result else {}
+        mark_changed("projects", "project_technologies")
+        return result
 
     @staticmethod
     async def update_project(project_id: int, project: ProjectUpdate) -> dict[str, Any] | None:
@@ -170,121 +342,124 @@ class ProjectService:
                 UPDATE projects
                 SET {", ".join(update_fields)}, updated_at = NOW()
                 WHERE id = ${param_count}
-                RETURNING id
+                RETURNING {PROJECT_COLUMNS}
             """
             params.append(project_id)
-            await fetch_one(query, *params)
-
-        if project.technology_ids is not None:
-            current_techs = await ProjectService.get_project_technologies(project_id)
-            current_ids = set(t["technology_id"] for t in current_techs)
-            new_ids = set(project.technology_ids)
-
-            to_add = new_ids - current_ids
-            to_remove = current_ids - new_ids
-
-            # Remove
-            if to_remove:
-                await execute(
-                    "DELETE FROM project_technologies WHERE project_id = $1 AND technology_id = ANY($2)",
-                    project_id,
-                    list(to_remove)
-                )
+        else:
+            query = f"SELECT {PROJECT_COLUMNS} FROM projects WHERE id = $1 FOR UPDATE"
+            params = [project_id]
 
-            # Add
-            for tech_id in to_add:
-                await execute(
-                    """
-                    INSERT INTO project_technologies (project_id, technology_id, usage_type, added_at)
-                    VALUES ($1, $2, 'production', NOW())
-                    ON CONFLICT (project_id, technology_id) DO NOTHING
-                    """,
-                    project_id,
-                    tech_id
-                )
+        with integrity_errors(team_id=project.team_id):
+            async with transaction() as conn:
+                row = await conn.fetchrow(query, *params)
+                if row is None:
+                    return None
+                result = dict(row)
+
+                if project.technology_ids is not None:
+                    technology_ids = list(dict.fromkeys(project.technology_ids))
+                    await conn.execute(SYNC_TECHNOLOGIES_QUERY, project_id, technology_ids)
+
+                technologies = await conn.fetch(PROJECT_TECHNOLOGIES_QUERY.sql, project_id)
 
-        return await ProjectService.get_project_by_id(project_id)
+        result["technologies"] = await ReferenceDataService.enrich_technologies([dict(t) for t in technologies])
+
+        mark_changed("projects", "project_technologies")
+        return result
 
     @staticmethod
-    async def delete_project(project_id: int) -> None:
-        await execute("DELETE FROM projects WHERE id = $1", project_id)
+    async def delete_project(project_id: int) -> bool:
+        deleted = await fetch_val("DELETE FROM projects WHERE id = $1 RETURNING id", project_id)
+        if deleted is None:
+            return False
+        mark_changed("projects", "project_technologies")
+        return True
 
     @staticmethod
-    async def get_project_technologies(project_id: int) -> list[dict[str, Any]]:
-        query = """
-            SELECT
-                pt.id, pt.project_id, pt.technology_id,
-                t.name as technology_name,
-                pt.version_id,
-                tv.version as version_number,
-                pt.usage_type, pt.notes, pt.added_at,
-                tc.name as category_name,
-                ts.name as status
-            FROM project_technologies pt
-            JOIN technologies t ON pt.technology_id = t.id
-            LEFT JOIN technology_versions tv ON pt.version_id = tv.id
-            JOIN technology_categories tc ON t.category_id = tc.id
-            JOIN technology_statuses ts ON t.status_id = ts.id
-            WHERE pt.project_id = $1
-            ORDER BY t.name ASC
+    @replica_read("projects")
+    async def get_projects_by_team_ids(team_ids: list[int]) -> dict[int, list[dict[str, Any]]]:
         """
-        return await fetch_all(query, project_id)
+        Get projects of teams, newest first (batch function of the team projects loader)
+
+        Args:
+            team_ids: Team IDs
+
+        Returns:
+            Mapping of team ID to its projects, without technologies; teams
+            without projects are absent
+        """
+        projects: dict[int, list[dict[str, Any]]] = {}
+        for row in await fetch_all(TEAM_PROJECTS_QUERY, team_ids):
+            projects.setdefault(row["team_id"], []).append(row)
+        return projects
 
     @staticmethod
-    async def check_project_technology_duplicate(project_id: int, technology_id: int) -> dict[str, Any] | None:
-        return await fetch_one(
-            "SELECT id FROM project_technologies WHERE project_id = $1 AND technology_id = $2",
-            project_id,
-            technology_id,
+    @replica_read(*PROJECT_TABLES)
+    async def get_technologies_by_project_ids(project_ids: list[int]) -> dict[int, list[dict[str, Any]]]:
+        """
+        Get technologies of projects (batch function of the project technologies loader)
+
+        Args:
+            project_ids: Project IDs
+
+        Returns:
+            Mapping of project ID to its technologies sorted by name;
+            projects without technologies are absent
+        """
+        technologies: dict[int, list[dict[str, Any]]] = {}
+        rows = await ReferenceDataService.enrich_technologies(await fetch_all(PROJECTS_TECHNOLOGIES_QUERY, project_ids))
+        for row in rows:
+            technologies.setdefault(row["project_id"], []).append(row)
+        return technologies
+
+    @staticmethod
+    async def get_project_technologies(project_id: int) -> list[dict[str, Any]]:
+        return await ReferenceDataService.enrich_technologies(
+            await fetch_all(PROJECT_TECHNOLOGIES_QUERY, project_id)
         )
 
     @staticmethod
     async def add_technology_to_project(project_id: int, tech: ProjectTechnologyCreate) -> dict[str, Any]:
-        insert_query = """
-            INSERT INTO project_technologies (
-                project_id, technology_id, version_id, usage_type, notes, added_at
+        with integrity_errors(
+            project_id=project_id,
+            technology_id=tech.technology_id,
+            version_id=tech.version_id,
+        ):
+            row = await fetch_one(
+                ADD_TECHNOLOGY_QUERY,
+                project_id,
+                tech.technology_id,
+                tech.version_id,
+                tech.usage_type,
+                tech.notes,
             )
-            VALUES ($1, $2, $3, $4, $5, NOW())
-            RETURNING id, project_id, technology_id, version_id, usage_type, notes, added_at
-        """
-        result = await fetch_one(
-            insert_query,
-            project_id,
-            tech.technology_id,
-            tech.version_id,
-            tech.usage_type,
-            tech.notes,
-        )
-        return dict(result) if result else {}
+        result = check_references(row, {
+            "project_found": NotFoundException(f"Проект с id={project_id} не найден"),
+            "technology_found": NotFoundException(f"Технология с id={tech.technology_id} не найдена"),
+            "version_found": NotFoundException(f"Версия с id={tech.version_id} не найдена для этой технологии"),
+            "id": ConflictException("Эта технология уже добавлена в проект"),
+        })
+        mark_changed("project_technologies")
+        return result
 
     @staticmethod
-    async def remove_technology_from_project(project_id: int, technology_id: int) -> None:
-        await execute(
-            "DELETE FROM project_technologies WHERE project_id = $1 AND technology_id = $2",
+    async def remove_technology_from_project(project_id: int, technology_id: int) -> bool:
+        deleted = await fetch_val(
+            "DELETE FROM project_technologies WHERE project_id = $1 AND technology_id = $2 RETURNING id",
             project_id,
             technology_id,
         )
+        if deleted is None:
+            return False
+        mark_changed("project_technologies")
+        return True
 
     @staticmethod
     async def preview_archive_candidates(inactive_days: int = 180) -> list[dict[str, Any]]:
         query = "SELECT * FROM archive_inactive_projects($1, true)"
-        results = await fetch_all(query, inactive_days)
-        return [dict(r) for r in results]
-
-    @staticmethod
-    async def execute_archiving(inactive_days: int, user_id: int) -> list[dict[str, Any]]:
-        query = "SELECT * FROM archive_inactive_projects($1, false)"
-        results = await fetch_all(query, inactive_days)
-
-        await execute(
-            "UPDATE archive_log SET archived_by = $1 WHERE id = (SELECT MAX(id) FROM archive_log)",
-            user_id
-        )
-
-        return [dict(r) for r in results]
+        return await fetch_all(query, inactive_days)
 
     @staticmethod
     async def get_archive_history(limit: int = 10) -> list[dict[str, Any]]:
         query = "SELECT * FROM get_archive_history($1)"
-        results = await fetch_all(query, limit)
-        return [dict(r) for r in results]
+        return await fetch_all(query, limit)
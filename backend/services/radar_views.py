@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Any, Iterable
+
+from backend.config import get_settings
+from backend.core.changes import on_change
+from backend.core.database import fetch_all, get_db_connection
+from backend.core.http_cache import get_table_versions
+
+logger = logging.getLogger(__name__)
+
+# Materialized view -> tables it is built from
+RADAR_VIEWS: dict[str, frozenset[str]] = {
+    "mv_technology_usage": frozenset({"technologies", "technology_categories", "project_technologies"}),
+    "mv_category_usage": frozenset({"technology_categories", "technologies", "project_technologies"}),
+    "mv_team_summary": frozenset({"teams", "users", "projects"}),
+}
+
+RETRY_DELAY_SECONDS = 5.0
+
+
+class RadarViewRefresher:
+    """
+    Debounced background refresher of the radar materialized views
+
+    Writes to source tables (local or announced by other workers) mark
+    views dirty. Dirty views are refreshed once writes pause for the
+    debounce interval, but no later than the maximum delay after the first
+    write. A view is refreshed by one worker at a time (advisory lock) and
+    skipped when its sources did not change since the last refresh.
+    """
+    _dirty: set[str] = set()
+    _dirty_since: float | None = None
+    _wakeup: asyncio.Event | None = None
+    _task: asyncio.Task | None = None
+
+    @classmethod
+    async def start(cls) -> None:
+        """
+        Start refresher, checking all views once
+        """
+        if cls._task is None:
+            cls._wakeup = asyncio.Event()
+            cls.mark_dirty(RADAR_VIEWS)
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        Stop refresher
+        """
+        task, cls._task = cls._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    @classmethod
+    def mark_dirty(cls, views: Iterable[str]) -> None:
+        """
+        Schedule views for refresh
+
+        Args:
+            views: View names
+        """
+        views = set(views)
+        if not views:
+            return
+        cls._dirty.update(views)
+        if cls._dirty_since is None:
+            cls._dirty_since = time.monotonic()
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    @classmethod
+    async def _debounce(cls) -> None:
+        settings = get_settings().cache
+        while True:
+            cls._wakeup.clear()
+            waited = time.monotonic() - cls._dirty_since
+            timeout = min(settings.radar_refresh_debounce_seconds, settings.radar_refresh_max_delay_seconds - waited)
+            if timeout <= 0:
+                return
+            try:
+                await asyncio.wait_for(cls._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            await cls._wakeup.wait()
+            await cls._debounce()
+
+            views, cls._dirty, cls._dirty_since = cls._dirty, set(), None
+            # A write racing the debounce timeout may have left the event set
+            # although its view is part of this batch
+            cls._wakeup.clear()
+            pending = set()
+            for view in sorted(views):
+                try:
+                    if not await cls.refresh(view):
+                        pending.add(view)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Refresh of %s failed", view)
+                    pending.add(view)
+
+            if pending:
+                await asyncio.sleep(RETRY_DELAY_SECONDS)
+                cls.mark_dirty(pending)
+
+    @staticmethod
+    async def refresh(view: str) -> bool:
+        """
+        Refresh view concurrently if its sources changed since last refresh
+
+        Args:
+            view: View name
+
+        Returns:
+            False if another worker holds the refresh lock, True otherwise
+        """
+        sources = sorted(RADAR_VIEWS[view])
+        async with get_db_connection(scoped=False) as conn:
+            if not await conn.fetchval("SELECT pg_try_advisory_lock(hashtext($1))", view):
+                return False
+            try:
+                source_version = await conn.fetchval(
+                    "SELECT COALESCE(SUM(version), 0) FROM table_versions WHERE table_name = ANY($1)",
+                    sources,
+                )
+                refreshed_version = await conn.fetchval(
+                    "SELECT source_version FROM materialized_view_refreshes WHERE view_name = $1",
+                    view,
+                )
+                if refreshed_version == source_version:
+                    return True
+
+                started = time.perf_counter()
+                async with conn.transaction():
+                    await conn.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}")
+                    await conn.execute(
+                        """
+                        INSERT INTO materialized_view_refreshes (view_name, source_version, refreshed_at, duration_ms)
+                        VALUES ($1, $2, NOW(), $3)
+                        ON CONFLICT (view_name) DO UPDATE
+                        SET source_version = EXCLUDED.source_version,
+                            refreshed_at = EXCLUDED.refreshed_at,
+                            duration_ms = EXCLUDED.duration_ms
+                        """,
+                        view,
+                        source_version,
+                        round((time.perf_counter() - started) * 1000, 3),
+                    )
+                logger.info("Refreshed %s in %.1f ms", view, (time.perf_counter() - started) * 1000)
+                return True
+            finally:
+                await conn.execute("SELECT pg_advisory_unlock(hashtext($1))", view)
+
+
+@on_change
+def _mark_views_dirty(tables: frozenset[str]) -> None:
+    RadarViewRefresher.mark_dirty([view for view, sources in RADAR_VIEWS.items() if sources & tables])
+
+
+class RadarViewService:
+    @staticmethod
+    async def get_freshness(views: list[str]) -> dict[str, Any]:
+        """
+        Get freshness of materialized views
+
+        Args:
+            views: View names
+
+        Returns:
+            Oldest refresh time of the views and whether any of them lags
+            behind its source tables
+        """
+        refreshes = await fetch_all(
+            "SELECT view_name, source_version, refreshed_at FROM materialized_view_refreshes WHERE view_name = ANY($1)",
+            views,
+        )
+        sources = tuple(sorted(set().union(*(RADAR_VIEWS[view] for view in views))))
+        versions = await get_table_versions(sources)
+
+        pending = False
+        for row in refreshes:
+            current = sum(versions[table][0] for table in RADAR_VIEWS[row["view_name"]])
+            pending = pending or row["source_version"] < current
+
+        return {
+            "refreshed_at": min((row["refreshed_at"] for row in refreshes), default=None),
+            "pending_refresh": pending,
+        }
@@ -0,0 +1,133 @@
+from typing import Any
+
+from backend.config import get_settings
+from backend.core.cache import TTLCache
+from backend.core.changes import on_change
+from backend.core.database import fetch_all, get_db_connection
+
+REFERENCE_TABLES = frozenset({
+    "technology_categories",
+    "technology_statuses",
+    "technologies",
+})
+
+CATEGORIES_QUERY = """
+    SELECT id, name, description, icon, created_at
+    FROM technology_categories
+    ORDER BY name ASC
+"""
+
+STATUSES_QUERY = "SELECT id, name FROM technology_statuses ORDER BY name ASC"
+
+TECHNOLOGIES_QUERY = """
+    SELECT
+        t.id, t.name,
+        t.category_id, tc.name as category_name,
+        t.status_id, ts.name as status
+    FROM technologies t
+    JOIN technology_categories tc ON t.category_id = tc.id
+    JOIN technology_statuses ts ON t.status_id = ts.id
+"""
+
+_reference_cache = TTLCache(
+    "reference_data",
+    maxsize=1,
+    ttl=get_settings().cache.reference_ttl_seconds,
+)
+
+
+@on_change
+def _invalidate_reference_data(tables: frozenset[str]) -> None:
+    if tables & REFERENCE_TABLES:
+        _reference_cache.invalidate()
+
+
+class ReferenceSnapshot:
+    """
+    In-memory copy of categories, statuses and the technology catalog
+    """
+    def __init__(
+        self,
+        categories: list[dict[str, Any]],
+        statuses: list[dict[str, Any]],
+        technologies: list[dict[str, Any]],
+    ):
+        self.categories = categories
+        self.statuses = [status["name"] for status in statuses]
+        self.status_ids = {status["name"]: status["id"] for status in statuses}
+        self.technologies = {tech["id"]: tech for tech in technologies}
+
+
+class ReferenceDataService:
+    @staticmethod
+    async def get_snapshot() -> ReferenceSnapshot:
+        """Get reference data, loaded once for concurrent callers and dropped on changes"""
+        return await _reference_cache.get_or_load("snapshot", ReferenceDataService.load_snapshot)
+
+    @staticmethod
+    async def load_snapshot() -> ReferenceSnapshot:
+        async with get_db_connection(scoped=False) as conn:
+            categories = await conn.fetch(CATEGORIES_QUERY)
+            statuses = await conn.fetch(STATUSES_QUERY)
+            technologies = await conn.fetch(TECHNOLOGIES_QUERY)
+
+        return ReferenceSnapshot(
+            [dict(row) for row in categories],
+            [dict(row) for row in statuses],
+            [dict(row) for row in technologies],
+        )
+
+    @staticmethod
+    async def list_categories() -> list[dict[str, Any]]:
+        snapshot = await ReferenceDataService.get_snapshot()
+        return [dict(category) for category in snapshot.categories]
+
+    @staticmethod
+    async def list_statuses() -> list[str]:
+        snapshot = await ReferenceDataService.get_snapshot()
+        return list(snapshot.statuses)
+
+    @staticmethod
+    async def get_technologies(technology_ids: set[int]) -> dict[int, dict[str, Any]]:
+        """
+        Get catalog entries by id
+
+        Ids missing from memory (written by another worker whose notification
+        has not arrived yet) are read from the database and trigger a reload
+        """
+        snapshot = await ReferenceDataService.get_snapshot()
+        found = {tid: snapshot.technologies[tid] for tid in technology_ids if tid in snapshot.technologies}
+
+        missing = technology_ids - found.keys()
+        if missing:
+            rows = await fetch_all(f"{TECHNOLOGIES_QUERY} WHERE t.id = ANY($1)", list(missing))
+            found.update((row["id"], row) for row in rows)
+            _reference_cache.invalidate()
+
+        return found
+
+    @staticmethod
+    async def enrich_technologies(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Fill technology_name, category_name and status of project technology rows
+
+        Rows are returned sorted by technology name; rows whose technology
+        no longer exists are dropped
+        """
+        if not rows:
+            return rows
+
+        technologies = await ReferenceDataService.get_technologies({row["technology_id"] for row in rows})
+
+        enriched = []
+        for row in rows:
+            tech = technologies.get(row["technology_id"])
+            if tech is None:
+                continue
+            row["technology_name"] = tech["name"]
+            row["category_name"] = tech["category_name"]
+            row["status"] = tech["status"]
+            enriched.append(row)
+
+        enriched.sort(key=lambda row: row["technology_name"])
+        return enriched
@@ -0,0 +1,49 @@
+from typing import Any
+
+from backend.core.database import fetch_all, replica_read
+from backend.core.search import build_search_condition, search_params
+
+SEARCH_TARGETS = {
+    "project": ("projects", "p", "p.name", "p.description", ["p.name", "p.description"]),
+    "technology": ("technologies", "t", "t.name", "t.description", ["t.name", "t.description"]),
+    "team": ("teams", "t", "t.name", "t.description", ["t.name", "t.description"]),
+    "user": ("users", "u", "COALESCE(u.full_name, u.email)", "u.email", ["u.email", "u.full_name"]),
+}
+
+
+class SearchService:
+    @staticmethod
+    @replica_read(*(table for table, *_ in SEARCH_TARGETS.values()))
+    async def search(q: str, types: list[str], limit: int) -> list[dict[str, Any]]:
+        parts = []
+        # Every target matches the same query, so they share its parameters
+        params: list[Any] = search_params(q)
+        limit_param = f"${len(params) + 1}"
+
+        for entity_type in types:
+            table, alias, title, subtitle, text_columns = SEARCH_TARGETS[entity_type]
+            condition, rank, _ = build_search_condition(q, f"{alias}.search_vector", text_columns, 1)
+            parts.append(f"""
+                (
+                    SELECT
+                        '{entity_type}' as type,
+                        {alias}.id,
+                        {title} as title,
+                        {subtitle} as subtitle,
+                        {rank}::float8 as rank
+                    FROM {table} {alias}
+                    WHERE {condition}
+                    ORDER BY rank DESC
+                    LIMIT {limit_param}
+                )
+            """)
+
+        if not parts:
+            return []
+
+        query = f"""
+            {" UNION ALL ".join(parts)}
+            ORDER BY rank DESC, type ASC, id ASC
+            LIMIT {limit_param}
+        """
+        return await fetch_all(query, *params, limit)
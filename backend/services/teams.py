@@ -1,17 +1,60 @@
-from typing import Any
+from typing import Any, AsyncGenerator
 
-from backend.core.database import fetch_all, fetch_one
+from backend.core.changes import mark_changed
+from backend.core.database import fetch_all, fetch_one, fetch_val, replica_read
+from backend.core.queries import QueryRegistry, page_query
+from backend.core.references import integrity_errors
+from backend.core.streaming import stream_query
 from backend.schemas.teams import TeamCreate
 
+EXPORT_COLUMNS = ["id", "name", "description", "lead_id", "member_count", "created_at", "updated_at"]
+
+TEAM_BY_ID_QUERY = QueryRegistry.register("teams.get", """
+    SELECT id, name, description, lead_id, created_at, updated_at
+    FROM teams
+    WHERE id = $1
+""", warmup_args=(0,))
+
+TEAMS_BY_IDS_QUERY = QueryRegistry.register("teams.by_ids", """
+    SELECT id, name, description, lead_id, created_at, updated_at
+    FROM teams
+    WHERE id = ANY($1)
+""", warmup_args=([],))
+
+TEAM_MEMBERS_QUERY = QueryRegistry.register("teams.members", """
+    SELECT tm.team_id, tm.user_id, u.full_name, tm.role, tm.joined_at
+    FROM team_members tm
+    JOIN users u ON tm.user_id = u.id
+    WHERE tm.team_id = ANY($1)
+    ORDER BY tm.team_id, u.full_name, tm.user_id
+""", warmup_args=([],))
+
+TEAM_LIST_TEMPLATE = """
+    SELECT
+        t.id, t.name, t.description, t.lead_id,
+        t.created_at, t.updated_at
+    FROM teams t
+    WHERE {where}
+    ORDER BY {sort_field} {sort_order}, t.id {sort_order}
+    LIMIT {limit} OFFSET {offset}
+"""
+
+TEAM_COUNT_TEMPLATE = "SELECT COUNT(*) as total FROM teams t WHERE {where}"
+
+# Default listing (no filters, newest first)
+page_query("teams.list", TEAM_LIST_TEMPLATE, "TRUE", "t.created_at", "DESC", 0, warmup=True)
+
 
 class TeamService:
     @staticmethod
+    @replica_read("teams")
     async def count_teams(where_clause: str, params: list[Any]) -> int:
-        count_query = f"SELECT COUNT(*) as total FROM teams t WHERE {where_clause}"
+        count_query = QueryRegistry.shape("teams.count", TEAM_COUNT_TEMPLATE, where=where_clause)
         total = await fetch_one(count_query, *params)
         return total["total"] if total else 0
 
     @staticmethod
+    @replica_read("teams")
     async def list_teams(
         where_clause: str,
         sort_field: str,
@@ -20,25 +63,63 @@ class TeamService:
         offset: int,
         params: list[Any],
     ) -> list[dict[str, Any]]:
-        data_query = f"""
+        data_query = page_query("teams.list", TEAM_LIST_TEMPLATE, where_clause, sort_field, sort_order, len(params))
+        return await fetch_all(data_query, *params, limit, offset)
+
+    @staticmethod
+    def stream_teams(
+        where_clause: str,
+        sort_field: str,
+        sort_order: str,
+        params: list[Any],
+        fmt: str,
+    ) -> AsyncGenerator[bytes, None]:
+        query = f"""
             SELECT
                 t.id, t.name, t.description, t.lead_id,
+                (SELECT COUNT(*) FROM team_members tm WHERE tm.team_id = t.id) as member_count,
                 t.created_at, t.updated_at
             FROM teams t
             WHERE {where_clause}
-            ORDER BY {sort_field} {sort_order}
-            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+            ORDER BY {sort_field} {sort_order}, t.id {sort_order}
         """
-        return await fetch_all(data_query, *params, limit, offset)
+        return stream_query(query, *params, fmt=fmt, columns=EXPORT_COLUMNS)
 
     @staticmethod
     async def get_team_by_id(team_id: int) -> dict[str, Any] | None:
-        query = """
-            SELECT id, name, description, lead_id, created_at, updated_at
-            FROM teams
-            WHERE id = $1
+        return await fetch_one(TEAM_BY_ID_QUERY, team_id)
+
+    @staticmethod
+    @replica_read("teams")
+    async def get_teams_by_ids(team_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Get teams by IDs (batch function of the teams loader)
+
+        Args:
+            team_ids: Team IDs
+
+        Returns:
+            Mapping of team ID to team
+        """
+        rows = await fetch_all(TEAMS_BY_IDS_QUERY, team_ids)
+        return {row["id"]: row for row in rows}
+
+    @staticmethod
+    @replica_read("team_members", "users")
+    async def get_members_by_team_ids(team_ids: list[int]) -> dict[int, list[dict[str, Any]]]:
+        """
+        Get members of teams, ordered by name (batch function of the team members loader)
+
+        Args:
+            team_ids: Team IDs
+
+        Returns:
+            Mapping of team ID to its members; teams without members are absent
         """
-        return await fetch_one(query, team_id)
+        members: dict[int, list[dict[str, Any]]] = {}
+        for row in await fetch_all(TEAM_MEMBERS_QUERY, team_ids):
+            members.setdefault(row.pop("team_id"), []).append(row)
+        return members
 
     @staticmethod
     async def create_team(team: TeamCreate) -> dict[str, Any]:
@@ -47,7 +128,9 @@ class TeamService:
             VALUES ($1, $2, $3, NOW(), NOW())
             RETURNING id, name, description, lead_id, created_at, updated_at
         """
-        result = await fetch_one(insert_query, team.name, team.description, team.lead_id)
+        with integrity_errors(lead_id=team.lead_id):
+            result = await fetch_one(insert_query, team.name, team.description, team.lead_id)
+        mark_changed("teams")
         return dict(result) if result else {}
 
     @staticmethod
@@ -58,15 +141,23 @@ class TeamService:
             WHERE id = $4
             RETURNING id, name, description, lead_id, created_at, updated_at
         """
-        result = await fetch_one(
-            update_query,
-            team.name,
-            team.description,
-            team.lead_id,
-            team_id
-        )
-        return dict(result) if result else None
+        with integrity_errors(lead_id=team.lead_id):
+            result = await fetch_one(
+                update_query,
+                team.name,
+                team.description,
+                team.lead_id,
+                team_id
+            )
+        if result is None:
+            return None
+        mark_changed("teams")
+        return dict(result)
 
     @staticmethod
-    async def delete_team(team_id: int) -> None:
-        await fetch_one("DELETE FROM teams WHERE id = $1", team_id)
+    async def delete_team(team_id: int) -> bool:
+        deleted = await fetch_val("DELETE FROM teams WHERE id = $1 RETURNING id", team_id)
+        if deleted is None:
+            return False
+        mark_changed("teams", "projects", "team_members")
+        return True
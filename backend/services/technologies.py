@@ -1,53 +1,95 @@
-from typing import Any
+from typing import Any, AsyncGenerator
 
-from backend.core.database import execute, fetch_all, fetch_one
+from backend.core.changes import mark_changed
+from backend.core.database import execute, fetch_all, fetch_one, fetch_val, replica_read
+from backend.core.exceptions import ConflictException, NotFoundException
+from backend.core.queries import QueryRegistry, page_query
+from backend.core.references import check_references, integrity_errors
+from backend.core.streaming import stream_query
+from backend.services.reference_data import ReferenceDataService
 from backend.schemas.technologies import TechnologyCategoryCreate, TechnologyCreate, TechnologyUpdate
 
+TECHNOLOGY_TABLES = ("technologies", "technology_statuses")
+STATS_TABLES = (*TECHNOLOGY_TABLES, "technology_categories", "projects", "project_technologies")
 
-class TechnologyService:
-    @staticmethod
-    async def list_categories() -> list[dict[str, Any]]:
-        query = """
-            SELECT id, name, description, icon, created_at
-            FROM technology_categories
-            ORDER BY name ASC
-        """
-        return await fetch_all(query)
+EXPORT_COLUMNS = [
+    "id", "name", "category_id", "category", "description", "official_website",
+    "status", "created_at", "updated_at",
+]
 
-    @staticmethod
-    async def get_category_by_name(name: str) -> dict[str, Any] | None:
-        return await fetch_one("SELECT id FROM technology_categories WHERE name = $1", name)
+TECHNOLOGY_WRITE_COLUMNS = """
+    w.id, w.name, w.category_id, w.description, w.official_website,
+    w.created_at, w.updated_at
+"""
+
+TECHNOLOGY_BY_ID_QUERY = QueryRegistry.register("technologies.get", """
+    SELECT
+        t.id, t.name, t.category_id, t.description, t.official_website,
+        ts.name as status, t.created_at, t.updated_at
+    FROM technologies t
+    JOIN technology_statuses ts ON t.status_id = ts.id
+    WHERE t.id = $1
+""", warmup_args=(0,))
 
+TECHNOLOGY_LIST_TEMPLATE = """
+    SELECT
+        t.id, t.name, t.category_id, t.description, t.official_website,
+        ts.name as status, t.created_at, t.updated_at
+    FROM technologies t
+    JOIN technology_statuses ts ON t.status_id = ts.id
+    WHERE {where}
+    ORDER BY {sort_field} {sort_order}, t.id {sort_order}
+    LIMIT {limit} OFFSET {offset}
+"""
+
+TECHNOLOGY_COUNT_TEMPLATE = """
+    SELECT COUNT(*) as total
+    FROM technologies t
+    JOIN technology_statuses ts ON t.status_id = ts.id
+    WHERE {where}
+"""
+
+# Default listing (no filters, newest first)
+page_query("technologies.list", TECHNOLOGY_LIST_TEMPLATE, "TRUE", "t.created_at", "DESC", 0, warmup=True)
+
+
+class TechnologyService:
     @staticmethod
-    async def get_category_by_id(category_id: int) -> dict[str, Any] | None:
-        return await fetch_one("SELECT id FROM technology_categories WHERE id = $1", category_id)
+    async def list_categories() -> list[dict[str, Any]]:
+        return await ReferenceDataService.list_categories()
 
     @staticmethod
     async def create_category(category: TechnologyCategoryCreate) -> dict[str, Any]:
         insert_query = """
             INSERT INTO technology_categories (name, description, icon, created_at)
             VALUES ($1, $2, $3, NOW())
+            ON CONFLICT (name) DO NOTHING
             RETURNING id, name, description, icon, created_at
         """
         result = await fetch_one(insert_query, category.name, category.description, category.icon)
-        return dict(result) if result else {}
+        if result is None:
+            raise ConflictException(f'Категория с именем "{category.name}" уже существует')
+        mark_changed("technology_categories")
+        return dict(result)
 
     @staticmethod
     async def list_statuses() -> list[str]:
-        query = "SELECT name FROM technology_statuses ORDER BY name ASC"
-        items = await fetch_all(query)
-        return [item["name"] for item in items]
-
-    @staticmethod
-    async def get_status_by_name(name: str) -> dict[str, Any] | None:
-        return await fetch_one("SELECT id FROM technology_statuses WHERE name = $1", name)
+        return await ReferenceDataService.list_statuses()
 
     @staticmethod
     async def create_status(name: str) -> None:
-        insert_query = "INSERT INTO technology_statuses (name, created_at) VALUES ($1, NOW())"
-        await execute(insert_query, name)
+        insert_query = """
+            INSERT INTO technology_statuses (name, created_at)
+            VALUES ($1, NOW())
+            ON CONFLICT (name) DO NOTHING
+        """
+        status = await execute(insert_query, name)
+        if status == "INSERT 0 0":
+            raise ConflictException(f'Статус "{name}" уже существует')
+        mark_changed("technology_statuses")
 
     @staticmethod
+    @replica_read(*STATS_TABLES)
     async def get_stats() -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
         query = """
             SELECT
@@ -55,47 +97,44 @@ class TechnologyService:
                 t.name,
                 ts.name as status,
                 tc.name as category,
-                COUNT(DISTINCT pt.project_id) as project_count,
-                COUNT(DISTINCT CASE WHEN pt.usage_type = 'production' THEN pt.project_id END) as production_count,
-                COUNT(DISTINCT CASE WHEN pt.usage_type = 'development' THEN pt.project_id END) as development_count,
-                COUNT(DISTINCT CASE WHEN pt.usage_type = 'testing' THEN pt.project_id END) as testing_count
-            FROM technologies t
+                s.project_count,
+                s.production_count,
+                s.development_count,
+                s.testing_count
+            FROM technology_usage_stats s
+            JOIN technologies t ON t.id = s.technology_id
             JOIN technology_statuses ts ON t.status_id = ts.id
             JOIN technology_categories tc ON t.category_id = tc.id
-            LEFT JOIN project_technologies pt ON t.id = pt.technology_id
-            GROUP BY t.id, t.name, ts.name, tc.name
-            ORDER BY project_count DESC, t.name ASC
+            ORDER BY s.project_count DESC, t.name ASC
             LIMIT 100
         """
         items = await fetch_all(query)
 
         total_query = """
             SELECT
-                COUNT(DISTINCT t.id) as total_technologies,
-                COUNT(DISTINCT p.id) as total_projects,
-                COUNT(DISTINCT pt.id) as total_usages,
-                COUNT(DISTINCT tc.id) as total_categories
-            FROM technologies t
-            CROSS JOIN projects p
-            LEFT JOIN project_technologies pt ON TRUE
-            CROSS JOIN technology_categories tc
+                COALESCE(MAX(value) FILTER (WHERE name = 'total_technologies'), 0) as total_technologies,
+                COALESCE(MAX(value) FILTER (WHERE name = 'total_projects'), 0) as total_projects,
+                COALESCE(MAX(value) FILTER (WHERE name = 'total_usages'), 0) as total_usages,
+                COALESCE(MAX(value) FILTER (WHERE name = 'total_categories'), 0) as total_categories
+            FROM registry_counters
         """
         total_stats = await fetch_one(total_query)
 
         return items, total_stats
 
     @staticmethod
+    async def rebuild_stats_counters() -> int:
+        return await fetch_val("SELECT rebuild_technology_stats()")
+
+    @staticmethod
+    @replica_read(*TECHNOLOGY_TABLES)
     async def count_technologies(where_clause: str, params: list[Any]) -> int:
-        count_query = f"""
-            SELECT COUNT(*) as total
-            FROM technologies t
-            JOIN technology_statuses ts ON t.status_id = ts.id
-            WHERE {where_clause}
-        """
+        count_query = QueryRegistry.shape("technologies.count", TECHNOLOGY_COUNT_TEMPLATE, where=where_clause)
         total = await fetch_one(count_query, *params)
         return total["total"] if total else 0
 
     @staticmethod
+    @replica_read(*TECHNOLOGY_TABLES)
     async def list_technologies(
         where_clause: str,
         sort_field: str,
@@ -104,84 +143,128 @@ class TechnologyService:
         offset: int,
         params: list[Any],
     ) -> list[dict[str, Any]]:
-        data_query = f"""
+        data_query = page_query(
+            "technologies.list", TECHNOLOGY_LIST_TEMPLATE, where_clause, sort_field, sort_order, len(params)
+        )
+        return await fetch_all(data_query, *params, limit, offset)
+
+    @staticmethod
+    def stream_technologies(
+        where_clause: str,
+        sort_field: str,
+        sort_order: str,
+        params: list[Any],
+        fmt: str,
+    ) -> AsyncGenerator[bytes, None]:
+        query = f"""
             SELECT
-                t.id, t.name, t.category_id, t.description, t.official_website,
+                t.id, t.name, t.category_id, tc.name as category,
+                t.description, t.official_website,
                 ts.name as status, t.created_at, t.updated_at
             FROM technologies t
             JOIN technology_statuses ts ON t.status_id = ts.id
+            JOIN technology_categories tc ON t.category_id = tc.id
             WHERE {where_clause}
-            ORDER BY {sort_field} {sort_order}
-            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+            ORDER BY {sort_field} {sort_order}, t.id {sort_order}
         """
-        return await fetch_all(data_query, *params, limit, offset)
+        return stream_query(query, *params, fmt=fmt, columns=EXPORT_COLUMNS)
 
     @staticmethod
-    async def create_technology(tech: TechnologyCreate, status_id: int) -> dict[str, Any]:
-        insert_query = """
-            INSERT INTO technologies (
-                name, category_id, description, official_website,
-                status_id, created_at, updated_at
+    async def create_technology(tech: TechnologyCreate) -> dict[str, Any]:
+        insert_query = f"""
+            WITH refs AS (
+                SELECT
+                    EXISTS(SELECT 1 FROM technology_categories WHERE id = $2) as category_found,
+                    (SELECT id FROM technology_statuses WHERE name = $5) as status_id
+            ),
+            w AS (
+                INSERT INTO technologies (
+                    name, category_id, description, official_website,
+                    status_id, created_at, updated_at
+                )
+                SELECT $1, $2, $3, $4, refs.status_id, NOW(), NOW()
+                FROM refs
+                WHERE refs.category_found AND refs.status_id IS NOT NULL
+                RETURNING *
             )
-            VALUES ($1, $2, $3, $4, $5, NOW(), NOW())
-            RETURNING id, name, category_id, description, official_website,
-                      status_id, created_at, updated_at
-        """
-        result = await fetch_one(
-            insert_query,
-            tech.name,
-            tech.category_id,
-            tech.description,
-            tech.official_website,
-            status_id,
-        )
-        return dict(result) if result else {}
-
-    @staticmethod
-    async def get_technology_by_id(tech_id: int) -> dict[str, Any] | None:
-        query = """
             SELECT
-                t.id, t.name, t.category_id, t.description, t.official_website,
-                ts.name as status, t.created_at, t.updated_at
-            FROM technologies t
-            JOIN technology_statuses ts ON t.status_id = ts.id
-            WHERE t.id = $1
+                refs.category_found,
+                refs.status_id IS NOT NULL as status_found,
+                {TECHNOLOGY_WRITE_COLUMNS},
+                $5 as status
+            FROM refs
+            LEFT JOIN w ON TRUE
         """
-        return await fetch_one(query, tech_id)
+        with integrity_errors(category_id=tech.category_id, status=tech.status):
+            row = await fetch_one(
+                insert_query,
+                tech.name,
+                tech.category_id,
+                tech.description,
+                tech.official_website,
+                tech.status,
+            )
+        result = check_references(row, {
+            "category_found": NotFoundException(f"Категория с id={tech.category_id} не найдена"),
+            "status_found": NotFoundException(f'Статус "{tech.status}" не найден'),
+        })
+        mark_changed("technologies")
+        return result
 
     @staticmethod
-    async def get_technology_simple_by_id(tech_id: int) -> dict[str, Any] | None:
-        return await fetch_one("SELECT id FROM technologies WHERE id = $1", tech_id)
+    async def get_technology_by_id(tech_id: int) -> dict[str, Any] | None:
+        return await fetch_one(TECHNOLOGY_BY_ID_QUERY, tech_id)
 
     @staticmethod
-    async def update_technology(tech_id: int, tech: TechnologyUpdate, status_id: int) -> dict[str, Any]:
-        update_query = """
-            UPDATE technologies
-            SET name = $1, category_id = $2, description = $3,
-                official_website = $4, status_id = $5, updated_at = NOW()
-            WHERE id = $6
-            RETURNING id, name, category_id, description, official_website,
-                      status_id, created_at, updated_at
+    async def update_technology(tech_id: int, tech: TechnologyUpdate) -> dict[str, Any]:
+        update_query = f"""
+            WITH refs AS (
+                SELECT
+                    EXISTS(SELECT 1 FROM technologies WHERE id = $6) as technology_found,
+                    EXISTS(SELECT 1 FROM technology_categories WHERE id = $2) as category_found,
+                    (SELECT id FROM technology_statuses WHERE name = $5) as status_id
+            ),
+            w AS (
+                UPDATE technologies t
+                SET name = $1, category_id = $2, description = $3,
+                    official_website = $4, status_id = refs.status_id, updated_at = NOW()
+                FROM refs
+                WHERE t.id = $6 AND refs.category_found AND refs.status_id IS NOT NULL
+                RETURNING t.*
+            )
+            SELECT
+                refs.technology_found,
+                refs.category_found,
+                refs.status_id IS NOT NULL as status_found,
+                {TECHNOLOGY_WRITE_COLUMNS},
+                $5 as status
+            FROM refs
+            LEFT JOIN w ON TRUE
         """
-        result = await fetch_one(
-            update_query,
-            tech.name,
-            tech.category_id,
-            tech.description,
-            tech.official_website,
-            status_id,
-            tech_id,
-        )
-        return dict(result) if result else {}
-
-    @staticmethod
-    async def delete_technology(tech_id: int) -> None:
-        await execute("DELETE FROM technologies WHERE id = $1", tech_id)
+        with integrity_errors(category_id=tech.category_id, status=tech.status):
+            row = await fetch_one(
+                update_query,
+                tech.name,
+                tech.category_id,
+                tech.description,
+                tech.official_website,
+                tech.status,
+                tech_id,
+            )
+        not_found = NotFoundException(f"Технология с id={tech_id} не найдена")
+        result = check_references(row, {
+            "technology_found": not_found,
+            "category_found": NotFoundException(f"Категория с id={tech.category_id} не найдена"),
+            "status_found": NotFoundException(f'Статус "{tech.status}" не найден'),
+            "id": not_found,
+        })
+        mark_changed("technologies")
+        return result
 
     @staticmethod
-    async def get_version_by_id(version_id: int, technology_id: int) -> dict[str, Any] | None:
-        return await fetch_one(
-            "SELECT id FROM technology_versions WHERE id = $1 AND technology_id = $2",
-            version_id,
-            technology_id,
-        )
+    async def delete_technology(tech_id: int) -> bool:
+        deleted = await fetch_val("DELETE FROM technologies WHERE id = $1 RETURNING id", tech_id)
+        if deleted is None:
+            return False
+        mark_changed("technologies", "project_technologies")
+        return True
@@ -0,0 +1,162 @@
+from typing import Any, AsyncIterable, Callable, Iterable
+
+import pytest
+
+from backend.core import cache
+from backend.core.database import Database
+
+DEFAULT_RESULTS = {
+    "fetch": [],
+    "fetchrow": None,
+    "fetchval": None,
+    "execute": "OK",
+    "cursor": [],
+}
+
+
+class FakeTransaction:
+    """
+    Transaction of FakeConnection, usable as context manager or started manually
+    """
+    def __init__(self, connection: "FakeConnection", options: dict[str, Any]):
+        self.connection = connection
+        self.options = options
+
+    async def start(self) -> None:
+        self.connection.transactions.append(self.options)
+        self.connection.open_transactions += 1
+
+    async def commit(self) -> None:
+        self.connection.commits += 1
+        self.connection.open_transactions -= 1
+
+    async def rollback(self) -> None:
+        self.connection.rollbacks += 1
+        self.connection.open_transactions -= 1
+
+    async def __aenter__(self) -> "FakeTransaction":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+
+class FakeCursor:
+    """
+    Server-side cursor over a prepared list of rows
+    """
+    def __init__(self, rows: list[Any]):
+        self.rows = rows
+
+    async def fetch(self, count: int) -> list[Any]:
+        chunk, self.rows = self.rows[:count], self.rows[count:]
+        return chunk
+
+
+class FakeConnection:
+    """
+    Connection answering queries through its FakeDatabase
+    """
+    def __init__(self, database: "FakeDatabase"):
+        self.database = database
+        self.transactions: list[dict[str, Any]] = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.open_transactions = 0
+        self.copied: dict[str, list[tuple]] = {}
+
+    def transaction(self, **options: Any) -> FakeTransaction:
+        return FakeTransaction(self, options)
+
+    def is_in_transaction(self) -> bool:
+        return self.open_transactions > 0
+
+    async def fetch(self, query: str, *args: Any) -> Any:
+        return self.database.answer("fetch", query, args)
+
+    async def fetchrow(self, query: str, *args: Any) -> Any:
+        return self.database.answer("fetchrow", query, args)
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        return self.database.answer("fetchval", query, args)
+
+    async def execute(self, query: str, *args: Any) -> Any:
+        return self.database.answer("execute", query, args)
+
+    async def cursor(self, query: str, *args: Any) -> FakeCursor:
+        return FakeCursor(list(self.database.answer("cursor", query, args)))
+
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: AsyncIterable[tuple] | Iterable[tuple],
+        columns: list[str],
+    ) -> str:
+        if isinstance(records, AsyncIterable):
+            rows = [record async for record in records]
+        else:
+            rows = list(records)
+        self.copied.setdefault(table_name, []).extend(rows)
+        return f"COPY {len(rows)}"
+
+
+class FakeDatabase:
+    """
+    Pool stand-in whose connections answer queries by SQL fragment
+
+    Answers are matched in registration order; an answer is a value or a
+    callable receiving the query parameters. Unmatched queries return an
+    empty result. Every query is recorded.
+    """
+    def __init__(self):
+        self.queries: list[tuple[str, str, tuple[Any, ...]]] = []
+        self.connections: list[FakeConnection] = []
+        self.checked_out: set[FakeConnection] = set()
+        self._answers: list[tuple[str, Any]] = []
+
+    def answer_with(self, fragment: str, result: Any | Callable[..., Any]) -> None:
+        self._answers.append((fragment, result))
+
+    def answer(self, method: str, query: str, args: tuple[Any, ...]) -> Any:
+        self.queries.append((method, query, args))
+        for fragment, result in self._answers:
+            if fragment in query:
+                if isinstance(result, BaseException):
+                    raise result
+                return result(*args) if callable(result) else result
+        return DEFAULT_RESULTS[method]
+
+    def calls(self, fragment: str) -> list[tuple[Any, ...]]:
+        """
+        Parameters of every recorded query containing the fragment
+        """
+        return [args for _, query, args in self.queries if fragment in query]
+
+    async def acquire(self) -> FakeConnection:
+        connection = FakeConnection(self)
+        self.connections.append(connection)
+        self.checked_out.add(connection)
+        return connection
+
+    async def release(self, connection: FakeConnection) -> None:
+        self.checked_out.remove(connection)
+
+
+@pytest.fixture
+def db(monkeypatch) -> FakeDatabase:
+    database = FakeDatabase()
+    monkeypatch.setattr(Database, "_pool", database)
+    return database
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # Process-wide caches must not carry values from one test to the next
+    for registered in cache._registry.values():
+        registered.invalidate()
+    yield
@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.core.exceptions import ValidationException
+from backend.services.archiving import ArchiveService
+
+CUTOFF = datetime(2026, 1, 1)
+NOW = datetime(2026, 7, 1)
+
+
+class ArchiveModel:
+    """
+    In-memory projects, archive_log and archive_items answering the
+    archiving statements the way PostgreSQL would
+    """
+    def __init__(self, db):
+        stale = CUTOFF - timedelta(days=30)
+        self.projects = [
+            {"id": 1, "name": "A", "status": "active", "updated_at": stale - timedelta(days=3)},
+            {"id": 2, "name": "B", "status": "active", "updated_at": stale},
+            {"id": 3, "name": "C", "status": "active", "updated_at": stale},
+            {"id": 4, "name": "D", "status": "active", "updated_at": stale + timedelta(days=1)},
+            {"id": 5, "name": "E", "status": "active", "updated_at": stale + timedelta(days=2)},
+            {"id": 6, "name": "F", "status": "active", "updated_at": CUTOFF + timedelta(days=1)},
+            {"id": 7, "name": "G", "status": "archived", "updated_at": stale},
+        ]
+        self.log: dict | None = None
+        self.items: list[dict] = []
+        self.batch_calls: list[tuple] = []
+        self.fail_batch: int | None = None
+
+        db.answer_with("WHERE status = 'in_progress'", self.unfinished_run)
+        db.answer_with("INSERT INTO archive_log", self.start_run)
+        db.answer_with("SELECT COUNT(*) FROM projects", self.count_remaining)
+        db.answer_with("WITH batch AS", self.archive_batch)
+        db.answer_with("SET projects_archived = projects_archived + $2", self.advance)
+        db.answer_with("SET status = 'completed'", self.finish)
+
+    def unfinished_run(self) -> dict | None:
+        return dict(self.log) if self.log and self.log["status"] == "in_progress" else None
+
+    def start_run(self, inactive_days: int, user_id: int | None, batch_size: int) -> dict:
+        self.log = {
+            "id": 1, "status": "in_progress", "projects_archived": 0, "batches": 0,
+            "inactive_days_threshold": inactive_days, "archived_by": user_id, "batch_size": batch_size,
+            "cutoff": CUTOFF, "cursor_updated_at": None, "cursor_id": None,
+        }
+        return dict(self.log)
+
+    def count_remaining(self, cutoff: datetime) -> int:
+        return len([p for p in self.projects if p["status"] == "active" and p["updated_at"] < cutoff])
+
+    def archive_batch(self, log_id, cutoff, cursor_updated_at, cursor_id, limit, batch) -> dict:
+        self.batch_calls.append((cursor_updated_at, cursor_id, batch))
+        if batch == self.fail_batch:
+            raise ConnectionError("connection lost")
+        candidates = sorted(
+            (p for p in self.projects
+             if p["status"] == "active" and p["updated_at"] < cutoff
+             and (p["updated_at"], p["id"]) > (cursor_updated_at, cursor_id)),
+            key=lambda p: (p["updated_at"], p["id"]),
+        )[:limit]
+        for project in candidates:
+            self.items.append({"project_id": project["id"], "last_updated": project["updated_at"], "batch": batch})
+            project.update(status="archived", updated_at=NOW)
+        last = self.items[-1] if candidates else {"last_updated": None, "project_id": None}
+        return {"archived": len(candidates), "cursor_updated_at": last["last_updated"], "cursor_id": last["project_id"]}
+
+    def advance(self, log_id, archived, cursor_updated_at, cursor_id) -> dict:
+        self.log["projects_archived"] += archived
+        self.log["batches"] += 1
+        self.log.update(cursor_updated_at=cursor_updated_at, cursor_id=cursor_id)
+        return dict(self.log)
+
+    def finish(self, log_id) -> dict:
+        self.log["status"] = "completed"
+        return dict(self.log)
+
+
+def _run(batch_size: int = 2, progress: list | None = None) -> dict:
+    async def report(done: int, total: int) -> None:
+        progress.append((done, total))
+
+    return asyncio.run(ArchiveService.run_chunked(180, 1, batch_size, report if progress is not None else None))
+
+
+def test_candidates_are_archived_batch_by_batch(db):
+    model = ArchiveModel(db)
+    progress: list = []
+
+    run = _run(progress=progress)
+
+    assert [item["project_id"] for item in model.items] == [1, 2, 3, 4, 5]
+    assert [item["batch"] for item in model.items] == [1, 1, 2, 2, 3]
+    assert (run["status"], run["projects_archived"], run["batches"], run["resumed"]) == ("completed", 5, 3, False)
+    assert progress == [(0, 5), (2, 5), (4, 5), (5, 5)]
+    # Every batch is committed on its own
+    assert sum(conn.commits for conn in db.connections) == 4
+
+
+def test_interrupted_run_resumes_from_cursor(db):
+    model = ArchiveModel(db)
+    model.fail_batch = 2
+
+    with pytest.raises(ConnectionError):
+        _run()
+
+    assert model.log["status"] == "in_progress"
+    assert (model.log["cursor_updated_at"], model.log["cursor_id"]) == (model.items[-1]["last_updated"], 2)
+    assert model.log["projects_archived"] == len(model.items) == 2
+
+    model.fail_batch = None
+    progress: list = []
+    run = _run(batch_size=50, progress=progress)
+
+    assert run["resumed"] is True
+    # Resumed with the original batch size and cursor, numbering batches on
+    assert model.batch_calls[2] == (model.items[1]["last_updated"], 2, 2)
+    assert [item["project_id"] for item in model.items] == [1, 2, 3, 4, 5]
+    assert len({item["project_id"] for item in model.items}) == len(model.items)
+    assert [item["batch"] for item in model.items] == [1, 1, 2, 2, 3]
+    assert run["projects_archived"] == len(model.items) == 5
+    assert run["batches"] == max(item["batch"] for item in model.items) == 3
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+    assert [p["id"] for p in model.projects if p["status"] == "active"] == [6]
+
+
+def test_completed_run_is_not_resumed(db):
+    model = ArchiveModel(db)
+    _run()
+    model.projects.append({"id": 8, "name": "H", "status": "active", "updated_at": CUTOFF - timedelta(days=1)})
+
+    run = _run()
+
+    assert run["resumed"] is False
+    assert model.batch_calls[-2] == (datetime.min, 0, 1)
+    assert [item["project_id"] for item in model.items] == [1, 2, 3, 4, 5, 8]
+
+
+def test_batch_size_must_be_positive(db):
+    with pytest.raises(ValidationException):
+        _run(batch_size=0)
+
+    assert db.queries == []
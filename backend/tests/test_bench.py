@@ -0,0 +1,168 @@
+import asyncio
+from collections import Counter
+
+import pytest
+from fastapi import FastAPI
+
+from backend.bench import generator
+from backend.bench.generator import COLUMNS, DATASET_TABLES, DatasetGenerator, load_dataset, resolve_scale
+from backend.bench.results import compare_results
+from backend.bench.runner import ASGIClient, Scenario, percentile, run_scenario, summarize
+from backend.tests.conftest import FakeConnection, FakeDatabase
+
+OFFSETS = {table: 100 * (number + 1) for number, table in enumerate(DATASET_TABLES)}
+
+
+def _scale(**overrides: int):
+    sizes = {
+        "users": 12, "teams": 3, "members_per_team": 4, "technologies": 8,
+        "versions_per_technology": 2, "projects": 6, "technologies_per_project": 3,
+    }
+    return resolve_scale("small", **{**sizes, **overrides})
+
+
+def _generate(scale, table: str) -> list[tuple]:
+    return list(getattr(DatasetGenerator(scale, OFFSETS, [1, 2], [1, 2, 3], "hash"), table)())
+
+
+def test_scale_overrides_preset_sizes():
+    scale = resolve_scale("large", projects=20, technologies=None)
+
+    assert scale.projects == 20
+    assert scale.technologies == 1000
+
+
+def test_scale_rejects_more_links_than_technologies():
+    with pytest.raises(ValueError):
+        resolve_scale("small", technologies=5, technologies_per_project=6)
+
+
+@pytest.mark.parametrize("table", DATASET_TABLES)
+def test_rows_are_deterministic_and_match_columns(table):
+    rows = _generate(_scale(), table)
+
+    assert rows == _generate(_scale(), table)
+    assert rows
+    assert all(len(row) == len(COLUMNS[table]) for row in rows)
+    # Identifiers continue after the existing rows of the table
+    assert [row[0] for row in rows] == list(range(OFFSETS[table] + 1, OFFSETS[table] + len(rows) + 1))
+
+
+def test_changing_one_size_keeps_other_tables():
+    assert _generate(_scale(), "technologies") == _generate(_scale(projects=50), "technologies")
+    assert _generate(_scale(), "projects") != _generate(_scale(seed=7), "projects")
+
+
+def test_links_reference_generated_rows():
+    scale = _scale()
+    links = _generate(scale, "project_technologies")
+    versions = {row[0]: row[1] for row in _generate(scale, "technology_versions")}
+    technology_ids = {row[0] for row in _generate(scale, "technologies")}
+
+    per_project = Counter(project_id for _, project_id, *_ in links)
+    assert sorted(per_project) == [row[0] for row in _generate(scale, "projects")]
+    assert set(per_project.values()) == {scale.technologies_per_project}
+    assert len({(row[1], row[2]) for row in links}) == len(links)
+    for _, _, technology_id, version_id, *_ in links:
+        assert technology_id in technology_ids
+        assert version_id is None or versions[version_id] == technology_id
+
+
+def test_dataset_is_loaded_in_one_transaction(monkeypatch):
+    monkeypatch.setattr(generator, "get_password_hash", lambda password: "hash")
+    database = FakeDatabase()
+    database.answer_with("FROM technology_categories", [{"id": 1}])
+    database.answer_with("FROM technology_statuses", [{"id": 1}, {"id": 2}])
+    database.answer_with("COALESCE(MAX(id), 0) FROM projects", 500)
+    database.answer_with("COALESCE(MAX(id), 0) FROM", 0)
+    conn = FakeConnection(database)
+    scale = _scale()
+
+    loaded = asyncio.run(load_dataset(conn, scale, reset=True))
+
+    assert loaded["projects"] == scale.projects
+    assert loaded["project_technologies"] == scale.projects * scale.technologies_per_project
+    assert list(conn.copied) == list(DATASET_TABLES)
+    assert conn.copied["projects"][0][0] == 501
+    assert conn.transactions == [{}] and conn.commits == 1
+    statements = [query for method, query, _ in database.queries if method == "execute"]
+    assert statements[0].startswith("TRUNCATE project_technologies, projects")
+    assert statements[-len(DATASET_TABLES):] == [f"ANALYZE {table}" for table in DATASET_TABLES]
+    assert database.calls("rebuild_technology_stats")
+
+
+def test_dataset_requires_reference_rows():
+    with pytest.raises(ValueError):
+        asyncio.run(load_dataset(FakeConnection(FakeDatabase()), _scale()))
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(n) for n in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_summary_in_milliseconds():
+    summary = summarize([0.002, 0.001, 0.004, 0.003], errors=1, elapsed=2.0)
+
+    assert summary == {
+        "requests": 4, "errors": 1, "rps": 2.0, "mean_ms": 2.5,
+        "p50_ms": 2.0, "p95_ms": 4.0, "p99_ms": 4.0, "max_ms": 4.0,
+    }
+
+
+def test_compare_reports_relative_change():
+    base = {"scenarios": {
+        "projects.list": {"p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 40.0, "rps": 100.0},
+        "teams.list": {"p50_ms": 1.0, "p95_ms": 1.0, "p99_ms": 1.0, "rps": 1.0},
+    }}
+    head = {"scenarios": {
+        "projects.list": {"p50_ms": 5.0, "p95_ms": 20.0, "p99_ms": 0.0, "rps": 150.0},
+        "search": {"p50_ms": 1.0, "p95_ms": 1.0, "p99_ms": 1.0, "rps": 1.0},
+    }}
+
+    assert compare_results(base, head) == [{
+        "scenario": "projects.list",
+        "p50_ms": (10.0, 5.0, -50.0),
+        "p95_ms": (20.0, 20.0, 0.0),
+        "p99_ms": (40.0, 0.0, -100.0),
+        "rps": (100.0, 150.0, 50.0),
+    }]
+
+
+def _bench_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    return app
+
+
+def test_client_calls_app_in_process():
+    client = ASGIClient(_bench_app())
+
+    assert asyncio.run(client.get("/api/v1/items/7?x=1")) == (200, len(b'{"id":7}'))
+    assert asyncio.run(client.get("/api/v1/missing"))[0] == 404
+
+
+def test_scenario_counts_failed_requests():
+    scenario = Scenario("items", lambda rng, ids: f"/items/{rng.randint(*ids['items'])}")
+    failing = Scenario("missing", lambda rng, ids: "/missing")
+
+    async def run() -> tuple[dict, dict]:
+        client = ASGIClient(_bench_app())
+        ids = {"items": (1, 5)}
+        return (
+            await run_scenario(client, scenario, ids, {}, concurrency=4, requests=20, warmup=2, seed=1),
+            await run_scenario(client, failing, ids, {}, concurrency=2, requests=3, warmup=0, seed=1),
+        )
+
+    items, missing = asyncio.run(run())
+
+    assert (items["requests"], items["errors"]) == (20, 0)
+    assert (missing["requests"], missing["errors"]) == (3, 3)
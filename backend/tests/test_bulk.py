@@ -0,0 +1,241 @@
+import asyncio
+import json
+from datetime import date
+from typing import AsyncGenerator
+
+import pytest
+
+from backend.core.exceptions import ValidationException
+from backend.core.streaming import iter_csv_rows, iter_lines
+from backend.routers.admin import import_registry
+from backend.services.bulk import (
+    MAX_REPORTED_ERRORS,
+    STAGING_TABLE,
+    BulkService,
+    ImportReport,
+    _expand_project,
+    _normalize_row,
+)
+from backend.tests.conftest import FakeConnection, FakeDatabase
+
+
+async def _chunks(data: bytes, size: int = 7) -> AsyncGenerator[bytes, None]:
+    # Small chunks split lines and multi-byte characters between reads
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _collect(iterable) -> list:
+    return [item async for item in iterable]
+
+
+def test_normalize_full_row():
+    record = _normalize_row({
+        "project_name": " Radar ",
+        "project_status": "maintenance",
+        "team_name": "Core",
+        "start_date": "2026-02-01",
+        "technology_name": "Python",
+        "technology_category": "Languages",
+        "technology_status": "adopt",
+        "technology_version": "3.12",
+        "usage_type": "testing",
+        "notes": "CI only",
+    }, 4)
+
+    assert record == (
+        4, "Radar", None, "maintenance", "Core", None, date(2026, 2, 1),
+        "Python", "Languages", "adopt", "3.12", "testing", "CI only",
+    )
+
+
+def test_normalize_defaults_usage_and_drops_link_fields_without_technology():
+    with_technology = _normalize_row({"project_name": "Radar", "technology_name": "Go"}, 1)
+    without_technology = _normalize_row({"project_name": "Radar", "usage_type": "testing", "notes": "x"}, 1)
+
+    assert with_technology[11] == "production"
+    assert without_technology[7:] == (None, None, None, None, None, None)
+
+
+@pytest.mark.parametrize("raw, message", [
+    ({"project_name": "  "}, "project_name: обязательное поле"),
+    ({"project_name": "x" * 256}, "project_name: длина превышает 255 символов"),
+    ({"project_name": "Radar", "project_status": "frozen"}, 'project_status: недопустимое значение "frozen"'),
+    ({"project_name": "Radar", "start_date": "01.02.2026"}, 'start_date: некорректная дата "01.02.2026"'),
+    ({"project_name": "Radar", "technology_name": "Go", "usage_type": "prod"}, 'usage_type: недопустимое значение "prod"'),
+    ({"project_name": "Radar", "technology_name": "Go", "technology_version": "1" * 51},
+     "technology_version: длина превышает 50 символов"),
+])
+def test_normalize_rejects_invalid_row(raw, message):
+    with pytest.raises(ValueError) as error:
+        _normalize_row(raw, 1)
+
+    assert str(error.value) == message
+
+
+def test_expand_project_without_technologies():
+    rows = _expand_project({"name": "Radar", "team": "Core", "status": "active"})
+
+    assert rows == [{
+        "project_name": "Radar", "project_description": None, "project_status": "active",
+        "team_name": "Core", "repository_url": None, "start_date": None,
+    }]
+
+
+def test_expand_project_with_named_and_detailed_technologies():
+    rows = _expand_project({
+        "name": "Radar",
+        "technologies": ["Go", {"name": "Rust", "version": "1.80", "usage_type": "development"}],
+    })
+
+    assert [(row["project_name"], row["technology_name"], row["technology_version"]) for row in rows] == [
+        ("Radar", "Go", None),
+        ("Radar", "Rust", "1.80"),
+    ]
+    assert rows[1]["usage_type"] == "development"
+
+
+@pytest.mark.parametrize("technologies, message", [
+    ("Go", "technologies: ожидается список"),
+    ([42], "technologies: ожидается строка или объект"),
+])
+def test_expand_project_rejects_malformed_technologies(technologies, message):
+    with pytest.raises(ValueError) as error:
+        _expand_project({"name": "Radar", "technologies": technologies})
+
+    assert str(error.value) == message
+
+
+def test_lines_are_split_across_chunks():
+    data = "﻿первая\r\nвторая\nтретья".encode()
+
+    assert asyncio.run(_collect(iter_lines(_chunks(data, 3)))) == ["первая", "вторая", "третья"]
+
+
+def test_csv_records_spanning_several_lines():
+    lines = ["a,b", '1,"first', "second", '"', "", '2,"x ""quoted"""']
+
+    async def source() -> AsyncGenerator[str, None]:
+        for line in lines:
+            yield line
+
+    assert asyncio.run(_collect(iter_csv_rows(source()))) == [
+        (1, ["a", "b"]),
+        (2, ["1", "first\nsecond\n"]),
+        (6, ["2", 'x "quoted"']),
+    ]
+
+
+def test_report_keeps_first_errors_only():
+    report = ImportReport()
+    for line_no in range(1, MAX_REPORTED_ERRORS + 6):
+        report.add_error(line_no, "ошибка")
+
+    assert report.error_count == MAX_REPORTED_ERRORS + 5
+    assert len(report.errors) == MAX_REPORTED_ERRORS
+    assert report.errors[-1]["line"] == MAX_REPORTED_ERRORS
+
+
+MIXED_NDJSON = "\n".join([
+    json.dumps({"project_name": "Radar", "team_name": "Core", "technology_name": "Python"}),
+    json.dumps({"project_name": "Bad", "project_status": "frozen"}),
+    "{broken",
+    "",
+    json.dumps({"name": "Atlas", "technologies": ["Go", {"name": "Rust", "usage_type": "prod"}]}),
+    json.dumps({"project_name": "Ghost", "team_name": "Nobody"}),
+    "[1, 2]",
+]).encode()
+
+
+def _import_database() -> FakeDatabase:
+    database = FakeDatabase()
+    database.answer_with(f"DELETE FROM {STAGING_TABLE}", [{"line_no": 6, "message": 'Команда "Nobody" не найдена'}])
+    database.answer_with("INSERT INTO technologies", [{"technology_id": 21}, {"technology_id": 21}])
+    database.answer_with("UPDATE projects p", [{"id": 1}])
+    database.answer_with("INSERT INTO projects", [{"project_id": 30}])
+    database.answer_with("INSERT INTO project_technologies", "INSERT 0 2")
+    return database
+
+
+def test_import_with_valid_and_invalid_rows():
+    database = _import_database()
+    conn = FakeConnection(database)
+
+    report = asyncio.run(BulkService.import_records(conn, _chunks(MIXED_NDJSON), "ndjson"))
+
+    assert [(error["line"], error["message"]) for error in report["errors"]][:2] == [
+        (2, 'project_status: недопустимое значение "frozen"'),
+        (3, report["errors"][1]["message"]),
+    ]
+    assert [error["line"] for error in report["errors"]] == [2, 3, 5, 7, 6]
+    assert report["errors"][2]["message"] == 'usage_type: недопустимое значение "prod"'
+    assert report["errors"][3]["message"] == "ожидается JSON-объект"
+    assert report["errors"][4]["message"] == 'Команда "Nobody" не найдена'
+    assert {key: value for key, value in report.items() if key != "errors"} == {
+        "rows": 7,
+        "imported_rows": 2,
+        "projects_created": 1,
+        "projects_updated": 1,
+        "technologies_created": 1,
+        "links_upserted": 2,
+        "error_count": 5,
+    }
+
+    staged = conn.copied[STAGING_TABLE]
+    assert [(record[0], record[1], record[7]) for record in staged] == [
+        (1, "Radar", "Python"),
+        (5, "Atlas", "Go"),
+        (6, "Ghost", None),
+    ]
+    assert len(conn.transactions) == 1 and conn.commits == 1
+
+
+def test_import_csv_with_multiline_values():
+    conn = FakeConnection(_import_database())
+    data = 'project_name,technology_name,notes\r\nRadar,Python,"first\r\nsecond"\r\nAtlas,,\r\n'.encode()
+
+    report = asyncio.run(BulkService.import_records(conn, _chunks(data), "csv"))
+
+    assert report["rows"] == 2
+    assert [(record[0], record[1], record[12]) for record in conn.copied[STAGING_TABLE]] == [
+        (2, "Radar", "first\nsecond"),
+        (4, "Atlas", None),
+    ]
+
+
+def test_import_csv_with_unknown_column_is_rejected():
+    conn = FakeConnection(_import_database())
+
+    with pytest.raises(ValidationException) as error:
+        asyncio.run(BulkService.import_records(conn, _chunks(b"project_name,owner\nRadar,me\n"), "csv"))
+
+    assert error.value.message == "Неизвестные колонки: owner"
+    assert conn.rollbacks == 1
+
+
+def test_import_endpoint_streams_request_body(db):
+    db.answer_with("INSERT INTO project_technologies", "INSERT 0 0")
+
+    class StreamedRequest:
+        def stream(self) -> AsyncGenerator[bytes, None]:
+            return _chunks(json.dumps({"project_name": "Radar"}).encode())
+
+    report = asyncio.run(import_registry(StreamedRequest(), "ndjson", {"id": 1, "is_admin": True}))
+
+    assert report["rows"] == 1 and report["error_count"] == 0
+    assert db.checked_out == set()
+
+
+def test_export_in_import_format():
+    database = FakeDatabase()
+    database.answer_with("FROM projects p", [
+        {"project_name": "Radar", "start_date": date(2026, 2, 1), "technology_name": "Go", "usage_type": "production"},
+    ])
+    conn = FakeConnection(database)
+
+    body = b"".join(asyncio.run(_collect(BulkService.export_records(conn, "csv"))))
+
+    header, row = body.decode().splitlines()
+    assert header.startswith("project_name,project_description,project_status,team_name")
+    assert row == "Radar,,,,,2026-02-01,Go,,,,production,"
+    assert conn.transactions == [{"readonly": True}]
@@ -0,0 +1,94 @@
+import asyncio
+
+from backend.core.cache import TTLCache
+
+
+def test_cancelled_loader_caller_does_not_cancel_waiters():
+    cache = TTLCache("test_get_or_load", maxsize=8, ttl=60)
+    calls = 0
+
+    async def load() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run() -> list[str]:
+        first = asyncio.create_task(cache.get_or_load("key", load))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_load("key", load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        first.cancel()
+        return await asyncio.gather(*waiters)
+
+    assert asyncio.run(run()) == ["value"] * 3
+    assert calls == 2
+    assert cache.get("key") == "value"
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache = TTLCache("test_ttl", maxsize=8, ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr("backend.core.cache.time.monotonic", lambda: now[0])
+
+    cache.set("key", "value")
+    now[0] += 9
+    assert cache.get("key") == "value"
+    now[0] += 2
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache("test_lru", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_concurrent_misses_share_one_load():
+    cache = TTLCache("test_collapse", maxsize=8, ttl=60)
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> list[int]:
+        return await asyncio.gather(*(cache.get_or_load("key", load) for _ in range(5)))
+
+    assert asyncio.run(run()) == [42] * 5
+    assert calls == 1
+
+
+def test_load_racing_invalidation_is_not_stored():
+    cache = TTLCache("test_generation", maxsize=8, ttl=60)
+
+    async def load() -> str:
+        cache.invalidate()
+        return "stale"
+
+    assert asyncio.run(cache.get_or_load("key", load)) == "stale"
+    assert cache.get("key") is None
+
+
+def test_failed_load_reaches_every_waiter_and_is_not_cached():
+    cache = TTLCache("test_failure", maxsize=8, ttl=60)
+
+    async def load() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("database down")
+
+    async def run() -> list:
+        return await asyncio.gather(*(cache.get_or_load("key", load) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.get("key") is None
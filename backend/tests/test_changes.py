@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from backend.core import changes, database
+from backend.core.changes import ChangeFeed, mark_changed, on_change
+from backend.core.database import RequestScope
+
+
+@pytest.fixture
+def received(monkeypatch):
+    calls: list[frozenset[str]] = []
+    monkeypatch.setattr(changes, "_listeners", [])
+    on_change(calls.append)
+    return calls
+
+
+def _change_in_request(received: list[frozenset[str]], commit: bool) -> None:
+    async def run() -> None:
+        request_scope = RequestScope()
+        request_scope.transactional = True
+        token = database._request_scope.set(request_scope)
+        try:
+            mark_changed("projects", "teams")
+            assert received == []
+            await request_scope.finish(commit=commit)
+        finally:
+            database._request_scope.reset(token)
+
+    asyncio.run(run())
+
+
+def test_change_outside_transaction_notifies_at_once(received):
+    mark_changed("projects", "teams")
+
+    assert received == [frozenset({"projects", "teams"})]
+
+
+def test_change_in_request_transaction_notifies_after_commit(received):
+    _change_in_request(received, commit=True)
+
+    assert received == [frozenset({"projects", "teams"})]
+
+
+def test_rolled_back_change_is_not_announced(received):
+    _change_in_request(received, commit=False)
+
+    assert received == []
+
+
+def test_failing_listener_does_not_stop_others(received, monkeypatch):
+    def broken(_: frozenset[str]) -> None:
+        raise RuntimeError("listener bug")
+
+    monkeypatch.setattr(changes, "_listeners", [broken, received.append])
+    mark_changed("users")
+
+    assert received == [frozenset({"users"})]
+
+
+def test_notification_of_other_worker_reaches_listeners(received):
+    ChangeFeed._on_notification(None, 1234, changes.CHANGES_CHANNEL, "technologies")
+
+    assert received == [frozenset({"technologies"})]
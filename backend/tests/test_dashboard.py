@@ -0,0 +1,37 @@
+import asyncio
+
+from backend.core.changes import mark_changed
+from backend.services.dashboard import DashboardService
+
+
+def _snapshot_queries(db) -> int:
+    return len(db.calls("FROM mv_team_summary"))
+
+
+def test_concurrent_requests_build_snapshot_once(db):
+    db.answer_with("FROM mv_team_summary", [{"id": 1, "name": "Core", "project_count": 3, "lead_name": None}])
+
+    async def run() -> list:
+        return await asyncio.gather(*(DashboardService.get_snapshot() for _ in range(5)))
+
+    snapshots = asyncio.run(run())
+
+    assert _snapshot_queries(db) == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert snapshots[0]["team_summary"][0]["name"] == "Core"
+
+
+def test_snapshot_is_rebuilt_after_a_dashboard_table_changes(db):
+    asyncio.run(DashboardService.get_snapshot())
+    mark_changed("projects")
+    asyncio.run(DashboardService.get_snapshot())
+
+    assert _snapshot_queries(db) == 2
+
+
+def test_snapshot_survives_unrelated_changes(db):
+    asyncio.run(DashboardService.get_snapshot())
+    mark_changed("technology_statuses")
+    asyncio.run(DashboardService.get_snapshot())
+
+    assert _snapshot_queries(db) == 1
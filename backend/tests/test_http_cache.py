@@ -0,0 +1,168 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Request, Response
+
+from backend.core.changes import mark_changed
+from backend.core.exceptions import NotModifiedException, api_exception_handler
+from backend.core.http_cache import _etag_matches, _not_modified_since, conditional, get_table_versions
+
+MODIFIED = datetime(2026, 3, 1, 12, 0, 30, 500000, tzinfo=timezone.utc)
+
+VERSIONS = {
+    "projects": {"table_name": "projects", "version": 4, "updated_at": MODIFIED},
+    "teams": {"table_name": "teams", "version": 2, "updated_at": datetime(2026, 1, 1, tzinfo=timezone.utc)},
+    "technologies": {
+        "table_name": "technologies", "version": 9, "updated_at": datetime(2026, 2, 1, tzinfo=timezone.utc),
+    },
+}
+
+
+def _versions_db(db, versions: dict = VERSIONS):
+    db.answer_with("FROM table_versions", lambda tables: [versions[t] for t in tables if t in versions])
+    return db
+
+
+def _request(query: str = "", path: str = "/projects", **headers: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+def _validate(dependency, request: Request) -> dict[str, str]:
+    response = Response()
+    asyncio.run(dependency(request, response))
+    return dict(response.headers)
+
+
+@pytest.mark.parametrize("header, expected", [
+    ('W/"abc"', True),
+    ('"abc"', True),
+    ('"other", W/"abc"', True),
+    ("*", True),
+    ('"other"', False),
+    ('"ab"', False),
+])
+def test_etag_matches_weakly(header, expected):
+    assert _etag_matches(header, 'W/"abc"') is expected
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("Sun, 01 Mar 2026 12:00:30 GMT", True),
+    ("Sun, 01 Mar 2026 12:01:00 GMT", True),
+    ("Sun, 01 Mar 2026 12:00:29 GMT", False),
+    ("2026-03-01", False),
+    ("", False),
+])
+def test_not_modified_since_ignores_subsecond_precision(header, expected):
+    assert _not_modified_since(header, MODIFIED) is expected
+
+
+def test_versions_are_cached_until_table_changes(db):
+    _versions_db(db)
+
+    first = asyncio.run(get_table_versions(("projects", "unknown")))
+    asyncio.run(get_table_versions(("projects",)))
+    mark_changed("projects")
+    asyncio.run(get_table_versions(("projects",)))
+
+    assert first == {"projects": (4, MODIFIED), "unknown": (0, datetime(1970, 1, 1, tzinfo=timezone.utc))}
+    assert db.calls("FROM table_versions") == [(["projects", "unknown"],), (["projects"],)]
+
+
+def test_validators_are_added_to_response(db):
+    _versions_db(db)
+
+    headers = _validate(conditional("projects", "teams"), _request())
+
+    assert headers["etag"].startswith('W/"')
+    assert headers["last-modified"] == "Sun, 01 Mar 2026 12:00:30 GMT"
+    assert headers["cache-control"] == "public, no-cache"
+    assert headers["x-accel-expires"] == "1"
+
+
+def test_private_response_is_not_stored_by_proxy(db):
+    _versions_db(db)
+
+    headers = _validate(conditional("projects", public=False), _request())
+
+    assert headers["cache-control"] == "private, no-cache"
+    assert "x-accel-expires" not in headers
+
+
+def test_etag_depends_on_url_and_versions(db):
+    versions = {table: dict(row) for table, row in VERSIONS.items()}
+    _versions_db(db, versions)
+    dependency = conditional("projects")
+
+    etag = _validate(dependency, _request("status=active"))["etag"]
+    assert _validate(dependency, _request("status=active"))["etag"] == etag
+    assert _validate(dependency, _request("status=archived"))["etag"] != etag
+    assert _validate(dependency, _request("status=active", path="/teams"))["etag"] != etag
+
+    versions["projects"]["version"] += 1
+    mark_changed("projects")
+    assert _validate(dependency, _request("status=active"))["etag"] != etag
+
+
+def test_matching_etag_is_answered_with_304(db):
+    _versions_db(db)
+    dependency = conditional("projects")
+    etag = _validate(dependency, _request())["etag"]
+
+    with pytest.raises(NotModifiedException) as error:
+        _validate(dependency, _request(if_none_match=etag))
+
+    response = asyncio.run(api_exception_handler(None, error.value))
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+
+def test_if_none_match_takes_precedence_over_date(db):
+    _versions_db(db)
+
+    headers = _validate(conditional("projects"), _request(
+        if_none_match='"stale"',
+        if_modified_since="Sun, 01 Mar 2026 13:00:00 GMT",
+    ))
+
+    assert "etag" in headers
+
+
+def test_unmodified_since_date_is_answered_with_304(db):
+    _versions_db(db)
+
+    with pytest.raises(NotModifiedException):
+        _validate(conditional("projects"), _request(if_modified_since="Sun, 01 Mar 2026 13:00:00 GMT"))
+
+
+def test_included_expansions_join_the_validator(db):
+    versions = {table: dict(row) for table, row in VERSIONS.items()}
+    _versions_db(db, versions)
+    dependency = conditional("projects", expansions={"technologies": ("technologies",), "team": ("teams",)})
+
+    etag = _validate(dependency, _request("include=technologies"))["etag"]
+    assert db.calls("FROM table_versions") == [(["projects", "technologies"],)]
+
+    # Only the requested expansion is part of the validator
+    versions["teams"]["version"] += 1
+    mark_changed("teams")
+    assert _validate(dependency, _request("include=technologies"))["etag"] == etag
+
+    versions["technologies"]["version"] += 1
+    mark_changed("technologies")
+    assert _validate(dependency, _request("include=technologies"))["etag"] != etag
+
+
+def test_unknown_include_is_ignored(db):
+    _versions_db(db)
+
+    _validate(conditional("projects", expansions={"team": ("teams",)}), _request("include=owner, team"))
+
+    assert db.calls("FROM table_versions") == [(["projects", "teams"],)]
@@ -0,0 +1,172 @@
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+
+import pytest
+
+from backend.core.jobs import WORKER_NAME, Job, JobRunner, Schedule, parse_daily_time
+
+UTC = timezone.utc
+
+STALE_RUNS = "AND status = 'running' AND id <> $2"
+START_RUN = "SET status = 'running'"
+FINISH_RUN = "SET status = $2, result = $3::jsonb"
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    monkeypatch.setattr(JobRunner, "_jobs", {})
+    monkeypatch.setattr(JobRunner, "_tasks", set())
+    monkeypatch.setattr(JobRunner, "_semaphore", asyncio.Semaphore(2))
+    return JobRunner
+
+
+def _job(calls: list, result=None, error: Exception | None = None, **params) -> Job:
+    async def func(context) -> dict | None:
+        calls.append((context.run_id, context.params, context.triggered_by))
+        if error is not None:
+            raise error
+        return result
+
+    return Job("cleanup", func, "Cleanup", default_params=params)
+
+
+def _finished(db) -> list[tuple]:
+    return [(status, result, error) for _, status, result, error in db.calls(FINISH_RUN)]
+
+
+async def _drain() -> None:
+    while JobRunner._tasks:
+        await asyncio.gather(*JobRunner._tasks)
+
+
+def test_parse_daily_time():
+    assert parse_daily_time("03:30") == time(3, 30, tzinfo=UTC)
+    assert parse_daily_time("") is None
+
+
+@pytest.mark.parametrize("moment, expected", [
+    (datetime(2026, 3, 1, 10, 14, 59, tzinfo=UTC), datetime(2026, 3, 1, 10, 15, tzinfo=UTC)),
+    (datetime(2026, 3, 1, 10, 15, tzinfo=UTC), datetime(2026, 3, 1, 10, 30, tzinfo=UTC)),
+    (datetime(2026, 3, 1, 10, 15, 1, tzinfo=UTC), datetime(2026, 3, 1, 10, 30, tzinfo=UTC)),
+])
+def test_interval_slots_are_aligned_to_epoch(moment, expected):
+    assert Schedule(every_seconds=900).next_after(moment) == expected
+
+
+@pytest.mark.parametrize("moment, expected", [
+    (datetime(2026, 3, 1, 2, 59, tzinfo=UTC), datetime(2026, 3, 1, 3, 0, tzinfo=UTC)),
+    (datetime(2026, 3, 1, 3, 0, tzinfo=UTC), datetime(2026, 3, 2, 3, 0, tzinfo=UTC)),
+    (datetime(2026, 3, 1, 3, 0, 1, tzinfo=UTC), datetime(2026, 3, 2, 3, 0, tzinfo=UTC)),
+    # 01:30 at UTC+3 is 22:30 UTC of the previous day
+    (datetime(2026, 3, 2, 1, 30, tzinfo=timezone(timedelta(hours=3))), datetime(2026, 3, 2, 3, 0, tzinfo=UTC)),
+])
+def test_daily_slot_is_next_occurrence(moment, expected):
+    assert Schedule(daily_at=time(3, 0, tzinfo=UTC)).next_after(moment) == expected
+
+
+def test_disabled_schedule_has_no_slot():
+    assert Schedule().next_after(datetime(2026, 3, 1, tzinfo=UTC)) is None
+
+
+def test_run_is_skipped_when_lock_is_held(db, runner):
+    db.answer_with("pg_try_advisory_lock", False)
+    calls: list = []
+
+    asyncio.run(runner._execute(_job(calls), 5, {}, None))
+
+    assert calls == []
+    assert _finished(db) == [("skipped", None, "Задача уже выполняется")]
+    assert not db.calls(START_RUN)
+    assert not db.calls("pg_advisory_unlock")
+    assert db.checked_out == set()
+
+
+def test_locked_run_fails_stale_runs_before_starting(db, runner):
+    db.answer_with("pg_try_advisory_lock", True)
+    calls: list = []
+
+    asyncio.run(runner._execute(_job(calls, result={"deleted": 3}), 5, {"days": 30}, 1))
+
+    statements = [query for method, query, _ in db.queries if method == "execute"]
+    assert STALE_RUNS in statements[0] and START_RUN in statements[1]
+    assert db.calls(STALE_RUNS) == [("cleanup", 5)]
+    assert db.calls(START_RUN) == [(5, WORKER_NAME)]
+    assert calls == [(5, {"days": 30}, 1)]
+    assert _finished(db) == [("succeeded", '{"deleted": 3}', None)]
+    assert db.calls("pg_advisory_unlock") == [("job:cleanup",)]
+    assert db.checked_out == set()
+
+
+def test_failed_job_is_recorded_and_unlocked(db, runner):
+    db.answer_with("pg_try_advisory_lock", True)
+
+    asyncio.run(runner._execute(_job([], error=ValueError("bad input")), 5, {}, None))
+
+    assert _finished(db) == [("failed", None, "ValueError: bad input")]
+    assert db.calls("pg_advisory_unlock") == [("job:cleanup",)]
+
+
+def test_claimed_slot_starts_run(db, runner):
+    db.answer_with("pg_try_advisory_lock", True)
+    db.answer_with("ON CONFLICT (job_name, scheduled_for) DO NOTHING", 8)
+    calls: list = []
+    slot = datetime(2026, 3, 1, 3, 0, tzinfo=UTC)
+
+    async def run() -> None:
+        await runner._claim_slot(_job(calls, days=30), slot)
+        await _drain()
+
+    asyncio.run(run())
+
+    assert db.calls("ON CONFLICT (job_name, scheduled_for)") == [("cleanup", '{"days": 30}', slot)]
+    assert calls == [(8, {"days": 30}, None)]
+
+
+def test_slot_claimed_by_another_worker_is_not_run(db, runner):
+    calls: list = []
+
+    async def run() -> None:
+        await runner._claim_slot(_job(calls), datetime(2026, 3, 1, 3, 0, tzinfo=UTC))
+        await _drain()
+
+    asyncio.run(run())
+
+    assert calls == []
+    assert not db.calls("pg_try_advisory_lock")
+
+
+def test_manual_run_merges_params_over_defaults(db, runner):
+    db.answer_with("pg_try_advisory_lock", True)
+    db.answer_with("INSERT INTO job_runs", lambda name, params, user: {"id": 9, "params": params})
+    calls: list = []
+    runner.register(_job(calls, days=30, dry_run=True))
+
+    async def run() -> dict:
+        queued = await runner.enqueue("cleanup", {"days": 7}, triggered_by=1)
+        await _drain()
+        return queued
+
+    queued = asyncio.run(run())
+
+    assert queued == {"id": 9, "params": {"days": 7, "dry_run": True}}
+    assert calls == [(9, {"days": 7, "dry_run": True}, 1)]
+
+
+def test_cancelled_run_is_recorded_as_failed(db, runner):
+    db.answer_with("pg_try_advisory_lock", True)
+    started = asyncio.Event()
+
+    async def func(context) -> None:
+        started.set()
+        await asyncio.sleep(10)
+
+    async def run() -> None:
+        task = asyncio.create_task(runner._execute(Job("cleanup", func, "Cleanup"), 5, {}, None))
+        await started.wait()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+
+    assert _finished(db) == [("failed", None, "Прервано остановкой приложения")]
+    assert db.calls("pg_advisory_unlock") == [("job:cleanup",)]
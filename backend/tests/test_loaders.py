@@ -0,0 +1,150 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from backend.core import database
+from backend.core.database import RequestScope
+from backend.core.loaders import DataLoader, get_loader
+from backend.services.includes import expand_projects
+
+NOW = datetime(2026, 1, 2, 3, 4, 5)
+
+TEAMS = {
+    1: {"id": 1, "name": "Core", "description": None, "lead_id": 10, "created_at": NOW, "updated_at": NOW},
+    2: {"id": 2, "name": "Data", "description": None, "lead_id": 20, "created_at": NOW, "updated_at": NOW},
+}
+USERS = {10: {"id": 10, "full_name": "Ann"}, 20: {"id": 20, "full_name": "Bob"}}
+MEMBERS = [(1, 10, "Ann"), (1, 11, "Carl"), (2, 20, "Bob")]
+
+
+class Batch:
+    """
+    Batch function recording the keys of every call
+    """
+    def __init__(self, fail: bool = False):
+        self.calls: list[list[int]] = []
+        self.fail = fail
+
+    async def __call__(self, keys: list[int]) -> dict[int, str]:
+        self.calls.append(keys)
+        if self.fail:
+            raise RuntimeError("database is down")
+        return {key: f"value {key}" for key in keys if key > 0}
+
+
+def test_concurrent_loads_are_resolved_by_one_batch():
+    batch = Batch()
+
+    async def scenario():
+        loader = DataLoader("test", batch)
+        return await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(-1))
+
+    assert asyncio.run(scenario()) == ["value 1", "value 2", "value 1", None]
+    assert batch.calls == [[1, 2, -1]]
+
+
+def test_loaded_keys_and_misses_are_kept():
+    batch = Batch()
+
+    async def scenario():
+        loader = DataLoader("test", batch)
+        await loader.load_many([1, -1])
+        return await loader.load_many([-1, 2, 1])
+
+    assert asyncio.run(scenario()) == [None, "value 2", "value 1"]
+    assert batch.calls == [[1, -1], [2]]
+
+
+def test_batches_are_split_by_max_size():
+    batch = Batch()
+
+    async def scenario():
+        return await DataLoader("test", batch, max_batch_size=2).load_many([1, 2, 3, 4, 5])
+
+    assert asyncio.run(scenario()) == [f"value {key}" for key in range(1, 6)]
+    assert batch.calls == [[1, 2], [3, 4], [5]]
+
+
+def test_failed_keys_are_retried_by_later_load():
+    batch = Batch(fail=True)
+
+    async def scenario():
+        loader = DataLoader("test", batch)
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        batch.fail = False
+        return results, await loader.load(1)
+
+    results, retried = asyncio.run(scenario())
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert retried == "value 1"
+    assert batch.calls == [[1, 2], [1]]
+
+
+def test_primed_key_is_not_queried():
+    batch = Batch()
+
+    async def scenario():
+        loader = DataLoader("test", batch)
+        loader.prime(1, "known")
+        loader.prime(1, "ignored")
+        return await loader.load_many([1, 2])
+
+    assert asyncio.run(scenario()) == ["known", "value 2"]
+    assert batch.calls == [[2]]
+
+
+def test_loader_is_shared_within_request_only():
+    batch = Batch()
+
+    async def scenario():
+        outside = get_loader("test", batch) is get_loader("test", batch)
+        token = database._request_scope.set(RequestScope())
+        try:
+            inside = get_loader("test", batch) is get_loader("test", batch)
+        finally:
+            database._request_scope.reset(token)
+        return outside, inside
+
+    assert asyncio.run(scenario()) == (False, True)
+
+
+@pytest.fixture
+def team_rows(db):
+    db.answer_with("FROM teams", lambda ids: [dict(TEAMS[key]) for key in ids if key in TEAMS])
+    db.answer_with("FROM users", lambda ids: [dict(USERS[key]) for key in ids if key in USERS])
+    db.answer_with("FROM team_members", lambda ids: [
+        {"team_id": team_id, "user_id": user_id, "full_name": name, "role": "developer", "joined_at": NOW}
+        for team_id, user_id, name in MEMBERS if team_id in ids
+    ])
+    return db
+
+
+def test_project_expansions_query_each_table_once(team_rows):
+    projects = [{"id": key, "team_id": team_id} for key, team_id in enumerate([1, 2, 1, None, 2, 3])]
+
+    async def scenario():
+        request_scope = RequestScope()
+        token = database._request_scope.set(request_scope)
+        try:
+            return await expand_projects(projects, frozenset({"team", "lead", "members"}))
+        finally:
+            database._request_scope.reset(token)
+            await request_scope.close()
+
+    expanded = asyncio.run(scenario())
+
+    assert sorted(team_rows.calls("FROM teams")[0][0]) == [1, 2, 3]
+    assert sorted(team_rows.calls("FROM users")[0][0]) == [10, 20]
+    assert sorted(team_rows.calls("FROM team_members")[0][0]) == [1, 2, 3]
+    assert len(team_rows.queries) == 3
+    assert not team_rows.checked_out
+    assert [project["team"] and project["team"]["name"] for project in expanded] == [
+        "Core", "Data", "Core", None, "Data", None,
+    ]
+    assert [project["lead"] and project["lead"]["full_name"] for project in expanded] == [
+        "Ann", "Bob", "Ann", None, "Bob", None,
+    ]
+    assert [[member["user_id"] for member in project["members"]] for project in expanded] == [
+        [10, 11], [20], [10, 11], [], [20], [],
+    ]
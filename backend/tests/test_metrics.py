@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+
+from backend.core import metrics
+from backend.core.database import DB_QUERY_DURATION, fetch_val
+from backend.core.metrics import (
+    HTTP_IN_FLIGHT,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    UNMATCHED_ROUTE,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsMiddleware,
+    collector,
+    render_metrics,
+)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # Metrics created by a test must not show up in the application registry
+    monkeypatch.setattr(metrics, "_metrics", [])
+    monkeypatch.setattr(metrics, "_collectors", [])
+
+
+def test_counter_and_gauge_render_labels(registry):
+    requests = Counter("requests_total", "Requests", ("path",))
+    requests.inc('/a"b')
+    requests.inc('/a"b', amount=2)
+    in_flight = Gauge("in_flight", "In flight")
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+
+    assert render_metrics().splitlines() == [
+        "# HELP requests_total Requests",
+        "# TYPE requests_total counter",
+        'requests_total{path="/a\\"b"} 3',
+        "# HELP in_flight In flight",
+        "# TYPE in_flight gauge",
+        "in_flight 1",
+    ]
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    latency = Histogram("latency_seconds", "Latency", ("route",), buckets=(0.5, 0.1))
+    for value in (0.05, 0.1, 0.3, 2.0):
+        latency.observe(value, "/x")
+
+    assert render_metrics().splitlines()[2:] == [
+        'latency_seconds_bucket{route="/x",le="0.1"} 2',
+        'latency_seconds_bucket{route="/x",le="0.5"} 3',
+        'latency_seconds_bucket{route="/x",le="+Inf"} 4',
+        'latency_seconds_sum{route="/x"} 2.45',
+        'latency_seconds_count{route="/x"} 4',
+    ]
+
+
+def test_collectors_run_before_rendering(registry):
+    size = Gauge("queue_size", "Queue size")
+    queue = [1, 2, 3]
+
+    @collector
+    def collect() -> None:
+        size.set(len(queue))
+
+    assert "queue_size 3" in render_metrics()
+    queue.pop()
+    assert "queue_size 2" in render_metrics()
+
+
+def _app() -> MetricsMiddleware:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        if item_id == 0:
+            raise RuntimeError("boom")
+        assert HTTP_IN_FLIGHT._values[()] >= 1
+        return {"id": item_id}
+
+    return MetricsMiddleware(app)
+
+
+def _get(app: MetricsMiddleware, path: str) -> None:
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    asyncio.run(app({
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "headers": [], "scheme": "http", "server": ("test", 80),
+    }, receive, send))
+
+
+def _requests(route: str, status: str) -> float:
+    return HTTP_REQUESTS._values.get(("GET", route, status), 0)
+
+
+def test_requests_are_labelled_by_route_template():
+    app = _app()
+    before = _requests("/items/{item_id}", "200")
+    observed = HTTP_REQUEST_DURATION._series.get(("GET", "/items/{item_id}"), [0])[-1]
+
+    _get(app, "/items/1")
+    _get(app, "/items/2")
+
+    assert _requests("/items/{item_id}", "200") == before + 2
+    assert HTTP_REQUEST_DURATION._series[("GET", "/items/{item_id}")][-1] > observed
+    assert HTTP_IN_FLIGHT._values[()] == 0
+
+
+def test_unmatched_paths_share_one_label():
+    before = _requests(UNMATCHED_ROUTE, "404")
+
+    _get(_app(), "/missing/1")
+    _get(_app(), "/missing/2")
+
+    assert _requests(UNMATCHED_ROUTE, "404") == before + 2
+
+
+def test_failed_request_is_counted_as_server_error():
+    before = _requests("/items/{item_id}", "500")
+
+    with pytest.raises(RuntimeError):
+        _get(_app(), "/items/0")
+
+    assert _requests("/items/{item_id}", "500") == before + 1
+    assert HTTP_IN_FLIGHT._values[()] == 0
+
+
+async def count_projects() -> int:
+    return await fetch_val("SELECT COUNT(*) FROM projects")
+
+
+def test_queries_are_labelled_by_calling_function(db):
+    label = ("count_projects",)
+    before = sum(DB_QUERY_DURATION._series.get(label, [0])[:-1])
+
+    asyncio.run(count_projects())
+
+    assert sum(DB_QUERY_DURATION._series[label][:-1]) == before + 1
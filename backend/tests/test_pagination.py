@@ -0,0 +1,182 @@
+import asyncio
+import json
+from datetime import date, datetime, timezone
+
+import asyncpg
+import pytest
+from fastapi import Response
+
+from backend.core.exceptions import ValidationException
+from backend.core.pagination import (
+    PaginatedResponse,
+    PaginationParams,
+    SortParams,
+    apply_cursor,
+    cursor_errors,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+    paginate,
+    paginate_json,
+)
+from backend.routers.projects import list_projects
+from backend.schemas.includes import ProjectDetails
+
+
+def _params(cursor: str | None, page: int = 1, page_size: int = 20) -> PaginationParams:
+    return PaginationParams(page=page, page_size=page_size, cursor=cursor, include_total=False)
+
+
+def _sort(sort_by: str = "created_at", sort_order: str = "desc") -> SortParams:
+    return SortParams(sort_by=sort_by, sort_order=sort_order)
+
+
+@pytest.mark.parametrize("value", [
+    datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc),
+    date(2026, 3, 1),
+    "Платформа",
+    42,
+    None,
+])
+def test_cursor_round_trip(value):
+    sort = _sort()
+
+    assert decode_cursor(encode_cursor(sort, value, 17), sort) == (value, 17)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(_sort("name", "asc"), "a/b+c?" * 10, 1)
+
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", "bm90IGpzb24", "WzEsMl0"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValidationException):
+        decode_cursor(cursor, _sort())
+
+
+def test_cursor_of_another_sort_is_rejected():
+    cursor = encode_cursor(_sort("name", "asc"), "a", 1)
+
+    with pytest.raises(ValidationException) as error:
+        decode_cursor(cursor, _sort("name", "desc"))
+    assert error.value.message == "Курсор не соответствует параметрам сортировки"
+
+
+def test_cursor_overrides_page_offset():
+    assert _params(None, page=3, page_size=10).offset == 20
+    assert _params("token", page=3, page_size=10).offset == 0
+
+
+def test_without_cursor_filter_is_unchanged():
+    assert apply_cursor("1=1", [5], _params(None), _sort(), "p.created_at", "p.id") == ("1=1", [5])
+
+
+def test_descending_keyset_condition():
+    sort = _sort()
+    value = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    where, params = apply_cursor(
+        "p.team_id = $1", [5], _params(encode_cursor(sort, value, 9)), sort, "p.created_at", "p.id"
+    )
+
+    assert where == "p.team_id = $1 AND (p.created_at < $2 OR (p.created_at = $2 AND p.id < $3))"
+    assert params == [5, value, 9]
+
+
+def test_ascending_keyset_condition_keeps_null_tail():
+    sort = _sort("name", "asc")
+    where, params = apply_cursor("1=1", [], _params(encode_cursor(sort, "b", 4)), sort, "t.name", "t.id")
+
+    assert where == "1=1 AND (t.name > $1 OR (t.name = $1 AND t.id > $2) OR t.name IS NULL)"
+    assert params == ["b", 4]
+
+
+def test_cursor_inside_null_block():
+    asc, desc = _sort("name", "asc"), _sort("name", "desc")
+
+    asc_where, asc_params = apply_cursor("1=1", [], _params(encode_cursor(asc, None, 4)), asc, "t.name", "t.id")
+    desc_where, _ = apply_cursor("1=1", [], _params(encode_cursor(desc, None, 4)), desc, "t.name", "t.id")
+
+    assert asc_where == "1=1 AND (t.name IS NULL AND t.id > $1)"
+    assert asc_params == [4]
+    assert desc_where == "1=1 AND ((t.name IS NULL AND t.id < $1) OR t.name IS NOT NULL)"
+
+
+def test_next_cursor_points_after_last_row_of_full_page():
+    sort = _sort("name", "asc")
+    items = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+    assert decode_cursor(next_cursor(items, _params(None, page_size=2), sort), sort) == ("b", 2)
+    assert next_cursor(items, _params(None, page_size=3), sort) is None
+
+
+def test_value_rejected_by_sort_column_is_invalid_cursor():
+    with pytest.raises(ValidationException):
+        with cursor_errors(_params("token")):
+            raise asyncpg.DataError("invalid input for query argument $1")
+
+
+def test_data_error_without_cursor_is_not_masked():
+    with pytest.raises(asyncpg.DataError):
+        with cursor_errors(_params(None)):
+            raise asyncpg.DataError("invalid input for query argument $1")
+
+
+def test_cursor_with_structured_value_is_rejected():
+    sort = SortParams(sort_by="name", sort_order="asc")
+    with pytest.raises(ValidationException):
+        decode_cursor(encode_cursor(sort, ["a", "b"], 1), sort)
+
+
+PAGE_ITEMS = (
+    '[{"name" : "Radar", "description" : null, "team_id" : null, "status" : "active", '
+    '"repository_url" : null, "start_date" : null, "id" : 1, '
+    '"created_at" : "2026-01-02T03:04:05", "updated_at" : "2026-01-02T03:04:05", "technologies" : []}]'
+)
+
+
+def test_items_are_spliced_into_envelope_unparsed():
+    sort = _sort("name", "asc")
+
+    response = paginate_json(PAGE_ITEMS, 1, ("Radar", 1), 41, _params(None, page_size=1), sort, {"ETag": 'W/"v"'})
+
+    assert response.body.startswith(b'{"items":' + PAGE_ITEMS.encode() + b",")
+    assert response.media_type == "application/json"
+    assert response.headers["etag"] == 'W/"v"'
+    body = json.loads(response.body)
+    assert decode_cursor(body.pop("next_cursor"), sort) == ("Radar", 1)
+    assert body.pop("items")[0]["name"] == "Radar"
+    assert body == {"page": 1, "page_size": 1, "total": 41, "total_pages": 41, "sort_by": "name", "sort_order": "asc"}
+
+
+def test_envelope_matches_model_page():
+    params, sort = _params(None, page=3, page_size=20), _sort()
+
+    response = paginate_json(b"[]", 0, None, None, params, sort, {})
+
+    assert json.loads(response.body) == paginate([], None, params, sort).model_dump()
+
+
+def test_short_page_has_no_next_cursor():
+    response = paginate_json("[{}]", 1, ("a", 1), None, _params(None, page_size=2), _sort("name", "asc"), {})
+
+    assert json.loads(response.body)["next_cursor"] is None
+
+
+def test_project_page_is_rendered_by_database(db):
+    db.answer_with("WITH page AS", {"count": 1, "last_sort_value": "Radar", "last_id": 1, "items": PAGE_ITEMS})
+    db.answer_with("COUNT(*)", {"total": 41})
+    response = Response(headers={"ETag": 'W/"v"'})
+    pagination = _params(None, page_size=1)
+    pagination.include_total = True
+
+    page = asyncio.run(list_projects(response, pagination, _sort("name", "asc"), None, "active", None, None))
+
+    [(_, page_query, args)] = [query for query in db.queries if "WITH page AS" in query[1]]
+    assert "ORDER BY p.name ASC, p.id ASC" in page_query and "ORDER BY p.name DESC, p.id DESC" in page_query
+    assert args == ("active", 1, 0)
+    assert page.headers["etag"] == 'W/"v"'
+    validated = PaginatedResponse[ProjectDetails].model_validate_json(page.body)
+    assert (validated.total, validated.items[0].id) == (41, 1)
+    assert decode_cursor(validated.next_cursor, _sort("name", "asc")) == ("Radar", 1)
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.core import security
+from backend.core.exceptions import TooManyRequestsException, api_exception_handler
+from backend.core.security import PasswordHasher
+
+
+@pytest.fixture
+def gate():
+    # Released on teardown so that a failing test does not hang on its workers
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+@pytest.fixture
+def hasher(monkeypatch, gate):
+    async def release_request_connection() -> None:
+        await asyncio.sleep(0)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(security, "release_request_connection", release_request_connection)
+    monkeypatch.setattr(PasswordHasher, "_executor", executor)
+    monkeypatch.setattr(PasswordHasher, "_capacity", classmethod(lambda cls: 2))
+    for counter in ("_pending", "_calls", "_rejected"):
+        monkeypatch.setattr(PasswordHasher, counter, 0)
+    yield PasswordHasher
+    gate.set()
+    executor.shutdown(wait=True)
+
+
+async def _wait_for(predicate) -> None:
+    for _ in range(500):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+def test_burst_is_bounded_by_capacity(hasher, gate):
+    async def burst() -> list:
+        calls = [asyncio.create_task(hasher.run(gate.wait)) for _ in range(5)]
+        await _wait_for(lambda: hasher._rejected == 3)
+        gate.set()
+        return await asyncio.gather(*calls, return_exceptions=True)
+
+    results = asyncio.run(burst())
+
+    assert sum(isinstance(result, TooManyRequestsException) for result in results) == 3
+    assert results.count(True) == 2
+    assert hasher._pending == 0
+
+
+def test_cancelled_caller_keeps_slot_until_worker_finishes(hasher, gate):
+    started = threading.Event()
+
+    def slow_hash() -> str:
+        started.set()
+        gate.wait()
+        return "hash"
+
+    async def cancel_running() -> tuple[int, int]:
+        call = asyncio.create_task(hasher.run(slow_hash))
+        await _wait_for(started.is_set)
+        call.cancel()
+        await asyncio.gather(call, return_exceptions=True)
+        held = hasher._pending
+        gate.set()
+        await _wait_for(lambda: hasher._pending == 0)
+        return held, hasher._pending
+
+    assert asyncio.run(cancel_running()) == (1, 0)
+
+
+def test_queued_call_cancelled_before_start_frees_slot(hasher, gate):
+    async def cancel_queued() -> int:
+        running = asyncio.create_task(hasher.run(gate.wait))
+        queued = asyncio.create_task(hasher.run(gate.wait))
+        await _wait_for(lambda: hasher._pending == 2)
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        await asyncio.gather(queued, return_exceptions=True)
+        await _wait_for(lambda: hasher._pending == 1)
+        gate.set()
+        await running
+        await _wait_for(lambda: hasher._pending == 0)
+        return hasher._calls
+
+    assert asyncio.run(cancel_queued()) == 1
+
+
+def test_hash_and_verify_run_in_the_pool(monkeypatch):
+    async def release_request_connection() -> None:
+        pass
+
+    monkeypatch.setattr(security, "release_request_connection", release_request_connection)
+    monkeypatch.setattr(PasswordHasher, "_executor", None)
+    monkeypatch.setattr(PasswordHasher, "_calls", 0)
+
+    async def run() -> tuple[bool, bool]:
+        hashed = await security.get_password_hash_async("secret")
+        return (
+            await security.verify_password_async("secret", hashed),
+            await security.verify_password_async("wrong", hashed),
+        )
+
+    try:
+        assert asyncio.run(run()) == (True, False)
+    finally:
+        PasswordHasher.shutdown()
+    assert PasswordHasher.stats()["calls"] == 3
+    assert PasswordHasher.stats()["pending"] == 0
+
+
+def test_saturated_pool_answers_429():
+    response = asyncio.run(api_exception_handler(None, TooManyRequestsException("busy")))
+
+    assert response.status_code == 429
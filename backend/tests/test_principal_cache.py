@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from backend.core.changes import ChangeFeed
+from backend.core.security import create_access_token, get_current_user, invalidate_principal
+from backend.services.auth import AuthService
+
+USER = {"id": 7, "email": "dev@local.com", "full_name": "Dev", "is_admin": False, "is_active": True}
+
+
+def _authenticate(token: str) -> dict:
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    return asyncio.run(get_current_user(credentials))
+
+
+def _principal_loads(db) -> int:
+    return len(db.calls("FROM users"))
+
+
+@pytest.fixture
+def token(db) -> str:
+    db.answer_with("FROM users", lambda user_id: dict(USER) if user_id == USER["id"] else None)
+    return create_access_token({"user_id": USER["id"]})
+
+
+def test_principal_is_loaded_once(db, token):
+    assert _authenticate(token) == USER
+    assert _authenticate(token) == USER
+
+    assert _principal_loads(db) == 1
+
+
+def test_principal_query_does_not_read_password_hash(db, token):
+    _authenticate(token)
+
+    assert all("password_hash" not in query for _, query, _ in db.queries)
+
+
+def test_callers_get_their_own_copy(db, token):
+    _authenticate(token)["is_admin"] = True
+
+    assert _authenticate(token)["is_admin"] is False
+
+
+def test_invalidated_principal_is_reloaded(db, token):
+    _authenticate(token)
+    invalidate_principal(USER["id"])
+    _authenticate(token)
+
+    assert _principal_loads(db) == 2
+
+
+def test_user_changes_of_other_workers_drop_principals(db, token):
+    _authenticate(token)
+    ChangeFeed._on_notification(None, 1234, "stack_radar_changes", "users")
+    _authenticate(token)
+
+    assert _principal_loads(db) == 2
+
+
+def test_unknown_user_is_rejected_and_not_cached(db):
+    token = create_access_token({"user_id": 999})
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as error:
+            _authenticate(token)
+        assert error.value.status_code == 401
+    assert _principal_loads(db) == 2
+
+
+def test_invalid_token_is_rejected(db):
+    with pytest.raises(HTTPException) as error:
+        _authenticate("not-a-token")
+
+    assert error.value.status_code == 401
+    assert db.queries == []
+
+
+def test_user_update_drops_cached_principal(db, token):
+    _authenticate(token)
+    asyncio.run(AuthService.update_user_password(USER["id"], "hash"))
+    _authenticate(token)
+
+    assert _principal_loads(db) == 2
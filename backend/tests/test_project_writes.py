@@ -0,0 +1,91 @@
+import asyncio
+
+import asyncpg
+import pytest
+
+from backend.core.exceptions import NotFoundException
+from backend.schemas.projects import ProjectCreate, ProjectUpdate
+from backend.services.projects import ProjectService
+
+PROJECT = {
+    "id": 11, "name": "Radar", "description": None, "team_id": 2, "status": "active",
+    "repository_url": None, "start_date": None, "created_at": None, "updated_at": None,
+}
+
+
+def _fk_violation(constraint: str, detail: str) -> asyncpg.ForeignKeyViolationError:
+    return asyncpg.ForeignKeyViolationError.new({"C": "23503", "M": "fk", "n": constraint, "D": detail})
+
+
+def test_project_and_links_are_written_in_one_transaction(db):
+    db.answer_with("INSERT INTO projects", dict(PROJECT))
+    db.answer_with("INSERT INTO project_technologies", [])
+
+    project = ProjectCreate(name="Radar", status="active", team_id=2, technology_ids=[3, 5, 3])
+    result = asyncio.run(ProjectService.create_project(project))
+
+    [conn] = db.connections
+    assert len(conn.transactions) == 1 and conn.commits == 1
+    assert [method for method, _, _ in db.queries] == ["fetchrow", "fetch"]
+    assert db.calls("INSERT INTO project_technologies") == [(11, [3, 5])]
+    assert result["id"] == 11 and result["technologies"] == []
+    assert db.checked_out == set()
+
+
+def test_project_without_technologies_skips_link_statement(db):
+    db.answer_with("INSERT INTO projects", dict(PROJECT))
+
+    asyncio.run(ProjectService.create_project(ProjectCreate(name="Radar", status="active")))
+
+    assert not db.calls("INSERT INTO project_technologies")
+
+
+def test_failed_link_rolls_back_project(db):
+    db.answer_with("INSERT INTO projects", dict(PROJECT))
+    db.answer_with("INSERT INTO project_technologies", _fk_violation(
+        "project_technologies_technology_id_fkey",
+        'Key (technology_id)=(99) is not present in table "technologies".',
+    ))
+
+    with pytest.raises(NotFoundException) as error:
+        asyncio.run(ProjectService.create_project(ProjectCreate(name="Radar", status="active", technology_ids=[99])))
+
+    [conn] = db.connections
+    assert conn.rollbacks == 1 and conn.commits == 0
+    assert error.value.message == "Технология с id=99 не найдена"
+
+
+def test_unknown_team_is_reported_as_not_found(db):
+    db.answer_with("INSERT INTO projects", _fk_violation(
+        "projects_team_id_fkey", 'Key (team_id)=(9) is not present in table "teams".'
+    ))
+
+    with pytest.raises(NotFoundException) as error:
+        asyncio.run(ProjectService.create_project(ProjectCreate(name="Radar", status="active", team_id=9)))
+
+    assert error.value.message == "Команда с id=9 не найдена"
+
+
+def test_update_syncs_stack_in_the_same_transaction(db):
+    db.answer_with("UPDATE projects", dict(PROJECT))
+
+    asyncio.run(ProjectService.update_project(11, ProjectUpdate(status="maintenance", technology_ids=[4, 4, 6])))
+
+    [conn] = db.connections
+    assert len(conn.transactions) == 1 and conn.commits == 1
+    assert db.calls("UPDATE projects") == [("maintenance", 11)]
+    assert db.calls("DELETE FROM project_technologies") == [(11, [4, 6])]
+
+
+def test_update_without_fields_locks_row_and_keeps_stack(db):
+    db.answer_with("FOR UPDATE", dict(PROJECT))
+
+    asyncio.run(ProjectService.update_project(11, ProjectUpdate()))
+
+    assert db.calls("FOR UPDATE") == [(11,)]
+    assert not db.calls("DELETE FROM project_technologies")
+
+
+def test_update_of_missing_project_returns_none(db):
+    assert asyncio.run(ProjectService.update_project(404, ProjectUpdate(name="x", technology_ids=[1]))) is None
+    assert not db.calls("DELETE FROM project_technologies")
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+
+import pytest
+
+from backend.core import queries
+from backend.core.database import fetch_val
+from backend.core.queries import Query, QueryRegistry, StatementCache, page_query
+
+TEMPLATE = "SELECT * FROM projects p WHERE {where} ORDER BY {sort_field} {sort_order} LIMIT {limit} OFFSET {offset}"
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(QueryRegistry, "_queries", {})
+    monkeypatch.setattr(QueryRegistry, "_shapes", {})
+    monkeypatch.setattr(QueryRegistry, "_overflowed", set())
+    return QueryRegistry
+
+
+@pytest.fixture
+def statement_cache(monkeypatch, registry):
+    monkeypatch.setattr(StatementCache, "_connections", {})
+    monkeypatch.setattr(StatementCache, "hits", {})
+    monkeypatch.setattr(StatementCache, "misses", {})
+    monkeypatch.setattr(StatementCache, "warmed", 0)
+    monkeypatch.setattr(StatementCache, "warmup_failures", 0)
+    monkeypatch.setattr(StatementCache, "_size", 0)
+    monkeypatch.setattr(StatementCache, "_lifetime", 0.0)
+    StatementCache.configure(2, 0)
+    return StatementCache
+
+
+class ServerConnection:
+    def __init__(self, pid: int, failing: str | None = None):
+        self.pid = pid
+        self.failing = failing
+        self.listeners = []
+        self.fetched: list[tuple] = []
+
+    def get_server_pid(self) -> int:
+        return self.pid
+
+    def add_termination_listener(self, listener) -> None:
+        self.listeners.append(listener)
+
+    async def fetch(self, sql: str, *args) -> list:
+        if self.failing and self.failing in sql:
+            raise RuntimeError("relation does not exist")
+        self.fetched.append((sql, args))
+        return []
+
+
+def test_names_are_unique(registry):
+    registry.register("projects.get", "SELECT 1")
+
+    with pytest.raises(ValueError):
+        registry.register("projects.get", "SELECT 2")
+
+
+def test_shapes_are_rendered_once_per_combination(registry):
+    first = registry.shape("projects.list", "SELECT {a}, {b}", a="1", b="2")
+    same = registry.shape("projects.list", "SELECT {a}, {b}", b="2", a="1")
+    other = registry.shape("projects.list", "SELECT {a}, {b}", a="1", b="3")
+
+    assert first is same
+    assert first.sql == "SELECT 1, 2" and other.sql == "SELECT 1, 3"
+    assert registry.stats() == {"static": 0, "shapes": {"projects.list": 2}, "overflowed": []}
+
+
+def test_unbounded_shapes_are_reported_once(registry, monkeypatch, caplog):
+    monkeypatch.setattr(queries, "MAX_SHAPES_PER_QUERY", 2)
+
+    with caplog.at_level(logging.WARNING, logger="backend.core.queries"):
+        shapes = [registry.shape("search", "SELECT {n}", n=str(n)) for n in range(4)]
+
+    assert [shape.sql for shape in shapes] == ["SELECT 0", "SELECT 1", "SELECT 2", "SELECT 3"]
+    assert registry.stats()["shapes"] == {"search": 2}
+    assert registry.stats()["overflowed"] == ["search"]
+    assert len(caplog.records) == 1
+
+
+def test_page_query_numbers_limit_after_filters(registry):
+    query = page_query("projects.list", TEMPLATE, "p.status = $1 AND p.team_id = $2", "p.name", "ASC", 2, warmup=True)
+
+    assert query.sql.endswith("ORDER BY p.name ASC LIMIT $3 OFFSET $4")
+    assert query.warmup_args == (0, 0)
+
+
+def test_warmup_covers_queries_with_arguments(registry):
+    registry.register("projects.get", "SELECT 1", warmup_args=(0,))
+    registry.register("projects.delete", "DELETE 1")
+    page_query("projects.list", TEMPLATE, "TRUE", "p.name", "ASC", 0, warmup=True)
+    page_query("projects.list", TEMPLATE, "p.status = $1", "p.name", "ASC", 1)
+
+    assert [(query.name, query.warmup_args) for query in registry.warmup_queries()] == [
+        ("projects.get", (0,)),
+        ("projects.list", (0, 0)),
+    ]
+
+
+def test_lookups_mirror_connection_lru(statement_cache):
+    conn = ServerConnection(pid=10)
+
+    for sql in ("SELECT 1", "SELECT 1", "SELECT 2", "SELECT 3", "SELECT 1", "SELECT 3"):
+        statement_cache.lookup(conn, sql, sql)
+
+    assert statement_cache.hits == {"SELECT 1": 1, "SELECT 3": 1}
+    assert statement_cache.misses == {"SELECT 1": 2, "SELECT 2": 1, "SELECT 3": 1}
+    assert list(statement_cache._connections[10]) == ["SELECT 1", "SELECT 3"]
+
+
+def test_expired_statement_is_a_miss(statement_cache, monkeypatch):
+    clock = iter([100.0, 150.0, 300.0])
+    monkeypatch.setattr(queries.time, "monotonic", lambda: next(clock))
+    statement_cache.configure(2, 100.0)
+    conn = ServerConnection(pid=10)
+
+    for _ in range(3):
+        statement_cache.lookup(conn, "SELECT 1", "q")
+
+    assert (statement_cache.hits, statement_cache.misses) == ({"q": 1}, {"q": 2})
+
+
+def test_closed_connection_drops_mirror(statement_cache):
+    conn = ServerConnection(pid=10)
+    statement_cache.lookup(conn, "SELECT 1", "q")
+
+    conn.listeners[0](conn)
+
+    assert statement_cache._connections == {}
+
+
+def test_disabled_cache_records_nothing(statement_cache):
+    statement_cache.configure(0, 0)
+
+    statement_cache.lookup(ServerConnection(pid=10), "SELECT 1", "q")
+    asyncio.run(statement_cache.init_connection(ServerConnection(pid=11)))
+
+    assert statement_cache.stats()["misses"] == 0
+    assert statement_cache._connections == {}
+
+
+def test_new_connection_prepares_warmup_queries(statement_cache):
+    QueryRegistry.register("projects.get", "SELECT * FROM projects WHERE id = $1", warmup_args=(0,))
+    QueryRegistry.register("legacy.get", "SELECT * FROM legacy WHERE id = $1", warmup_args=(0,))
+    conn = ServerConnection(pid=10, failing="legacy")
+
+    asyncio.run(statement_cache.init_connection(conn))
+    statement_cache.lookup(conn, "SELECT * FROM projects WHERE id = $1", "projects.get")
+
+    assert conn.fetched == [("SELECT * FROM projects WHERE id = $1", (0,))]
+    assert (statement_cache.warmed, statement_cache.warmup_failures) == (1, 1)
+    stats = statement_cache.stats()
+    assert stats["queries"] == {"projects.get": {"hits": 1, "misses": 0, "hit_ratio": 1.0}}
+    assert stats["connections"] == 1
+
+
+def test_fetch_helpers_accept_registered_query(db, statement_cache):
+    statement_cache.configure(0, 0)
+    query = Query("projects.count", "SELECT COUNT(*) FROM projects WHERE status = $1")
+    db.answer_with("FROM projects", 3)
+
+    assert asyncio.run(fetch_val(query, "active")) == 3
+    assert db.queries == [("fetchval", query.sql, ("active",))]
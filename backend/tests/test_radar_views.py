@@ -0,0 +1,167 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.config import get_settings
+from backend.core.changes import mark_changed
+from backend.services import radar_views
+from backend.services.radar_views import RadarViewRefresher, RadarViewService
+
+
+@pytest.fixture
+def refresher(monkeypatch):
+    settings = get_settings().cache
+    monkeypatch.setattr(settings, "radar_refresh_debounce_seconds", 0.05)
+    monkeypatch.setattr(settings, "radar_refresh_max_delay_seconds", 1.0)
+    monkeypatch.setattr(radar_views, "RETRY_DELAY_SECONDS", 0.01)
+    monkeypatch.setattr(RadarViewRefresher, "_dirty", set())
+    monkeypatch.setattr(RadarViewRefresher, "_dirty_since", None)
+    monkeypatch.setattr(RadarViewRefresher, "_wakeup", None)
+    monkeypatch.setattr(RadarViewRefresher, "_task", None)
+
+    refreshed: list[str] = []
+    locked: set[str] = set()
+
+    async def refresh(view: str) -> bool:
+        if view in locked:
+            locked.discard(view)
+            return False
+        refreshed.append(view)
+        return True
+
+    monkeypatch.setattr(RadarViewRefresher, "refresh", refresh)
+    return settings, refreshed, locked
+
+
+def _run_refresher(scenario) -> None:
+    async def run() -> None:
+        await RadarViewRefresher.start()
+        try:
+            await scenario()
+        finally:
+            await RadarViewRefresher.stop()
+
+    asyncio.run(run())
+
+
+def test_all_views_are_checked_on_start(refresher):
+    _, refreshed, _ = refresher
+
+    _run_refresher(lambda: asyncio.sleep(0.15))
+
+    assert refreshed == ["mv_category_usage", "mv_team_summary", "mv_technology_usage"]
+
+
+def test_burst_of_writes_refreshes_affected_view_once(refresher):
+    _, refreshed, _ = refresher
+
+    async def scenario() -> None:
+        await asyncio.sleep(0.15)
+        refreshed.clear()
+        for _ in range(5):
+            mark_changed("projects")
+            await asyncio.sleep(0.01)
+        # Still within the debounce interval of the last write
+        assert refreshed == []
+        await asyncio.sleep(0.15)
+
+    _run_refresher(scenario)
+
+    assert refreshed == ["mv_team_summary"]
+
+
+def test_continuous_writes_refresh_after_max_delay(refresher):
+    settings, refreshed, _ = refresher
+    settings.radar_refresh_max_delay_seconds = 0.15
+
+    async def scenario() -> None:
+        await asyncio.sleep(0.15)
+        refreshed.clear()
+        for _ in range(20):
+            mark_changed("project_technologies")
+            await asyncio.sleep(0.02)
+
+    _run_refresher(scenario)
+
+    assert "mv_technology_usage" in refreshed
+
+
+def test_view_locked_by_another_worker_is_retried(refresher):
+    _, refreshed, locked = refresher
+    locked.add("mv_team_summary")
+
+    _run_refresher(lambda: asyncio.sleep(0.3))
+
+    assert refreshed.count("mv_team_summary") == 1
+    assert refreshed[-1] == "mv_team_summary"
+
+
+def _lock_db(db, locked: bool = True, source_version: int = 7, refreshed_version: int | None = 5):
+    db.answer_with("pg_try_advisory_lock", locked)
+    db.answer_with("FROM table_versions", source_version)
+    db.answer_with("FROM materialized_view_refreshes", refreshed_version)
+    return db
+
+
+def test_refresh_skipped_when_lock_is_held(db):
+    _lock_db(db, locked=False)
+
+    assert asyncio.run(RadarViewRefresher.refresh("mv_team_summary")) is False
+    assert not db.calls("REFRESH MATERIALIZED VIEW")
+    assert not db.calls("pg_advisory_unlock")
+
+
+def test_refresh_skipped_when_sources_did_not_change(db):
+    _lock_db(db, refreshed_version=7)
+
+    assert asyncio.run(RadarViewRefresher.refresh("mv_team_summary")) is True
+    assert not db.calls("REFRESH MATERIALIZED VIEW")
+    assert db.calls("FROM table_versions") == [(["projects", "teams", "users"],)]
+    assert db.calls("pg_advisory_unlock") == [("mv_team_summary",)]
+
+
+def test_refresh_records_source_version(db):
+    _lock_db(db)
+
+    assert asyncio.run(RadarViewRefresher.refresh("mv_team_summary")) is True
+
+    [conn] = db.connections
+    assert conn.transactions == [{}] and conn.commits == 1
+    assert db.calls("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_team_summary") == [()]
+    [(view, version, _)] = db.calls("INSERT INTO materialized_view_refreshes")
+    assert (view, version) == ("mv_team_summary", 7)
+    assert db.calls("pg_advisory_unlock") == [("mv_team_summary",)]
+    assert db.checked_out == set()
+
+
+def test_failed_refresh_releases_lock(db):
+    _lock_db(db)
+    db.answer_with("REFRESH MATERIALIZED VIEW", RuntimeError("canceling statement"))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(RadarViewRefresher.refresh("mv_team_summary"))
+
+    assert db.connections[0].rollbacks == 1
+    assert db.calls("pg_advisory_unlock") == [("mv_team_summary",)]
+
+
+def test_freshness_reports_lagging_view(db):
+    refreshed_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    versions = {"projects": 2, "teams": 2, "users": 2}
+    db.answer_with("FROM materialized_view_refreshes", [
+        {"view_name": "mv_team_summary", "source_version": 6, "refreshed_at": refreshed_at},
+    ])
+    db.answer_with("FROM table_versions", lambda tables: [
+        {"table_name": table, "version": versions[table], "updated_at": refreshed_at} for table in tables
+    ])
+
+    assert asyncio.run(RadarViewService.get_freshness(["mv_team_summary"])) == {
+        "refreshed_at": refreshed_at,
+        "pending_refresh": False,
+    }
+
+    versions["projects"] += 1
+    mark_changed("projects")
+
+    assert asyncio.run(RadarViewService.get_freshness(["mv_team_summary"]))["pending_refresh"] is True
@@ -0,0 +1,118 @@
+import asyncio
+
+from backend.core import database
+from backend.core.changes import mark_changed
+from backend.core.database import RequestScope
+from backend.services.reference_data import ReferenceDataService
+
+GO = {"id": 1, "name": "Go", "category_id": 1, "category_name": "Languages", "status_id": 1, "status": "adopt"}
+RUST = {"id": 2, "name": "Rust", "category_id": 1, "category_name": "Languages", "status_id": 2, "status": "trial"}
+ZIG = {"id": 3, "name": "Zig", "category_id": 1, "category_name": "Languages", "status_id": 3, "status": "assess"}
+
+
+def _reference_db(db):
+    db.answer_with("WHERE t.id = ANY", lambda ids: [tech for tech in (GO, RUST, ZIG) if tech["id"] in ids])
+    db.answer_with("FROM technology_categories", [{"id": 1, "name": "Languages"}])
+    db.answer_with("FROM technology_statuses", [{"id": 1, "name": "adopt"}, {"id": 2, "name": "trial"}])
+    db.answer_with("FROM technologies t", [GO, RUST])
+    return db
+
+
+def _snapshot_loads(db) -> int:
+    return len(db.calls("FROM technology_statuses"))
+
+
+def test_snapshot_is_loaded_once(db):
+    _reference_db(db)
+
+    async def run() -> tuple:
+        return await asyncio.gather(
+            ReferenceDataService.list_categories(),
+            ReferenceDataService.list_statuses(),
+            ReferenceDataService.get_technologies({1, 2}),
+        )
+
+    categories, statuses, technologies = asyncio.run(run())
+
+    assert _snapshot_loads(db) == 1
+    assert categories == [{"id": 1, "name": "Languages"}]
+    assert statuses == ["adopt", "trial"]
+    assert technologies == {1: GO, 2: RUST}
+    assert db.checked_out == set()
+
+
+def test_listings_do_not_expose_snapshot(db):
+    _reference_db(db)
+
+    asyncio.run(ReferenceDataService.list_categories())[0]["name"] = "changed"
+    asyncio.run(ReferenceDataService.list_statuses()).append("hold")
+
+    assert asyncio.run(ReferenceDataService.list_categories())[0]["name"] == "Languages"
+    assert asyncio.run(ReferenceDataService.list_statuses()) == ["adopt", "trial"]
+
+
+def test_snapshot_bypasses_request_connection(db):
+    _reference_db(db)
+
+    async def request() -> None:
+        request_scope = RequestScope()
+        request_scope.transactional = True
+        token = database._request_scope.set(request_scope)
+        try:
+            await database.execute("INSERT INTO technology_statuses (name) VALUES ($1)", "hold")
+            await ReferenceDataService.list_statuses()
+        finally:
+            database._request_scope.reset(token)
+            await request_scope.close()
+
+    asyncio.run(request())
+
+    # Uncommitted writes of the request must not reach the shared snapshot
+    assert len(db.connections) == 2
+    assert db.connections[1].transactions == []
+
+
+def test_reference_changes_reload_snapshot(db):
+    _reference_db(db)
+
+    asyncio.run(ReferenceDataService.list_statuses())
+    mark_changed("projects")
+    asyncio.run(ReferenceDataService.list_statuses())
+    assert _snapshot_loads(db) == 1
+
+    mark_changed("technologies")
+    asyncio.run(ReferenceDataService.list_statuses())
+    assert _snapshot_loads(db) == 2
+
+
+def test_missing_technology_is_read_and_triggers_reload(db):
+    _reference_db(db)
+
+    technologies = asyncio.run(ReferenceDataService.get_technologies({1, 3}))
+
+    assert technologies == {1: GO, 3: ZIG}
+    assert db.calls("WHERE t.id = ANY") == [([3],)]
+
+    asyncio.run(ReferenceDataService.get_technologies({1}))
+    assert _snapshot_loads(db) == 2
+
+
+def test_enrich_fills_names_sorts_and_drops_deleted(db):
+    _reference_db(db)
+    rows = [
+        {"id": 10, "technology_id": 2},
+        {"id": 11, "technology_id": 4},
+        {"id": 12, "technology_id": 1},
+    ]
+
+    enriched = asyncio.run(ReferenceDataService.enrich_technologies(rows))
+
+    assert enriched == [
+        {"id": 12, "technology_id": 1, "technology_name": "Go", "category_name": "Languages", "status": "adopt"},
+        {"id": 10, "technology_id": 2, "technology_name": "Rust", "category_name": "Languages", "status": "trial"},
+    ]
+
+
+def test_enrich_without_rows_skips_snapshot(db):
+    assert asyncio.run(ReferenceDataService.enrich_technologies([])) == []
+    assert db.queries == []
@@ -0,0 +1,136 @@
+import asyncio
+
+import asyncpg
+import pytest
+
+from backend.core.exceptions import ConflictException, NotFoundException
+from backend.core.references import _detail_values, check_references, integrity_errors
+from backend.schemas.projects import ProjectTechnologyCreate
+from backend.schemas.technologies import TechnologyCreate
+from backend.services.projects import ProjectService
+from backend.services.technologies import TechnologyService
+
+LINK = {"id": 7, "project_id": 1, "technology_id": 2, "version_id": None, "usage_type": "production", "notes": None}
+
+
+def _violation(error_type: type, constraint: str, detail: str | None = None) -> asyncpg.PostgresError:
+    fields = {"C": error_type.sqlstate, "M": "violation", "n": constraint}
+    if detail is not None:
+        fields["D"] = detail
+    return error_type.new(fields)
+
+
+@pytest.mark.parametrize("detail, values", [
+    ('Key (technology_id)=(99) is not present in table "technologies".', {"technology_id": "99"}),
+    ("Key (project_id, technology_id)=(1, 2) already exists.", {"project_id": "1", "technology_id": "2"}),
+    ("Key (name)=(a, b) already exists.", {}),
+    ("constraint violated", {}),
+    (None, {}),
+])
+def test_detail_values(detail, values):
+    assert _detail_values(detail) == values
+
+
+def test_violation_message_prefers_reported_key():
+    with pytest.raises(NotFoundException) as error:
+        with integrity_errors(technology_id=3):
+            raise _violation(
+                asyncpg.ForeignKeyViolationError,
+                "project_technologies_technology_id_fkey",
+                'Key (technology_id)=(99) is not present in table "technologies".',
+            )
+
+    assert error.value.message == "Технология с id=99 не найдена"
+    assert isinstance(error.value.__cause__, asyncpg.ForeignKeyViolationError)
+
+
+def test_violation_message_falls_back_to_context():
+    with pytest.raises(ConflictException) as error:
+        with integrity_errors(name="Languages"):
+            raise _violation(asyncpg.UniqueViolationError, "technology_categories_name_key")
+
+    assert error.value.message == 'Категория с именем "Languages" уже существует'
+
+
+@pytest.mark.parametrize("constraint", ["unknown_fkey", "projects_team_id_fkey"])
+def test_unmapped_violation_is_reraised(constraint):
+    # The second constraint is known, but its message has no value to show
+    with pytest.raises(asyncpg.ForeignKeyViolationError):
+        with integrity_errors():
+            raise _violation(asyncpg.ForeignKeyViolationError, constraint)
+
+
+def test_check_references_raises_first_missing_reference():
+    checks = {
+        "project_found": NotFoundException("project"),
+        "technology_found": NotFoundException("technology"),
+    }
+
+    with pytest.raises(NotFoundException) as error:
+        check_references({"project_found": False, "technology_found": False}, checks)
+    assert error.value.message == "project"
+
+    with pytest.raises(NotFoundException):
+        check_references(None, checks)
+
+
+def test_check_references_strips_flags():
+    row = {"project_found": True, "technology_found": True, **LINK}
+
+    assert check_references(row, {"project_found": NotFoundException()}) == LINK
+
+
+@pytest.mark.parametrize("flags, error_type, message", [
+    ({"project_found": False}, NotFoundException, "Проект с id=1 не найден"),
+    ({"technology_found": False}, NotFoundException, "Технология с id=2 не найдена"),
+    ({"version_found": False}, NotFoundException, "Версия с id=5 не найдена для этой технологии"),
+    ({"id": None}, ConflictException, "Эта технология уже добавлена в проект"),
+])
+def test_add_technology_reports_reference_from_write(db, flags, error_type, message):
+    db.answer_with("project_technologies", {
+        "project_found": True, "technology_found": True, "version_found": True, **LINK, **flags,
+    })
+    tech = ProjectTechnologyCreate(technology_id=2, version_id=5, usage_type="production")
+
+    with pytest.raises(error_type) as error:
+        asyncio.run(ProjectService.add_technology_to_project(1, tech))
+
+    assert error.value.message == message
+    assert len(db.queries) == 1
+
+
+def test_add_technology_single_statement(db):
+    db.answer_with("project_technologies", {
+        "project_found": True, "technology_found": True, "version_found": True, **LINK,
+    })
+    tech = ProjectTechnologyCreate(technology_id=2, usage_type="production")
+
+    result = asyncio.run(ProjectService.add_technology_to_project(1, tech))
+
+    assert result == LINK
+    [(_, _, args)] = db.queries
+    assert args == (1, 2, None, "production", None)
+
+
+def test_add_technology_racing_project_delete(db):
+    db.answer_with("project_technologies", _violation(
+        asyncpg.ForeignKeyViolationError,
+        "project_technologies_project_id_fkey",
+        'Key (project_id)=(1) is not present in table "projects".',
+    ))
+    tech = ProjectTechnologyCreate(technology_id=2, usage_type="production")
+
+    with pytest.raises(NotFoundException) as error:
+        asyncio.run(ProjectService.add_technology_to_project(1, tech))
+
+    assert error.value.message == "Проект с id=1 не найден"
+
+
+def test_create_technology_with_unknown_status(db):
+    db.answer_with("INSERT INTO technologies", {"category_found": True, "status_found": False, "id": None})
+    tech = TechnologyCreate(name="Go", category_id=1, status="hold")
+
+    with pytest.raises(NotFoundException) as error:
+        asyncio.run(TechnologyService.create_technology(tech))
+
+    assert error.value.message == 'Статус "hold" не найден'
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+
+from backend.config import get_settings
+from backend.core import changes, database
+from backend.core.changes import mark_changed
+from backend.core.database import RequestScope, transaction
+from backend.core.replicas import Replica, ReplicaSet
+from backend.services.auth import AuthService
+from backend.tests.conftest import FakeConnection, FakeDatabase
+
+USERS = [{"id": 1, "full_name": "Ann"}]
+
+
+class ReplicaPool:
+    """
+    Pool of a replica answering through its own FakeDatabase
+    """
+    def __init__(self):
+        self.database = FakeDatabase()
+        self.database.answer_with("FROM users", USERS)
+        self.error: BaseException | None = None
+
+    @asynccontextmanager
+    async def acquire(self):
+        if self.error is not None:
+            raise self.error
+        yield FakeConnection(self.database)
+
+    def get_size(self) -> int:
+        return 1
+
+
+def _replica(name: str) -> Replica:
+    replica = Replica(name, 5432)
+    replica.pool = ReplicaPool()
+    replica.healthy = True
+    return replica
+
+
+@pytest.fixture
+def replicas(monkeypatch, db):
+    settings = get_settings().database
+    monkeypatch.setattr(settings, "replica_routing", "round_robin")
+    monkeypatch.setattr(settings, "read_your_writes_seconds", 5.0)
+    replicas = [_replica("replica-a"), _replica("replica-b")]
+    monkeypatch.setattr(ReplicaSet, "replicas", replicas)
+    monkeypatch.setattr(ReplicaSet, "primary_reads", 0)
+    monkeypatch.setattr(ReplicaSet, "_changed_at", {})
+    monkeypatch.setattr(ReplicaSet, "_cursor", 0)
+    # Only the routing listener, other listeners keep process-wide state
+    monkeypatch.setattr(changes, "_listeners", [ReplicaSet.note_changed])
+    db.answer_with("FROM users", USERS)
+    return replicas
+
+
+def _in_request(coroutine_function, transactional: bool = False):
+    async def scenario():
+        request_scope = RequestScope()
+        request_scope.transactional = transactional
+        token = database._request_scope.set(request_scope)
+        try:
+            return await coroutine_function()
+        finally:
+            database._request_scope.reset(token)
+            await request_scope.close()
+
+    return asyncio.run(scenario())
+
+
+def _reads(replica: Replica) -> int:
+    return len(replica.pool.database.queries)
+
+
+def test_round_robin_skips_ejected_replicas(replicas):
+    first, second = replicas
+
+    assert [ReplicaSet.choose(frozenset({"users"})) for _ in range(4)] == [second, first, second, first]
+
+    second.healthy = False
+    assert [ReplicaSet.choose(frozenset({"users"})) for _ in range(2)] == [first, first]
+
+    first.healthy = False
+    assert ReplicaSet.choose(frozenset({"users"})) is None
+
+
+def test_least_busy_prefers_idle_replica(replicas, monkeypatch):
+    monkeypatch.setattr(get_settings().database, "replica_routing", "least_busy")
+    first, second = replicas
+    first.in_flight = 3
+
+    assert [ReplicaSet.choose(frozenset({"users"})) for _ in range(3)] == [second, second, second]
+
+
+def test_written_table_is_read_from_primary_within_window(replicas):
+    ReplicaSet.note_changed(frozenset({"users"}))
+
+    assert ReplicaSet.choose(frozenset({"users", "teams"})) is None
+    assert ReplicaSet.choose(frozenset({"teams"})) is not None
+
+    ReplicaSet._changed_at["users"] = time.monotonic() - 6.0
+    assert ReplicaSet.choose(frozenset({"users"})) is not None
+
+
+def test_ejection_is_counted_once(replicas):
+    first, _ = replicas
+
+    ReplicaSet.eject(first, OSError("connection refused"))
+    ReplicaSet.eject(first, "replication lag 9.0 s")
+
+    assert not first.healthy
+    assert first.ejections == 1
+    assert first.last_error == "replication lag 9.0 s"
+
+
+def test_request_read_goes_to_replica(replicas, db):
+    users = _in_request(lambda: AuthService.get_user_summaries([1]))
+
+    assert users == {1: USERS[0]}
+    assert [_reads(replica) for replica in replicas] == [0, 1]
+    assert (replicas[1].reads, replicas[1].in_flight) == (1, 0)
+    assert not db.queries
+    assert ReplicaSet.primary_reads == 0
+
+
+def test_reads_outside_request_or_in_transaction_use_primary(replicas, db):
+    asyncio.run(AuthService.get_user_summaries([1]))
+    _in_request(lambda: AuthService.get_user_summaries([1]), transactional=True)
+
+    async def read_in_transaction():
+        async with transaction():
+            return await AuthService.get_user_summaries([1])
+
+    _in_request(read_in_transaction)
+
+    assert [_reads(replica) for replica in replicas] == [0, 0]
+    assert len(db.calls("FROM users")) == 3
+    assert ReplicaSet.primary_reads == 3
+
+
+def test_read_after_own_write_uses_primary(replicas, db):
+    async def write_then_read():
+        mark_changed("users")
+        return await AuthService.get_user_summaries([1])
+
+    assert _in_request(write_then_read) == {1: USERS[0]}
+    assert [_reads(replica) for replica in replicas] == [0, 0]
+    assert ReplicaSet.primary_reads == 1
+
+
+def test_failing_replica_is_ejected_and_read_repeated_on_primary(replicas, db):
+    _, second = replicas
+    second.pool.error = ConnectionRefusedError("connection refused")
+
+    users = _in_request(lambda: AuthService.get_user_summaries([1]))
+
+    assert users == {1: USERS[0]}
+    assert not second.healthy and second.ejections == 1
+    assert second.in_flight == 0
+    assert len(db.calls("FROM users")) == 1
+    assert ReplicaSet.primary_reads == 1
+    assert ReplicaSet.choose(frozenset({"users"})) is replicas[0]
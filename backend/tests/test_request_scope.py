@@ -0,0 +1,203 @@
+import asyncio
+
+import pytest
+
+from backend.core import database
+from backend.core.database import (
+    Database,
+    RequestScope,
+    RequestScopeMiddleware,
+    after_commit,
+    execute,
+    fetch_one,
+    get_db_connection,
+    release_request_connection,
+    request_transaction,
+)
+
+
+class FakeTransaction:
+    def __init__(self, connection: "FakeConnection"):
+        self.connection = connection
+
+    async def start(self) -> None:
+        await asyncio.sleep(0)
+        self.connection.transactions += 1
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.transactions = 0
+
+    def transaction(self) -> FakeTransaction:
+        return FakeTransaction(self)
+
+
+class SuspendingPool:
+    """
+    Pool whose acquire yields to the event loop, as it does under load
+    """
+    def __init__(self):
+        self.checked_out: set[FakeConnection] = set()
+        self.acquired: list[FakeConnection] = []
+
+    async def acquire(self) -> FakeConnection:
+        await asyncio.sleep(0)
+        connection = FakeConnection()
+        self.checked_out.add(connection)
+        self.acquired.append(connection)
+        return connection
+
+    async def release(self, connection: FakeConnection) -> None:
+        self.checked_out.remove(connection)
+
+
+async def _run_request(transactional: bool, tasks: int) -> SuspendingPool:
+    pool = SuspendingPool()
+    previous, Database._pool = Database._pool, pool
+    request_scope = RequestScope()
+    request_scope.transactional = transactional
+    token = database._request_scope.set(request_scope)
+
+    async def query() -> None:
+        async with get_db_connection():
+            await asyncio.sleep(0)
+
+    try:
+        await asyncio.gather(*(query() for _ in range(tasks)))
+        await request_scope.close()
+    finally:
+        database._request_scope.reset(token)
+        Database._pool = previous
+    return pool
+
+
+def test_concurrent_first_use_returns_every_connection():
+    pool = asyncio.run(_run_request(transactional=False, tasks=7))
+
+    assert pool.checked_out == set()
+    assert len(pool.acquired) == 7
+
+
+def test_concurrent_first_use_starts_one_request_transaction():
+    pool = asyncio.run(_run_request(transactional=True, tasks=7))
+
+    assert pool.checked_out == set()
+    assert sum(connection.transactions for connection in pool.acquired) == 1
+
+
+def _endpoint(events: list[str], status: int, transactional: bool = True, fail: bool = False):
+    async def app(scope, receive, send):
+        if transactional:
+            await request_transaction()
+        await fetch_one("SELECT 1 FROM projects WHERE id = $1", 1)
+        await execute("UPDATE projects SET name = $1", "Radar")
+        after_commit(lambda: events.append("committed"))
+        if fail:
+            raise RuntimeError("boom")
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+def _serve(app, events: list[str]) -> None:
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        events.append(message["type"])
+
+    asyncio.run(RequestScopeMiddleware(app)({"type": "http"}, receive, send))
+
+
+def test_successful_request_commits_before_response(db):
+    events: list[str] = []
+
+    _serve(_endpoint(events, 201), events)
+
+    [connection] = db.connections
+    assert connection.transactions == [{}]
+    assert (connection.commits, connection.rollbacks) == (1, 0)
+    assert events == ["committed", "http.response.start", "http.response.body"]
+    assert db.checked_out == set()
+
+
+def test_error_status_rolls_back_request(db):
+    events: list[str] = []
+
+    _serve(_endpoint(events, 409), events)
+
+    [connection] = db.connections
+    assert (connection.commits, connection.rollbacks) == (0, 1)
+    assert "committed" not in events
+    assert db.checked_out == set()
+
+
+def test_unhandled_error_rolls_back_request(db):
+    events: list[str] = []
+
+    with pytest.raises(RuntimeError):
+        _serve(_endpoint(events, 200, fail=True), events)
+
+    [connection] = db.connections
+    assert (connection.commits, connection.rollbacks) == (0, 1)
+    assert events == []
+    assert db.checked_out == set()
+
+
+def test_read_request_reuses_one_connection_without_transaction(db):
+    events: list[str] = []
+
+    _serve(_endpoint(events, 200, transactional=False), events)
+
+    [connection] = db.connections
+    assert connection.transactions == []
+    assert [method for method, _, _ in db.queries] == ["fetchrow", "execute"]
+    # Without a request transaction callbacks run right away
+    assert events[0] == "committed"
+
+
+def test_idle_connection_is_returned_before_long_wait(db):
+    async def request() -> None:
+        request_scope = RequestScope()
+        token = database._request_scope.set(request_scope)
+        try:
+            await fetch_one("SELECT 1")
+            await release_request_connection()
+            assert db.checked_out == set()
+            await fetch_one("SELECT 2")
+            assert len(db.checked_out) == 1
+        finally:
+            database._request_scope.reset(token)
+            await request_scope.close()
+
+    asyncio.run(request())
+
+    assert len(db.connections) == 2
+    assert db.checked_out == set()
+
+
+def test_connection_with_request_transaction_is_kept(db):
+    async def request() -> None:
+        request_scope = RequestScope()
+        request_scope.transactional = True
+        token = database._request_scope.set(request_scope)
+        try:
+            await execute("UPDATE projects SET name = $1", "Radar")
+            await release_request_connection()
+            assert len(db.checked_out) == 1
+        finally:
+            database._request_scope.reset(token)
+            await request_scope.close()
+
+    asyncio.run(request())
+
+    assert db.connections[0].rollbacks == 1
+    assert db.checked_out == set()
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from backend.core.exceptions import ValidationException
+from backend.core.search import build_search_condition, escape_like, search_params
+from backend.routers.search import search
+from backend.services.search import SearchService
+
+
+def test_like_wildcards_are_escaped():
+    assert escape_like(r"100%_done\now") == r"100\%\_done\\now"
+
+
+def test_search_params_match_whole_query_and_escaped_substring():
+    assert search_params("50%") == ["50%", r"%50\%%"]
+
+
+def test_condition_numbers_parameters_from_given_index():
+    condition, rank, params = build_search_condition("go", "p.search_vector", ["p.name", "p.description"], 4)
+
+    assert condition == (
+        "(p.search_vector @@ websearch_to_tsquery('simple', $4)"
+        " OR p.name ILIKE $5 OR p.description ILIKE $5)"
+    )
+    assert rank == "(ts_rank(p.search_vector, websearch_to_tsquery('simple', $4)) + similarity(p.name, $4))"
+    assert params == ["go", "%go%"]
+
+
+def test_search_passes_limit_after_shared_parameters(db):
+    asyncio.run(SearchService.search("go", ["project", "team"], 5))
+
+    [(method, query, args)] = db.queries
+    assert args == ("go", "%go%", 5)
+    assert query.count("LIMIT $3") == 3
+    assert "FROM projects p" in query and "FROM teams t" in query
+
+
+def test_search_without_types_runs_no_query(db):
+    assert asyncio.run(SearchService.search("go", [], 5)) == []
+    assert db.queries == []
+
+
+def _searched_tables(db, current_user: dict | None, types: str | None = None) -> str:
+    asyncio.run(search(q="go", types=types, limit=10, current_user=current_user))
+    return db.queries[-1][1]
+
+
+def test_users_are_searched_for_admins_only(db):
+    assert "FROM users u" not in _searched_tables(db, None)
+    assert "FROM users u" not in _searched_tables(db, {"id": 1, "is_admin": False}, "user,project")
+    assert "FROM users u" in _searched_tables(db, {"id": 1, "is_admin": True})
+
+
+def test_unknown_search_type_is_rejected(db):
+    with pytest.raises(ValidationException):
+        asyncio.run(search(q="go", types="project,planet", limit=10, current_user=None))
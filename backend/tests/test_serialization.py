@@ -0,0 +1,101 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from backend.core import serialization
+from backend.core.pagination import PaginatedResponse, PaginationParams, SortParams, paginate_rows
+from backend.core.serialization import FastJSONResponse, dumps, loads, shape_rows
+from backend.schemas.projects import Project
+
+# TIMESTAMP columns come back naive
+ADDED_AT = datetime(2026, 1, 2, 3, 4, 5, 250000)
+
+LINK = {
+    "id": 7, "project_id": 1, "technology_id": 2, "technology_name": "Go", "version_id": None,
+    "version_number": None, "usage_type": "production", "notes": None, "added_at": ADDED_AT,
+    "category_name": "Languages", "status": "adopt",
+}
+
+ROW = {
+    "id": 1, "name": "Радар", "description": None, "team_id": 3, "status": "active",
+    "repository_url": None, "start_date": date(2026, 1, 1), "created_at": ADDED_AT, "updated_at": ADDED_AT,
+    "technologies": [{**LINK, "sort_key": 1}], "team_name": "Core",
+}
+
+VALUE = {
+    "at": datetime(2026, 1, 2, 3, 4, 5, 600000),
+    "day": date(2026, 1, 2),
+    "score": Decimal("1.5"),
+    "name": "Платформа",
+    "tags": ["a", None, True],
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_database_values_are_encoded(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    encoded = dumps(VALUE)
+
+    assert encoded == (
+        '{"at":"2026-01-02T03:04:05.600000","day":"2026-01-02","score":1.5,'
+        '"name":"Платформа","tags":["a",null,true]}'
+    ).encode()
+    assert loads(encoded)["name"] == "Платформа"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_unknown_types_are_rejected(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_fast_response_renders_with_shared_encoder():
+    response = FastJSONResponse({"day": date(2026, 1, 2)}, headers={"ETag": 'W/"1"'})
+
+    assert response.body == b'{"day":"2026-01-02"}'
+    assert response.headers["etag"] == 'W/"1"'
+
+
+def test_rows_are_cut_to_model_fields():
+    [shaped] = shape_rows(Project, [ROW])
+
+    assert list(shaped) == list(Project.model_fields)
+    assert shaped["technologies"] == [LINK]
+    assert shaped["start_date"] is ROW["start_date"]
+
+
+def test_expansions_are_kept_as_they_are():
+    [shaped] = shape_rows(Project, [ROW], extra=("team_name",))
+
+    assert shaped["team_name"] == "Core"
+
+
+def test_missing_field_is_an_error():
+    row = dict(ROW)
+    del row["status"]
+
+    with pytest.raises(KeyError):
+        shape_rows(Project, [row])
+
+
+def test_page_matches_response_model_output():
+    pagination = PaginationParams(page=2, page_size=1, cursor=None, include_total=True)
+    sort = SortParams(sort_by="name", sort_order="asc")
+
+    response = paginate_rows(Project, [ROW], 3, pagination, sort, None, {"ETag": 'W/"v"'})
+
+    validated = PaginatedResponse[Project].model_validate({
+        "items": [ROW], "page": 2, "page_size": 1, "total": 3, "total_pages": 3,
+        "sort_by": "name", "sort_order": "asc", "next_cursor": None,
+    })
+    assert json.loads(response.body) == validated.model_dump(mode="json")
+    assert response.headers["etag"] == 'W/"v"'
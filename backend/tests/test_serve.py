@@ -0,0 +1,101 @@
+import asyncio
+import importlib
+import os
+
+import pytest
+
+from backend import cli
+from backend.config import DatabaseConfig, get_settings
+from backend.core.database import Database
+
+
+@pytest.fixture
+def served(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "1")
+    monkeypatch.setenv("DB_MAX_POOL_SIZE", "20")
+    calls: list[dict] = []
+    monkeypatch.setattr(cli.uvicorn, "run", lambda app, **options: calls.append({"app": app, **options}))
+    yield calls
+    get_settings.cache_clear()
+
+
+def _serve(*argv: str) -> None:
+    cli.handle_serve(cli.create_parser().parse_args(["serve", *argv]))
+
+
+@pytest.mark.parametrize("workers, sizes", [
+    (1, (5, 20)),
+    (4, (5, 5)),
+    (8, (2, 2)),
+    (40, (1, 1)),
+])
+def test_pool_budget_is_split_between_workers(workers, sizes):
+    config = DatabaseConfig(host="db", port=5432, username="u", password="p", database="d")
+
+    assert config.worker_pool_sizes(workers) == sizes
+
+
+def test_production_server_runs_several_workers(served, monkeypatch):
+    imported = []
+    monkeypatch.setattr(importlib, "import_module", imported.append)
+
+    _serve("--workers", "4", "--graceful-timeout", "12")
+
+    [options] = served
+    assert options["app"] == "backend.main:app"
+    assert options["workers"] == 4
+    assert options["reload"] is False
+    assert options["timeout_graceful_shutdown"] == 12
+    assert os.environ["WEB_CONCURRENCY"] == "4"
+    assert get_settings().server.workers == 4
+    assert imported == ["backend.main"]
+
+
+def test_reload_runs_single_worker(served, monkeypatch):
+    imported = []
+    monkeypatch.setattr(importlib, "import_module", imported.append)
+
+    _serve("--reload", "--workers", "4")
+
+    assert served[0]["workers"] == 1
+    assert served[0]["reload"] is True
+    assert os.environ["WEB_CONCURRENCY"] == "1"
+    assert imported == []
+
+
+def test_broken_application_fails_in_supervisor(served, monkeypatch):
+    def import_module(name: str) -> None:
+        raise ImportError("broken build")
+
+    monkeypatch.setattr(importlib, "import_module", import_module)
+
+    with pytest.raises(SystemExit) as exit_info:
+        _serve("--workers", "2")
+
+    assert exit_info.value.code == 1
+    assert served == []
+
+
+class ClosingPool:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.closed = False
+        self.terminated = False
+
+    async def close(self) -> None:
+        await asyncio.sleep(self.delay)
+        self.closed = True
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+@pytest.mark.parametrize("delay, closed, terminated", [(0, True, False), (10, False, True)])
+def test_pool_close_is_bounded(monkeypatch, delay, closed, terminated):
+    pool = ClosingPool(delay)
+    monkeypatch.setattr(Database, "_pool", pool)
+
+    asyncio.run(Database.disconnect(timeout=0.05))
+
+    assert (pool.closed, pool.terminated) == (closed, terminated)
+    assert Database._pool is None
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+import pytest
+
+from backend.config import get_settings
+from backend.core.database import fetch_all
+from backend.core.slow_queries import SlowQueryLog, normalize_query, param_shape
+
+SLOW = 0.75
+FAST = 0.01
+
+
+class ExplainConnection:
+    def __init__(self, plan: str | Exception):
+        self.plan = plan
+        self.statements: list[tuple[str, tuple]] = []
+        self.transactions: list[dict] = []
+
+    @asynccontextmanager
+    async def transaction(self, **options):
+        self.transactions.append(options)
+        yield
+
+    async def execute(self, query: str, *args) -> str:
+        self.statements.append((query, args))
+        return "SET"
+
+    async def fetchval(self, query: str, *args):
+        self.statements.append((query, args))
+        if isinstance(self.plan, Exception):
+            raise self.plan
+        return self.plan
+
+
+class ExplainPool:
+    def __init__(self, plan: str | Exception = '[{"Plan": {"Node Type": "Seq Scan"}}]', idle: int = 1):
+        self.connection = ExplainConnection(plan)
+        self.idle = idle
+        self.acquired = 0
+
+    def get_idle_size(self) -> int:
+        return self.idle
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquired += 1
+        yield self.connection
+
+
+@pytest.fixture
+def slow_log(monkeypatch):
+    settings = get_settings().database
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 500.0)
+    monkeypatch.setattr(settings, "slow_query_explain", False)
+    monkeypatch.setattr(SlowQueryLog, "_entries", None)
+    monkeypatch.setattr(SlowQueryLog, "_explained_at", {})
+    return settings
+
+
+def _observe(query: str, args: tuple = (), elapsed: float = SLOW, pool=None) -> None:
+    async def run() -> None:
+        SlowQueryLog.observe(query, args, elapsed, "ProjectService.list_projects", pool)
+        await asyncio.gather(*SlowQueryLog._tasks)
+
+    asyncio.run(run())
+
+
+def test_normalize_replaces_literals_and_keeps_parameters():
+    query = """
+        SELECT t1.id, 'it''s'   FROM projects t1
+        WHERE t1.status = 'active' AND t1.score > 2.5 AND t1.team_id = $12
+        LIMIT 10
+    """
+
+    assert normalize_query(query) == (
+        "SELECT t1.id, ? FROM projects t1 WHERE t1.status = ? AND t1.score > ? AND t1.team_id = $12 LIMIT ?"
+    )
+
+
+@pytest.mark.parametrize("value, shape", [
+    (None, "null"),
+    ("secret", "str(6)"),
+    (b"ab", "bytes(2)"),
+    ([1, 2, 3], "list[3]"),
+    (42, "int"),
+])
+def test_param_shape_hides_values(value, shape):
+    assert param_shape(value) == shape
+
+
+def test_fast_queries_are_not_recorded(slow_log):
+    _observe("SELECT 1", elapsed=FAST)
+
+    assert SlowQueryLog.entries() == []
+
+
+def test_zero_threshold_disables_log(slow_log):
+    slow_log.slow_query_threshold_ms = 0
+
+    _observe("SELECT 1")
+
+    assert SlowQueryLog.entries() == []
+
+
+def test_slow_query_is_recorded_without_values(slow_log, caplog):
+    with caplog.at_level(logging.WARNING, logger="backend.core.slow_queries"):
+        _observe("SELECT * FROM users WHERE email = $1", ("admin@local.com",))
+
+    [entry] = SlowQueryLog.entries()
+    assert entry["duration_ms"] == 750.0
+    assert entry["caller"] == "ProjectService.list_projects"
+    assert entry["query"] == "SELECT * FROM users WHERE email = $1"
+    assert entry["params"] == ["str(15)"]
+    assert entry["plan"] is None
+    assert "admin@local.com" not in caplog.text
+    assert entry["fingerprint"] in caplog.text
+
+
+def test_entries_are_newest_first_and_bounded(slow_log, monkeypatch):
+    monkeypatch.setattr(slow_log, "slow_query_log_size", 2)
+
+    for number in range(3):
+        _observe(f"SELECT * FROM t{number}")
+
+    assert [entry["query"] for entry in SlowQueryLog.entries()] == ["SELECT * FROM t2", "SELECT * FROM t1"]
+    assert [entry["query"] for entry in SlowQueryLog.entries(limit=1)] == ["SELECT * FROM t2"]
+
+
+def test_plan_is_captured_once_per_query_shape(slow_log):
+    slow_log.slow_query_explain = True
+    pool = ExplainPool()
+
+    _observe("SELECT * FROM projects WHERE id = $1", (1,), pool=pool)
+    _observe("SELECT * FROM projects   WHERE id = $1", (2,), pool=pool)
+
+    second, first = SlowQueryLog.entries()
+    assert first["plan"] == {"Plan": {"Node Type": "Seq Scan"}}
+    assert second["plan"] is None
+    assert pool.acquired == 1
+    assert pool.connection.transactions == [{"readonly": True}]
+    assert pool.connection.statements == [
+        ("SET LOCAL statement_timeout = 10000", ()),
+        ("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT * FROM projects WHERE id = $1", (1,)),
+    ]
+
+
+def test_writes_are_never_explained(slow_log):
+    slow_log.slow_query_explain = True
+    pool = ExplainPool()
+
+    _observe("UPDATE projects SET name = $1", ("Radar",), pool=pool)
+
+    assert pool.acquired == 0
+
+
+def test_plan_capture_skipped_when_pool_is_busy(slow_log):
+    slow_log.slow_query_explain = True
+    pool = ExplainPool(idle=0)
+
+    _observe("SELECT 1", pool=pool)
+
+    assert pool.acquired == 0
+    assert SlowQueryLog.entries()[0]["plan_error"] == "пул соединений занят"
+
+
+def test_failed_plan_capture_is_recorded(slow_log):
+    slow_log.slow_query_explain = True
+
+    _observe("SELECT 1", pool=ExplainPool(plan=TimeoutError("canceling statement")))
+
+    assert SlowQueryLog.entries()[0]["plan_error"] == "TimeoutError: canceling statement"
+
+
+async def list_slow_projects() -> list:
+    return await fetch_all("SELECT * FROM projects WHERE status = 'active'")
+
+
+def test_fetch_helpers_report_slow_statements(db, slow_log):
+    slow_log.slow_query_threshold_ms = 1e-9
+
+    asyncio.run(list_slow_projects())
+
+    [entry] = SlowQueryLog.entries()
+    assert entry["caller"] == "list_slow_projects"
+    assert entry["query"] == "SELECT * FROM projects WHERE status = ?"
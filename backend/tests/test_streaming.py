@@ -0,0 +1,102 @@
+import asyncio
+from datetime import date, datetime
+
+from backend.core.pagination import SortParams
+from backend.core.streaming import encode_csv, encode_ndjson, iter_cursor, stream_query
+from backend.routers.projects import export_projects
+from backend.tests.conftest import FakeConnection, FakeDatabase
+
+ROWS = [{"id": n, "name": f"p{n}"} for n in range(1, 6)]
+
+
+async def _collect(iterable) -> list:
+    return [item async for item in iterable]
+
+
+def test_ndjson_encodes_one_object_per_line():
+    body = encode_ndjson([
+        {"id": 1, "created_at": datetime(2026, 1, 2, 3, 4, 5)},
+        {"id": 2, "created_at": None},
+    ])
+
+    assert body == b'{"id":1,"created_at":"2026-01-02T03:04:05"}\n{"id":2,"created_at":null}\n'
+
+
+def test_csv_flattens_values_in_column_order():
+    body = encode_csv(
+        [{"name": 'Radar, "v2"', "start_date": date(2026, 2, 1), "technologies": ["Go", "Rust"], "team_id": None}],
+        ["name", "team_id", "start_date", "technologies"],
+        header=True,
+    )
+
+    assert body.decode() == 'name,team_id,start_date,technologies\n"Radar, ""v2""",,2026-02-01,Go;Rust\n'
+
+
+def test_cursor_is_read_in_chunks():
+    database = FakeDatabase()
+    database.answer_with("FROM projects", ROWS)
+    conn = FakeConnection(database)
+
+    chunks = asyncio.run(_collect(iter_cursor(conn, "SELECT * FROM projects", chunk_size=2)))
+
+    assert [[row["id"] for row in chunk] for chunk in chunks] == [[1, 2], [3, 4], [5]]
+
+
+def test_cursor_ending_on_chunk_boundary():
+    database = FakeDatabase()
+    database.answer_with("FROM projects", ROWS[:4])
+    conn = FakeConnection(database)
+
+    chunks = asyncio.run(_collect(iter_cursor(conn, "SELECT * FROM projects", chunk_size=2)))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2]
+
+
+def test_stream_holds_readonly_transaction_until_exhausted(db):
+    db.answer_with("FROM projects", ROWS)
+
+    async def consume() -> list[bytes]:
+        stream = stream_query("SELECT * FROM projects", fmt="csv", columns=["id", "name"], chunk_size=3)
+        header = await stream.__anext__()
+        # The header is sent before a connection is taken
+        assert db.connections == []
+        rest = await _collect(stream)
+        return [header, *rest]
+
+    chunks = asyncio.run(consume())
+
+    assert chunks == [b"id,name\n", b"1,p1\n2,p2\n3,p3\n", b"4,p4\n5,p5\n"]
+    assert db.connections[0].transactions == [{"readonly": True}]
+    assert db.checked_out == set()
+
+
+def test_stream_closed_early_releases_connection(db):
+    db.answer_with("FROM projects", ROWS)
+
+    async def read_first_chunk() -> bytes:
+        stream = stream_query("SELECT * FROM projects", chunk_size=2)
+        chunk = await stream.__anext__()
+        await stream.aclose()
+        return chunk
+
+    assert asyncio.run(read_first_chunk()).count(b"\n") == 2
+    assert db.connections[0].rollbacks == 1
+    assert db.checked_out == set()
+
+
+def test_project_export_applies_list_filters(db):
+    db.answer_with("FROM projects p", [{"id": 1, "name": "Radar", "technologies": ["Go", "Rust"]}])
+
+    async def export() -> tuple[dict, bytes]:
+        response = await export_projects(SortParams("name", "asc"), "csv", None, "active", 3)
+        return dict(response.headers), b"".join(await _collect(response.body_iterator))
+
+    headers, body = asyncio.run(export())
+
+    assert headers["content-type"] == "text/csv; charset=utf-8"
+    assert headers["content-disposition"] == 'attachment; filename="projects.csv"'
+    assert body.decode().splitlines()[1] == "1,Radar,,,,,,,,Go;Rust"
+    [(_, query, args)] = db.queries
+    assert "p.status = $1 AND p.team_id = $2" in query
+    assert "ORDER BY p.name ASC, p.id ASC" in query
+    assert args == ("active", 3)
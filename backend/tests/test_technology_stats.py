@@ -0,0 +1,48 @@
+import asyncio
+
+from backend.cli import StatsManager
+from backend.services.technologies import TechnologyService
+from backend.tests.conftest import FakeConnection, FakeDatabase
+
+
+def test_stats_are_read_from_counter_tables(db):
+    usage = [{"id": 1, "name": "Python", "project_count": 3, "production_count": 2}]
+    totals = {"total_technologies": 10, "total_projects": 4, "total_usages": 7, "total_categories": 2}
+    db.answer_with("FROM technology_usage_stats", usage)
+    db.answer_with("FROM registry_counters", totals)
+
+    items, summary = asyncio.run(TechnologyService.get_stats())
+
+    assert items == usage
+    assert summary == totals
+    # Nothing is aggregated over the link table at read time
+    assert not db.calls("FROM project_technologies")
+    assert not db.calls("COUNT(")
+
+
+def test_rebuild_returns_number_of_drifted_rows(db):
+    db.answer_with("rebuild_technology_stats()", 3)
+
+    assert asyncio.run(TechnologyService.rebuild_stats_counters()) == 3
+
+
+def _rebuild(drifted: int, capsys) -> tuple[FakeConnection, str]:
+    database = FakeDatabase()
+    database.answer_with("rebuild_technology_stats()", drifted)
+    manager = StatsManager()
+    manager.conn = FakeConnection(database)
+    asyncio.run(manager.rebuild())
+    return manager.conn, capsys.readouterr().out
+
+
+def test_cli_rebuild_reports_drift(capsys):
+    conn, out = _rebuild(2, capsys)
+
+    assert "[WARN] Fixed 2 drifted counter row(s)" in out
+    assert conn.commits == 1
+
+
+def test_cli_rebuild_reports_consistent_counters(capsys):
+    _, out = _rebuild(0, capsys)
+
+    assert "[OK] Counters are consistent" in out
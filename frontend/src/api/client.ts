@@ -21,6 +21,7 @@ export type PaginatedResponse<T> = {
 	total_pages: number;
 	sort_by: string;
 	sort_order: string;
+	next_cursor?: string | null;
 };
 
 export type LoginRequest = {
@@ -165,6 +166,38 @@ export type DashboardStats = {
 		category: string;
 		count: number;
 	}>;
+	freshness: {
+		refreshed_at: string | null;
+		pending_refresh: boolean;
+	};
+};
+
+export type JobRunStatus = "queued" | "running" | "succeeded" | "failed" | "skipped";
+
+export type JobRun<TResult = Record<string, unknown>> = {
+	id: number;
+	job_name: string;
+	status: JobRunStatus;
+	params: Record<string, unknown>;
+	scheduled_for: string | null;
+	triggered_by: number | null;
+	worker: string | null;
+	progress_done: number;
+	progress_total: number | null;
+	message: string | null;
+	result: TResult | null;
+	error: string | null;
+	created_at: string;
+	started_at: string | null;
+	finished_at: string | null;
+};
+
+export type ArchiveJobResult = {
+	archive_log_id: number;
+	inactive_days: number;
+	count: number;
+	batches: number;
+	resumed: boolean;
 };
 
 export type AddTechnologyToProjectRequest = {
@@ -456,20 +489,13 @@ export const api = {
 		const query = buildQuery({ inactive_days: inactiveDays });
 		return request(`/admin/archive/preview${query}`);
 	},
-	executeArchive(inactiveDays: number): Promise<{
-		success: boolean;
-		count: number;
-		archived_projects: Array<{
-			project_id: number;
-			project_name: string;
-			last_updated: string;
-			days_inactive: number;
-			action_taken: string;
-		}>;
-	}> {
+	executeArchive(inactiveDays: number): Promise<JobRun<ArchiveJobResult>> {
 		const query = buildQuery({ inactive_days: inactiveDays });
 		return request(`/admin/archive/execute${query}`, { method: "POST" });
 	},
+	getJobRun<TResult = Record<string, unknown>>(runId: number): Promise<JobRun<TResult>> {
+		return request(`/admin/jobs/runs/${runId}`);
+	},
 	getArchiveHistory(limit: number = 10): Promise<{
 		history: Array<{
 			id: number;
@@ -478,6 +504,9 @@ export const api = {
 			projects_count: number;
 			inactive_threshold: number;
 			notes: string;
+			status: "in_progress" | "completed";
+			batches: number;
+			finished_at: string | null;
 		}>;
 	}> {
 		const query = buildQuery({ limit });
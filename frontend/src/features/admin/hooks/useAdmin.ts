@@ -1,5 +1,18 @@
 import { useState, useEffect } from "react";
-import { api } from "@/api/client";
+import { api, type ArchiveJobResult, type JobRun } from "@/api/client";
+
+const JOB_POLL_INTERVAL_MS = 1000;
+
+async function waitForJobRun<TResult>(run: JobRun<TResult>): Promise<JobRun<TResult>> {
+    while (run.status === "queued" || run.status === "running") {
+        await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+        run = await api.getJobRun<TResult>(run.id);
+    }
+    if (run.status !== "succeeded") {
+        throw new Error(run.error ?? "Задача не выполнена");
+    }
+    return run;
+}
 
 export interface ArchivePreviewProject {
     project_id: number;
@@ -16,6 +29,9 @@ export interface ArchiveHistoryEntry {
     projects_count: number;
     inactive_threshold: number;
     notes: string;
+    status: "in_progress" | "completed";
+    batches: number;
+    finished_at: string | null;
 }
 
 export function useArchivePreview() {
@@ -43,8 +59,8 @@ export function useArchiveExecute() {
     const execute = async (inactiveDays: number) => {
         setLoading(true);
         try {
-            const resp = await api.executeArchive(inactiveDays);
-            return resp;
+            const run = await waitForJobRun<ArchiveJobResult>(await api.executeArchive(inactiveDays));
+            return { count: run.result?.count ?? 0, batches: run.result?.batches ?? 0 };
         } finally {
             setLoading(false);
         }